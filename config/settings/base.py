@@ -54,7 +54,6 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
-    'background_task',
 ]
 
 MIDDLEWARE = [
@@ -98,6 +97,16 @@ DATABASES = {
     }
 }
 
+# 캐시 설정 (검색 결과 수, 마크다운 변환 결과, 페이지 캐시에서 사용)
+# 개발 환경은 프로세스 메모리(locmem)를 사용하고, 운영 환경(prod.py)은 여러 워커가 함께 쓰는 캐시로 바꿈
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'pybo',
+        'OPTIONS': {'MAX_ENTRIES': 10000},  # 페이지 HTML도 보관하므로 기본값(300)보다 크게 설정
+    }
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/3.1/ref/settings/#auth-password-validators
@@ -149,6 +158,143 @@ ALLOWED_FILE_TYPES=[
 
 ]
 
+# 얼굴 인코딩 캐시 설정 (pybo.inference.embedding_cache)
+AI_EMBEDDING_CACHE = {
+    'MAX_BYTES': 64 * 1024 * 1024,  # 메모리 계층(LRU)의 최대 크기, 64MB
+    'DB_PATH': os.path.join(BASE_DIR, 'cache', 'face_embeddings.sqlite3'),  # 디스크 계층 sqlite 파일, None이면 사용하지 않음
+    'MODEL_VERSION': 'yolov8_l_trump',  # 모델을 교체하면 값을 바꿔 이전 인코딩을 사용하지 않도록 함
+}
+
+# 얼굴 갤러리 설정 (pybo.inference.gallery)
+AI_FACE_GALLERY = {
+    'ENABLED': False,  # True이면 유사도 게시글의 AI 처리 후 얼굴 인코딩을 갤러리에 추가
+    'PATH': os.path.join(BASE_DIR, 'cache', 'face_gallery'),  # 갤러리 파일을 저장할 디렉터리
+}
+
+# 얼굴 갤러리 근사 최근접 이웃 인덱스 설정 (pybo.inference.ann)
+AI_ANN_INDEX = {
+    'BACKEND': 'brute',  # 'brute'(정확한 전체 탐색), 'ivf'(NumPy IVF), 'hnsw'(hnswlib 필요)
+    'OPTIONS': {},  # 인덱스 생성 옵션 (예: 'ivf'는 {'nlist': 1024, 'nprobe': 16})
+    'PATH': os.path.join(BASE_DIR, 'cache', 'face_ann_index'),  # build_face_gallery --index로 저장한 인덱스 디렉터리
+    'REBUILD_INACTIVE_RATIO': 0.1,  # 인덱스에 남은 삭제/중복 얼굴이 이 비율을 넘으면 활성 얼굴만으로 인덱스를 다시 만듦
+}
+
+# AI 시스템 계정 캐시 설정 (pybo.ai_user)
+# 계정이 바뀌면 공유 캐시의 버전 키를 올려 다른 웹 워커와 run_jobs 프로세스도 다시 조회하게 함
+AI_USER = {
+    'CACHE_ALIAS': 'default',  # 무효화 버전을 보관할 CACHES 이름 (여러 프로세스가 공유하는 캐시여야 함), None이면 프로세스 안에서만 무효화
+    'MISS_TIMEOUT': 30,  # 계정이 없다는 결과를 보관할 시간(초), 이후 다시 조회
+    'VERSION_CHECK_INTERVAL': 5,  # 공유 캐시의 무효화 버전을 확인하는 간격(초), 다른 프로세스의 변경은 이만큼 늦게 반영
+}
+
+# 게시판 목록 페이지네이션 방식 (pybo.pagination)
+# 'cursor'이면 (create_date, id) 기준 커서 방식(이전/다음 링크), 'page'이면 페이지 번호 방식 (목록 URL에 ?mode=page로 전환 가능)
+# 두 방식 모두 번호 열에는 게시글 ID가 아니라 최신 글부터 매긴 행 번호를 표시
+BOARD_PAGINATION_MODE = 'cursor'
+
+# 목록 화면의 게시글 수 설정 (pybo.counters)
+# 전체 목록은 게시글 작성/삭제 시 증감하는 게시판별 게시글 수를 사용하고, 검색 목록은 아래 설정으로 결과 수를 캐시함
+POST_COUNTER = {
+    'CACHE_ALIAS': 'default',  # 검색 결과 수를 보관할 CACHES 이름, None이면 검색할 때마다 셈
+    'SEARCH_TIMEOUT': 60,  # 검색 결과 수 보관 시간(초), 이 시간 동안은 새 글이 반영되지 않을 수 있음
+    'SEARCH_MAX_COUNT': 10000,  # 검색 결과를 셀 최대 개수, 더 많으면 이 값을 결과 수로 사용
+}
+
+# 게시글 조회수 설정 (pybo.view_counter)
+# 조회수 증가분을 프로세스 메모리에 모았다가 아래 조건 중 하나를 만족하면 한 번의 UPDATE로 기록
+VIEW_COUNTER = {
+    'FLUSH_THRESHOLD': 100,  # 모인 조회수가 이 값 이상이면 기록
+    'FLUSH_INTERVAL': 10.0,  # 마지막 기록 후 이 시간(초)이 지나면 다음 조회 시 기록
+    'HLL_PRECISION': 12,  # 순 방문자 스케치 크기(2^12 = 4KB, 표준 오차 약 1.6%), 운영 중에는 바꾸지 않음
+}
+
+# 게시글 검색 백엔드 (pybo.search)
+# 'auto'이면 sqlite는 FTS5, MySQL은 FULLTEXT(ngram 파서), 그 외 DB는 icontains 검색을 사용
+SEARCH_BACKEND = 'auto'
+
+# 마크다운 변환 캐시 설정 (pybo.markdown_cache)
+MARKDOWN_CACHE = {
+    'MAX_ENTRIES': 2048,  # 프로세스 계층(LRU)에 보관할 최대 변환 결과 수
+    'CACHE_ALIAS': 'default',  # 공유 계층으로 사용할 CACHES 이름, None이면 사용하지 않음
+    'TIMEOUT': 60 * 60 * 24 * 7,  # 공유 계층 보관 시간(초), 7일
+}
+
+# 게시판 페이지 캐시 설정 (pybo.page_cache)
+# 로그인하지 않은 사용자의 목록/상세 페이지와 상세 페이지의 댓글 목록을 캐시하고, 게시글/댓글/추천이 바뀌면 버전을 올려 무효화함
+PAGE_CACHE = {
+    'CACHE_ALIAS': 'default',  # 페이지와 버전을 보관할 CACHES 이름, None이면 캐시하지 않음
+    'TIMEOUT': 60,  # 페이지 보관 시간(초), 이 시간 동안은 캐시된 페이지의 조회수가 이전 값일 수 있음
+}
+
+# AI 백엔드 설정 (pybo.inference.backends)
+# 'remote'는 AI 서버(AI_SERVER)에 이미지를 보내고, 'local'은 ai_system 파이프라인을 작업 프로세스에서 직접 실행,
+# 'pool'은 같은 파이프라인을 추론 워커 프로세스 풀(INFERENCE_POOL)에서 실행
+AI_BACKEND = {
+    'DEFAULT': 'remote',  # 게시판별 설정이 없을 때 사용할 백엔드
+    'BOARDS': {  # 게시판별 백엔드
+        'similarity': 'remote',
+        'detection': 'remote',
+    },
+    'DETECTORS': ['yolo'],  # 'local', 'pool' 백엔드가 사용할 얼굴 탐지기
+}
+
+# 추론 워커 프로세스 풀 설정 (pybo.inference.pool, AI_BACKEND의 'pool' 백엔드)
+# 작업 워커(run_jobs --workers)의 스레드 수를 PROCESSES 이상으로 두어야 모든 추론 워커가 동시에 일함
+INFERENCE_POOL = {
+    'PROCESSES': None,  # 추론 워커 프로세스 수 (None이면 CPU 코어 수)
+    'THREADS_PER_WORKER': 1,  # 워커마다 torch/OpenMP가 사용할 스레드 수 (PROCESSES x THREADS_PER_WORKER <= 코어 수 권장)
+    'MAX_JOBS_PER_WORKER': 500,  # 워커가 이 수만큼 작업을 처리하면 새 워커로 교체
+    'MAX_RSS_MB': 3072,  # 작업을 마친 워커의 메모리(RSS)가 이 값(MB) 이상이면 새 워커로 교체 (None이면 확인 안 함)
+    'MAX_CRASH_RETRIES': 1,  # 워커가 작업 도중 죽었을 때 새 워커에서 다시 실행할 횟수
+    'START_METHOD': 'spawn',  # 워커 시작 방식 ('spawn', 'forkserver', 'fork')
+    'SHARED_MEMORY': True,  # 디코딩한 이미지를 공유 메모리로 넘김 (False이면 경로만 넘기고 워커가 파일을 다시 읽음)
+}
+
+# 탐지기 마이크로 배치 설정 (pybo.inference.batching)
+# 같은 프로세스에서 동시에 들어온 탐지 요청을 짧은 시간 동안 모아 모델을 한 번만 실행 ('local' 백엔드 + 작업 스레드 여러 개일 때 효과)
+AI_DETECTOR_BATCHING = {
+    'ENABLED': False,  # True이면 DETECTORS의 모델 호출을 배치로 모음
+    'DETECTORS': ['yolo', 'yolo_onnx'],  # 배치를 사용할 탐지기 이름 목록
+    'MAX_BATCH_SIZE': 8,  # 한 번에 실행할 최대 이미지 수
+    'MAX_WAIT_MS': 5.0,  # 첫 요청 후 다음 요청을 기다리는 최대 시간(밀리초), 요청 하나의 최대 추가 지연
+    'MODEL_ATTRIBUTE': 'model',  # 탐지기에서 이미지 목록을 한 번에 처리하는 모델 속성 이름 (ultralytics YOLO)
+}
+
+# ONNX 얼굴 탐지기 설정 (pybo.inference.onnx_detector, 탐지기 이름 'yolo_onnx')
+# AI_BACKEND['DETECTORS']를 ['yolo_onnx']로 바꾸면 PyTorch YOLO 대신 onnxruntime으로 CPU에서 실행
+# 모델은 python manage.py export_detector yolov8_l_trump.pt --int8로 생성
+AI_ONNX_DETECTOR = {
+    'MODELS': {  # 설정 클래스 이름 -> ONNX 모델 경로 (없는 설정 클래스에서는 'yolo_onnx'를 사용할 수 없음)
+        'DetectionConfig': os.path.join(BASE_DIR, 'models', 'yolov8_l_trump.int8.onnx'),
+    },
+    'IMAGE_SIZE': 640,  # 내보낼 때 사용한 입력 크기
+    'CONF_THRESHOLD': 0.25,  # 탐지 신뢰도 하한
+    'IOU_THRESHOLD': 0.45,  # NMS에서 겹친 박스를 제거할 IoU 기준
+    'THREADS': None,  # onnxruntime 연산 스레드 수 (None이면 코어 수, 추론 워커 풀에서는 THREADS_PER_WORKER와 맞춤)
+}
+
+# AI 서버 HTTP 클라이언트 설정 (pybo.ai_client)
+AI_SERVER = {
+    'BASE_URL': 'http://52.78.102.210:8007',  # AI 서버 주소
+    'HTTP2': False,  # True이면 HTTP/2 사용 (h2 패키지와 HTTP/2를 지원하는 서버 필요)
+    'MAX_CONNECTIONS': 20,  # 프로세스당 최대 동시 연결 수
+    'MAX_KEEPALIVE_CONNECTIONS': 10,  # 재사용을 위해 열어 둘 최대 연결 수
+    'KEEPALIVE_EXPIRY': 30.0,  # 사용하지 않는 연결을 닫기까지의 시간(초)
+    'TIMEOUT': {'CONNECT': 5.0, 'READ': 30.0, 'WRITE': 30.0, 'POOL': 10.0},  # 단계별 타임아웃(초)
+}
+
+# AI 작업 큐 설정 (pybo.jobs)
+AI_JOB_QUEUE = {
+    'BACKEND': 'thread',  # 'thread'(웹 프로세스 안에서 실행, 개발용) 또는 'sqlite'(run_jobs 워커에서 실행)
+    'WORKERS': 2,  # 'thread' 백엔드의 작업 스레드 수
+    'MAX_RETRIES': 3,  # 작업 실패 시 최대 재시도 횟수
+    'RETRY_BACKOFF': 2.0,  # 첫 재시도까지의 대기 시간(초), 재시도할 때마다 두 배
+    'VISIBILITY_TIMEOUT': 300,  # 'sqlite' 백엔드에서 워커가 완료를 알리지 않으면 다시 실행할 때까지의 시간(초)
+    'POLL_INTERVAL': 1.0,  # 알림을 받지 못했을 때 큐를 다시 확인하는 최대 간격(초)
+    'DB_PATH': os.path.join(BASE_DIR, 'cache', 'jobs.sqlite3'),  # 'sqlite' 백엔드의 작업 파일
+    'NOTIFY_PORT': 8765,  # 'sqlite' 백엔드에서 작업 추가를 워커에 알릴 로컬 UDP 포트
+}
+
 STATIC_URL = '/static/'
 STATICFILES_DIRS = [
     BASE_DIR / 'static', # static 디렉터리를 추가
@@ -37,4 +37,15 @@ DATABASES = {
         'HOST': 'ls-2a4d43344121d1c3ef988f7729390afcdaaf899d.ch42m0omuy1q.ap-northeast-2.rds.amazonaws.com',
         'PORT': '3306',
     }
-}
\ No newline at end of file
+}
+# gunicorn 워커들이 페이지 캐시의 버전을 함께 보도록 파일 캐시 사용 (Redis 등 공유 캐시가 있으면 그 캐시로 바꿈)
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(BASE_DIR, 'cache', 'django'),
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    }
+}
+
+# AI 작업은 gunicorn과 별도로 실행하는 `python manage.py run_jobs` 워커에서 처리
+AI_JOB_QUEUE = {**AI_JOB_QUEUE, 'BACKEND': 'sqlite'}
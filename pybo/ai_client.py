@@ -0,0 +1,151 @@
+import asyncio
+import os
+import threading
+import weakref
+
+import httpx
+
+from .url_patterns import URLS
+
+import logging
+logger = logging.getLogger(URLS['APP_NAME'])  # 로거 설정
+
+"""
+AI 서버 호출에 사용하는 프로세스 단위 HTTP 클라이언트 모듈입니다.
+
+작업마다 httpx.Client를 새로 만들면 요청마다 TCP(및 TLS) 연결을 새로 맺어야 하므로,
+프로세스마다 하나의 클라이언트를 만들어 연결 풀과 keep-alive를 재사용합니다.
+연결 수 제한, 타임아웃, HTTP/2 사용 여부는 settings.AI_SERVER에서 설정합니다.
+
+httpx.Client는 여러 스레드에서 함께 사용할 수 있지만 fork 이후에는 부모의 연결을 공유하면 안 되므로
+프로세스 ID가 바뀌면 클라이언트를 새로 만듭니다. 비동기 클라이언트는 이벤트 루프마다 하나씩 만듭니다.
+"""
+
+PROCESS_IMAGE_PATH = '/process_ai_image/'  # 인물 탐지 (이미지 1장)
+PROCESS_IMAGE_TWO_PATH = '/process_ai_image_two/'  # 얼굴 유사도 비교 (이미지 2장)
+
+DEFAULT_OPTIONS = {
+    'BASE_URL': 'http://52.78.102.210:8007',
+    'HTTP2': False,
+    'MAX_CONNECTIONS': 20,
+    'MAX_KEEPALIVE_CONNECTIONS': 10,
+    'KEEPALIVE_EXPIRY': 30.0,
+    'TIMEOUT': {'CONNECT': 5.0, 'READ': 30.0, 'WRITE': 30.0, 'POOL': 10.0},
+}
+
+_client = None  # 프로세스 단위 동기 클라이언트
+_client_pid = None  # 클라이언트를 만든 프로세스 ID
+_client_lock = threading.Lock()
+_async_clients = weakref.WeakKeyDictionary()  # 이벤트 루프 -> 비동기 클라이언트
+
+
+def get_client_options() -> dict:
+    """
+    settings.AI_SERVER 설정을 기본값과 합쳐 반환합니다.
+
+    Returns
+    -------
+    dict
+        'BASE_URL', 'HTTP2', 'MAX_CONNECTIONS' 등 대문자 키를 가진 설정입니다.
+    """
+    from django.conf import settings
+
+    options = {**DEFAULT_OPTIONS, **getattr(settings, 'AI_SERVER', {})}
+    options['TIMEOUT'] = {**DEFAULT_OPTIONS['TIMEOUT'], **options['TIMEOUT']}
+    return options
+
+
+def build_client_kwargs(options: dict) -> dict:
+    """
+    설정으로 httpx.Client/AsyncClient 생성 인자를 만듭니다.
+
+    HTTP2가 True여도 h2 패키지가 설치되어 있지 않으면 HTTP/1.1을 사용합니다.
+
+    Parameters
+    ----------
+    options : dict
+        get_client_options()의 결과입니다.
+
+    Returns
+    -------
+    dict
+        base_url, http2, limits, timeout 인자입니다.
+    """
+    http2 = options['HTTP2']
+    if http2:
+        try:
+            import h2  # noqa: F401  httpx의 HTTP/2 지원에 필요한 선택 의존성
+        except ImportError:
+            logger.warning("h2 패키지가 없어 AI 서버에 HTTP/1.1로 연결합니다.")
+            http2 = False
+
+    timeout = options['TIMEOUT']
+    return {
+        'base_url': options['BASE_URL'],
+        'http2': http2,
+        'limits': httpx.Limits(
+            max_connections=options['MAX_CONNECTIONS'],
+            max_keepalive_connections=options['MAX_KEEPALIVE_CONNECTIONS'],
+            keepalive_expiry=options['KEEPALIVE_EXPIRY'],
+        ),
+        'timeout': httpx.Timeout(
+            connect=timeout['CONNECT'], read=timeout['READ'], write=timeout['WRITE'], pool=timeout['POOL']
+        ),
+    }
+
+
+def get_ai_client() -> httpx.Client:
+    """
+    AI 서버용 프로세스 단위 httpx.Client를 반환합니다. 요청 경로는 BASE_URL 기준 상대 경로로 지정합니다.
+
+    Returns
+    -------
+    httpx.Client
+        연결 풀을 공유하는 클라이언트입니다. 호출한 쪽에서 닫지 않습니다.
+    """
+    global _client, _client_pid
+    pid = os.getpid()
+    if _client is None or _client_pid != pid:
+        with _client_lock:
+            if _client is None or _client_pid != pid:  # fork 이후에는 부모의 연결을 사용하지 않고 새로 만듦
+                _client = httpx.Client(**build_client_kwargs(get_client_options()))
+                _client_pid = pid
+    return _client
+
+
+def get_async_ai_client() -> httpx.AsyncClient:
+    """
+    현재 이벤트 루프에서 사용할 AI 서버용 httpx.AsyncClient를 반환합니다.
+
+    비동기 클라이언트의 연결은 이벤트 루프에 묶이므로 루프마다 하나씩 만들고, 루프가 사라지면 함께 정리됩니다.
+
+    Returns
+    -------
+    httpx.AsyncClient
+        현재 이벤트 루프의 클라이언트입니다. 호출한 쪽에서 닫지 않습니다.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(**build_client_kwargs(get_client_options()))
+        _async_clients[loop] = client
+    return client
+
+
+def close_ai_clients() -> None:
+    """
+    동기 클라이언트를 닫습니다. 설정을 바꾼 뒤나 프로세스 종료 시 호출합니다.
+
+    비동기 클라이언트는 닫지 않고 목록에서만 제거합니다. (각 이벤트 루프에서 aclose()로 닫아야 함)
+
+    Returns
+    -------
+    None
+    """
+    global _client, _client_pid
+    with _client_lock:
+        if _client is not None and _client_pid == os.getpid():
+            _client.close()
+        _client = None
+        _client_pid = None
+    _async_clients.clear()
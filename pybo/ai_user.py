@@ -0,0 +1,185 @@
+from typing import Optional
+import threading
+import time
+
+from django.contrib.auth.models import User
+from django.db import transaction
+
+from .url_patterns import URLS
+
+import logging
+logger = logging.getLogger(URLS['APP_NAME'])  # 로거 설정
+
+"""
+AI 시스템 계정('AI')을 프로세스 단위로 캐싱하는 모듈입니다.
+
+상세 페이지 조회나 AI 댓글 생성 시마다 User.objects.get(username='AI')를 실행하지 않도록
+한 번 조회한 결과를 프로세스 메모리에 보관합니다.
+
+여러 웹 워커와 run_jobs 프로세스가 같은 계정을 보도록 무효화는 공유 캐시의 버전 키로 전달합니다.
+1. User 행이 저장/삭제되면 signals 모듈에서 clear_ai_user_cache()를 호출해 버전을 올립니다. (커밋 뒤에 한 번 더)
+2. 각 프로세스는 VERSION_CHECK_INTERVAL초마다 한 번만 버전을 확인하고(캐시 조회 한 번), 버전이 바뀌었으면 데이터베이스에서 다시 조회합니다.
+   공유 캐시가 파일 캐시이면 버전 확인도 파일 읽기이므로 매 조회마다 확인하지 않습니다.
+   그 대신 다른 프로세스의 변경은 최대 VERSION_CHECK_INTERVAL초 늦게 반영됩니다. (같은 프로세스의 변경은 시그널로 바로 반영)
+3. 계정이 없다는 결과는 MISS_TIMEOUT초 동안만 보관합니다. (시그널을 거치지 않고 만든 계정도 곧 반영)
+
+여러 프로세스가 같은 버전을 보도록 운영 환경에서는 공유 캐시(파일, Redis, Memcached 등)를 사용해야 합니다.
+"""
+
+AI_USERNAME = 'AI'  # AI 시스템 계정의 사용자 이름
+VERSION_KEY = 'pybo:ai_user:version'  # 공유 캐시의 무효화 버전 키
+
+DEFAULT_OPTIONS = {
+    'CACHE_ALIAS': 'default',
+    'MISS_TIMEOUT': 30,
+    'VERSION_CHECK_INTERVAL': 5,
+}
+
+_MISSING = object()  # 아직 조회하지 않았음을 나타내는 값 (None은 '계정 없음'을 의미)
+_ai_user_cache = {'user': _MISSING, 'version': None, 'expires': None, 'checked': None}  # 프로세스 단위 캐시
+_lock = threading.Lock()  # 여러 스레드가 동시에 조회하지 않도록 보호
+
+
+def _get_options() -> dict:
+    from django.conf import settings
+
+    return {**DEFAULT_OPTIONS, **getattr(settings, 'AI_USER', {})}
+
+
+def _shared_cache(options: dict):
+    from django.core.cache import caches
+
+    return caches[options['CACHE_ALIAS']] if options['CACHE_ALIAS'] else None
+
+
+def _current_version(options: dict):
+    """
+    공유 캐시의 현재 버전을 반환합니다. 버전이 없으면 현재 시각(마이크로초)으로 만듭니다.
+    """
+    cache = _shared_cache(options)
+    if cache is None:
+        return None
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, time.time_ns() // 1000, None)  # 다른 프로세스가 먼저 만들었으면 그 값을 사용
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def get_ai_user() -> Optional[User]:
+    """
+    AI 시스템 계정을 반환합니다.
+
+    마지막 버전 확인 후 VERSION_CHECK_INTERVAL초가 지나지 않았으면 공유 캐시도 보지 않고 캐시된 값을 반환합니다.
+    지났으면 공유 캐시의 버전을 확인해, 그대로이면 캐시된 값을 반환하고 바뀌었으면 데이터베이스를 다시 조회합니다.
+    계정이 없는 경우(None)는 MISS_TIMEOUT초 동안만 캐싱합니다.
+
+    Returns
+    -------
+    User or None
+        AI 계정 객체입니다. 계정이 없으면 None을 반환합니다.
+    """
+    options = _get_options()
+    checked = _ai_user_cache['checked']  # 다른 스레드가 비울 수 있으므로 한 번만 읽음
+    if checked is not None and time.monotonic() - checked < options['VERSION_CHECK_INTERVAL'] and \
+            _is_fresh(_ai_user_cache, _ai_user_cache['version']):
+        return _ai_user_cache['user']  # 최근에 버전을 확인했음
+
+    version = _current_version(options)
+    if _is_fresh(_ai_user_cache, version):
+        _ai_user_cache['checked'] = time.monotonic()
+        return _ai_user_cache['user']
+
+    with _lock:
+        if _is_fresh(_ai_user_cache, version):  # 다른 스레드가 먼저 채운 경우
+            return _ai_user_cache['user']
+        user = User.objects.filter(username=AI_USERNAME).first()
+        if user is None:
+            logger.error(f"슈퍼유저 '{AI_USERNAME}'가 존재하지 않습니다.")
+        _ai_user_cache.update(
+            user=user,
+            version=version,
+            expires=None if user is not None else time.monotonic() + options['MISS_TIMEOUT'],
+            checked=time.monotonic(),
+        )
+    return user
+
+
+def _is_fresh(entry: dict, version) -> bool:
+    """
+    캐시된 값이 현재 버전이고, 계정 없음 결과라면 보관 시간이 지나지 않았는지 확인합니다.
+    """
+    if entry['user'] is _MISSING or entry['version'] != version:
+        return False
+    return entry['expires'] is None or time.monotonic() < entry['expires']
+
+
+def get_ai_user_id() -> Optional[int]:
+    """
+    AI 시스템 계정의 ID를 반환합니다.
+
+    Returns
+    -------
+    int or None
+        AI 계정의 ID입니다. 계정이 없으면 None을 반환합니다.
+    """
+    user = get_ai_user()
+    return user.pk if user is not None else None
+
+
+def is_ai_user(user) -> bool:
+    """
+    주어진 사용자가 AI 시스템 계정인지 ID로 비교합니다.
+
+    Parameters
+    ----------
+    user : User or AnonymousUser
+        비교할 사용자입니다.
+
+    Returns
+    -------
+    bool
+        AI 계정이면 True, 아니면 False입니다.
+    """
+    ai_user_id = get_ai_user_id()
+    return ai_user_id is not None and user.pk == ai_user_id
+
+
+def peek_ai_user_id() -> Optional[int]:
+    """
+    데이터베이스를 조회하지 않고 현재 캐시된 AI 계정의 ID를 반환합니다.
+
+    Returns
+    -------
+    int or None
+        캐시된 AI 계정의 ID입니다. 캐시가 비어 있거나 계정이 없으면 None을 반환합니다.
+    """
+    return getattr(_ai_user_cache['user'], 'pk', None)
+
+
+def clear_ai_user_cache() -> None:
+    """
+    모든 프로세스의 캐시된 AI 계정을 무효화합니다. 다음 get_ai_user() 호출 시 다시 조회합니다.
+
+    공유 버전을 지금 올리고, 진행 중인 트랜잭션이 커밋된 뒤 한 번 더 올립니다.
+    (커밋 전에 다른 프로세스가 이전 행을 새 버전으로 캐싱할 수 있으므로)
+
+    Returns
+    -------
+    None
+    """
+    _clear()
+    transaction.on_commit(_clear)
+
+
+def _clear() -> None:
+    with _lock:
+        _ai_user_cache.update(user=_MISSING, version=None, expires=None, checked=None)
+
+    cache = _shared_cache(_get_options())
+    if cache is None:
+        return
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:  # 버전이 아직 없거나 캐시에서 밀려남
+        cache.set(VERSION_KEY, time.time_ns() // 1000, None)
@@ -3,3 +3,6 @@ from .url_patterns import URLS
 
 class PyboConfig(AppConfig):
     name = URLS['APP_NAME']
+
+    def ready(self):
+        from . import signals  # noqa: F401  시그널 수신기 등록
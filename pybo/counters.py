@@ -0,0 +1,337 @@
+import hashlib
+import threading
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from .url_patterns import URLS
+
+import logging
+logger = logging.getLogger(URLS['APP_NAME'])  # 로거 설정
+
+"""
+게시글 목록의 전체 글 수를 제공하는 카운터 모듈입니다.
+
+목록 화면은 페이지 링크와 게시글 번호를 계산하기 위해 요청마다 COUNT(*)를 실행했는데,
+게시글이 많아지면 이 쿼리가 목록 조회보다 느려집니다. (검색 시에는 DISTINCT가 붙어 더 느림)
+
+1. 전체 목록: 게시판별 게시글 수(PostCountModel)를 게시글 작성/삭제 시 1씩 증감하여 보관합니다. (항상 정확한 값)
+2. 검색 목록: COUNT 결과를 조건(SQL)별로 캐시에 SEARCH_TIMEOUT초 동안 보관합니다. (그 동안은 오래된 값일 수 있음)
+   SEARCH_MAX_COUNT개까지만 세므로 결과가 그보다 많으면 SEARCH_MAX_COUNT를 추정값으로 사용합니다.
+
+게시글/댓글의 추천 수(vote_count)와 댓글 수(comment_count) 컬럼도 이 모듈의 adjust_count()로
+UPDATE ... SET 컬럼 = 컬럼 + n 형태로 갱신하고, repair_counts()로 실제 값과 어긋난 행을 고칩니다.
+"""
+
+DEFAULT_OPTIONS = {
+    'CACHE_ALIAS': 'default',
+    'SEARCH_TIMEOUT': 60,
+    'SEARCH_MAX_COUNT': 10000,
+}
+
+
+class PostCounter:
+    """
+    게시판별 전체 게시글 수와 검색 결과 수를 제공하는 카운터입니다.
+
+    Attributes
+    ----------
+    cache_alias : str or None
+        검색 결과 수를 보관할 settings.CACHES의 이름입니다. None이면 검색할 때마다 셉니다.
+    search_timeout : int
+        검색 결과 수를 캐시에 보관하는 시간(초)입니다. 이 시간 동안은 새 글이 반영되지 않을 수 있습니다.
+    search_max_count : int or None
+        검색 결과를 셀 최대 개수입니다. None이면 모두 셉니다.
+
+    Methods
+    -------
+    total(model):
+        게시판의 전체 게시글 수를 반환합니다.
+    increment(model, delta):
+        게시판의 게시글 수를 delta만큼 증감합니다.
+    recount(model):
+        COUNT(*)로 게시판의 게시글 수를 다시 계산합니다.
+    filtered(queryset):
+        검색 조건이 적용된 QuerySet의 결과 수(캐시 또는 추정값)를 반환합니다.
+    """
+
+    def __init__(self, cache_alias: str = 'default', search_timeout: int = 60, search_max_count: int = 10000):
+        self.cache_alias = cache_alias
+        self.search_timeout = search_timeout
+        self.search_max_count = search_max_count
+
+    def total(self, model) -> int:
+        """
+        게시판의 전체 게시글 수를 반환합니다. 아직 기록이 없으면 COUNT(*)로 계산하여 기록합니다.
+
+        Parameters
+        ----------
+        model : Model class
+            게시글 모델 클래스입니다.
+
+        Returns
+        -------
+        int
+            전체 게시글 수입니다.
+        """
+        from .models import PostCountModel
+
+        count = PostCountModel.objects.filter(label=model._meta.label_lower).values_list('count', flat=True).first()
+        if count is None:
+            count = self.recount(model)
+        return count
+
+    def increment(self, model, delta: int = 1) -> None:
+        """
+        게시판의 게시글 수를 delta만큼 증감합니다.
+
+        UPDATE ... SET count = count + delta로 처리하므로 여러 프로세스가 동시에 호출해도 값이 어긋나지 않습니다.
+        아직 기록이 없으면 COUNT(*)로 새로 계산합니다. (이번에 작성/삭제한 글이 이미 반영되어 있음)
+
+        Parameters
+        ----------
+        model : Model class
+            게시글 모델 클래스입니다.
+        delta : int
+            증감할 값입니다. 작성 시 1, 삭제 시 -1입니다.
+
+        Returns
+        -------
+        None
+        """
+        from .models import PostCountModel
+
+        updated = PostCountModel.objects.filter(label=model._meta.label_lower).update(count=F('count') + delta)
+        if not updated:
+            self.recount(model)
+
+    def recount(self, model) -> int:
+        """
+        COUNT(*)로 게시판의 게시글 수를 다시 계산하여 기록합니다.
+
+        시그널을 거치지 않는 bulk_create 등으로 값이 어긋났을 때 사용합니다.
+
+        Parameters
+        ----------
+        model : Model class
+            게시글 모델 클래스입니다.
+
+        Returns
+        -------
+        int
+            다시 계산한 게시글 수입니다.
+        """
+        from .models import PostCountModel
+
+        count = model.objects.count()
+        try:
+            with transaction.atomic():
+                PostCountModel.objects.update_or_create(label=model._meta.label_lower, defaults={'count': count})
+        except IntegrityError:  # 다른 요청이 동시에 기록을 만든 경우
+            PostCountModel.objects.filter(label=model._meta.label_lower).update(count=count)
+        logger.info(f"게시글 수 다시 계산: {model._meta.label_lower} = {count}")
+        return count
+
+    def filtered(self, queryset) -> int:
+        """
+        검색 조건이 적용된 QuerySet의 결과 수를 반환합니다.
+
+        같은 조건(SQL)의 결과 수는 search_timeout초 동안 캐시된 값을 사용하고,
+        결과가 search_max_count개보다 많으면 search_max_count를 반환합니다. (LIMIT을 건 COUNT)
+
+        Parameters
+        ----------
+        queryset : QuerySet
+            검색 조건이 적용된 게시글 QuerySet입니다.
+
+        Returns
+        -------
+        int
+            결과 수(또는 추정값)입니다.
+        """
+        cache = self._cache()
+        key = self.make_key(queryset)
+        count = cache.get(key) if cache is not None else None
+        if count is None:
+            counted = queryset.order_by()
+            if self.search_max_count:
+                counted = counted[:self.search_max_count]  # 최대 개수까지만 셈
+            count = counted.count()
+            if cache is not None:
+                cache.set(key, count, self.search_timeout)
+        return count
+
+    @staticmethod
+    def make_key(queryset) -> str:
+        """
+        QuerySet의 SQL로 검색 결과 수의 캐시 키를 만듭니다.
+        """
+        sql, params = queryset.order_by().query.sql_with_params()
+        digest = hashlib.sha1(f"{sql}|{params!r}".encode('utf-8')).hexdigest()
+        return f"pybo:count:{queryset.model._meta.label_lower}:{digest}"
+
+    def _cache(self):
+        """
+        검색 결과 수를 보관할 캐시를 반환합니다. 설정되지 않았으면 None을 반환합니다.
+        """
+        if not self.cache_alias:
+            return None
+        from django.core.cache import caches
+
+        return caches[self.cache_alias]
+
+
+_post_counter = None  # 프로세스 단위 카운터 (처음 사용할 때 settings로 생성)
+_post_counter_lock = threading.Lock()
+
+
+def get_post_counter() -> PostCounter:
+    """
+    settings.POST_COUNTER 설정으로 만든 프로세스 단위 카운터를 반환합니다.
+
+    Returns
+    -------
+    PostCounter
+        프로세스 단위 카운터입니다.
+    """
+    global _post_counter
+    if _post_counter is None:
+        with _post_counter_lock:
+            if _post_counter is None:
+                from django.conf import settings
+
+                options = {**DEFAULT_OPTIONS, **getattr(settings, 'POST_COUNTER', {})}
+                _post_counter = PostCounter(
+                    cache_alias=options['CACHE_ALIAS'],
+                    search_timeout=options['SEARCH_TIMEOUT'],
+                    search_max_count=options['SEARCH_MAX_COUNT'],
+                )
+    return _post_counter
+
+
+def adjust_count(model, pks, field: str, delta: int) -> int:
+    """
+    게시글/댓글의 저장된 개수 컬럼(vote_count, comment_count)을 delta만큼 증감합니다.
+
+    UPDATE ... SET field = field + delta로 처리하므로 여러 요청이 동시에 호출해도 값이 어긋나지 않습니다.
+
+    Parameters
+    ----------
+    model : Model class
+        게시글 또는 댓글 모델 클래스입니다.
+    pks : iterable
+        갱신할 객체의 ID 목록입니다.
+    field : str
+        갱신할 컬럼 이름입니다.
+    delta : int
+        증감할 값입니다.
+
+    Returns
+    -------
+    int
+        갱신된 행 수입니다.
+    """
+    pks = list(pks)
+    if not pks or not delta:
+        return 0
+    return model.objects.filter(pk__in=pks).update(**{field: F(field) + delta})
+
+
+def recount_votes(model, pks) -> int:
+    """
+    게시글/댓글의 vote_count를 중간 테이블의 실제 추천 행 수로 다시 계산합니다.
+
+    voter.add()/remove()는 실제로 추가/삭제된 행이 아니라 요청한 ID 전체를 시그널로 넘기므로(추천하지 않은 사용자의 remove(),
+    동시에 실행된 add() 포함) 증감 대신 다시 셉니다. 대상 행만 인덱스로 세므로 비용은 추천 수에 비례합니다.
+
+    Parameters
+    ----------
+    model : Model class
+        게시글 또는 댓글 모델 클래스입니다.
+    pks : iterable
+        다시 셀 객체의 ID 목록입니다.
+
+    Returns
+    -------
+    int
+        갱신된 행 수입니다.
+    """
+    pks = list(pks)
+    if not pks:
+        return 0
+    return model.objects.filter(pk__in=pks).update(vote_count=count_expressions(model)['vote_count'])
+
+
+def count_expressions(model) -> dict:
+    """
+    모델의 저장된 개수 컬럼마다 실제 개수를 계산하는 서브쿼리 식을 반환합니다.
+
+    마이그레이션의 과거 모델(apps.get_model)에도 사용할 수 있도록 모델 메타 정보만 사용합니다.
+
+    Parameters
+    ----------
+    model : Model class
+        게시글 또는 댓글 모델 클래스입니다.
+
+    Returns
+    -------
+    dict
+        컬럼 이름 -> 실제 개수 식입니다. (게시글: vote_count, comment_count / 댓글: vote_count)
+    """
+    voter = model._meta.get_field('voter')
+    through = voter.remote_field.through
+    source = voter.m2m_field_name()  # 중간 테이블에서 이 모델을 가리키는 컬럼 이름
+
+    expressions = {'vote_count': _count_subquery(through, source)}
+    if any(field.name == 'comment_count' for field in model._meta.concrete_fields):
+        comments = model._meta.get_field('comments')
+        expressions['comment_count'] = _count_subquery(comments.related_model, comments.field.name)
+    return expressions
+
+
+def _count_subquery(related_model, fk_name: str):
+    """
+    related_model에서 fk_name이 바깥 행을 가리키는 행 수를 세는 서브쿼리 식을 만듭니다.
+    """
+    counted = (
+        related_model.objects.filter(**{fk_name: OuterRef('pk')})
+        .order_by()
+        .values(fk_name)
+        .annotate(total=Count('pk'))
+        .values('total')
+    )
+    return Coalesce(Subquery(counted, output_field=IntegerField()), Value(0))
+
+
+def repair_counts(model, dry_run: bool = False, batch_size: int = 1000) -> int:
+    """
+    저장된 개수 컬럼이 실제 개수와 다른 행을 찾아 고칩니다.
+
+    시그널을 거치지 않는 bulk 작업이나 중간에 실패한 요청으로 값이 어긋났을 때 사용합니다.
+
+    Parameters
+    ----------
+    model : Model class
+        게시글 또는 댓글 모델 클래스입니다.
+    dry_run : bool
+        True이면 어긋난 행 수만 세고 고치지 않습니다.
+    batch_size : int
+        한 번의 UPDATE로 고칠 최대 행 수입니다.
+
+    Returns
+    -------
+    int
+        실제 개수와 달랐던 행 수입니다.
+    """
+    expressions = count_expressions(model)
+    annotations = {f'actual_{field}': expression for field, expression in expressions.items()}
+    drift = Q()
+    for field in expressions:
+        drift |= ~Q(**{field: F(f'actual_{field}')})
+
+    drifted = list(model.objects.annotate(**annotations).filter(drift).values_list('pk', flat=True))
+    if not dry_run:
+        for start in range(0, len(drifted), batch_size):
+            model.objects.filter(pk__in=drifted[start:start + batch_size]).update(**expressions)
+    return len(drifted)
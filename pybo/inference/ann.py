@@ -0,0 +1,593 @@
+import json
+import os
+import threading
+
+import numpy as np
+
+from .gallery import l2_normalize
+from ..url_patterns import URLS
+
+import logging
+logger = logging.getLogger(URLS['APP_NAME'])  # 로거 설정
+
+"""
+얼굴 인코딩용 근사 최근접 이웃(ANN) 인덱스 모듈입니다.
+
+얼굴 인코딩이 수십만 개를 넘으면 전체 행렬을 훑는 방식(brute force)도 느려지므로,
+교체 가능한 인덱스를 제공합니다. 모든 인덱스는 L2 정규화된 벡터의 내적(코사인 유사도)으로 비교하며,
+벡터 ID로는 FaceGallery의 행 번호를 사용합니다.
+
+1. 'brute' : 정확한 전체 탐색 (기준값, 기본값)
+2. 'ivf'   : 순수 NumPy로 구현한 IVF(역색인) 인덱스. 구형 k-means로 nlist개 군집을 만들고 nprobe개 군집만 탐색
+3. 'hnsw'  : hnswlib가 설치된 경우 사용할 수 있는 HNSW 그래프 인덱스
+
+brute/ivf 인덱스는 .npy 파일로 저장하고 워커 시작 시 메모리 맵(mmap)으로 불러오므로
+여러 워커가 같은 파일을 페이지 캐시로 공유합니다. 저장 이후 추가된 벡터는 메모리의 delta 영역에 보관합니다.
+"""
+
+
+class BaseAnnIndex:
+    """
+    ANN 인덱스의 공통 인터페이스입니다.
+
+    Attributes
+    ----------
+    dim : int
+        벡터 차원입니다.
+    ntotal : int
+        인덱스에 들어 있는 벡터 수입니다.
+
+    Methods
+    -------
+    build(vectors, ids):
+        벡터 전체로 인덱스를 새로 만듭니다.
+    add(vectors, ids):
+        벡터를 인덱스에 추가합니다.
+    search(query, k):
+        질의 벡터와 가장 가까운 k개 벡터의 ID와 유사도를 반환합니다.
+    save(directory) / load(directory):
+        인덱스를 파일로 저장하거나 불러옵니다.
+    """
+
+    name = NotImplemented  # 인덱스 이름 (하위 클래스에서 설정 필요)
+
+    def __init__(self, dim: int):
+        self.dim = dim
+        self._lock = threading.Lock()
+
+    @property
+    def ntotal(self) -> int:
+        raise NotImplementedError
+
+    def build(self, vectors, ids=None) -> None:
+        raise NotImplementedError
+
+    def add(self, vectors, ids=None) -> None:
+        raise NotImplementedError
+
+    def search(self, query, k: int = 10):
+        raise NotImplementedError
+
+    def save(self, directory: str) -> None:
+        raise NotImplementedError
+
+    @classmethod
+    def load(cls, directory: str) -> 'BaseAnnIndex':
+        raise NotImplementedError
+
+    def _prepare(self, vectors, ids):
+        """
+        벡터를 L2 정규화하고, ID가 없으면 현재 벡터 수부터 이어지는 번호를 붙입니다.
+        """
+        vectors = l2_normalize(np.atleast_2d(vectors))
+        if vectors.shape[1] != self.dim:
+            raise ValueError(f"벡터 차원이 다릅니다. (인덱스: {self.dim}, 입력: {vectors.shape[1]})")
+        if ids is None:
+            ids = np.arange(self.ntotal, self.ntotal + vectors.shape[0], dtype=np.int64)
+        return vectors, np.asarray(ids, dtype=np.int64)
+
+    def _write_meta(self, directory: str, **extra) -> None:
+        """
+        인덱스 종류와 설정을 meta.json에 기록합니다.
+        """
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, 'meta.json'), 'w') as f:
+            json.dump({'name': self.name, 'dim': self.dim, **extra}, f)
+
+
+def _top_k(scores: np.ndarray, ids: np.ndarray, k: int):
+    """
+    유사도가 가장 높은 k개의 (ID, 유사도)를 내림차순으로 반환합니다.
+    """
+    k = min(k, scores.shape[0])
+    if k <= 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+    top = np.argpartition(-scores, k - 1)[:k]
+    top = top[np.argsort(-scores[top])]
+    return ids[top], scores[top]
+
+
+class BruteForceIndex(BaseAnnIndex):
+    """
+    모든 벡터와 내적을 계산하는 정확한 인덱스입니다. ANN 인덱스의 기준값 및 대체 수단으로 사용합니다.
+    """
+
+    name = 'brute'
+
+    def __init__(self, dim: int):
+        super().__init__(dim)
+        self._base_vectors = np.zeros((0, dim), dtype=np.float32)  # 저장 파일에서 불러온(mmap) 벡터
+        self._base_ids = np.zeros(0, dtype=np.int64)
+        self._delta_vectors = []  # 불러온 뒤 추가된 벡터
+        self._delta_ids = []
+
+    @property
+    def ntotal(self) -> int:
+        return self._base_ids.shape[0] + sum(ids.shape[0] for ids in self._delta_ids)
+
+    def _all(self):
+        """
+        저장된 벡터와 delta 벡터를 합쳐 반환합니다.
+        """
+        if not self._delta_ids:
+            return self._base_vectors, self._base_ids
+        return (np.concatenate([self._base_vectors, *self._delta_vectors]),
+                np.concatenate([self._base_ids, *self._delta_ids]))
+
+    def build(self, vectors, ids=None) -> None:
+        with self._lock:
+            self._base_vectors = np.zeros((0, self.dim), dtype=np.float32)
+            self._base_ids = np.zeros(0, dtype=np.int64)
+            self._delta_vectors, self._delta_ids = [], []
+            self._base_vectors, self._base_ids = self._prepare(vectors, ids)
+
+    def add(self, vectors, ids=None) -> None:
+        with self._lock:
+            vectors, ids = self._prepare(vectors, ids)
+            self._delta_vectors.append(vectors)
+            self._delta_ids.append(ids)
+            if len(self._delta_ids) > 64:  # 조각이 많아지면 delta 영역끼리 합침 (mmap으로 불러온 벡터는 그대로 둠)
+                self._delta_vectors = [np.concatenate(self._delta_vectors)]
+                self._delta_ids = [np.concatenate(self._delta_ids)]
+
+    def search(self, query, k: int = 10):
+        query = l2_normalize(np.ravel(query))
+        with self._lock:
+            parts = [(self._base_vectors, self._base_ids), *zip(self._delta_vectors, self._delta_ids)]
+            scores = np.concatenate([vectors @ query for vectors, _ in parts])  # 벡터를 복사하지 않고 유사도만 합침
+            ids = np.concatenate([ids for _, ids in parts])
+        return _top_k(scores, ids, k)
+
+    def save(self, directory: str) -> None:
+        with self._lock:
+            vectors, ids = self._all()
+            self._write_meta(directory)
+            np.save(os.path.join(directory, 'vectors.npy'), vectors)
+            np.save(os.path.join(directory, 'ids.npy'), ids)
+
+    @classmethod
+    def load(cls, directory: str) -> 'BruteForceIndex':
+        with open(os.path.join(directory, 'meta.json')) as f:
+            meta = json.load(f)
+        index = cls(meta['dim'])
+        index._base_vectors = np.load(os.path.join(directory, 'vectors.npy'), mmap_mode='r')
+        index._base_ids = np.load(os.path.join(directory, 'ids.npy'), mmap_mode='r')
+        return index
+
+
+class IVFIndex(BaseAnnIndex):
+    """
+    순수 NumPy로 구현한 IVF(Inverted File) 인덱스입니다.
+
+    구형(spherical) k-means로 nlist개의 중심점을 학습하고, 각 벡터를 가장 가까운 중심점의 목록에 넣습니다.
+    검색 시에는 질의와 가까운 nprobe개 목록만 탐색하므로 nprobe를 늘리면 재현율이, 줄이면 속도가 올라갑니다.
+
+    벡터는 목록 순서대로 정렬된 연속 배열(vectors, ids)과 목록 시작 위치(offsets)로 저장되며,
+    저장 이후 추가된 벡터는 목록 번호와 함께 delta 영역에 보관됩니다.
+
+    Attributes
+    ----------
+    nlist : int
+        군집(목록) 수입니다.
+    nprobe : int
+        검색 시 탐색할 목록 수입니다.
+    """
+
+    name = 'ivf'
+
+    def __init__(self, dim: int, nlist: int = 1024, nprobe: int = 16, train_iterations: int = 10, seed: int = 0):
+        super().__init__(dim)
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.train_iterations = train_iterations
+        self.seed = seed
+        self.centroids = None  # (nlist, dim) 중심점
+        self._vectors = np.zeros((0, dim), dtype=np.float32)  # 목록 순서대로 정렬된 벡터
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._offsets = np.zeros(1, dtype=np.int64)  # 목록 i는 [offsets[i], offsets[i+1]) 구간
+        self._delta_vectors = []
+        self._delta_ids = []
+        self._delta_lists = []
+
+    @property
+    def ntotal(self) -> int:
+        return self._ids.shape[0] + sum(ids.shape[0] for ids in self._delta_ids)
+
+    def train(self, vectors) -> None:
+        """
+        구형 k-means로 중심점을 학습합니다. 벡터가 많으면 일부(목록당 최대 64개)만 사용합니다.
+        """
+        vectors = l2_normalize(np.atleast_2d(vectors))
+        rng = np.random.default_rng(self.seed)
+        nlist = min(self.nlist, vectors.shape[0])
+        sample_size = min(vectors.shape[0], nlist * 64)
+        sample = vectors[rng.choice(vectors.shape[0], sample_size, replace=False)]
+
+        centroids = sample[rng.choice(sample_size, nlist, replace=False)].copy()
+        for _ in range(self.train_iterations):
+            assignments = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, sample)
+            empty = ~np.bincount(assignments, minlength=nlist).astype(bool)
+            sums[empty] = centroids[empty]  # 빈 군집은 이전 중심점 유지
+            centroids = l2_normalize(sums)
+        self.centroids = centroids
+        self.nlist = nlist
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        """
+        각 벡터를 가장 가까운 중심점의 목록 번호로 배정합니다.
+        """
+        return np.argmax(vectors @ self.centroids.T, axis=1)
+
+    def build(self, vectors, ids=None) -> None:
+        vectors = l2_normalize(np.atleast_2d(vectors))
+        self.train(vectors)
+        with self._lock:
+            self._vectors = np.zeros((0, self.dim), dtype=np.float32)
+            self._ids = np.zeros(0, dtype=np.int64)
+            self._offsets = np.zeros(self.nlist + 1, dtype=np.int64)
+            self._delta_vectors, self._delta_ids, self._delta_lists = [], [], []
+            vectors, ids = self._prepare(vectors, ids)
+            self._set_sorted(vectors, ids, self._assign(vectors))
+
+    def _set_sorted(self, vectors, ids, lists) -> None:
+        """
+        벡터를 목록 번호 순서로 정렬하여 연속 배열에 저장합니다.
+        """
+        order = np.argsort(lists, kind='stable')
+        self._vectors = np.ascontiguousarray(vectors[order])
+        self._ids = np.ascontiguousarray(ids[order])
+        self._offsets = np.concatenate([[0], np.cumsum(np.bincount(lists, minlength=self.nlist))]).astype(np.int64)
+
+    def add(self, vectors, ids=None) -> None:
+        if self.centroids is None:
+            raise ValueError("IVF 인덱스를 먼저 build() 해야 합니다.")
+        with self._lock:
+            vectors, ids = self._prepare(vectors, ids)
+            self._delta_vectors.append(vectors)
+            self._delta_ids.append(ids)
+            self._delta_lists.append(self._assign(vectors))
+
+    def search(self, query, k: int = 10, nprobe: int = None):
+        query = l2_normalize(np.ravel(query))
+        nprobe = min(nprobe or self.nprobe, self.nlist)
+
+        with self._lock:
+            probes = np.argpartition(-(self.centroids @ query), nprobe - 1)[:nprobe]  # 가까운 nprobe개 목록
+            score_parts, id_parts = [], []
+            for probe in probes:
+                start, end = self._offsets[probe], self._offsets[probe + 1]
+                if end > start:
+                    score_parts.append(self._vectors[start:end] @ query)
+                    id_parts.append(self._ids[start:end])
+            for vectors, ids, lists in zip(self._delta_vectors, self._delta_ids, self._delta_lists):
+                mask = np.isin(lists, probes)
+                if mask.any():
+                    score_parts.append(vectors[mask] @ query)
+                    id_parts.append(ids[mask])
+
+        if not score_parts:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        return _top_k(np.concatenate(score_parts), np.concatenate(id_parts), k)
+
+    def save(self, directory: str) -> None:
+        with self._lock:
+            if self._delta_ids:  # delta 영역을 정렬된 배열에 합친 뒤 저장
+                lists = np.repeat(np.arange(self.nlist), np.diff(self._offsets))
+                self._set_sorted(
+                    np.concatenate([self._vectors, *self._delta_vectors]),
+                    np.concatenate([self._ids, *self._delta_ids]),
+                    np.concatenate([lists, *self._delta_lists]),
+                )
+                self._delta_vectors, self._delta_ids, self._delta_lists = [], [], []
+            self._write_meta(directory, nlist=self.nlist, nprobe=self.nprobe)
+            np.save(os.path.join(directory, 'centroids.npy'), self.centroids)
+            np.save(os.path.join(directory, 'vectors.npy'), self._vectors)
+            np.save(os.path.join(directory, 'ids.npy'), self._ids)
+            np.save(os.path.join(directory, 'offsets.npy'), self._offsets)
+
+    @classmethod
+    def load(cls, directory: str) -> 'IVFIndex':
+        with open(os.path.join(directory, 'meta.json')) as f:
+            meta = json.load(f)
+        index = cls(meta['dim'], nlist=meta['nlist'], nprobe=meta['nprobe'])
+        index.centroids = np.load(os.path.join(directory, 'centroids.npy'))
+        index._vectors = np.load(os.path.join(directory, 'vectors.npy'), mmap_mode='r')
+        index._ids = np.load(os.path.join(directory, 'ids.npy'), mmap_mode='r')
+        index._offsets = np.load(os.path.join(directory, 'offsets.npy'))
+        return index
+
+
+class HNSWIndex(BaseAnnIndex):
+    """
+    hnswlib의 HNSW 그래프 인덱스를 감싼 인덱스입니다. hnswlib가 설치된 경우에만 사용할 수 있습니다.
+
+    hnswlib 파일 형식은 메모리 맵을 지원하지 않으므로 load() 시 인덱스 전체를 메모리로 읽습니다.
+    """
+
+    name = 'hnsw'
+
+    def __init__(self, dim: int, max_elements: int = 100000, m: int = 16, ef_construction: int = 200, ef: int = 64):
+        super().__init__(dim)
+        import hnswlib  # 선택 의존성
+
+        self.ef = ef
+        self._index = hnswlib.Index(space='ip', dim=dim)  # 정규화된 벡터의 내적 = 코사인 유사도
+        self._index.init_index(max_elements=max_elements, M=m, ef_construction=ef_construction)
+        self._index.set_ef(ef)
+
+    @property
+    def ntotal(self) -> int:
+        return self._index.get_current_count()
+
+    def build(self, vectors, ids=None) -> None:
+        self.add(vectors, ids)
+
+    def add(self, vectors, ids=None) -> None:
+        with self._lock:
+            vectors, ids = self._prepare(vectors, ids)
+            needed = self.ntotal + vectors.shape[0]
+            if needed > self._index.get_max_elements():
+                self._index.resize_index(max(needed, self._index.get_max_elements() * 2))
+            self._index.add_items(vectors, ids)
+
+    def search(self, query, k: int = 10):
+        query = l2_normalize(np.ravel(query))
+        k = min(k, self.ntotal)
+        if k <= 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        with self._lock:
+            labels, distances = self._index.knn_query(query, k=k)
+        return labels[0].astype(np.int64), (1.0 - distances[0]).astype(np.float32)  # ip 거리 = 1 - 내적
+
+    def save(self, directory: str) -> None:
+        with self._lock:
+            self._write_meta(directory, ef=self.ef)
+            self._index.save_index(os.path.join(directory, 'hnsw.bin'))
+
+    @classmethod
+    def load(cls, directory: str) -> 'HNSWIndex':
+        with open(os.path.join(directory, 'meta.json')) as f:
+            meta = json.load(f)
+        index = cls(meta['dim'], max_elements=1, ef=meta['ef'])
+        index._index.load_index(os.path.join(directory, 'hnsw.bin'))
+        index._index.set_ef(index.ef)
+        return index
+
+
+class AnnIndexFactory:
+    """
+    이름으로 ANN 인덱스를 생성하거나 불러오는 팩토리입니다.
+
+    Methods
+    -------
+    create(name, dim, **options):
+        인덱스를 생성합니다. hnswlib가 없으면 'hnsw' 대신 'brute'를 사용합니다.
+    load(directory):
+        meta.json에 기록된 종류의 인덱스를 불러옵니다.
+    """
+
+    INDEX_CLASSES = {
+        BruteForceIndex.name: BruteForceIndex,
+        IVFIndex.name: IVFIndex,
+        HNSWIndex.name: HNSWIndex,
+    }
+
+    @classmethod
+    def create(cls, name: str, dim: int, **options) -> BaseAnnIndex:
+        if name not in cls.INDEX_CLASSES:
+            raise ValueError(f"지원하지 않는 인덱스입니다: {name}")
+        try:
+            return cls.INDEX_CLASSES[name](dim, **options)
+        except ImportError:
+            logger.warning(f"{name} 인덱스를 사용할 수 없어 brute 인덱스로 대체합니다.")
+            return BruteForceIndex(dim)
+
+    @classmethod
+    def load(cls, directory: str) -> BaseAnnIndex:
+        with open(os.path.join(directory, 'meta.json')) as f:
+            name = json.load(f)['name']
+        return cls.INDEX_CLASSES[name].load(directory)
+
+
+def sync_index(index: BaseAnnIndex, gallery, start: int) -> int:
+    """
+    갤러리의 start행부터 새로 추가된 활성 행을 인덱스에 추가합니다. 인덱스의 벡터 ID는 갤러리의 행 번호입니다.
+
+    Parameters
+    ----------
+    index : BaseAnnIndex
+        동기화할 인덱스입니다.
+    gallery : FaceGallery
+        얼굴 갤러리입니다.
+    start : int
+        인덱스에 아직 반영하지 않은 첫 갤러리 행 번호입니다.
+
+    Returns
+    -------
+    int
+        비활성(삭제된 게시글, 중복 라벨)이라 추가하지 않은 행 수입니다.
+    """
+    rows = np.arange(start, len(gallery), dtype=np.int64)
+    if not rows.shape[0]:
+        return 0
+    active = rows[gallery.active[start:]]
+    if active.shape[0]:
+        index.add(gallery.matrix[active], active)
+    return rows.shape[0] - active.shape[0]
+
+
+def build_index(name: str, gallery, **options):
+    """
+    갤러리의 활성 행만으로 인덱스를 새로 만듭니다.
+
+    Parameters
+    ----------
+    name : str
+        인덱스 이름입니다. (AnnIndexFactory.INDEX_CLASSES의 키)
+    gallery : FaceGallery
+        얼굴 갤러리입니다.
+    options : dict
+        인덱스 생성 옵션입니다.
+
+    Returns
+    -------
+    BaseAnnIndex
+        벡터 ID가 갤러리 행 번호인 인덱스입니다.
+    """
+    index = AnnIndexFactory.create(name, gallery.dim, **options)
+    rows = np.flatnonzero(gallery.active).astype(np.int64)
+    index.build(gallery.matrix[rows], rows)
+    return index
+
+
+_ann_index = None  # 프로세스 단위 인덱스 (워커 시작 시 load_ann_index()로 불러옴)
+_ann_state = {
+    'generation': None,  # 인덱스를 만들 때 사용한 갤러리 세대 (세대가 바뀌면 행 번호가 달라지므로 다시 만듦)
+    'rows': 0,  # 인덱스에 반영한 갤러리 행 수 (앞쪽부터)
+    'skipped': 0,  # 반영한 행 중 비활성이라 인덱스에 넣지 않은 행 수
+}
+_ann_index_lock = threading.Lock()
+
+
+def stale_count(gallery) -> int:
+    """
+    인덱스에 들어 있지만 지금은 비활성인(게시글 삭제, 중복 라벨) 벡터 수입니다.
+
+    반영한 행 중 비활성 행은 인덱스에 넣지 않은 행(skipped)과 넣은 뒤 비활성이 된 행의 합이며,
+    동기화한 뒤에는 반영한 행이 갤러리 전체이므로 갤러리의 비활성 행 수에서 넣지 않은 행 수를 뺍니다.
+    """
+    return gallery.inactive_count - _ann_state['skipped']
+
+
+def get_ann_index(gallery=None):
+    """
+    settings.AI_ANN_INDEX 설정의 프로세스 단위 인덱스를 반환합니다.
+
+    저장된 인덱스 파일이 있으면 메모리 맵으로 불러오고, 없으면 갤러리의 활성 행으로 새로 만듭니다.
+    다음 경우에는 인덱스를 갤러리로 다시 만듭니다.
+        - 갤러리를 다시 만들어 세대가 바뀐 경우 (행 번호가 달라짐)
+        - 저장된 인덱스의 벡터 수가 갤러리 행 수보다 많은 경우 (다른 갤러리로 만든 인덱스)
+        - 인덱스에 남은 비활성 벡터가 REBUILD_INACTIVE_RATIO를 넘은 경우 (검색 시 건너뛰는 결과가 늘어남)
+    반환하기 전에 갤러리에 추가된 활성 행을 인덱스에 반영합니다.
+
+    Parameters
+    ----------
+    gallery : FaceGallery, optional
+        인덱스와 동기화할 갤러리입니다. (기본값은 프로세스 단위 갤러리)
+
+    Returns
+    -------
+    BaseAnnIndex or None
+        인덱스입니다. 갤러리가 비어 있으면 None을 반환합니다.
+    """
+    global _ann_index
+    from django.conf import settings
+    from .gallery import get_face_gallery
+
+    gallery = gallery if gallery is not None else get_face_gallery()
+    options = getattr(settings, 'AI_ANN_INDEX', {})
+    path = options.get('PATH')
+
+    with _ann_index_lock:
+        if _ann_index is not None and gallery.generation != _ann_state['generation']:
+            logger.info(f"얼굴 갤러리 세대가 바뀌어 ANN 인덱스를 다시 만듭니다. ({_ann_state['generation']} -> {gallery.generation})")
+            _ann_index = None
+            path = None  # 저장된 인덱스는 이전 세대의 행 번호일 수 있음
+
+        if _ann_index is None and path and os.path.exists(os.path.join(path, 'meta.json')):
+            _ann_index = AnnIndexFactory.load(path)  # build_face_gallery가 갤러리 행 0..ntotal-1로 만든 인덱스
+            _ann_state.update(generation=gallery.generation, rows=_ann_index.ntotal, skipped=0)
+            logger.info(f"ANN 인덱스 로드 - {_ann_index.name}, 벡터 수: {_ann_index.ntotal}")
+            if _ann_index.ntotal > len(gallery):
+                logger.warning(f"ANN 인덱스가 갤러리와 맞지 않아 다시 만듭니다. (인덱스: {_ann_index.ntotal}, 갤러리: {len(gallery)})")
+                _ann_index = None
+
+        if _ann_index is not None:
+            _ann_state['skipped'] += sync_index(_ann_index, gallery, _ann_state['rows'])
+            _ann_state['rows'] = len(gallery)
+            if stale_count(gallery) > options.get('REBUILD_INACTIVE_RATIO', 0.1) * max(_ann_index.ntotal, 1):
+                logger.info(f"ANN 인덱스의 비활성 벡터가 많아 다시 만듭니다. ({stale_count(gallery)}/{_ann_index.ntotal})")
+                _ann_index = None
+
+        if _ann_index is None:
+            if not len(gallery):
+                return None
+            _ann_index = build_index(options.get('BACKEND', 'brute'), gallery, **options.get('OPTIONS', {}))
+            _ann_state.update(generation=gallery.generation, rows=len(gallery), skipped=gallery.inactive_count)
+    return _ann_index
+
+
+def search_gallery(index: BaseAnnIndex, gallery, query, k: int = 5, exclude_post_id: int = None) -> list:
+    """
+    인덱스로 찾은 행 번호를 갤러리 라벨로 바꾸어 FaceGallery.search()와 같은 형식으로 반환합니다.
+
+    제외할 게시글의 얼굴 수만큼 더 조회하고, 비활성 벡터(삭제된 게시글, 중복 라벨)를 건너뛰느라
+    k개를 채우지 못하면 조회 수를 두 배씩 늘려 다시 검색합니다.
+
+    Parameters
+    ----------
+    index : BaseAnnIndex
+        검색할 인덱스입니다.
+    gallery : FaceGallery
+        행 번호에 대응하는 라벨을 가진 갤러리입니다.
+    query : np.ndarray
+        (dim,) 모양의 질의 얼굴 인코딩입니다.
+    k : int, optional
+        반환할 결과 수입니다. (기본값은 5)
+    exclude_post_id : int, optional
+        결과에서 제외할 게시글 ID입니다.
+
+    Returns
+    -------
+    list
+        (게시글 ID, 이미지 번호, 얼굴 번호, 코사인 유사도) 튜플 목록입니다. 유사도가 높은 순서입니다.
+    """
+    labels, active = gallery.labels, gallery.active
+    fetch = k if exclude_post_id is None else k + gallery.face_count(exclude_post_id)  # 제외할 얼굴만큼 여유 있게 조회
+    while True:
+        ids, scores = index.search(query, k=fetch)
+        results = []
+        for row, score in zip(ids, scores):
+            if row >= len(labels) or not active[row]:  # 갤러리에 없거나 비활성인 행
+                continue
+            label = labels[row]
+            if exclude_post_id is not None and label[0] == exclude_post_id:
+                continue
+            results.append((*map(int, label), float(score)))
+        if len(results) >= k or len(ids) < fetch or fetch >= index.ntotal:  # 채웠거나 더 찾을 벡터가 없음
+            return results[:k]
+        fetch = min(fetch * 2, index.ntotal)
+
+
+def load_ann_index():
+    """
+    워커 시작 시점에 인덱스를 미리 불러옵니다. (예: gunicorn의 post_fork 훅)
+
+    Returns
+    -------
+    BaseAnnIndex or None
+        불러온 인덱스입니다.
+    """
+    return get_ann_index()
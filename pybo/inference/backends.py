@@ -0,0 +1,424 @@
+import base64
+from dataclasses import dataclass
+import mimetypes
+import os
+import platform
+import re
+import threading
+from typing import Optional
+
+from ..ai_client import PROCESS_IMAGE_PATH, PROCESS_IMAGE_TWO_PATH, get_ai_client
+from ..url_patterns import URLS
+
+import logging
+logger = logging.getLogger(URLS['APP_NAME'])  # 로거 설정
+
+"""
+게시판의 AI 작업(얼굴 유사도 비교, 인물 탐지)을 실행하는 백엔드 모듈입니다.
+
+1. 'remote': AI 서버에 이미지를 보내고 결과를 받습니다. (pybo.ai_client의 공유 HTTP 클라이언트 사용)
+2. 'local' : pybo.views.ai의 ai_system 파이프라인을 현재 프로세스에서 실행합니다. (네트워크 왕복 없음)
+3. 'pool'  : 'local'과 같은 파이프라인을 모델을 미리 로드한 추론 워커 프로세스 풀(pybo.inference.pool)에서 실행합니다.
+
+세 백엔드는 AI 서버 응답 형식의 결과를 같은 함수(similarity_result, detection_result)로 바꿔
+같은 결과 객체(SimilarityResult, DetectionResult)를 반환하고 같은 예외를 던지므로,
+작업 함수는 settings.AI_BACKEND의 게시판별 설정만 바꿔 백엔드를 바꿀 수 있습니다.
+- ValueError: 사진에 얼굴이 1개가 아닌 경우 등 입력 문제 (메시지를 그대로 사용자에게 표시)
+- AIBackendError: AI 서버의 오류 응답 등 처리 실패
+- httpx.TransportError: AI 서버 연결 실패/시간 초과 ('remote'만 해당, 작업 큐가 다시 실행)
+- InferencePoolError: 추론 워커가 작업 도중 죽었거나 풀을 사용할 수 없음 ('pool'만 해당)
+"""
+
+DEFAULT_OPTIONS = {
+    'DEFAULT': 'remote',
+    'BOARDS': {},
+    'DETECTORS': ['yolo'],
+}
+
+
+class AIBackendError(Exception):
+    """
+    AI 백엔드가 결과를 만들지 못했을 때 발생하는 예외입니다.
+    """
+
+
+@dataclass
+class SimilarityResult:
+    """
+    얼굴 유사도 비교 결과입니다.
+
+    Attributes
+    ----------
+    message : str
+        댓글로 표시할 결과 메시지입니다.
+    similarity : float or None
+        유사도(%)입니다. AI 서버가 메시지만 반환하면 None입니다.
+    """
+
+    message: str
+    similarity: Optional[float] = None
+
+
+@dataclass
+class DetectionResult:
+    """
+    인물 탐지 결과입니다.
+
+    Attributes
+    ----------
+    message : str
+        댓글로 표시할 결과 메시지입니다.
+    image_name : str
+        탐지 결과를 그린 이미지의 MEDIA_ROOT 기준 상대 경로입니다. (댓글의 image1에 저장)
+    """
+
+    message: str
+    image_name: str
+
+
+DETECTION_MESSAGE = "인물 탐지 결과입니다."
+NO_RESULT_MESSAGE = "AI 처리 결과가 없습니다."
+SIMILARITY_PATTERN = re.compile(r"유사도는 ([0-9.]+)%")  # format_similarity 메시지에서 유사도를 읽는 정규식
+
+
+def format_similarity(similarity: float) -> str:
+    """
+    유사도(%)를 댓글 메시지로 만듭니다.
+    """
+    return f"두 얼굴의 유사도는 {similarity:.2f}%입니다."
+
+
+def similarity_result(data: dict) -> SimilarityResult:
+    """
+    AI 서버 응답 형식의 유사도 비교 결과({'result', 'similarity'})를 SimilarityResult로 만듭니다.
+
+    모든 백엔드가 이 함수로 결과를 만들므로, 같은 파이프라인 출력이면 백엔드와 관계없이 같은 결과가 됩니다.
+    AI 서버가 유사도 없이 메시지만 보내면 메시지에서 유사도를 읽고, 유사도가 있으면 메시지를 format_similarity로 다시 만듭니다.
+
+    Parameters
+    ----------
+    data : dict
+        'result'(결과 메시지)와 'similarity'(유사도, %) 키를 가진 결과입니다. 두 키 모두 없을 수 있습니다.
+
+    Returns
+    -------
+    SimilarityResult
+        댓글로 표시할 결과입니다.
+    """
+    message = data.get('result') or NO_RESULT_MESSAGE
+    similarity = data.get('similarity')
+    if similarity is None:
+        match = SIMILARITY_PATTERN.search(message)
+        if match is None:
+            return SimilarityResult(message=message)  # 유사도가 없는 메시지(오류 안내 등)는 그대로 표시
+        similarity = match.group(1)
+    similarity = float(similarity)
+    return SimilarityResult(message=format_similarity(similarity), similarity=similarity)
+
+
+def detection_result(data: dict) -> DetectionResult:
+    """
+    AI 서버 응답 형식의 인물 탐지 결과({'message', 'image_path'})를 DetectionResult로 만듭니다.
+
+    Parameters
+    ----------
+    data : dict
+        'message'(결과 메시지, 없으면 기본 메시지)와 'image_path'(결과 이미지 경로) 키를 가진 결과입니다.
+
+    Returns
+    -------
+    DetectionResult
+        댓글로 표시할 결과입니다. 결과 이미지 경로는 MEDIA_ROOT 기준 상대 경로로 바뀝니다.
+    """
+    if not data.get('image_path'):
+        raise AIBackendError("탐지 결과 이미지가 없습니다.")
+    return DetectionResult(
+        message=data.get('message') or DETECTION_MESSAGE,
+        image_name=media_relative_path(str(data['image_path'])),
+    )
+
+
+def media_relative_path(path: str) -> str:
+    """
+    AI 서버 또는 파이프라인이 반환한 이미지 경로를 MEDIA_ROOT 기준 상대 경로('detection/a_image1/...')로 바꿉니다.
+
+    로컬 파이프라인의 경로는 MEDIA_ROOT 기준으로 바꾸고,
+    AI 서버의 경로는 운영체제에 따라 구분자가 다를 수 있으므로 'media' 디렉터리 뒤의 경로를 사용합니다.
+    """
+    from django.conf import settings
+
+    normalized = path.replace('\\', '/')
+    media_root = str(settings.MEDIA_ROOT).replace('\\', '/').rstrip('/') + '/'
+    if normalized.startswith(media_root):
+        return normalized[len(media_root):]
+    return normalized.split('media/', 1)[-1]
+
+
+class RemoteAIBackend:
+    """
+    AI 서버에 이미지를 보내 처리하는 백엔드입니다.
+
+    Methods
+    -------
+    compare_faces(image1_path, image2_path):
+        두 이미지의 얼굴 유사도를 비교합니다.
+    detect_president(image_path):
+        이미지에서 인물을 탐지하고 결과 이미지를 MEDIA_ROOT에 저장합니다.
+    warm_up():
+        미리 준비할 것이 없으므로 빈 보고서를 반환합니다.
+    """
+
+    name = 'remote'
+
+    def compare_faces(self, image1_path: str, image2_path: str) -> SimilarityResult:
+        image1_path, image2_path = self._local_path(image1_path), self._local_path(image2_path)
+        with open(image1_path, 'rb') as f1, open(image2_path, 'rb') as f2:
+            response = get_ai_client().post(
+                PROCESS_IMAGE_TWO_PATH,
+                files={
+                    'file1': (os.path.basename(image1_path), f1, mimetypes.guess_type(image1_path)[0]),
+                    'file2': (os.path.basename(image2_path), f2, mimetypes.guess_type(image2_path)[0]),
+                },
+            )
+        return similarity_result(self._json(response))
+
+    def detect_president(self, image_path: str) -> DetectionResult:
+        from django.conf import settings
+
+        with open(self._local_path(image_path), 'rb') as f:
+            response = get_ai_client().post(PROCESS_IMAGE_PATH, files={'file': f})
+        data = self._json(response)
+        result = detection_result(data)
+
+        # AI 서버가 보낸 결과 이미지를 서버와 같은 상대 경로로 MEDIA_ROOT에 저장
+        output_path = os.path.join(settings.MEDIA_ROOT, result.image_name)
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        with open(output_path, 'wb') as out_file:
+            out_file.write(base64.b64decode(data['base64_image']))
+        return result
+
+    def warm_up(self) -> dict:
+        return {}
+
+    @staticmethod
+    def _json(response) -> dict:
+        if response.status_code != 200:
+            raise AIBackendError(f"AI 서버 오류 응답: {response.status_code}")
+        return response.json()
+
+    @staticmethod
+    def _local_path(path: str) -> str:
+        """
+        운영체제에 맞는 경로 구분자로 바꿉니다. (특히 윈도우와 리눅스)
+        """
+        if platform.system() == "Windows":
+            return path.replace("/", "\\")
+        return path.replace("\\", "/")
+
+
+class LocalAIBackend:
+    """
+    pybo.views.ai의 파이프라인을 현재 프로세스에서 실행하는 백엔드입니다.
+
+    ai_system, face_recognition 등 로컬 AI 의존성은 처음 사용할 때 임포트합니다.
+
+    Attributes
+    ----------
+    detectors : list
+        사용할 얼굴 탐지기 이름 목록입니다.
+
+    Methods
+    -------
+    compare_faces(image1_path, image2_path):
+        두 이미지의 얼굴 유사도를 비교합니다.
+    detect_president(image_path):
+        이미지에서 인물을 탐지하고 결과 이미지를 저장합니다.
+    warm_up():
+        탐지기를 미리 로드하고 로드 시간/메모리 보고서를 반환합니다.
+    """
+
+    name = 'local'
+
+    def __init__(self, detectors=('yolo',)):
+        self.detectors = list(detectors)
+
+    def compare_faces(self, image1_path: str, image2_path: str) -> SimilarityResult:
+        from ..views import ai
+
+        # AI 서버와 같은 응답 형식으로 만들어 같은 함수로 결과를 만듭니다.
+        similarity = float(ai.compare_faces(image1_path, image2_path, self.detectors))
+        return similarity_result({'similarity': similarity})
+
+    def detect_president(self, image_path: str) -> DetectionResult:
+        from ..views import ai
+
+        output_path = ai.detect_president(image_path, self.detectors)
+        return detection_result({'image_path': output_path})
+
+    def warm_up(self) -> dict:
+        from ..views import ai
+
+        return ai.warm_up(self.detectors)
+
+
+def run_local_backend(method: str, detectors, *args):
+    """
+    추론 워커 프로세스에서 LocalAIBackend의 메서드를 실행합니다. (PooledAIBackend의 작업 함수)
+    """
+    return getattr(LocalAIBackend(detectors), method)(*args)
+
+
+def warm_up_local_backend(detectors) -> None:
+    """
+    추론 워커 프로세스가 시작할 때 탐지기를 미리 로드합니다. (PooledAIBackend의 워커 initializer)
+    """
+    report = LocalAIBackend(detectors).warm_up()
+    logger.info(f"추론 워커 준비 완료 - PID {report.get('pid')}")
+
+
+class PooledAIBackend:
+    """
+    LocalAIBackend의 파이프라인을 추론 워커 프로세스 풀에서 실행하는 백엔드입니다.
+
+    작업 스레드는 결과를 기다리기만 하므로, 추론은 웹/작업 프로세스 밖에서 워커 수만큼 동시에 실행됩니다.
+    풀은 처음 사용할 때 settings.INFERENCE_POOL 설정으로 시작합니다.
+
+    settings.INFERENCE_POOL['SHARED_MEMORY']가 True이면 작업 스레드가 이미지를 한 번 디코딩해 공유 메모리에 올리고
+    워커에는 핸들만 넘깁니다. (pybo.inference.shared_image, 작업이 끝나면 공유 메모리 해제)
+
+    Attributes
+    ----------
+    detectors : list
+        사용할 얼굴 탐지기 이름 목록입니다.
+    shared_memory : bool
+        이미지를 공유 메모리로 넘기는지 여부입니다.
+
+    Methods
+    -------
+    compare_faces(image1_path, image2_path):
+        두 이미지의 얼굴 유사도를 워커에서 비교합니다.
+    detect_president(image_path):
+        이미지에서 인물을 워커에서 탐지합니다.
+    warm_up():
+        풀을 시작하고 모든 워커가 탐지기를 로드할 때까지 기다립니다.
+    close():
+        풀의 워커를 종료합니다.
+    """
+
+    name = 'pool'
+
+    def __init__(self, detectors=('yolo',)):
+        self.detectors = list(detectors)
+        self.shared_memory = True
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def compare_faces(self, image1_path: str, image2_path: str) -> SimilarityResult:
+        return self._run('compare_faces', image1_path, image2_path)
+
+    def detect_president(self, image_path: str) -> DetectionResult:
+        return self._run('detect_president', image_path)
+
+    def _run(self, method: str, *image_paths):
+        pool = self.pool
+        if not self.shared_memory:
+            return pool.run(run_local_backend, method, self.detectors, *image_paths)
+
+        from .shared_image import share_images
+
+        with share_images(*image_paths) as handles:  # 작업이 끝날 때까지(재시도 포함) 공유 메모리 유지
+            return pool.run(run_local_backend, method, self.detectors, *handles)
+
+    def warm_up(self) -> dict:
+        pool = self.pool.start(wait=True)
+        return {'processes': pool.processes, 'pids': pool.worker_pids()}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+    @property
+    def pool(self):
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    from .pool import create_inference_pool, get_pool_options
+
+                    self.shared_memory = get_pool_options()['SHARED_MEMORY']
+                    self._pool = create_inference_pool(warm_up_local_backend, (self.detectors,))
+        return self._pool
+
+
+AI_BACKENDS = {
+    'remote': RemoteAIBackend,
+    'local': LocalAIBackend,
+    'pool': PooledAIBackend,
+}
+
+_backends = {}  # 백엔드 이름 -> 프로세스 단위 백엔드
+_backends_lock = threading.Lock()
+
+
+def create_ai_backend(name: str, detectors=('yolo',)):
+    """
+    이름으로 AI 백엔드를 만듭니다.
+
+    Parameters
+    ----------
+    name : str
+        'remote', 'local', 'pool' 중 하나입니다.
+    detectors : iterable
+        'local', 'pool' 백엔드가 사용할 탐지기 이름 목록입니다.
+
+    Returns
+    -------
+    RemoteAIBackend, LocalAIBackend or PooledAIBackend
+        AI 백엔드입니다.
+    """
+    if name not in AI_BACKENDS:
+        raise ValueError(f"알 수 없는 AI 백엔드입니다: {name} (사용 가능: {', '.join(AI_BACKENDS)})")
+    if name == 'remote':
+        return RemoteAIBackend()
+    return AI_BACKENDS[name](detectors)
+
+
+def get_ai_backend(board_name: str):
+    """
+    settings.AI_BACKEND에서 게시판에 설정된 프로세스 단위 AI 백엔드를 반환합니다.
+
+    Parameters
+    ----------
+    board_name : str
+        게시판 이름입니다. (예: 'similarity', 'detection')
+
+    Returns
+    -------
+    RemoteAIBackend, LocalAIBackend or PooledAIBackend
+        게시판의 AI 백엔드입니다. 같은 이름의 백엔드는 게시판끼리 공유합니다.
+    """
+    from django.conf import settings
+
+    options = {**DEFAULT_OPTIONS, **getattr(settings, 'AI_BACKEND', {})}
+    name = options['BOARDS'].get(board_name, options['DEFAULT'])
+    backend = _backends.get(name)
+    if backend is None:
+        with _backends_lock:
+            backend = _backends.get(name)
+            if backend is None:
+                backend = _backends[name] = create_ai_backend(name, options['DETECTORS'])
+                logger.info(f"AI 백엔드 생성: {name}")
+    return backend
+
+
+def clear_ai_backends() -> None:
+    """
+    프로세스 단위 백엔드를 버립니다. 설정을 바꾼 뒤 호출합니다. ('pool' 백엔드의 워커도 종료)
+    """
+    with _backends_lock:
+        for backend in _backends.values():
+            close = getattr(backend, 'close', None)
+            if close is not None:
+                close()
+        _backends.clear()
@@ -0,0 +1,305 @@
+from concurrent.futures import Future
+from typing import Callable
+import functools
+import threading
+import time
+
+from ..url_patterns import URLS
+
+import logging
+logger = logging.getLogger(URLS['APP_NAME'])  # 로거 설정
+
+"""
+여러 작업의 탐지 요청을 모아 한 번의 배치 추론(forward pass)으로 실행하는 마이크로 배치 모듈입니다.
+
+steps.FaceDetector는 Data 하나(이미지 한 장)씩 탐지기를 호출하므로, 인물 탐지 게시글이 여러 개 대기 중이어도
+모델은 이미지 한 장짜리 추론을 여러 번 실행합니다. 모델 호출마다 드는 고정 비용(전처리, 커널 실행, 가중치 읽기)은
+배치 크기와 거의 관계없으므로 여러 장을 한 번에 실행하면 처리량이 늘어납니다.
+
+1. MicroBatcher: 첫 요청이 도착한 뒤 MAX_WAIT_MS 동안(또는 MAX_BATCH_SIZE개가 모일 때까지) 요청을 모아
+                 배치 함수를 한 번 호출하고, 결과를 요청마다 나눠 돌려줍니다.
+2. BatchingModel: 탐지기의 모델(ultralytics YOLO처럼 이미지 목록을 받아 결과 목록을 반환하는 호출 가능 객체)을 감싸
+                  이미지 한 장짜리 호출을 MicroBatcher로 보냅니다. (settings.AI_DETECTOR_BATCHING)
+
+3. LockedModel: 배치를 사용하지 않는 탐지기의 모델 호출을 잠금으로 직렬화합니다. (serialize_detector)
+               ultralytics YOLO 모델 등은 여러 스레드가 동시에 호출하면 안전하지 않으므로, 레지스트리가 공유하는
+               탐지기는 항상 BatchingModel(배치 스레드 하나만 호출) 또는 LockedModel로 감쌉니다.
+
+요청을 모으려면 같은 프로세스에서 여러 작업이 동시에 탐지기를 호출해야 합니다.
+('local' AI 백엔드에서 작업 큐의 스레드가 여러 개인 경우, run_jobs --workers)
+MAX_WAIT_MS는 요청 하나가 더 기다릴 수 있는 최대 시간이므로, 한 장짜리 추론 시간보다 충분히 짧게 설정합니다.
+"""
+
+DEFAULT_OPTIONS = {
+    'ENABLED': False,
+    'DETECTORS': ['yolo', 'yolo_onnx'],
+    'MAX_BATCH_SIZE': 8,
+    'MAX_WAIT_MS': 5.0,
+    'MODEL_ATTRIBUTE': 'model',
+}
+
+
+class MicroBatcher:
+    """
+    요청을 짧은 시간 동안 모아 배치 함수로 한 번에 실행하는 스케줄러입니다.
+
+    배치 함수는 배치 스레드 하나에서만 호출되므로 모델을 여러 스레드가 동시에 호출하지 않습니다.
+
+    Attributes
+    ----------
+    batch_fn : callable
+        요청 목록을 받아 같은 순서의 결과 목록을 반환하는 함수입니다.
+    max_batch_size : int
+        한 번에 실행할 최대 요청 수입니다.
+    max_wait : float
+        첫 요청이 도착한 뒤 다음 요청을 기다리는 최대 시간(초)입니다.
+    stats : dict
+        실행한 배치 수와 요청 수입니다.
+
+    Methods
+    -------
+    submit(item):
+        요청을 넣고 결과를 담을 Future를 반환합니다.
+    __call__(item):
+        요청을 넣고 결과를 기다려 반환합니다.
+    close():
+        배치 스레드를 종료합니다. 남은 요청은 실행한 뒤 종료합니다.
+    """
+
+    def __init__(self, batch_fn: Callable, max_batch_size: int = 8, max_wait_ms: float = 5.0, name: str = 'batcher'):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self.stats = {'batches': 0, 'items': 0}
+        self._pending = []  # (요청, Future)
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=f'pybo-{name}', daemon=True)
+        self._thread.start()
+
+    def submit(self, item) -> Future:
+        """
+        요청을 넣고 결과를 담을 Future를 반환합니다.
+
+        Parameters
+        ----------
+        item : object
+            배치 함수에 넘길 요청 하나입니다. (예: 이미지)
+
+        Returns
+        -------
+        concurrent.futures.Future
+            결과 또는 배치 함수가 던진 예외를 담을 Future입니다.
+        """
+        future = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("종료된 마이크로 배치 스케줄러입니다.")
+            self._pending.append((item, future))
+            if len(self._pending) == 1 or len(self._pending) >= self.max_batch_size:
+                self._condition.notify()  # 첫 요청이면 대기 시간 측정 시작, 가득 찼으면 바로 실행
+        return future
+
+    def __call__(self, item):
+        return self.submit(item).result()
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:  # 종료
+                    return
+                # 첫 요청이 도착한 시점부터 최대 max_wait초 동안 배치가 찰 때까지 기다림
+                deadline = time.monotonic() + self.max_wait
+                while len(self._pending) < self.max_batch_size and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not self._condition.wait(remaining):
+                        break
+                batch = self._pending[:self.max_batch_size]
+                del self._pending[:self.max_batch_size]
+
+            self._execute(batch)
+
+    def _execute(self, batch: list) -> None:
+        """
+        배치 함수를 한 번 호출하고 결과를 요청마다 나눠 돌려줍니다.
+        """
+        items = [item for item, _ in batch]
+        try:
+            results = self.batch_fn(items)
+            if len(results) != len(items):
+                raise RuntimeError(f"배치 결과 수가 요청 수와 다릅니다: {len(results)} != {len(items)}")
+        except Exception as e:  # 배치 전체 실패
+            logger.exception(f"배치 실행 실패 - 요청 {len(items)}개")
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        self.stats['batches'] += 1
+        self.stats['items'] += len(items)
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+
+
+class BatchingModel:
+    """
+    이미지 목록을 한 번에 처리할 수 있는 모델을 감싸, 이미지 한 장짜리 호출을 마이크로 배치로 모으는 객체입니다.
+
+    ultralytics YOLO처럼 model(이미지 목록, **옵션)이 이미지마다 결과 하나씩 든 목록을 반환하는 모델을 가정합니다.
+    한 장짜리 호출 model(이미지, **옵션)은 원래 모델과 같이 결과 하나가 든 목록을 반환합니다.
+    같은 옵션으로 호출한 요청끼리만 한 번에 실행하며, 그 밖의 속성은 원래 모델에 그대로 위임합니다.
+    배치 실행과 목록 호출은 같은 잠금 안에서 원래 모델을 호출하므로 모델이 동시에 호출되지 않습니다.
+
+    Methods
+    -------
+    __call__(source, **kwargs):
+        이미지 한 장이면 배치로 모아 실행하고, 목록이면 바로 실행합니다.
+    close():
+        배치 스레드를 종료합니다.
+    """
+
+    def __init__(self, model, max_batch_size: int = 8, max_wait_ms: float = 5.0, name: str = 'detector'):
+        self._model = model
+        self._lock = threading.Lock()  # 원래 모델은 한 번에 하나의 호출만 실행
+        self._batcher = MicroBatcher(self._run_batch, max_batch_size, max_wait_ms, name=f'batch-{name}')
+
+    def __call__(self, source, **kwargs):
+        if isinstance(source, (list, tuple)):  # 이미 여러 장이면 그대로 실행
+            with self._lock:
+                return self._model(source, **kwargs)
+        return [self._batcher((source, kwargs))]
+
+    def __getattr__(self, name):
+        return getattr(self._model, name)
+
+    @property
+    def batch_stats(self) -> dict:
+        return dict(self._batcher.stats)
+
+    def close(self) -> None:
+        self._batcher.close()
+
+    def _run_batch(self, requests: list) -> list:
+        """
+        요청을 옵션별로 묶어 모델을 묶음마다 한 번 호출합니다. (대부분 모든 요청의 옵션이 같아 한 번 호출)
+        """
+        groups = {}
+        for index, (image, kwargs) in enumerate(requests):
+            groups.setdefault(repr(sorted(kwargs.items())), []).append(index)
+
+        results = [None] * len(requests)
+        for indexes in groups.values():
+            kwargs = requests[indexes[0]][1]
+            with self._lock:
+                outputs = self._model([requests[i][0] for i in indexes], **kwargs)
+            for i, output in zip(indexes, outputs):
+                results[i] = output
+        return results
+
+
+class LockedModel:
+    """
+    모델(또는 탐지기)의 호출을 잠금으로 직렬화하는 객체입니다.
+
+    model(...) 호출과 메서드 호출(예: model.predict(...))은 잠금 안에서 실행하고, 그 밖의 속성은 그대로 위임합니다.
+    """
+
+    def __init__(self, model):
+        self._model = model
+        self._lock = threading.RLock()  # 메서드 안에서 모델을 다시 호출해도 교착되지 않도록 재진입 가능
+
+    def __call__(self, *args, **kwargs):
+        with self._lock:
+            return self._model(*args, **kwargs)
+
+    def __getattr__(self, name):
+        value = getattr(self._model, name)
+        if not callable(value):
+            return value
+
+        @functools.wraps(value)
+        def locked(*args, **kwargs):
+            with self._lock:
+                return value(*args, **kwargs)
+        return locked
+
+
+def get_batching_options() -> dict:
+    """
+    settings.AI_DETECTOR_BATCHING과 기본값을 합친 마이크로 배치 설정을 반환합니다.
+    """
+    from django.conf import settings
+
+    return {**DEFAULT_OPTIONS, **getattr(settings, 'AI_DETECTOR_BATCHING', {})}
+
+
+def enable_batching(detector, name: str, options: dict = None):
+    """
+    설정에서 배치를 켠 탐지기라면 탐지기의 모델을 BatchingModel로 바꿉니다.
+
+    Parameters
+    ----------
+    detector : object
+        FaceDetectorFactory로 만든 탐지기입니다.
+    name : str
+        탐지기 이름입니다. (예: 'yolo')
+    options : dict, optional
+        마이크로 배치 설정입니다. (기본값은 get_batching_options())
+
+    Returns
+    -------
+    object
+        같은 탐지기입니다. 모델 속성이 없으면 바꾸지 않고 반환합니다.
+    """
+    options = options or get_batching_options()
+    if not options['ENABLED'] or name not in options['DETECTORS']:
+        return detector
+
+    attribute = options['MODEL_ATTRIBUTE']
+    model = getattr(detector, attribute, None)
+    if model is None or not callable(model):
+        logger.warning(f"마이크로 배치를 사용할 수 없는 탐지기입니다: {name} (모델 속성 '{attribute}' 없음)")
+        return detector
+    if not isinstance(model, BatchingModel):
+        setattr(detector, attribute, BatchingModel(model, options['MAX_BATCH_SIZE'], options['MAX_WAIT_MS'], name=name))
+        logger.info(f"탐지기 마이크로 배치 사용 - {name} (최대 {options['MAX_BATCH_SIZE']}장, {options['MAX_WAIT_MS']}ms)")
+    return detector
+
+
+def serialize_detector(detector, name: str, options: dict = None):
+    """
+    여러 스레드가 공유하는 탐지기의 모델 호출이 동시에 실행되지 않도록 합니다.
+
+    모델이 BatchingModel이면 배치 스레드 하나만 모델을 호출하므로 그대로 두고,
+    아니면 모델을 LockedModel로 감쌉니다. 모델 속성이 없으면 탐지기 전체를 LockedModel로 감쌉니다.
+
+    Parameters
+    ----------
+    detector : object
+        enable_batching()을 거친 탐지기입니다.
+    name : str
+        탐지기 이름입니다. (예: 'yolo')
+    options : dict, optional
+        마이크로 배치 설정입니다. (기본값은 get_batching_options())
+
+    Returns
+    -------
+    object
+        모델 호출이 직렬화된 탐지기입니다.
+    """
+    options = options or get_batching_options()
+    attribute = options['MODEL_ATTRIBUTE']
+    model = getattr(detector, attribute, None)
+    if isinstance(model, (BatchingModel, LockedModel)):
+        return detector
+    if model is None or not callable(model):
+        logger.info(f"탐지기 호출 직렬화 - {name} (모델 속성 '{attribute}' 없음, 탐지기 전체 잠금)")
+        return LockedModel(detector)
+    setattr(detector, attribute, LockedModel(model))
+    return detector
@@ -0,0 +1,327 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+import hashlib
+import io
+import os
+import sqlite3
+import threading
+
+import numpy as np
+
+from ..url_patterns import URLS
+
+import logging
+logger = logging.getLogger(URLS['APP_NAME'])  # 로거 설정
+
+"""
+이미지 내용(SHA-256)으로 얼굴 인코딩을 찾아 쓰는 임베딩 캐시 모듈입니다.
+
+같은 사진이 다시 업로드되거나 댓글에서 재사용되면 얼굴 탐지와 인코딩을 다시 수행하지 않고
+저장된 결과(인코딩, 바운딩 박스)를 반환합니다. 결과 이미지 경로는 요청한 파일마다 다르므로 저장하지 않습니다. 캐시 키는 (이미지 SHA-256, 탐지기 목록, 모델 버전)으로 구성되므로
+모델이나 탐지기 구성이 바뀌면 자연스럽게 새 키를 사용합니다.
+
+1. 메모리 계층: 바이트 한도를 넘으면 가장 오래 사용하지 않은 항목부터 제거(LRU)합니다.
+2. 디스크 계층: sqlite 파일에 .npy 형식의 blob으로 저장하여 워커 재시작 후에도 유지됩니다.
+"""
+
+HASH_CHUNK_SIZE = 1024 * 1024  # 이미지 해시 계산 시 한 번에 읽을 크기 (1MB)
+
+
+@dataclass
+class EmbeddingEntry:
+    """
+    하나의 이미지에 대한 얼굴 인코딩 결과입니다.
+
+    Attributes
+    ----------
+    encodings : np.ndarray
+        (얼굴 수, 임베딩 차원) 모양의 float32 배열입니다.
+    boxes : np.ndarray
+        (얼굴 수, 4) 모양의 바운딩 박스 배열입니다. 탐지 결과가 없으면 (0, 4) 배열입니다.
+    """
+
+    encodings: np.ndarray
+    boxes: np.ndarray
+
+    @property
+    def nbytes(self) -> int:
+        """
+        메모리 계층에서 차지하는 대략적인 크기(바이트)입니다.
+        """
+        return self.encodings.nbytes + self.boxes.nbytes
+
+
+def _to_blob(array: np.ndarray) -> bytes:
+    """
+    배열을 .npy 형식의 바이트로 변환합니다.
+    """
+    buffer = io.BytesIO()
+    np.save(buffer, array, allow_pickle=False)
+    return buffer.getvalue()
+
+
+def _from_blob(blob: bytes) -> np.ndarray:
+    """
+    .npy 형식의 바이트를 배열로 변환합니다.
+    """
+    return np.load(io.BytesIO(blob), allow_pickle=False)
+
+
+def as_encoding_matrix(encodings) -> np.ndarray:
+    """
+    파이프라인이 반환한 얼굴 인코딩 목록을 (얼굴 수, 임베딩 차원) 모양의 float32 배열로 변환합니다.
+
+    Parameters
+    ----------
+    encodings : list
+        얼굴별 인코딩 벡터 목록입니다.
+
+    Returns
+    -------
+    np.ndarray
+        (얼굴 수, 임베딩 차원) 배열입니다. 얼굴이 없으면 (0, 0) 배열입니다.
+    """
+    if len(encodings) == 0:
+        return np.zeros((0, 0), dtype=np.float32)
+    return np.stack([np.ravel(np.asarray(encoding, dtype=np.float32)) for encoding in encodings])
+
+
+def hash_image(image) -> str:
+    """
+    이미지 내용의 SHA-256 해시를 계산합니다.
+
+    Parameters
+    ----------
+    image : str or bytes
+        이미지 파일 경로 또는 이미지 바이트입니다.
+
+    Returns
+    -------
+    str
+        16진수 SHA-256 해시 문자열입니다.
+    """
+    digest = hashlib.sha256()
+    if isinstance(image, (bytes, bytearray, memoryview)):
+        digest.update(image)
+    else:
+        with open(image, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+class EmbeddingCache:
+    """
+    메모리(LRU)와 디스크(sqlite) 두 계층으로 구성된 얼굴 인코딩 캐시입니다.
+
+    Attributes
+    ----------
+    max_bytes : int
+        메모리 계층에 보관할 최대 크기(바이트)입니다.
+    db_path : str or None
+        디스크 계층으로 사용할 sqlite 파일 경로입니다. None이면 디스크 계층을 사용하지 않습니다.
+    model_version : str
+        캐시 키에 포함할 모델 버전입니다.
+    hits, misses : int
+        캐시 적중/실패 횟수입니다.
+
+    Methods
+    -------
+    make_key(image, detectors):
+        이미지와 탐지기 목록으로 캐시 키를 만듭니다.
+    get(key):
+        캐시된 인코딩을 반환합니다.
+    set(key, entry):
+        인코딩을 캐시에 저장합니다.
+    clear():
+        메모리 계층을 비웁니다.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, db_path: Optional[str] = None, model_version: str = '1'):
+        self.max_bytes = max_bytes
+        self.db_path = db_path
+        self.model_version = model_version
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = OrderedDict()  # 키 -> EmbeddingEntry (앞쪽일수록 오래 사용하지 않은 항목)
+        self._size = 0  # 메모리 계층에 보관 중인 크기(바이트)
+        self._lock = threading.Lock()
+        self._connection = None  # 디스크 계층 연결 (처음 사용할 때 생성)
+
+    def make_key(self, image, detectors, digest: Optional[str] = None) -> str:
+        """
+        (이미지 SHA-256, 탐지기 목록, 모델 버전)으로 캐시 키를 만듭니다.
+
+        Parameters
+        ----------
+        image : str or bytes
+            이미지 파일 경로 또는 이미지 바이트입니다.
+        detectors : list
+            사용한 얼굴 탐지기 이름 목록입니다.
+        digest : str, optional
+            이미 계산한 이미지 SHA-256입니다. 주어지면 image를 다시 읽지 않습니다. (공유 메모리 이미지)
+
+        Returns
+        -------
+        str
+            캐시 키 문자열입니다.
+        """
+        return f"{digest or hash_image(image)}:{','.join(sorted(detectors))}:{self.model_version}"
+
+    def get(self, key: str) -> Optional[EmbeddingEntry]:
+        """
+        캐시된 인코딩을 반환합니다. 메모리 계층에 없으면 디스크 계층을 확인하고, 찾으면 메모리 계층으로 올립니다.
+
+        Parameters
+        ----------
+        key : str
+            make_key()로 만든 캐시 키입니다.
+
+        Returns
+        -------
+        EmbeddingEntry or None
+            캐시된 인코딩입니다. 없으면 None을 반환합니다.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)  # 최근 사용한 항목으로 표시
+                self.hits += 1
+                return entry
+
+            entry = self._load_from_disk(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._remember(key, entry)
+            self.hits += 1
+            return entry
+
+    def set(self, key: str, entry: EmbeddingEntry) -> None:
+        """
+        인코딩을 메모리 계층과 디스크 계층에 저장합니다.
+
+        Parameters
+        ----------
+        key : str
+            make_key()로 만든 캐시 키입니다.
+        entry : EmbeddingEntry
+            저장할 인코딩 결과입니다.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            self._remember(key, entry)
+            self._save_to_disk(key, entry)
+
+    def clear(self) -> None:
+        """
+        메모리 계층을 비웁니다. 디스크 계층은 유지됩니다.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remember(self, key: str, entry: EmbeddingEntry) -> None:
+        """
+        메모리 계층에 항목을 추가하고, 한도를 넘으면 오래 사용하지 않은 항목부터 제거합니다.
+        """
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= previous.nbytes
+
+        self._entries[key] = entry
+        self._size += entry.nbytes
+
+        while self._size > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)  # 가장 오래 사용하지 않은 항목 제거
+            self._size -= evicted.nbytes
+
+    def _get_connection(self):
+        """
+        디스크 계층 sqlite 연결을 반환합니다. 처음 호출될 때 파일과 테이블을 만듭니다.
+        """
+        if self._connection is None:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS face_embedding ('
+                'key TEXT PRIMARY KEY, encodings BLOB NOT NULL, boxes BLOB NOT NULL)'
+            )
+            self._connection.commit()
+        return self._connection
+
+    def _load_from_disk(self, key: str) -> Optional[EmbeddingEntry]:
+        """
+        디스크 계층에서 항목을 읽습니다.
+        """
+        if not self.db_path:
+            return None
+        try:
+            row = self._get_connection().execute(
+                'SELECT encodings, boxes FROM face_embedding WHERE key = ?', (key,)
+            ).fetchone()
+        except sqlite3.Error:
+            logger.exception("임베딩 캐시 디스크 계층 조회 실패")
+            return None
+        if row is None:
+            return None
+        return EmbeddingEntry(encodings=_from_blob(row[0]), boxes=_from_blob(row[1]))
+
+    def _save_to_disk(self, key: str, entry: EmbeddingEntry) -> None:
+        """
+        디스크 계층에 항목을 저장합니다. 저장에 실패해도 메모리 계층은 그대로 사용합니다.
+        """
+        if not self.db_path:
+            return
+        try:
+            connection = self._get_connection()
+            connection.execute(
+                'INSERT OR REPLACE INTO face_embedding (key, encodings, boxes) VALUES (?, ?, ?)',
+                (key, _to_blob(entry.encodings), _to_blob(entry.boxes)),
+            )
+            connection.commit()
+        except sqlite3.Error:
+            logger.exception("임베딩 캐시 디스크 계층 저장 실패")
+
+
+_embedding_cache = None  # 프로세스 단위 캐시 (처음 사용할 때 settings로 생성)
+_embedding_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """
+    settings.AI_EMBEDDING_CACHE 설정으로 만든 프로세스 단위 임베딩 캐시를 반환합니다.
+
+    Returns
+    -------
+    EmbeddingCache
+        프로세스 단위 임베딩 캐시입니다.
+    """
+    global _embedding_cache
+    if _embedding_cache is None:
+        with _embedding_cache_lock:
+            if _embedding_cache is None:
+                from django.conf import settings
+
+                options = getattr(settings, 'AI_EMBEDDING_CACHE', {})
+                _embedding_cache = EmbeddingCache(
+                    max_bytes=options.get('MAX_BYTES', 64 * 1024 * 1024),
+                    db_path=options.get('DB_PATH'),
+                    model_version=options.get('MODEL_VERSION', '1'),
+                )
+    return _embedding_cache
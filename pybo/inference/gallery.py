@@ -0,0 +1,555 @@
+from typing import Optional
+import json
+import os
+import shutil
+import threading
+import time
+
+import numpy as np
+
+from ..url_patterns import URLS
+
+import logging
+logger = logging.getLogger(URLS['APP_NAME'])  # 로거 설정
+
+"""
+저장된 모든 얼굴 인코딩과 한 얼굴을 한 번에 비교하는 얼굴 갤러리 모듈입니다.
+
+얼굴 유사도 비교 게시판(SimilarityPostModel)에 업로드된 사진의 인코딩을
+L2 정규화된 연속(contiguous) float32 행렬 하나에 모아 두고,
+질의 얼굴과의 코사인 유사도를 행렬-벡터 곱 한 번으로 계산하여 상위 k개를 찾습니다.
+
+각 행에는 (게시글 ID, 이미지 번호, 얼굴 번호) 라벨이 붙습니다.
+게시글이 삭제되면 행을 지우지 않고 게시글 ID를 삭제 목록(tombstone)에 기록하여 검색에서 제외하며,
+같은 라벨의 행이 다시 추가되면(작업 재시도 등) 처음 추가된 행만 사용합니다.
+삭제된 행까지 정리하여 갤러리를 다시 만들려면 python manage.py build_face_gallery 명령을 사용합니다.
+"""
+
+LABEL_FIELDS = ('post_id', 'image_no', 'face_no')  # 라벨 열 이름
+
+
+def l2_normalize(vectors: np.ndarray) -> np.ndarray:
+    """
+    각 행을 L2 정규화합니다. 크기가 0인 행은 그대로 둡니다.
+
+    Parameters
+    ----------
+    vectors : np.ndarray
+        (n, d) 또는 (d,) 모양의 배열입니다.
+
+    Returns
+    -------
+    np.ndarray
+        정규화된 float32 배열입니다.
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class FaceGallery:
+    """
+    L2 정규화된 얼굴 인코딩을 연속 행렬에 보관하고 상위 k개 유사 얼굴을 찾는 갤러리입니다.
+
+    행렬은 용량이 부족할 때마다 두 배로 늘어나므로 추가(append)는 평균 O(d)입니다.
+    directory를 지정하면 추가된 행을 디스크 파일 끝에도 덧붙이므로(append-only),
+    다른 프로세스나 재시작한 워커가 load()로 다시 인코딩하지 않고 불러올 수 있습니다.
+
+    행 번호는 근사 최근접 이웃 인덱스의 벡터 ID로도 쓰이므로 행을 지우거나 옮기지 않습니다.
+    대신 삭제된 게시글의 행과 이미 있는 라벨로 다시 추가된 행은 비활성(active가 False)으로 표시하고 검색에서 제외합니다.
+
+    디스크 형식 (directory/CURRENT에 적힌 세대 디렉터리 안, CURRENT가 없으면 directory 바로 아래)
+        CURRENT     : 현재 세대 디렉터리 이름 (save()가 새 세대를 다 쓴 뒤 os.replace로 한 번에 바꿈)
+        meta.json   : {"dim": 임베딩 차원}
+        gallery.bin : (라벨 int64 x 3, 인코딩 float32 x dim) 레코드를 순서대로 이어 붙인 파일
+                      추가할 때마다 레코드를 write() 한 번으로 덧붙이므로 여러 프로세스가 동시에 추가해도
+                      라벨과 인코딩이 서로 섞이지 않습니다.
+        removed.bin : 삭제된 게시글 ID(int64)를 이어 붙인 파일 (gallery.bin과 같은 방식으로 덧붙임)
+
+    갤러리를 다시 만들면(build_face_gallery) 새 세대 디렉터리에 쓰고 CURRENT를 바꾸므로, 다른 프로세스는
+    기존 파일을 읽는 도중에 잘린 파일을 보지 않으며, refresh()에서 세대가 바뀐 것을 확인하면 처음부터 다시 불러옵니다.
+
+    Attributes
+    ----------
+    dim : int or None
+        임베딩 차원입니다. 처음 추가되는 인코딩으로 정해집니다.
+    directory : str or None
+        추가된 행을 덧붙일 디렉터리입니다. None이면 메모리에만 보관합니다.
+    generation : str or None
+        불러온 세대 디렉터리 이름입니다. (CURRENT가 없는 이전 형식이면 '', 불러온 적이 없으면 None)
+
+    Methods
+    -------
+    add(encodings, labels):
+        인코딩과 라벨을 갤러리 끝에 추가합니다.
+    remove(post_ids):
+        게시글의 얼굴을 검색에서 제외합니다.
+    has_post(post_id):
+        게시글의 얼굴이 이미 갤러리에 있는지 확인합니다.
+    search(query, k):
+        질의 인코딩과 가장 비슷한 상위 k개 얼굴을 반환합니다.
+    refresh():
+        다른 프로세스가 파일에 덧붙인 행과 삭제 목록을 읽어 옵니다.
+    save(directory) / load(directory):
+        갤러리 전체를 파일로 저장하거나 불러옵니다.
+    """
+
+    def __init__(self, dim: Optional[int] = None, directory: Optional[str] = None, initial_capacity: int = 1024):
+        self.dim = dim
+        self.directory = directory
+        self.generation = None
+        self._initial_capacity = initial_capacity
+        self._lock = threading.Lock()  # 추가와 검색이 동시에 일어나도 행렬이 깨지지 않도록 보호
+        self._reset()
+
+    def _reset(self) -> None:
+        """
+        보관 중인 행과 삭제 목록을 모두 비웁니다. (세대가 바뀌어 처음부터 다시 불러올 때 사용)
+        """
+        self._matrix = None  # (용량, dim) float32 행렬, 앞쪽 _size개 행만 유효
+        self._labels = np.zeros((0, len(LABEL_FIELDS)), dtype=np.int64)
+        self._active = np.zeros(0, dtype=bool)  # 검색에 사용하는 행 (삭제된 게시글, 중복 라벨이면 False)
+        self._size = 0
+        self._inactive = 0  # 비활성 행 수
+        self._label_keys = set()  # 활성 행의 라벨 (중복 추가 확인)
+        self._posts = {}  # 게시글 ID -> 활성 행(얼굴) 수
+        self._removed = set()  # 삭제된 게시글 ID
+        self._removed_read = 0  # removed.bin에서 읽은 ID 수
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """
+        유효한 행만 담은 (n, dim) 행렬 뷰입니다. (복사하지 않음)
+        """
+        if self._matrix is None:
+            return np.zeros((0, self.dim or 0), dtype=np.float32)
+        return self._matrix[:self._size]
+
+    @property
+    def labels(self) -> np.ndarray:
+        """
+        유효한 행의 (n, 3) 라벨 배열 뷰입니다. (게시글 ID, 이미지 번호, 얼굴 번호)
+        """
+        return self._labels[:self._size]
+
+    @property
+    def active(self) -> np.ndarray:
+        """
+        유효한 행의 (n,) 활성 여부 배열 뷰입니다. False인 행은 검색에서 제외합니다.
+        """
+        return self._active[:self._size]
+
+    @property
+    def inactive_count(self) -> int:
+        """
+        삭제된 게시글이거나 중복 라벨이라 검색에서 제외하는 행 수입니다.
+        """
+        return self._inactive
+
+    def has_post(self, post_id: int) -> bool:
+        """
+        게시글의 얼굴이 갤러리에 있는지(삭제되지 않은 행이 있는지) 확인합니다.
+        """
+        return int(post_id) in self._posts
+
+    def face_count(self, post_id: int) -> int:
+        """
+        게시글의 활성 행(얼굴) 수를 반환합니다.
+        """
+        return self._posts.get(int(post_id), 0)
+
+    def _reserve(self, capacity: int) -> None:
+        """
+        행렬 용량을 capacity 이상으로 늘립니다. 부족할 때마다 두 배씩 늘립니다.
+        """
+        current = 0 if self._matrix is None else self._matrix.shape[0]
+        if capacity <= current:
+            return
+
+        new_capacity = max(self._initial_capacity, current)
+        while new_capacity < capacity:
+            new_capacity *= 2
+
+        matrix = np.empty((new_capacity, self.dim), dtype=np.float32)
+        labels = np.empty((new_capacity, len(LABEL_FIELDS)), dtype=np.int64)
+        active = np.zeros(new_capacity, dtype=bool)
+        if self._size:
+            matrix[:self._size] = self._matrix[:self._size]
+            labels[:self._size] = self._labels[:self._size]
+            active[:self._size] = self._active[:self._size]
+        self._matrix, self._labels, self._active = matrix, labels, active
+
+    def add(self, encodings, labels) -> None:
+        """
+        인코딩과 라벨을 갤러리 끝에 추가합니다. directory가 지정되어 있으면 파일 끝에도 덧붙입니다.
+
+        Parameters
+        ----------
+        encodings : np.ndarray
+            (n, dim) 모양의 얼굴 인코딩입니다. 추가하기 전에 L2 정규화됩니다.
+        labels : list
+            (게시글 ID, 이미지 번호, 얼굴 번호) 튜플 n개입니다.
+
+        Returns
+        -------
+        None
+        """
+        if not self.directory:
+            with self._lock:
+                self._append(encodings, labels)
+            return
+
+        # 디스크에 먼저 덧붙인 뒤 파일에서 다시 읽어 오므로, 다른 프로세스가 추가한 행과 순서가 항상 같습니다.
+        encodings = l2_normalize(np.atleast_2d(encodings))
+        labels = np.asarray(labels, dtype=np.int64).reshape(-1, len(LABEL_FIELDS))
+        if encodings.shape[0] != labels.shape[0]:
+            raise ValueError("인코딩 수와 라벨 수가 다릅니다.")
+        if self.dim is not None and encodings.shape[1] != self.dim:
+            raise ValueError(f"임베딩 차원이 다릅니다. (갤러리: {self.dim}, 입력: {encodings.shape[1]})")
+        if encodings.shape[0]:
+            _append_records(_current_dir(self.directory), encodings, labels)
+            self.refresh()
+
+    def _append(self, encodings, labels):
+        """
+        인코딩과 라벨을 메모리 행렬 끝에 추가하고, 정규화된 인코딩과 라벨 배열을 반환합니다.
+        """
+        encodings = l2_normalize(np.atleast_2d(encodings))
+        labels = np.asarray(labels, dtype=np.int64).reshape(-1, len(LABEL_FIELDS))
+        if encodings.shape[0] != labels.shape[0]:
+            raise ValueError("인코딩 수와 라벨 수가 다릅니다.")
+        if encodings.shape[0] == 0:
+            return encodings, labels
+
+        if self.dim is None:
+            self.dim = encodings.shape[1]
+        elif encodings.shape[1] != self.dim:
+            raise ValueError(f"임베딩 차원이 다릅니다. (갤러리: {self.dim}, 입력: {encodings.shape[1]})")
+
+        end = self._size + encodings.shape[0]
+        self._reserve(end)
+        self._matrix[self._size:end] = encodings
+        self._labels[self._size:end] = labels
+        for row, label in enumerate(map(tuple, labels.tolist()), start=self._size):
+            # 삭제된 게시글이거나 이미 있는 라벨(작업 재시도, 동시 추가)이면 비활성
+            active = label[0] not in self._removed and label not in self._label_keys
+            self._active[row] = active
+            if active:
+                self._label_keys.add(label)
+                self._posts[label[0]] = self._posts.get(label[0], 0) + 1
+            else:
+                self._inactive += 1
+        self._size = end
+        return encodings, labels
+
+    def remove(self, post_ids) -> None:
+        """
+        게시글의 얼굴을 검색에서 제외합니다. directory가 지정되어 있으면 삭제 목록 파일 끝에도 덧붙입니다.
+
+        행은 그대로 두므로 행 번호(근사 최근접 이웃 인덱스의 벡터 ID)는 바뀌지 않습니다.
+
+        Parameters
+        ----------
+        post_ids : list
+            삭제된 게시글 ID 목록입니다.
+
+        Returns
+        -------
+        None
+        """
+        post_ids = np.asarray(post_ids, dtype=np.int64).reshape(-1)
+        if not post_ids.shape[0]:
+            return
+        if self.directory:
+            _append_removed(_current_dir(self.directory), post_ids)
+            self.refresh()
+        else:
+            with self._lock:
+                self._mark_removed(post_ids)
+
+    def _mark_removed(self, post_ids) -> None:
+        """
+        삭제된 게시글 ID를 기록하고 해당 게시글의 활성 행을 비활성으로 바꿉니다.
+        """
+        post_ids = set(map(int, post_ids)) - self._removed
+        if not post_ids:
+            return
+        self._removed |= post_ids
+        for post_id in post_ids:
+            self._posts.pop(post_id, None)
+        self._label_keys = {label for label in self._label_keys if label[0] not in post_ids}
+
+        rows = self.active & np.isin(self.labels[:, 0], list(post_ids))
+        self._active[:self._size][rows] = False
+        self._inactive += int(rows.sum())
+
+    def search(self, query, k: int = 5, exclude_post_id: Optional[int] = None) -> list:
+        """
+        질의 인코딩과 코사인 유사도가 가장 높은 상위 k개 얼굴을 반환합니다.
+
+        Parameters
+        ----------
+        query : np.ndarray
+            (dim,) 모양의 질의 얼굴 인코딩입니다.
+        k : int, optional
+            반환할 결과 수입니다. (기본값은 5)
+        exclude_post_id : int, optional
+            결과에서 제외할 게시글 ID입니다. (예: 질의 사진이 올라온 게시글)
+
+        Returns
+        -------
+        list
+            (게시글 ID, 이미지 번호, 얼굴 번호, 코사인 유사도) 튜플 목록입니다. 유사도가 높은 순서입니다.
+        """
+        if self._size == 0 or k <= 0:
+            return []
+
+        query = l2_normalize(np.ravel(query))
+        with self._lock:
+            matrix, labels = self.matrix, self.labels
+            scores = matrix @ query  # 행렬-벡터 곱 한 번으로 모든 얼굴과의 코사인 유사도 계산
+            scores = np.where(self.active, scores, -np.inf)  # 삭제된 게시글, 중복 라벨 제외
+
+        if exclude_post_id is not None:
+            scores = np.where(labels[:, 0] == exclude_post_id, -np.inf, scores)
+
+        k = min(k, scores.shape[0])
+        top = np.argpartition(-scores, k - 1)[:k]  # 상위 k개만 부분 정렬
+        top = top[np.argsort(-scores[top])]
+        return [(*map(int, labels[i]), float(scores[i])) for i in top if np.isfinite(scores[i])]
+
+    def save(self, directory: str) -> None:
+        """
+        갤러리 전체를 directory의 새 세대로 저장합니다.
+
+        새 세대 디렉터리에 모두 쓴 뒤 CURRENT를 os.replace로 바꾸므로, 다른 프로세스가 읽는 기존 파일은 바뀌지 않습니다.
+        바로 이전 세대는 읽는 도중인 프로세스를 위해 남기고, 그보다 오래된 세대(와 이전 형식 파일)는 지웁니다.
+        행 번호를 유지하기 위해 비활성 행도 그대로 저장하고, 삭제 목록도 함께 저장합니다.
+
+        Parameters
+        ----------
+        directory : str
+            저장할 디렉터리 경로입니다.
+
+        Returns
+        -------
+        None
+        """
+        os.makedirs(directory, exist_ok=True)
+        previous = _current_generation(directory)
+        generation = f'gen-{time.time_ns()}'
+        target = os.path.join(directory, generation)
+        os.makedirs(target)
+        with self._lock:
+            if self._size:
+                _append_records(target, self.matrix, self.labels)
+            if self._removed:
+                _append_removed(target, np.fromiter(sorted(self._removed), dtype=np.int64))
+
+        pointer = os.path.join(directory, f'CURRENT.{os.getpid()}.tmp')
+        with open(pointer, 'w') as f:
+            f.write(generation)
+        os.replace(pointer, os.path.join(directory, 'CURRENT'))  # 새 세대로 한 번에 전환
+
+        for name in os.listdir(directory):
+            path = os.path.join(directory, name)
+            if name in ('meta.json', 'gallery.bin', 'removed.bin'):  # 이전 형식 (세대 없이 directory 바로 아래)
+                os.remove(path)
+            elif name.startswith('gen-') and name not in (generation, previous):
+                shutil.rmtree(path, ignore_errors=True)
+
+    def refresh(self) -> int:
+        """
+        다른 프로세스가 directory의 파일 끝에 덧붙인 행과 삭제된 게시글 ID를 읽어 옵니다. 새로 추가된 부분만 읽습니다.
+
+        갤러리를 다시 만들어 세대가 바뀌었으면 보관 중인 행을 비우고 새 세대를 처음부터 불러옵니다.
+        (행 번호가 바뀌므로 근사 최근접 이웃 인덱스는 generation을 보고 다시 만듦)
+
+        Returns
+        -------
+        int
+            새로 읽어 온 행 수입니다.
+        """
+        if not self.directory:
+            return 0
+
+        with self._lock:
+            generation = _current_generation(self.directory)
+            if generation != self.generation:
+                if self.generation is not None:
+                    logger.info(f"얼굴 갤러리 세대 변경 - {self.generation or '(이전 형식)'} -> {generation}, 다시 불러옵니다.")
+                self._reset()
+                self.dim = None  # 모델을 바꿔 다시 만든 경우 차원이 다를 수 있음
+                self.generation = generation
+            directory = os.path.join(self.directory, generation)
+
+            removed = _read_removed(directory, self._removed_read)
+            self._removed_read += removed.shape[0]
+            self._mark_removed(removed)
+
+            if self.dim is None:
+                meta_path = os.path.join(directory, 'meta.json')
+                if not os.path.exists(meta_path):
+                    return 0
+                with open(meta_path) as f:
+                    self.dim = json.load(f)['dim']
+
+            records = _read_records(directory, self.dim, self._size)
+            self._append(records['encoding'], records['label'])
+            return records.shape[0]
+
+    @classmethod
+    def load(cls, directory: str, bind: bool = True) -> 'FaceGallery':
+        """
+        directory에 저장된 갤러리를 불러옵니다. 파일이 없으면 빈 갤러리를 반환합니다.
+
+        Parameters
+        ----------
+        directory : str
+            저장된 디렉터리 경로입니다.
+        bind : bool, optional
+            True이면 이후 추가되는 행도 같은 디렉터리에 덧붙입니다. (기본값은 True)
+
+        Returns
+        -------
+        FaceGallery
+            불러온 갤러리입니다.
+        """
+        gallery = cls(directory=directory)
+        gallery.refresh()
+        if not bind:
+            gallery.directory = None
+        return gallery
+
+
+def _current_generation(directory: str) -> str:
+    """
+    directory/CURRENT에 적힌 현재 세대 디렉터리 이름을 반환합니다. CURRENT가 없으면 이전 형식이므로 ''입니다.
+    """
+    try:
+        with open(os.path.join(directory, 'CURRENT')) as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return ''
+
+
+def _current_dir(directory: str) -> str:
+    """
+    행과 삭제 목록을 덧붙일 현재 세대 디렉터리 경로입니다.
+    """
+    return os.path.join(directory, _current_generation(directory))
+
+
+def _record_dtype(dim: int) -> np.dtype:
+    """
+    디스크 레코드의 자료형입니다. (라벨 int64 x 3, 인코딩 float32 x dim)
+    """
+    return np.dtype([('label', np.int64, (len(LABEL_FIELDS),)), ('encoding', np.float32, (dim,))])
+
+
+def _read_records(directory: str, dim: int, start_row: int) -> np.ndarray:
+    """
+    gallery.bin에서 start_row번째 레코드부터 끝까지 읽습니다. 덧붙이는 도중인 마지막 레코드는 제외합니다.
+    """
+    dtype = _record_dtype(dim)
+    path = os.path.join(directory, 'gallery.bin')
+    if not os.path.exists(path):
+        return np.zeros(0, dtype=dtype)
+    with open(path, 'rb') as f:
+        f.seek(start_row * dtype.itemsize)
+        data = f.read()
+    rows = len(data) // dtype.itemsize
+    return np.frombuffer(data[:rows * dtype.itemsize], dtype=dtype)
+
+
+def _read_removed(directory: str, start: int) -> np.ndarray:
+    """
+    removed.bin에서 start번째 게시글 ID부터 끝까지 읽습니다. 덧붙이는 도중인 마지막 ID는 제외합니다.
+    """
+    path = os.path.join(directory, 'removed.bin')
+    if not os.path.exists(path):
+        return np.zeros(0, dtype=np.int64)
+    with open(path, 'rb') as f:
+        f.seek(start * 8)
+        data = f.read()
+    return np.frombuffer(data[:len(data) // 8 * 8], dtype=np.int64)
+
+
+def _append_removed(directory: str, post_ids: np.ndarray) -> None:
+    """
+    삭제된 게시글 ID를 removed.bin 끝에 write() 한 번으로 덧붙입니다.
+    """
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, 'removed.bin'), 'ab') as f:
+        f.write(np.asarray(post_ids, dtype=np.int64).tobytes())
+
+
+def _append_records(directory: str, encodings: np.ndarray, labels: np.ndarray) -> None:
+    """
+    정규화된 인코딩과 라벨을 gallery.bin 끝에 write() 한 번으로 덧붙입니다.
+    """
+    os.makedirs(directory, exist_ok=True)
+    dim = encodings.shape[1]
+    meta_path = os.path.join(directory, 'meta.json')
+    if not os.path.exists(meta_path):
+        with open(meta_path, 'w') as f:
+            json.dump({'dim': dim}, f)
+
+    records = np.empty(encodings.shape[0], dtype=_record_dtype(dim))
+    records['label'] = labels
+    records['encoding'] = encodings
+    with open(os.path.join(directory, 'gallery.bin'), 'ab') as f:
+        f.write(records.tobytes())
+
+
+_gallery = None  # 프로세스 단위 갤러리 (처음 사용할 때 디스크에서 불러옴)
+_gallery_lock = threading.Lock()
+
+
+def get_face_gallery() -> FaceGallery:
+    """
+    settings.AI_FACE_GALLERY['PATH']에서 불러온 프로세스 단위 얼굴 갤러리를 반환합니다.
+
+    Returns
+    -------
+    FaceGallery
+        프로세스 단위 얼굴 갤러리입니다.
+    """
+    global _gallery
+    if _gallery is None:
+        with _gallery_lock:
+            if _gallery is None:
+                from django.conf import settings
+
+                path = getattr(settings, 'AI_FACE_GALLERY', {}).get('PATH')
+                _gallery = FaceGallery.load(path) if path else FaceGallery()
+    return _gallery
+
+
+def remove_from_face_gallery(post_id: int) -> None:
+    """
+    삭제된 게시글의 얼굴을 얼굴 갤러리 검색에서 제외합니다.
+
+    이 프로세스가 갤러리를 불러왔으면 바로 반영하고, 아니면 갤러리 디렉터리의 삭제 목록에만 덧붙입니다.
+    (다른 프로세스는 refresh()에서 읽어 감, 갤러리를 만든 적이 없으면 아무것도 하지 않음)
+
+    Parameters
+    ----------
+    post_id : int
+        삭제된 게시글의 ID입니다.
+
+    Returns
+    -------
+    None
+    """
+    from django.conf import settings
+
+    path = getattr(settings, 'AI_FACE_GALLERY', {}).get('PATH')
+    if _gallery is not None:
+        _gallery.remove([post_id])
+    elif path and os.path.exists(os.path.join(_current_dir(path), 'meta.json')):
+        _append_removed(_current_dir(path), np.array([post_id], dtype=np.int64))
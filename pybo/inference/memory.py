@@ -0,0 +1,39 @@
+import os
+
+"""
+프로세스 메모리 사용량을 측정하는 모듈입니다.
+
+AI 의존성(ai_system 등) 없이 임포트할 수 있으므로 모델 레지스트리(pybo.inference.registry)와
+추론 워커 풀(pybo.inference.pool)이 함께 사용합니다.
+"""
+
+
+def current_rss_bytes() -> int:
+    """
+    현재 프로세스의 RSS(실제 사용 중인 메모리) 크기를 바이트 단위로 반환합니다.
+
+    psutil이 설치되어 있으면 psutil을 사용하고, 없으면 /proc/self/statm(리눅스)을,
+    그것도 없으면 resource 모듈의 최대 RSS 값을 사용합니다.
+
+    Returns
+    -------
+    int
+        RSS 크기(바이트)입니다. 측정할 수 없으면 0을 반환합니다.
+    """
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    try:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024  # 리눅스에서는 KB 단위
+    except ImportError:
+        return 0
@@ -0,0 +1,322 @@
+import os
+import shutil
+
+import numpy as np
+
+from ..url_patterns import URLS
+
+import logging
+logger = logging.getLogger(URLS['APP_NAME'])  # 로거 설정
+
+"""
+YOLO 얼굴 탐지기를 ONNX로 내보내 onnxruntime으로 CPU에서 실행하는 모듈입니다.
+
+서버에 GPU가 없어 DetectionConfig.yolo_path('yolov8_l_trump.pt')의 PyTorch 모델을 CPU에서 실행하고 있으며,
+탐지에 드는 CPU 시간이 게시글당 비용에서 가장 큽니다. onnxruntime은 그래프 최적화(연산 결합, 상수 접기)를 적용하고
+int8 양자화 모델을 실행할 수 있어 같은 CPU에서 PyTorch보다 빠르게 실행됩니다.
+
+1. 내보내기: export_onnx()로 .pt 가중치를 ONNX(배치 크기 가변)로 내보내고,
+             quantize_onnx()로 int8 양자화 모델을 만듭니다. (export_detector 명령)
+2. 실행: 탐지기 이름 'yolo_onnx'를 선택하면 레지스트리가 OnnxYoloDetector를 생성합니다. (settings.AI_ONNX_DETECTOR)
+3. 비교: evaluate_detector 명령으로 라벨이 있는 로컬 샘플에서 PyTorch/ONNX/int8 모델의 정확도와 지연 시간을 비교합니다.
+
+전처리(레터박스, 0~1 정규화)와 후처리(신뢰도 필터, NMS)는 ultralytics YOLOv8과 같은 방식으로 NumPy로 구현합니다.
+onnxruntime(실행), ultralytics(내보내기)는 선택 의존성이며 사용할 때 임포트합니다.
+"""
+
+DEFAULT_OPTIONS = {
+    'MODELS': {},  # 설정 클래스 이름 -> ONNX 모델 경로
+    'IMAGE_SIZE': 640,
+    'CONF_THRESHOLD': 0.25,
+    'IOU_THRESHOLD': 0.45,
+    'THREADS': None,
+}
+
+PAD_VALUE = 114  # ultralytics 레터박스 여백 색
+
+
+def get_onnx_options() -> dict:
+    """
+    settings.AI_ONNX_DETECTOR와 기본값을 합친 ONNX 탐지기 설정을 반환합니다.
+    """
+    from django.conf import settings
+
+    return {**DEFAULT_OPTIONS, **getattr(settings, 'AI_ONNX_DETECTOR', {})}
+
+
+def letterbox(image_rgb: np.ndarray, size: int = 640):
+    """
+    비율을 유지한 채 size x size 입력으로 크기를 바꾸고 남는 부분을 회색으로 채웁니다.
+
+    Parameters
+    ----------
+    image_rgb : np.ndarray
+        (높이, 너비, 3) uint8 RGB 이미지입니다.
+    size : int, optional
+        모델 입력 크기입니다.
+
+    Returns
+    -------
+    tensor : np.ndarray
+        (3, size, size) float32 모델 입력입니다. (0~1)
+    scale : float
+        원본 좌표에 곱해 입력 좌표로 바꾸는 배율입니다.
+    pad : tuple
+        입력 이미지 왼쪽, 위쪽 여백(픽셀)입니다.
+    """
+    from PIL import Image
+
+    height, width = image_rgb.shape[:2]
+    scale = min(size / height, size / width)
+    new_width, new_height = round(width * scale), round(height * scale)
+    pad_x, pad_y = (size - new_width) // 2, (size - new_height) // 2
+
+    canvas = np.full((size, size, 3), PAD_VALUE, dtype=np.uint8)
+    resized = Image.fromarray(image_rgb).resize((new_width, new_height), Image.BILINEAR)
+    canvas[pad_y:pad_y + new_height, pad_x:pad_x + new_width] = np.asarray(resized)
+    tensor = canvas.transpose(2, 0, 1).astype(np.float32) / 255.0  # HWC -> CHW
+    return tensor, scale, (pad_x, pad_y)
+
+
+def box_iou(boxes1: np.ndarray, boxes2: np.ndarray) -> np.ndarray:
+    """
+    (x1, y1, x2, y2) 바운딩 박스 사이의 IoU 행렬 (len(boxes1), len(boxes2))을 반환합니다.
+    """
+    boxes1 = np.asarray(boxes1, dtype=np.float32).reshape(-1, 4)
+    boxes2 = np.asarray(boxes2, dtype=np.float32).reshape(-1, 4)
+    top_left = np.maximum(boxes1[:, None, :2], boxes2[None, :, :2])
+    bottom_right = np.minimum(boxes1[:, None, 2:], boxes2[None, :, 2:])
+    intersection = np.prod(np.clip(bottom_right - top_left, 0, None), axis=2)
+    area1 = np.prod(boxes1[:, 2:] - boxes1[:, :2], axis=1)
+    area2 = np.prod(boxes2[:, 2:] - boxes2[:, :2], axis=1)
+    return intersection / np.maximum(area1[:, None] + area2[None, :] - intersection, 1e-9)
+
+
+def nms(boxes: np.ndarray, scores: np.ndarray, iou_threshold: float) -> np.ndarray:
+    """
+    신뢰도가 높은 박스부터 남기고, 남긴 박스와 IoU가 iou_threshold보다 큰 박스를 제거합니다.
+
+    Returns
+    -------
+    np.ndarray
+        남긴 박스의 인덱스입니다. (신뢰도 내림차순)
+    """
+    order = np.argsort(-scores)
+    keep = []
+    while order.size:
+        best = order[0]
+        keep.append(best)
+        rest = order[1:]
+        order = rest[box_iou(boxes[best], boxes[rest])[0] <= iou_threshold]
+    return np.asarray(keep, dtype=np.int64)
+
+
+def decode_output(output: np.ndarray, scale: float, pad: tuple, image_shape: tuple,
+                  conf_threshold: float = 0.25, iou_threshold: float = 0.45) -> np.ndarray:
+    """
+    YOLOv8 출력 한 장을 원본 이미지 좌표의 탐지 결과로 바꿉니다.
+
+    Parameters
+    ----------
+    output : np.ndarray
+        (4 + 클래스 수, 후보 수) 출력입니다. 앞 4개 행은 입력 좌표의 (중심 x, 중심 y, 너비, 높이)입니다.
+    scale, pad : float, tuple
+        letterbox()가 반환한 배율과 여백입니다.
+    image_shape : tuple
+        원본 이미지의 (높이, 너비)입니다.
+    conf_threshold, iou_threshold : float, optional
+        신뢰도 하한과 NMS IoU 기준입니다.
+
+    Returns
+    -------
+    np.ndarray
+        (탐지 수, 5) 배열 (x1, y1, x2, y2, 신뢰도)입니다. 신뢰도 내림차순입니다.
+    """
+    predictions = np.asarray(output, dtype=np.float32).T  # (후보 수, 4 + 클래스 수)
+    scores = predictions[:, 4:].max(axis=1)
+    predictions, scores = predictions[scores >= conf_threshold], scores[scores >= conf_threshold]
+    if not len(scores):
+        return np.zeros((0, 5), dtype=np.float32)
+
+    center, half = predictions[:, :2], predictions[:, 2:4] / 2
+    boxes = np.concatenate([center - half, center + half], axis=1)
+    boxes = (boxes - np.tile(pad, 2)) / scale  # 입력 좌표 -> 원본 좌표
+    height, width = image_shape[:2]
+    boxes[:, [0, 2]] = boxes[:, [0, 2]].clip(0, width)
+    boxes[:, [1, 3]] = boxes[:, [1, 3]].clip(0, height)
+
+    keep = nms(boxes, scores, iou_threshold)
+    return np.concatenate([boxes[keep], scores[keep, None]], axis=1).astype(np.float32)
+
+
+class OnnxYoloModel:
+    """
+    ONNX로 내보낸 YOLOv8 모델을 onnxruntime으로 실행하는 모델입니다.
+
+    ultralytics YOLO 모델처럼 이미지 목록을 받아 이미지마다 결과 하나씩 든 목록을 반환하므로
+    탐지기 마이크로 배치(pybo.inference.batching.BatchingModel)로 감쌀 수 있습니다.
+    배치 크기가 가변인 모델이면 목록 전체를 한 번에 실행하고, 고정이면 한 장씩 실행합니다.
+
+    Methods
+    -------
+    __call__(images):
+        이미지(또는 이미지 목록)의 탐지 결과 목록을 반환합니다.
+    """
+
+    def __init__(self, model_path: str, image_size: int = 640, conf_threshold: float = 0.25,
+                 iou_threshold: float = 0.45, threads: int = None):
+        import onnxruntime as ort  # 선택 의존성
+
+        session_options = ort.SessionOptions()
+        session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if threads:
+            session_options.intra_op_num_threads = threads  # 추론 워커 풀에서는 INFERENCE_POOL.THREADS_PER_WORKER와 맞춤
+        self.session = ort.InferenceSession(model_path, session_options, providers=['CPUExecutionProvider'])
+        self.input_name = self.session.get_inputs()[0].name
+        self.dynamic_batch = not isinstance(self.session.get_inputs()[0].shape[0], int)
+        self.model_path = model_path
+        self.image_size = image_size
+        self.conf_threshold = conf_threshold
+        self.iou_threshold = iou_threshold
+
+    def __call__(self, images, **kwargs) -> list:
+        if isinstance(images, np.ndarray) and images.ndim == 3:  # 한 장
+            images = [images]
+        inputs = [letterbox(image, self.image_size) for image in images]
+        batch = np.stack([tensor for tensor, _, _ in inputs])
+
+        if self.dynamic_batch:
+            outputs = self.session.run(None, {self.input_name: batch})[0]
+        else:
+            outputs = np.concatenate([self.session.run(None, {self.input_name: tensor[None]})[0] for tensor in batch])
+
+        return [
+            decode_output(output, scale, pad, image.shape, self.conf_threshold, self.iou_threshold)
+            for output, (_, scale, pad), image in zip(outputs, inputs, images)
+        ]
+
+
+class OnnxYoloDetector:
+    """
+    FaceDetectorFactory의 'yolo' 탐지기 대신 사용할 수 있는 ONNX 얼굴 탐지기입니다. (탐지기 이름 'yolo_onnx')
+
+    Attributes
+    ----------
+    model : OnnxYoloModel
+        ONNX 모델입니다. (AI_DETECTOR_BATCHING의 MODEL_ATTRIBUTE)
+
+    Methods
+    -------
+    detect_faces(image_rgb):
+        이미지 한 장의 얼굴 바운딩 박스와 신뢰도를 반환합니다.
+    """
+
+    name = 'yolo_onnx'
+
+    def __init__(self, model_path: str, **options):
+        self.model = OnnxYoloModel(model_path, **options)
+
+    def detect_faces(self, image_rgb: np.ndarray) -> list:
+        """
+        이미지 한 장의 얼굴 바운딩 박스와 신뢰도를 반환합니다.
+
+        Parameters
+        ----------
+        image_rgb : np.ndarray
+            (높이, 너비, 3) uint8 RGB 이미지입니다.
+
+        Returns
+        -------
+        list
+            (x1, y1, x2, y2, 신뢰도) 튜플 목록입니다.
+        """
+        return [tuple(map(float, box)) for box in self.model(image_rgb)[0]]
+
+    __call__ = detect_faces
+
+    @classmethod
+    def from_settings(cls, config_name: str) -> 'OnnxYoloDetector':
+        """
+        settings.AI_ONNX_DETECTOR에서 설정 클래스(예: 'DetectionConfig')의 ONNX 모델로 탐지기를 생성합니다.
+        """
+        options = get_onnx_options()
+        model_path = options['MODELS'].get(config_name)
+        if not model_path:
+            raise ValueError(f"{config_name}의 ONNX 모델이 설정되지 않았습니다. (AI_ONNX_DETECTOR['MODELS'])")
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(f"ONNX 모델이 없습니다: {model_path} (python manage.py export_detector로 생성)")
+        return cls(
+            model_path,
+            image_size=options['IMAGE_SIZE'],
+            conf_threshold=options['CONF_THRESHOLD'],
+            iou_threshold=options['IOU_THRESHOLD'],
+            threads=options['THREADS'],
+        )
+
+
+def export_onnx(weights_path: str, output_path: str, image_size: int = 640, opset: int = 17) -> str:
+    """
+    ultralytics YOLO 가중치(.pt)를 배치 크기가 가변인 ONNX 모델로 내보냅니다.
+
+    Returns
+    -------
+    str
+        내보낸 ONNX 모델 경로입니다.
+    """
+    from ultralytics import YOLO  # 선택 의존성
+
+    exported = YOLO(weights_path).export(format='onnx', imgsz=image_size, dynamic=True, simplify=True, opset=opset)
+    if os.path.abspath(exported) != os.path.abspath(output_path):
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        shutil.move(exported, output_path)
+    logger.info(f"ONNX 내보내기 완료 - {weights_path} -> {output_path}")
+    return output_path
+
+
+class _CalibrationReader:
+    """
+    정적 양자화의 보정(calibration)용 입력을 샘플 이미지에서 하나씩 만드는 onnxruntime 데이터 리더입니다.
+    """
+
+    def __init__(self, input_name: str, image_paths: list, image_size: int):
+        self.input_name = input_name
+        self.image_paths = iter(image_paths)
+        self.image_size = image_size
+
+    def get_next(self):
+        from PIL import Image
+
+        path = next(self.image_paths, None)
+        if path is None:
+            return None
+        with Image.open(path) as image:
+            tensor, _, _ = letterbox(np.asarray(image.convert('RGB')), self.image_size)
+        return {self.input_name: tensor[None]}
+
+
+def quantize_onnx(model_path: str, output_path: str, calibration_images: list = None, image_size: int = 640) -> str:
+    """
+    ONNX 모델을 int8로 양자화합니다.
+
+    보정 이미지가 있으면 활성값 범위를 측정하는 정적 양자화(QDQ, 채널별 가중치)를,
+    없으면 가중치만 미리 양자화하는 동적 양자화를 사용합니다. (합성곱 모델은 정적 양자화가 더 빠르고 정확함)
+
+    Returns
+    -------
+    str
+        양자화한 ONNX 모델 경로입니다.
+    """
+    import onnxruntime as ort
+    from onnxruntime.quantization import QuantFormat, QuantType, quantize_dynamic, quantize_static  # 선택 의존성
+
+    if calibration_images:
+        input_name = ort.InferenceSession(model_path, providers=['CPUExecutionProvider']).get_inputs()[0].name
+        quantize_static(
+            model_path, output_path, _CalibrationReader(input_name, calibration_images, image_size),
+            quant_format=QuantFormat.QDQ, per_channel=True,
+            activation_type=QuantType.QUInt8, weight_type=QuantType.QInt8,
+        )
+    else:
+        quantize_dynamic(model_path, output_path, weight_type=QuantType.QUInt8)
+    logger.info(f"int8 양자화 완료 - {model_path} -> {output_path} (보정 이미지 {len(calibration_images or [])}장)")
+    return output_path
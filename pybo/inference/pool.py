@@ -0,0 +1,495 @@
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Callable, Optional
+import atexit
+import itertools
+import multiprocessing
+import multiprocessing.connection
+import os
+import signal
+import socket
+import sys
+import threading
+
+from .memory import current_rss_bytes
+from ..url_patterns import URLS
+
+import logging
+logger = logging.getLogger(URLS['APP_NAME'])  # 로거 설정
+
+"""
+모델을 한 번만 로드해 두고 추론 작업을 나눠 실행하는 추론 워커 프로세스 풀 모듈입니다.
+
+얼굴 탐지/인코딩은 CPU를 오래 쓰는 작업이므로 웹 요청 워커나 작업 큐의 스레드에서 직접 실행하면
+GIL 때문에 코어를 나눠 쓰지 못하고, 모델도 작업 스레드를 가진 프로세스마다 따로 올라갑니다.
+이 풀은 워커 프로세스를 미리 띄워 모델을 로드(initializer)해 두고, 작업을 로컬 파이프로 보내 실행합니다.
+
+1. 동시 실행: 워커 프로세스 수(PROCESSES)만큼 작업을 동시에 실행하고, 나머지는 풀 안의 대기열에서 기다립니다.
+2. 재활용: 워커가 MAX_JOBS_PER_WORKER개 작업을 처리했거나 RSS가 MAX_RSS_MB를 넘으면 종료하고 새 워커로 바꿉니다.
+           (모델/라이브러리의 메모리 누수와 단편화가 쌓이지 않도록 함)
+3. 장애 복구: 워커가 작업 도중 죽으면(세그폴트, OOM 등) 새 워커를 띄우고 작업을 MAX_CRASH_RETRIES번까지 다시 실행합니다.
+              새 워커가 모델 로드 중에 계속 죽으면(MAX_STARTUP_FAILURES번 연속) 풀을 고장 상태로 바꾸고 작업을 실패시킵니다.
+
+워커마다 torch/OpenMP 스레드 수를 THREADS_PER_WORKER로 제한하므로, GPU가 없는 서버에서는
+PROCESSES x THREADS_PER_WORKER가 코어 수를 넘지 않게 설정하면 처리량이 코어 수에 비례해 늘어납니다.
+
+작업 함수와 인자, 결과는 pickle로 주고받으므로 작업 함수는 모듈 최상위 함수여야 합니다.
+"""
+
+DEFAULT_OPTIONS = {
+    'PROCESSES': None,
+    'THREADS_PER_WORKER': 1,
+    'MAX_JOBS_PER_WORKER': 500,
+    'MAX_RSS_MB': None,
+    'MAX_CRASH_RETRIES': 1,
+    'START_METHOD': 'spawn',
+    'SHARED_MEMORY': True,
+}
+MAX_STARTUP_FAILURES = 3  # 워커가 준비되기 전에 연속으로 죽으면 풀을 고장 상태로 바꾸는 횟수
+THREAD_ENV_VARS = ('OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS')
+
+
+class InferencePoolError(Exception):
+    """
+    추론 워커 풀이 작업을 실행할 수 없을 때 발생하는 예외입니다. (풀 종료, 고장, 워커 비정상 종료)
+    """
+
+
+def _worker_main(conn, max_jobs: int, max_rss_bytes: Optional[int], threads: int) -> None:
+    """
+    추론 워커 프로세스의 본체입니다.
+
+    스레드 수를 제한하고 Django를 설정한 뒤, 파이프로 받은 initializer로 모델을 로드하고 부모 프로세스에 준비 완료를 알립니다.
+    (initializer와 작업 함수는 Django 설정 뒤에 받아야 모델 등을 임포트하는 모듈의 함수도 사용할 수 있음)
+    이후 파이프로 받은 작업을 하나씩 실행하고, 재활용 조건에 닿으면 결과를 보낸 뒤 종료합니다.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl+C는 부모 프로세스가 받아 풀을 정리함
+    for name in THREAD_ENV_VARS:
+        os.environ[name] = str(threads)  # torch/numpy를 임포트하기 전에 설정해야 적용됨
+    if 'torch' in sys.modules:  # fork로 시작해 이미 임포트된 경우
+        sys.modules['torch'].set_num_threads(threads)
+
+    import django
+    from django.apps import apps
+    if not apps.ready:  # spawn으로 시작한 새 인터프리터
+        django.setup()
+
+    initializer, initargs = conn.recv()
+    if initializer is not None:
+        initializer(*initargs)
+    conn.send(('ready', os.getpid()))
+
+    jobs_done = 0
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:  # 부모 프로세스 종료
+            break
+        if message is None:  # 풀 종료
+            break
+
+        job_id, func, args, kwargs = message
+        try:
+            ok, value = True, func(*args, **kwargs)
+        except Exception as e:
+            ok, value = False, e
+        jobs_done += 1
+        rss = current_rss_bytes()
+        retiring = jobs_done >= max_jobs or bool(max_rss_bytes and rss >= max_rss_bytes)
+
+        try:
+            conn.send(('done', job_id, ok, value, rss, retiring))
+        except Exception as e:  # 결과나 예외를 pickle할 수 없는 경우
+            conn.send(('done', job_id, False, InferencePoolError(f"작업 결과를 전달할 수 없습니다: {e!r}"), rss, retiring))
+        if retiring:
+            break
+
+
+@dataclass
+class _PoolJob:
+    """
+    풀 대기열의 작업 하나입니다.
+    """
+
+    id: int
+    func: Callable
+    args: tuple
+    kwargs: dict
+    future: Future
+    crashes: int = 0
+
+
+class _Worker:
+    """
+    부모 프로세스에서 본 워커 프로세스 하나의 상태입니다.
+    """
+
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+        self.pid = None  # 'ready'를 받으면 설정
+        self.job = None  # 실행 중인 작업
+        self.jobs_done = 0
+        self.retiring = False  # 재활용 조건에 닿아 스스로 종료하는 중
+
+    @property
+    def ready(self) -> bool:
+        return self.pid is not None
+
+    @property
+    def idle(self) -> bool:
+        return self.ready and self.job is None and not self.retiring
+
+
+class InferencePool:
+    """
+    모델을 미리 로드한 워커 프로세스에서 추론 작업을 실행하는 풀입니다.
+
+    작업 분배와 워커 교체는 풀의 분배 스레드 하나가 맡으며, submit()은 여러 스레드에서 동시에 호출할 수 있습니다.
+
+    Attributes
+    ----------
+    processes : int
+        워커 프로세스 수(동시 실행 작업 수)입니다.
+    max_jobs_per_worker : int
+        워커 하나가 처리한 뒤 새 워커로 바뀌는 작업 수입니다.
+    max_rss_bytes : int or None
+        작업을 마친 워커의 RSS가 이 값 이상이면 새 워커로 바꿉니다. None이면 확인하지 않습니다.
+    max_crash_retries : int
+        워커가 작업 도중 죽었을 때 작업을 다시 실행할 횟수입니다.
+    stats : dict
+        처리한 작업 수와 워커 시작/재활용/비정상 종료 횟수입니다.
+
+    Methods
+    -------
+    start(wait, timeout):
+        워커 프로세스를 띄웁니다. wait가 True이면 모든 워커가 모델을 로드할 때까지 기다립니다.
+    submit(func, *args, **kwargs):
+        작업을 대기열에 넣고 Future를 반환합니다.
+    run(func, *args, **kwargs):
+        작업을 실행하고 결과를 반환합니다.
+    worker_pids():
+        준비된 워커 프로세스 ID 목록을 반환합니다.
+    shutdown():
+        워커를 종료하고 남은 작업을 실패시킵니다.
+    """
+
+    def __init__(self, processes: Optional[int] = None, initializer: Optional[Callable] = None, initargs: tuple = (),
+                 max_jobs_per_worker: int = 500, max_rss_bytes: Optional[int] = None, max_crash_retries: int = 1,
+                 threads_per_worker: int = 1, start_method: str = 'spawn'):
+        self.processes = processes or os.cpu_count() or 1
+        self.initializer = initializer
+        self.initargs = initargs
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.max_rss_bytes = max_rss_bytes
+        self.max_crash_retries = max_crash_retries
+        self.threads_per_worker = threads_per_worker
+        self.stats = {'jobs': 0, 'started': 0, 'recycled': 0, 'crashed': 0}
+
+        self._context = multiprocessing.get_context(start_method)
+        self._pending = deque()  # 워커를 기다리는 작업
+        self._workers = []
+        self._job_ids = itertools.count(1)
+        self._condition = threading.Condition()  # 대기열, 워커 준비 상태 보호
+        self._wakeup_recv, self._wakeup_send = socket.socketpair()  # submit()/shutdown()이 분배 스레드를 깨움
+        self._wakeup_recv.setblocking(False)
+        self._thread = None
+        self._closed = False
+        self._broken = None  # 고장 원인 (InferencePoolError)
+        self._startup_failures = 0
+
+    def start(self, wait: bool = True, timeout: Optional[float] = None) -> 'InferencePool':
+        """
+        워커 프로세스를 띄우고 분배 스레드를 시작합니다. 이미 시작했으면 아무것도 하지 않습니다.
+
+        Parameters
+        ----------
+        wait : bool
+            True이면 모든 워커가 모델 로드를 마칠 때까지 기다립니다.
+        timeout : float, optional
+            wait가 True일 때 기다릴 최대 시간(초)입니다.
+
+        Returns
+        -------
+        InferencePool
+            자기 자신입니다.
+        """
+        with self._condition:
+            if self._closed:
+                raise InferencePoolError("종료된 추론 워커 풀입니다.")
+            if self._thread is None:
+                for _ in range(self.processes):
+                    self._start_worker()
+                self._thread = threading.Thread(target=self._dispatch_loop, name='pybo-inference-pool', daemon=True)
+                self._thread.start()
+                atexit.register(self.shutdown)
+                logger.info(f"추론 워커 풀 시작 - 프로세스 {self.processes}개")
+            if wait:
+                self._condition.wait_for(
+                    lambda: self._broken or sum(worker.ready for worker in self._workers) >= self.processes, timeout)
+            if self._broken:
+                raise self._broken
+        return self
+
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        """
+        작업을 대기열에 넣고 Future를 반환합니다. 풀이 시작되지 않았으면 시작합니다. (워커 준비는 기다리지 않음)
+
+        Parameters
+        ----------
+        func : callable
+            워커에서 실행할 모듈 최상위 함수입니다.
+        args, kwargs
+            func에 전달할 인자입니다. (pickle 가능해야 함)
+
+        Returns
+        -------
+        concurrent.futures.Future
+            작업 결과 또는 작업이 던진 예외를 담을 Future입니다.
+        """
+        if self._thread is None:
+            self.start(wait=False)
+        future = Future()
+        with self._condition:
+            if self._closed or self._broken:
+                raise self._broken or InferencePoolError("종료된 추론 워커 풀입니다.")
+            self._pending.append(_PoolJob(next(self._job_ids), func, args, kwargs, future))
+        self._wake()
+        return future
+
+    def run(self, func: Callable, *args, **kwargs):
+        """
+        작업을 실행하고 결과를 반환합니다. 작업이 던진 예외는 그대로 다시 던집니다.
+        """
+        return self.submit(func, *args, **kwargs).result()
+
+    def worker_pids(self) -> list:
+        """
+        준비된 워커 프로세스 ID 목록을 반환합니다.
+        """
+        with self._condition:
+            return [worker.pid for worker in self._workers if worker.ready]
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """
+        워커에 종료를 알리고, timeout초 안에 끝나지 않은 워커는 강제 종료합니다. 대기 중인 작업은 실패시킵니다.
+
+        Parameters
+        ----------
+        timeout : float
+            워커가 실행 중인 작업을 마치고 종료하기를 기다릴 시간(초)입니다.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._fail_pending(InferencePoolError("추론 워커 풀이 종료되었습니다."))
+        self._wake()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+        for worker in list(self._workers):
+            try:
+                worker.conn.send(None)
+            except (OSError, ValueError):
+                pass
+        for worker in list(self._workers):
+            worker.process.join(timeout)
+            if worker.process.is_alive():
+                worker.process.terminate()
+                worker.process.join()
+            if worker.job is not None and not worker.job.future.done():
+                worker.job.future.set_exception(InferencePoolError("추론 워커 풀이 종료되었습니다."))
+            worker.conn.close()
+        self._workers.clear()
+        self._wakeup_recv.close()
+        self._wakeup_send.close()
+        atexit.unregister(self.shutdown)
+        logger.info(f"추론 워커 풀 종료 - {self.stats}")
+
+    def _start_worker(self) -> None:
+        """
+        워커 프로세스를 하나 띄웁니다. (_condition을 잡은 상태에서 호출)
+        """
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self.max_jobs_per_worker, self.max_rss_bytes, self.threads_per_worker),
+            name='pybo-inference-worker',
+            daemon=True,  # 부모 프로세스가 종료되면 함께 종료
+        )
+        process.start()
+        child_conn.close()  # 부모에서는 자식 쪽 끝을 닫아야 워커가 죽었을 때 EOF를 받음
+        parent_conn.send((self.initializer, self.initargs))  # 워커가 Django를 설정한 뒤 읽음
+        self._workers.append(_Worker(process, parent_conn))
+        self.stats['started'] += 1
+
+    def _wake(self) -> None:
+        try:
+            self._wakeup_send.send(b'\0')
+        except (BlockingIOError, OSError):  # 이미 깨우는 신호가 쌓여 있거나 종료됨
+            pass
+
+    def _dispatch_loop(self) -> None:
+        """
+        워커의 메시지와 종료를 기다리면서, 준비된 워커에 대기 중인 작업을 보내는 분배 스레드입니다.
+        """
+        while not self._closed:
+            self._assign_jobs()
+            waitables = [self._wakeup_recv]
+            for worker in self._workers:
+                waitables += [worker.conn, worker.process.sentinel]
+            try:
+                ready = multiprocessing.connection.wait(waitables)
+            except OSError:  # 종료 중에 닫힌 연결
+                break
+
+            if self._wakeup_recv in ready:
+                try:
+                    while self._wakeup_recv.recv(4096):
+                        pass
+                except (BlockingIOError, OSError):
+                    pass
+            for worker in list(self._workers):
+                if worker.conn in ready:
+                    self._receive(worker)
+            for worker in list(self._workers):
+                if worker.process.sentinel in ready:
+                    self._replace(worker)
+
+    def _assign_jobs(self) -> None:
+        """
+        대기 중인 작업을 쉬고 있는 워커에 보냅니다.
+        """
+        with self._condition:
+            for worker in self._workers:
+                while worker.idle and self._pending:
+                    job = self._pending.popleft()
+                    if job.crashes == 0 and not job.future.set_running_or_notify_cancel():
+                        continue  # 대기 중에 취소된 작업
+                    try:
+                        worker.conn.send((job.id, job.func, job.args, job.kwargs))
+                    except (OSError, ValueError):  # 워커가 방금 죽음 (_replace에서 처리)
+                        self._pending.appendleft(job)
+                        break
+                    except Exception as e:  # 작업 함수나 인자를 pickle할 수 없음
+                        job.future.set_exception(e)
+                        continue
+                    worker.job = job
+
+    def _receive(self, worker: _Worker) -> bool:
+        """
+        워커가 보낸 메시지(준비 완료, 작업 결과)를 처리합니다. 워커가 종료되어 읽을 메시지가 없으면 False를 반환합니다.
+        """
+        try:
+            message = worker.conn.recv()
+        except (EOFError, OSError):  # 워커 종료 (sentinel로 처리)
+            return False
+
+        with self._condition:
+            if message[0] == 'ready':
+                worker.pid = message[1]
+                self._startup_failures = 0
+                self._condition.notify_all()
+                return True
+
+            _, job_id, ok, value, rss, retiring = message
+            job, worker.job = worker.job, None
+            worker.jobs_done += 1
+            worker.retiring = retiring
+            self.stats['jobs'] += 1
+        if ok:
+            job.future.set_result(value)
+        else:
+            job.future.set_exception(value)
+        if retiring:
+            logger.info(f"추론 워커 재활용 - PID {worker.pid}, 작업 {worker.jobs_done}개, RSS {rss / 1024 / 1024:.0f}MB")
+        return True
+
+    def _replace(self, worker: _Worker) -> None:
+        """
+        종료된 워커를 정리하고 새 워커를 띄웁니다. 실행 중이던 작업은 다시 실행하거나 실패시킵니다.
+        """
+        while worker.conn.poll() and self._receive(worker):  # 종료 직전에 보낸 결과를 먼저 처리 (EOF에서도 poll()은 True)
+            pass
+        worker.process.join()
+        worker.conn.close()
+
+        with self._condition:
+            self._workers.remove(worker)
+            if worker.retiring:
+                self.stats['recycled'] += 1
+            else:
+                self.stats['crashed'] += 1
+                logger.warning(f"추론 워커 비정상 종료 - PID {worker.pid}, 종료 코드 {worker.process.exitcode}")
+                if not worker.ready:
+                    self._startup_failures += 1
+
+            job = worker.job
+            if job is not None:
+                job.crashes += 1
+                if job.crashes <= self.max_crash_retries:
+                    self._pending.appendleft(job)  # 새 워커에서 먼저 다시 실행
+                else:
+                    job.future.set_exception(InferencePoolError(f"추론 워커가 작업 도중 종료되었습니다. (종료 코드 {worker.process.exitcode})"))
+
+            if self._closed:
+                return
+            if self._startup_failures >= MAX_STARTUP_FAILURES:
+                self._broken = InferencePoolError(f"추론 워커가 모델 로드 중에 {self._startup_failures}번 연속 종료되었습니다.")
+                self._fail_pending(self._broken)
+                self._condition.notify_all()
+                logger.error(str(self._broken))
+                return
+            self._start_worker()
+
+    def _fail_pending(self, error: Exception) -> None:
+        """
+        대기 중인 작업을 모두 실패시킵니다. (_condition을 잡은 상태에서 호출)
+        """
+        while self._pending:
+            job = self._pending.popleft()
+            if not job.future.done():
+                job.future.set_exception(error)
+
+
+def get_pool_options() -> dict:
+    """
+    settings.INFERENCE_POOL과 기본값을 합친 추론 워커 풀 설정을 반환합니다.
+    """
+    from django.conf import settings
+
+    return {**DEFAULT_OPTIONS, **getattr(settings, 'INFERENCE_POOL', {})}
+
+
+def create_inference_pool(initializer: Optional[Callable] = None, initargs: tuple = (), **overrides) -> InferencePool:
+    """
+    settings.INFERENCE_POOL 설정으로 추론 워커 풀을 만듭니다. (시작은 start() 또는 첫 submit()에서)
+
+    Parameters
+    ----------
+    initializer : callable, optional
+        워커가 시작할 때 한 번 실행할 모듈 최상위 함수입니다. (예: 모델 로드)
+    initargs : tuple
+        initializer에 전달할 인자입니다.
+    overrides : dict
+        settings 대신 사용할 설정입니다. (예: PROCESSES=2)
+
+    Returns
+    -------
+    InferencePool
+        시작하지 않은 추론 워커 풀입니다.
+    """
+    options = {**get_pool_options(), **overrides}
+    max_rss_mb = options['MAX_RSS_MB']
+    return InferencePool(
+        processes=options['PROCESSES'],
+        initializer=initializer,
+        initargs=initargs,
+        max_jobs_per_worker=options['MAX_JOBS_PER_WORKER'],
+        max_rss_bytes=int(max_rss_mb * 1024 * 1024) if max_rss_mb else None,
+        max_crash_retries=options['MAX_CRASH_RETRIES'],
+        threads_per_worker=options['THREADS_PER_WORKER'],
+        start_method=options['START_METHOD'],
+    )
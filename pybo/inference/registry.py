@@ -0,0 +1,280 @@
+import os
+import threading
+import time
+
+from ai_system import Pipeline, BaseConfig, factories
+
+from .batching import enable_batching, serialize_detector
+from .memory import current_rss_bytes
+from .onnx_detector import OnnxYoloDetector
+from ..url_patterns import URLS
+
+import logging
+logger = logging.getLogger(URLS['APP_NAME'])  # 로거 설정
+
+"""
+얼굴 탐지기(detector)와 파이프라인을 프로세스 단위로 보관하는 레지스트리 모듈입니다.
+
+YOLO 가중치(예: yolov8_l_trump.pt)는 디스크에서 읽어 오는 데 시간이 오래 걸리므로,
+워커 프로세스마다 한 번만 로드하고 이후 작업에서는 같은 객체를 재사용합니다.
+
+작업 큐 스레드 여러 개가 동시에 추론할 수 있으므로(thread 백엔드의 WORKERS, run_jobs --workers)
+    - 탐지기는 프로세스에서 하나를 공유하되 모델 호출을 직렬화하고 (BatchingModel 또는 LockedModel)
+    - 파이프라인(ai_system의 Pipeline은 스레드 안전하지 않음)은 스레드마다 따로 만들어 같은 탐지기를 사용합니다.
+
+워커 시작 시점에 미리 로드하려면 워커의 시작 훅(예: gunicorn의 post_fork,
+`run_jobs --warm-up`)에서 registry.warm_up()을 호출합니다.
+"""
+
+DISABLED_DETECTORS = ('mtcnn',)  # 사용하지 않는 탐지기 ('mtcnn' 탐지기는 사용하지 않음)
+DEFAULT_WARMUP_DETECTORS = ('yolo',)  # warm_up()에서 기본으로 로드할 탐지기
+
+
+class FaceDetectorFactory:
+    """
+    ai_system의 FaceDetectorFactory에 이 프로젝트의 탐지기를 더한 팩토리입니다.
+
+    LOCAL_DETECTORS에 있는 이름(예: 'yolo_onnx')은 설정 클래스 이름으로 직접 생성하고,
+    나머지 이름은 ai_system의 FaceDetectorFactory에 설정 정보와 함께 넘깁니다.
+    """
+
+    LOCAL_DETECTORS = {
+        OnnxYoloDetector.name: OnnxYoloDetector.from_settings,  # ONNX(onnxruntime) CPU 탐지기 (AI_ONNX_DETECTOR)
+    }
+
+    @classmethod
+    def create(cls, name: str, config: dict, config_class=BaseConfig):
+        """
+        이름에 해당하는 탐지기를 생성합니다.
+
+        Parameters
+        ----------
+        name : str
+            탐지기 이름입니다. (예: 'yolo', 'yolo_onnx')
+        config : dict
+            설정 클래스의 설정 정보입니다. ai_system의 탐지기는 config[name]으로 생성합니다.
+        config_class : type, optional
+            설정 클래스입니다. 이 프로젝트의 탐지기는 클래스 이름으로 설정을 찾습니다. (기본값은 BaseConfig)
+
+        Returns
+        -------
+        object
+            생성된 탐지기입니다.
+        """
+        if name in cls.LOCAL_DETECTORS:
+            return cls.LOCAL_DETECTORS[name](config_class.__name__)
+        return factories.FaceDetectorFactory.create(name, config[f'{name}'])
+
+
+class ModelRegistry:
+    """
+    탐지기와 파이프라인을 한 번만 생성하여 재사용하는 프로세스 단위 레지스트리입니다.
+
+    탐지기는 (설정 클래스, 탐지기 이름)으로, 파이프라인은 (파이프라인 이름, 설정 클래스, 탐지기 목록, 스레드)로 구분합니다.
+    설정 클래스마다 모델 경로가 다를 수 있으므로(예: DetectionConfig.yolo_path) 설정 클래스도 키에 포함합니다.
+
+    Attributes
+    ----------
+    stats : dict
+        탐지기별 로드 시간(초)과 로드 전후 RSS 증가량(바이트)입니다.
+
+    Methods
+    -------
+    get_config(config_class):
+        설정 클래스의 설정 정보를 반환합니다.
+
+    get_detectors(detector_names, config_class):
+        탐지기 목록을 반환합니다. 처음 요청된 탐지기만 로드합니다.
+
+    get_pipeline(name, detector_names, builder, config_class):
+        현재 스레드의 파이프라인을 반환합니다. 스레드에서 처음 요청된 경우에만 builder로 생성합니다.
+
+    warm_up(detector_names, config_classes):
+        탐지기를 미리 로드합니다.
+
+    memory_report():
+        로드된 모델과 메모리 사용량을 반환합니다.
+
+    clear():
+        보관 중인 모든 탐지기와 파이프라인을 비웁니다.
+    """
+
+    def __init__(self):
+        self._configs = {}  # 설정 클래스 -> 설정 정보
+        self._detectors = {}  # (설정 클래스, 탐지기 이름) -> 탐지기
+        self._pipelines = {}  # (파이프라인 이름, 설정 클래스, 탐지기 목록, 스레드 ID) -> 파이프라인
+        self._lock = threading.RLock()  # 같은 모델을 여러 스레드가 동시에 로드하지 않도록 보호
+        self.stats = {}
+
+    def get_config(self, config_class=BaseConfig):
+        """
+        설정 클래스의 설정 정보를 반환합니다.
+
+        Parameters
+        ----------
+        config_class : type, optional
+            설정 클래스입니다. (기본값은 BaseConfig)
+
+        Returns
+        -------
+        dict
+            config_class.get_config()의 결과입니다.
+        """
+        config = self._configs.get(config_class)
+        if config is None:
+            with self._lock:
+                config = self._configs.get(config_class)
+                if config is None:
+                    config = config_class.get_config()
+                    self._configs[config_class] = config
+        return config
+
+    def get_detectors(self, detector_names, config_class=BaseConfig) -> list:
+        """
+        탐지기 목록을 반환합니다. 처음 요청된 탐지기만 FaceDetectorFactory로 생성(모델 로드)합니다.
+
+        Parameters
+        ----------
+        detector_names : list
+            사용할 탐지기 이름 목록입니다.
+        config_class : type, optional
+            탐지기 설정을 가져올 설정 클래스입니다.
+
+        Returns
+        -------
+        list
+            탐지기 객체 목록입니다. 사용하지 않는 탐지기(DISABLED_DETECTORS)는 제외됩니다.
+        """
+        detectors = []
+        for name in detector_names:
+            if name in DISABLED_DETECTORS:
+                continue
+            key = (config_class, name)
+            detector = self._detectors.get(key)
+            if detector is None:
+                detector = self._load_detector(key)
+            detectors.append(detector)
+        return detectors
+
+    def _load_detector(self, key):
+        """
+        탐지기를 생성하고 로드 시간과 메모리 증가량을 기록합니다.
+
+        Parameters
+        ----------
+        key : tuple
+            (설정 클래스, 탐지기 이름)입니다.
+
+        Returns
+        -------
+        object
+            생성된 탐지기입니다.
+        """
+        with self._lock:
+            detector = self._detectors.get(key)
+            if detector is not None:  # 다른 스레드가 먼저 로드한 경우
+                return detector
+
+            config_class, name = key
+            config = self.get_config(config_class)
+
+            rss_before = current_rss_bytes()
+            start = time.perf_counter()
+            detector = FaceDetectorFactory.create(name, config, config_class)
+            detector = enable_batching(detector, name)  # 동시 탐지 요청을 한 번의 배치 추론으로 모음 (AI_DETECTOR_BATCHING)
+            detector = serialize_detector(detector, name)  # 여러 스레드가 공유하므로 모델 호출을 직렬화
+            load_seconds = time.perf_counter() - start
+
+            self._detectors[key] = detector
+            self.stats[f'{config_class.__name__}.{name}'] = {
+                'load_seconds': load_seconds,
+                'rss_delta_bytes': max(current_rss_bytes() - rss_before, 0),
+            }
+            logger.info(f"탐지기 로드 완료 - {config_class.__name__}.{name} ({load_seconds:.2f}s)")
+            return detector
+
+    def get_pipeline(self, name: str, detector_names, builder, config_class=BaseConfig):
+        """
+        현재 스레드의 파이프라인을 반환합니다. 스레드에서 처음 요청된 경우에만 builder로 생성합니다.
+
+        파이프라인은 스레드 사이에 공유하지 않으며, 탐지기(모델)는 모든 스레드의 파이프라인이 공유합니다.
+        스레드 ID는 스레드가 끝난 뒤 재사용될 수 있지만, 이전 스레드는 이미 끝났으므로 같은 파이프라인을 동시에 쓰지 않습니다.
+
+        Parameters
+        ----------
+        name : str
+            파이프라인 이름입니다. (예: 'encode', 'detect')
+        detector_names : list
+            파이프라인에서 사용할 탐지기 이름 목록입니다.
+        builder : callable
+            탐지기 목록을 받아 Pipeline을 생성하는 함수입니다.
+        config_class : type, optional
+            탐지기 설정을 가져올 설정 클래스입니다.
+
+        Returns
+        -------
+        Pipeline
+            현재 스레드에서 재사용 가능한 파이프라인입니다.
+        """
+        key = (name, config_class, tuple(detector_names), threading.get_ident())
+        pipeline = self._pipelines.get(key)
+        if pipeline is None:
+            with self._lock:
+                pipeline = self._pipelines.get(key)
+                if pipeline is None:
+                    pipeline = builder(self.get_detectors(detector_names, config_class))
+                    self._pipelines[key] = pipeline
+        return pipeline
+
+    def warm_up(self, detector_names=DEFAULT_WARMUP_DETECTORS, config_classes=(BaseConfig,)) -> dict:
+        """
+        탐지기를 미리 로드합니다. 워커 시작 시점에 호출하면 첫 작업의 지연을 없앨 수 있습니다.
+
+        Parameters
+        ----------
+        detector_names : list, optional
+            로드할 탐지기 이름 목록입니다.
+        config_classes : list, optional
+            탐지기를 로드할 설정 클래스 목록입니다.
+
+        Returns
+        -------
+        dict
+            memory_report()의 결과입니다.
+        """
+        for config_class in config_classes:
+            self.get_detectors(detector_names, config_class)
+        return self.memory_report()
+
+    def memory_report(self) -> dict:
+        """
+        로드된 모델과 메모리 사용량을 반환합니다.
+
+        Returns
+        -------
+        dict
+            프로세스 ID, 현재 RSS(바이트), 탐지기별 로드 시간/RSS 증가량, 보관 중인 파이프라인 수입니다.
+        """
+        return {
+            'pid': os.getpid(),
+            'rss_bytes': current_rss_bytes(),
+            'detectors': dict(self.stats),
+            'pipelines': len(self._pipelines),
+        }
+
+    def clear(self) -> None:
+        """
+        보관 중인 모든 설정, 탐지기, 파이프라인을 비웁니다.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            self._configs.clear()
+            self._detectors.clear()
+            self._pipelines.clear()
+            self.stats.clear()
+
+
+registry = ModelRegistry()  # 프로세스 단위 레지스트리
@@ -0,0 +1,206 @@
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Optional
+import hashlib
+import io
+
+import numpy as np
+
+from ..url_patterns import URLS
+
+import logging
+logger = logging.getLogger(URLS['APP_NAME'])  # 로거 설정
+
+"""
+디코딩한 이미지를 공유 메모리(multiprocessing.shared_memory)로 추론 워커 프로세스에 넘기는 모듈입니다.
+
+추론 워커 풀(pybo.inference.pool)에 이미지 경로만 넘기면 워커가 파일을 다시 읽어 해시(임베딩 캐시 키)를 계산하고 디코딩하며,
+디코딩한 배열을 작업 인자로 넘기면 pickle → 파이프 전송 → unpickle 과정에서 이미지 전체가 여러 번 복사됩니다.
+(12메가픽셀 RGB 이미지 한 장은 약 36MB)
+
+1. 작업 스레드: 파일을 한 번 읽어 SHA-256을 계산하고, RGB로 디코딩해 공유 메모리 블록에 씁니다. (SharedImage)
+2. 추론 워커: 작업 인자로 받은 작은 핸들(SharedImageHandle)로 같은 블록을 열어 복사 없이 NumPy 배열로 사용합니다. (open_image)
+
+수명 관리
+    - 블록은 만든 쪽(작업 스레드)이 소유하며, 작업이 끝나면(성공, 실패, 워커 비정상 종료 모두) SharedImage.close()로 해제(unlink)합니다.
+    - 워커는 블록을 열고 닫기만 하고 해제하지 않습니다. (작업이 재시도될 때 같은 블록을 다시 열 수 있음)
+    - 작업 프로세스가 비정상 종료되어 해제하지 못한 블록은 multiprocessing의 resource_tracker가 정리합니다.
+"""
+
+
+@dataclass(frozen=True)
+class SharedImageHandle:
+    """
+    공유 메모리에 있는 디코딩된 이미지를 가리키는 핸들입니다. (작업 인자로 pickle되어 워커에 전달)
+
+    Attributes
+    ----------
+    name : str
+        공유 메모리 블록 이름입니다.
+    shape : tuple
+        이미지 배열의 모양 (높이, 너비, 3)입니다.
+    dtype : str
+        이미지 배열의 자료형입니다.
+    path : str
+        원본 이미지 파일 경로입니다. (로그, 결과 파일 이름에 사용)
+    digest : str
+        원본 이미지 파일의 SHA-256입니다. (임베딩 캐시 키에 사용)
+    """
+
+    name: str
+    shape: tuple
+    dtype: str
+    path: str
+    digest: str
+
+
+@dataclass
+class ImageSource:
+    """
+    파이프라인에 넣을 이미지입니다. (open_image()가 반환)
+
+    Attributes
+    ----------
+    path : str
+        원본 이미지 파일 경로입니다.
+    digest : str or None
+        원본 이미지 파일의 SHA-256입니다. None이면 필요할 때 파일에서 계산합니다.
+    image_rgb : np.ndarray or None
+        디코딩된 RGB 이미지입니다. None이면 파이프라인이 파일에서 디코딩합니다.
+    """
+
+    path: str
+    digest: Optional[str] = None
+    image_rgb: Optional[np.ndarray] = None
+
+
+def decode_image(data: bytes) -> np.ndarray:
+    """
+    이미지 파일 내용을 (높이, 너비, 3) uint8 RGB 배열로 디코딩합니다. (EXIF 회전은 적용하지 않음)
+    """
+    from PIL import Image
+
+    with Image.open(io.BytesIO(data)) as image:
+        return np.asarray(image.convert('RGB'))
+
+
+class SharedImage:
+    """
+    이미지를 한 번 디코딩해 공유 메모리 블록에 보관하는 소유자 객체입니다.
+
+    with 문으로 사용하면 블록을 빠져나올 때 해제합니다.
+
+    Attributes
+    ----------
+    handle : SharedImageHandle
+        워커에 넘길 핸들입니다.
+
+    Methods
+    -------
+    close():
+        공유 메모리 블록을 닫고 해제합니다. 여러 번 호출해도 됩니다.
+    """
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            data = f.read()  # 해시와 디코딩에 같은 바이트를 사용 (파일은 한 번만 읽음)
+        image = decode_image(data)
+
+        self._shm = shared_memory.SharedMemory(create=True, size=max(image.nbytes, 1))
+        try:
+            np.ndarray(image.shape, dtype=image.dtype, buffer=self._shm.buf)[...] = image  # 디코딩 결과를 한 번 복사
+        except BaseException:
+            self.close()
+            raise
+        self.handle = SharedImageHandle(
+            name=self._shm.name,
+            shape=image.shape,
+            dtype=image.dtype.str,
+            path=str(path),
+            digest=hashlib.sha256(data).hexdigest(),
+        )
+
+    def close(self) -> None:
+        if self._shm is None:
+            return
+        shm, self._shm = self._shm, None
+        shm.close()
+        try:
+            shm.unlink()
+        except FileNotFoundError:  # 이미 해제됨
+            pass
+
+    def __enter__(self) -> 'SharedImage':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+@contextmanager
+def share_images(*paths):
+    """
+    여러 이미지를 공유 메모리에 올리고 핸들 목록을 반환합니다. with 문을 빠져나오면 모두 해제합니다.
+
+    Parameters
+    ----------
+    paths : str
+        이미지 파일 경로입니다.
+
+    Yields
+    ------
+    list
+        경로 순서대로 SharedImageHandle 목록입니다.
+    """
+    with ExitStack() as stack:
+        yield [stack.enter_context(SharedImage(path)).handle for path in paths]
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    다른 프로세스가 만든 공유 메모리 블록을 엽니다. 여는 쪽은 해제 책임이 없으므로 resource_tracker에 등록하지 않습니다.
+
+    Python 3.12 이하에서는 여는 쪽도 등록되지만, 추론 워커는 부모 프로세스의 resource_tracker를 같이 쓰므로
+    같은 이름이 한 번 더 등록될 뿐이고 부모가 해제(unlink)할 때 함께 지워집니다. (워커에서 등록을 취소하면 부모의 등록이 사라짐)
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+@contextmanager
+def open_image(image):
+    """
+    이미지 경로 또는 SharedImageHandle을 파이프라인에 넣을 ImageSource로 엽니다.
+
+    핸들이면 공유 메모리 블록을 복사 없이 읽기 전용 NumPy 배열로 열고, with 문을 빠져나올 때 닫습니다.
+    (배열은 with 문 안에서만 사용해야 하며, 이미지를 바꾸려면 복사본을 만들어야 함)
+
+    Parameters
+    ----------
+    image : str or SharedImageHandle
+        이미지 파일 경로 또는 공유 메모리 핸들입니다.
+
+    Yields
+    ------
+    ImageSource
+        원본 경로, SHA-256, 디코딩된 이미지입니다. 경로를 받은 경우 SHA-256과 이미지는 None입니다.
+    """
+    if not isinstance(image, SharedImageHandle):
+        yield ImageSource(path=str(image))
+        return
+
+    shm = _attach(image.name)
+    image_rgb = np.ndarray(image.shape, dtype=np.dtype(image.dtype), buffer=shm.buf)
+    image_rgb.flags.writeable = False  # 워커가 공유 블록(원본)을 바꾸지 못하도록 함
+    source = ImageSource(path=image.path, digest=image.digest, image_rgb=image_rgb)
+    try:
+        yield source
+    finally:
+        source.image_rgb = None
+        try:
+            shm.close()
+        except BufferError:  # 파이프라인이 아직 배열을 참조함 (참조가 사라지면 가비지 컬렉션에서 닫힘)
+            logger.warning(f"공유 메모리 이미지를 바로 닫지 못했습니다: {image.path}")
@@ -0,0 +1,624 @@
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+import heapq
+import itertools
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+
+from django.db import close_old_connections, connection as db_connection, transaction
+
+from .url_patterns import URLS
+
+import logging
+logger = logging.getLogger(URLS['APP_NAME'])  # 로거 설정
+
+"""
+AI 댓글 작업을 처리하는 작업 큐 모듈입니다.
+
+django-background-tasks는 워커가 background_task 테이블을 주기적으로 조회(polling)하므로
+작업 지연이 "조회 주기 + 예약 지연(schedule=1)"만큼 늘어나고, 워커가 많을수록 DB 부하가 커집니다.
+이 모듈은 작업을 넣는 즉시 워커를 깨우는 작업 큐를 제공하며, 백엔드는 settings.AI_JOB_QUEUE['BACKEND']로 고릅니다.
+
+1. 'thread' : 웹 프로세스 안의 작업 스레드에서 실행합니다. (개발용, 별도 워커 불필요)
+2. 'sqlite' : sqlite 파일에 작업을 저장하고 `python manage.py run_jobs` 워커가 실행합니다.
+              작업을 넣으면 로컬 UDP 알림으로 대기 중인 워커를 바로 깨우고, 알림을 놓쳐도 POLL_INTERVAL 안에 처리합니다.
+
+공통 기능
+    - 우선순위: 숫자가 작을수록 먼저 실행합니다. (PRIORITY_HIGH < PRIORITY_NORMAL < PRIORITY_LOW)
+    - 재시도: 작업이 예외를 던지면 RETRY_BACKOFF * 2^(시도 횟수 - 1)초 뒤에 다시 실행하고,
+              MAX_RETRIES를 넘기면 실패로 기록한 뒤 on_failure 콜백을 호출합니다.
+    - 가시성 타임아웃: 'sqlite' 백엔드에서 워커가 작업 도중 종료되면 VISIBILITY_TIMEOUT초 뒤 다른 워커가 다시 가져갑니다.
+                       이렇게 다시 가져간 횟수도 시도 횟수에 포함되므로, 워커를 계속 종료시키는 작업도
+                       MAX_RETRIES를 넘기면 실패로 기록되고 on_failure 콜백이 호출됩니다.
+
+사용 예:
+    @job('similarity.ai_comment', on_failure=mark_failed)
+    def update_comment(comment_id, post_id): ...
+
+    update_comment.enqueue(comment_id=comment.id, post_id=post.id)
+"""
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 5
+PRIORITY_LOW = 9
+
+DEFAULT_OPTIONS = {
+    'BACKEND': 'thread',
+    'WORKERS': 2,
+    'MAX_RETRIES': 3,
+    'RETRY_BACKOFF': 2.0,
+    'VISIBILITY_TIMEOUT': 300,
+    'POLL_INTERVAL': 1.0,
+    'DB_PATH': None,
+    'NOTIFY_PORT': None,
+}
+
+
+@dataclass
+class JobSpec:
+    """
+    등록된 작업 함수와 기본 실행 옵션입니다.
+    """
+
+    name: str
+    func: Callable
+    priority: int = PRIORITY_NORMAL
+    max_retries: Optional[int] = None  # None이면 백엔드 설정(MAX_RETRIES)을 사용
+    on_failure: Optional[Callable] = None  # 재시도를 모두 실패한 뒤 같은 인자로 호출
+
+
+@dataclass
+class Job:
+    """
+    큐에 들어간 작업 하나입니다.
+
+    Attributes
+    ----------
+    attempts : int
+        지금까지 실행을 시작한 횟수입니다. (첫 실행이면 1)
+    run_at : float
+        실행 가능한 가장 이른 시각(time.time())입니다.
+    """
+
+    id: int
+    name: str
+    kwargs: dict
+    priority: int = PRIORITY_NORMAL
+    max_retries: int = 0
+    attempts: int = 0
+    run_at: float = field(default_factory=time.time)
+
+
+JOB_REGISTRY = {}  # 작업 이름 -> JobSpec
+
+
+def job(name: str, priority: int = PRIORITY_NORMAL, max_retries: Optional[int] = None, on_failure: Optional[Callable] = None):
+    """
+    함수를 작업으로 등록하는 데코레이터입니다.
+
+    등록된 함수에는 작업 큐에 넣는 enqueue(**kwargs) 메서드가 추가되며, 함수를 직접 호출하면 즉시 실행됩니다.
+
+    Parameters
+    ----------
+    name : str
+        작업 이름입니다. 'sqlite' 백엔드에 저장되므로 함수 이름을 바꿔도 유지해야 합니다.
+    priority : int, optional
+        기본 우선순위입니다. 숫자가 작을수록 먼저 실행됩니다.
+    max_retries : int, optional
+        최대 재시도 횟수입니다. (기본값은 settings.AI_JOB_QUEUE['MAX_RETRIES'])
+    on_failure : callable, optional
+        재시도를 모두 실패했을 때 작업과 같은 인자로 호출할 함수입니다.
+
+    Returns
+    -------
+    callable
+        작업 함수를 등록하는 데코레이터입니다.
+    """
+    def decorator(func):
+        JOB_REGISTRY[name] = JobSpec(name, func, priority, max_retries, on_failure)
+        func.job_name = name
+        func.enqueue = lambda priority=None, **kwargs: enqueue(name, priority=priority, **kwargs)
+        return func
+    return decorator
+
+
+def enqueue(name: str, priority: Optional[int] = None, **kwargs) -> None:
+    """
+    작업을 큐에 넣습니다. 트랜잭션 안에서 호출되면 커밋된 뒤에 넣어 워커가 아직 저장되지 않은 행을 읽지 않도록 합니다.
+
+    Parameters
+    ----------
+    name : str
+        job()으로 등록한 작업 이름입니다.
+    priority : int, optional
+        이번 작업의 우선순위입니다. (기본값은 등록 시 지정한 우선순위)
+    kwargs : dict
+        작업 함수에 전달할 인자입니다. 'sqlite' 백엔드에 저장할 수 있도록 JSON으로 변환 가능해야 합니다.
+
+    Returns
+    -------
+    None
+    """
+    spec = JOB_REGISTRY[name]
+    json.dumps(kwargs)  # 'thread' 백엔드에서도 JSON으로 변환할 수 없는 인자를 미리 확인
+    backend = get_job_backend()
+    priority = spec.priority if priority is None else priority
+    transaction.on_commit(lambda: backend.enqueue(name, kwargs, priority=priority, max_retries=spec.max_retries))
+
+
+def _close_old_connections() -> None:
+    """
+    오래되거나 사용할 수 없는 DB 연결을 닫습니다. 트랜잭션 안(예: 테스트에서 직접 실행)에서는 연결을 유지합니다.
+    """
+    if not db_connection.in_atomic_block:
+        close_old_connections()
+
+
+class BaseJobBackend:
+    """
+    작업 큐 백엔드의 공통 동작(작업 실행, 재시도, 워커 루프)을 구현한 클래스입니다.
+
+    하위 클래스는 enqueue(), claim(), ack(), retry(), bury(), wait()를 구현합니다.
+
+    Attributes
+    ----------
+    max_retries : int
+        작업별 설정이 없을 때 사용할 최대 재시도 횟수입니다.
+    retry_backoff : float
+        첫 재시도까지의 대기 시간(초)입니다. 재시도할 때마다 두 배로 늘어납니다.
+    poll_interval : float
+        알림이 없을 때 큐를 다시 확인하는 최대 간격(초)입니다.
+    """
+
+    def __init__(self, max_retries: int = 3, retry_backoff: float = 2.0, poll_interval: float = 1.0, **options):
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.poll_interval = poll_interval
+
+    def enqueue(self, name: str, kwargs: dict, priority: int = PRIORITY_NORMAL, max_retries: Optional[int] = None) -> int:
+        raise NotImplementedError
+
+    def claim(self) -> Optional[Job]:
+        raise NotImplementedError
+
+    def ack(self, job: Job) -> None:
+        raise NotImplementedError
+
+    def retry(self, job: Job, delay: float, error: str) -> None:
+        raise NotImplementedError
+
+    def bury(self, job: Job, error: str) -> None:
+        raise NotImplementedError
+
+    def wait(self, timeout: float) -> None:
+        raise NotImplementedError
+
+    def retry_delay(self, attempts: int) -> float:
+        """
+        attempts번째 실행이 실패했을 때 다음 실행까지 기다릴 시간(초)입니다.
+        """
+        return self.retry_backoff * 2 ** (attempts - 1)
+
+    def run(self, job: Job) -> bool:
+        """
+        작업 하나를 실행하고 결과에 따라 완료, 재시도 예약, 실패 기록 중 하나를 수행합니다.
+
+        Parameters
+        ----------
+        job : Job
+            claim()으로 가져온 작업입니다.
+
+        Returns
+        -------
+        bool
+            작업이 성공했으면 True입니다.
+        """
+        spec = JOB_REGISTRY.get(job.name)
+        if spec is None:
+            logger.error(f"등록되지 않은 작업 - {job.name} (ID: {job.id})")
+            self.bury(job, 'unregistered job')
+            return False
+
+        _close_old_connections()  # 작업 스레드에서도 요청 처리와 같이 끊어진 DB 연결을 정리
+        try:
+            spec.func(**job.kwargs)
+        except Exception as e:
+            if job.attempts <= job.max_retries:
+                delay = self.retry_delay(job.attempts)
+                logger.warning(f"작업 실패, {delay:.1f}초 뒤 재시도 - {job.name} (ID: {job.id}, 시도: {job.attempts}): {e!r}")
+                self.retry(job, delay, repr(e))
+                return False
+
+            logger.exception(f"작업 최종 실패 - {job.name} (ID: {job.id}, 시도: {job.attempts})")
+            self.bury(job, repr(e))
+            self.on_failure(job)
+            return False
+        finally:
+            _close_old_connections()
+
+        self.ack(job)
+        return True
+
+    def on_failure(self, job: Job) -> None:
+        """
+        재시도를 모두 실패한 작업의 on_failure 콜백을 작업과 같은 인자로 호출합니다. 콜백의 오류는 기록만 합니다.
+        """
+        spec = JOB_REGISTRY.get(job.name)
+        if spec is None or spec.on_failure is None:
+            return
+        try:
+            spec.on_failure(**job.kwargs)
+        except Exception:
+            logger.exception(f"작업 실패 처리 중 오류 - {job.name} (ID: {job.id})")
+
+    def work(self, stop_event: Optional[threading.Event] = None, burst: bool = False) -> int:
+        """
+        큐에서 작업을 가져와 실행하는 워커 루프입니다.
+
+        Parameters
+        ----------
+        stop_event : threading.Event, optional
+            설정되면 현재 작업을 마친 뒤 루프를 끝냅니다.
+        burst : bool, optional
+            True이면 지금 실행할 작업이 없을 때 바로 끝냅니다. (테스트, 일회성 실행용)
+
+        Returns
+        -------
+        int
+            실행한 작업 수입니다.
+        """
+        processed = 0
+        while stop_event is None or not stop_event.is_set():
+            job = self.claim()
+            if job is None:
+                if burst:
+                    break
+                self.wait(self.poll_interval)
+                continue
+            self.run(job)
+            processed += 1
+        return processed
+
+
+class ThreadJobBackend(BaseJobBackend):
+    """
+    웹 프로세스 안의 작업 스레드에서 작업을 실행하는 백엔드입니다. (개발용)
+
+    작업은 메모리에만 있으므로 프로세스가 종료되면 사라지며, 가시성 타임아웃은 적용되지 않습니다.
+    작업 스레드는 처음 작업이 들어올 때 시작하므로 gunicorn 등에서 fork 이후 워커마다 따로 만들어집니다.
+    """
+
+    def __init__(self, workers: int = 2, **options):
+        super().__init__(**options)
+        self.workers = workers
+        self._ready = []  # (우선순위, 순번, 작업) 힙 - 지금 실행할 수 있는 작업
+        self._delayed = []  # (실행 시각, 순번, 작업) 힙 - 재시도 대기 중인 작업
+        self._counter = itertools.count(1)
+        self._condition = threading.Condition()
+        self._threads = []
+        self._stop_event = threading.Event()
+
+    def enqueue(self, name: str, kwargs: dict, priority: int = PRIORITY_NORMAL, max_retries: Optional[int] = None) -> int:
+        job_id = next(self._counter)
+        job = Job(job_id, name, kwargs, priority, self.max_retries if max_retries is None else max_retries)
+        with self._condition:
+            heapq.heappush(self._ready, (priority, job_id, job))
+            self._condition.notify()  # 대기 중인 작업 스레드 하나를 바로 깨움
+        self.start()
+        return job_id
+
+    def claim(self) -> Optional[Job]:
+        with self._condition:
+            now = time.time()
+            while self._delayed and self._delayed[0][0] <= now:  # 대기 시간이 지난 재시도 작업을 실행 목록으로 이동
+                _, _, job = heapq.heappop(self._delayed)
+                heapq.heappush(self._ready, (job.priority, job.id, job))
+            if not self._ready:
+                return None
+            _, _, job = heapq.heappop(self._ready)
+            job.attempts += 1
+            return job
+
+    def ack(self, job: Job) -> None:
+        pass
+
+    def retry(self, job: Job, delay: float, error: str) -> None:
+        with self._condition:
+            job.run_at = time.time() + delay
+            heapq.heappush(self._delayed, (job.run_at, job.id, job))
+            self._condition.notify()
+
+    def bury(self, job: Job, error: str) -> None:
+        pass  # 실패한 작업은 로그로만 남김
+
+    def wait(self, timeout: float) -> None:
+        with self._condition:
+            if self._ready:
+                return
+            if self._delayed:
+                timeout = min(timeout, max(self._delayed[0][0] - time.time(), 0))
+            self._condition.wait(timeout)
+
+    def start(self) -> None:
+        """
+        작업 스레드가 없으면 시작합니다.
+        """
+        if self._threads:
+            return
+        with self._condition:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                thread = threading.Thread(target=self.work, args=(self._stop_event,), name=f'pybo-job-{i}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+
+class SqliteJobBackend(BaseJobBackend):
+    """
+    sqlite 파일에 작업을 저장하고 `run_jobs` 워커 프로세스가 실행하는 백엔드입니다.
+
+    작업을 가져올 때 상태를 'running'으로 바꾸고 leased_until(현재 시각 + 가시성 타임아웃)을 기록합니다.
+    워커가 완료(ack)하면 행을 지우고, 실패하면 다시 'queued'로 돌려 run_at 이후에 실행되도록 합니다.
+    워커가 비정상 종료되어 leased_until이 지난 'running' 작업은 다른 워커가 다시 가져갑니다.
+
+    가져올 때마다 1씩 늘어나는 attempts를 임대 토큰으로 사용하여, ack/retry/bury는 자신이 가져간 임대가
+    그대로인 경우에만(status = 'running' AND attempts = 가져갈 때의 값) 행을 바꿉니다.
+    가시성 타임아웃을 넘겨 다른 워커가 다시 가져간 작업을 이전 워커가 지우거나 대기 상태로 되돌리지 않습니다.
+
+    임대가 만료된 작업을 다시 가져가면 시도 횟수가 max_retries + 1을 넘는 경우(워커를 매번 종료시키는 작업)에는
+    실행하지 않고 실패로 기록한 뒤 on_failure 콜백을 호출합니다.
+
+    Attributes
+    ----------
+    db_path : str
+        작업을 저장할 sqlite 파일 경로입니다.
+    visibility_timeout : float
+        작업을 가져간 워커가 완료를 알리지 않으면 다시 실행할 때까지의 시간(초)입니다.
+    notify_port : int or None
+        작업 추가를 알릴 로컬 UDP 포트입니다. None이면 POLL_INTERVAL 간격으로만 확인합니다.
+    """
+
+    def __init__(self, db_path: str, visibility_timeout: float = 300, notify_port: Optional[int] = None, **options):
+        super().__init__(**options)
+        self.db_path = db_path
+        self.visibility_timeout = visibility_timeout
+        self.notify_port = notify_port
+        self._local = threading.local()  # 스레드별 sqlite 연결
+        self._listener = None  # 워커 쪽 알림 수신 소켓
+        self._listener_lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        현재 스레드의 sqlite 연결을 반환합니다. 처음 호출될 때 파일과 테이블을 만듭니다.
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)  # 트랜잭션은 직접 관리
+            connection.execute('PRAGMA journal_mode=WAL')  # 워커가 읽는 동안 웹 프로세스가 작업을 넣을 수 있도록 함
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS job_queue ('
+                'id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, kwargs TEXT NOT NULL, '
+                'priority INTEGER NOT NULL, max_retries INTEGER NOT NULL, attempts INTEGER NOT NULL DEFAULT 0, '
+                "status TEXT NOT NULL DEFAULT 'queued', run_at REAL NOT NULL, leased_until REAL, last_error TEXT)"
+            )
+            connection.execute('CREATE INDEX IF NOT EXISTS job_queue_ready ON job_queue (status, priority, id)')
+            self._local.connection = connection
+        return connection
+
+    def enqueue(self, name: str, kwargs: dict, priority: int = PRIORITY_NORMAL, max_retries: Optional[int] = None) -> int:
+        cursor = self._connection().execute(
+            'INSERT INTO job_queue (name, kwargs, priority, max_retries, run_at) VALUES (?, ?, ?, ?, ?)',
+            (name, json.dumps(kwargs), priority, self.max_retries if max_retries is None else max_retries, time.time()),
+        )
+        self._notify()
+        return cursor.lastrowid
+
+    def claim(self) -> Optional[Job]:
+        while True:
+            job, expired = self._claim_row()
+            if expired is None:
+                return job
+            # 임대 만료(워커 비정상 종료)가 반복되어 시도 횟수를 모두 쓴 작업은 실행하지 않고 실패 처리
+            logger.error(f"작업 최종 실패 (가시성 타임아웃 초과) - {expired.name} (ID: {expired.id}, 시도: {expired.attempts})")
+            _close_old_connections()
+            try:
+                self.on_failure(expired)
+            finally:
+                _close_old_connections()
+
+    def _claim_row(self):
+        """
+        실행할 작업 하나를 가져옵니다.
+
+        Returns
+        -------
+        tuple
+            (가져간 작업, 실패로 기록한 작업)입니다. 임대가 만료된 작업의 시도 횟수가 max_retries + 1에 도달했으면
+            가져가지 않고 'failed'로 바꾼 뒤 두 번째 값으로 반환합니다. 실행할 작업이 없으면 (None, None)입니다.
+        """
+        connection = self._connection()
+        now = time.time()
+        connection.execute('BEGIN IMMEDIATE')  # 여러 워커가 같은 작업을 가져가지 않도록 쓰기 잠금
+        try:
+            row = connection.execute(
+                'SELECT id, name, kwargs, priority, max_retries, attempts, run_at, status FROM job_queue '
+                "WHERE (status = 'queued' AND run_at <= ?) OR (status = 'running' AND leased_until < ?) "
+                'ORDER BY priority, id LIMIT 1',
+                (now, now),
+            ).fetchone()
+            if row is None:
+                connection.execute('COMMIT')
+                return None, None
+            job = Job(row[0], row[1], json.loads(row[2]), row[3], row[4], row[5], row[6])
+
+            if row[7] == 'running' and job.attempts > job.max_retries:  # 다시 가져가면 max_retries + 1회를 넘음
+                connection.execute(
+                    "UPDATE job_queue SET status = 'failed', leased_until = NULL, last_error = ? WHERE id = ?",
+                    ('visibility timeout exceeded', job.id),
+                )
+                connection.execute('COMMIT')
+                return None, job
+
+            connection.execute(
+                "UPDATE job_queue SET status = 'running', leased_until = ?, attempts = attempts + 1 WHERE id = ?",
+                (now + self.visibility_timeout, job.id),
+            )
+            connection.execute('COMMIT')
+        except Exception:
+            connection.execute('ROLLBACK')
+            raise
+        job.attempts += 1  # 같은 트랜잭션에서 바꾼 값 (UPDATE ... RETURNING은 sqlite 3.35 이상 필요)
+        return job, None
+
+    LEASED = "id = ? AND status = 'running' AND attempts = ?"  # 가져간 임대가 그대로인 행
+
+    def ack(self, job: Job) -> None:
+        cursor = self._connection().execute(f'DELETE FROM job_queue WHERE {self.LEASED}', (job.id, job.attempts))
+        self._check_lease(job, cursor, '완료')
+
+    def retry(self, job: Job, delay: float, error: str) -> None:
+        cursor = self._connection().execute(
+            f"UPDATE job_queue SET status = 'queued', run_at = ?, leased_until = NULL, last_error = ? WHERE {self.LEASED}",
+            (time.time() + delay, error, job.id, job.attempts),
+        )
+        self._check_lease(job, cursor, '재시도')
+
+    def bury(self, job: Job, error: str) -> None:
+        cursor = self._connection().execute(
+            f"UPDATE job_queue SET status = 'failed', leased_until = NULL, last_error = ? WHERE {self.LEASED}",
+            (error, job.id, job.attempts),
+        )  # 실패한 작업은 원인 확인을 위해 남겨 둠
+        self._check_lease(job, cursor, '실패 기록')
+
+    @staticmethod
+    def _check_lease(job: Job, cursor: sqlite3.Cursor, action: str) -> None:
+        """
+        바뀐 행이 없으면 임대가 만료되어 다른 워커가 작업을 다시 가져간 것이므로 기록만 남깁니다.
+        """
+        if cursor.rowcount == 0:
+            logger.warning(
+                f"작업 {action} 무시 - 가시성 타임아웃이 지나 다른 워커가 다시 가져갔습니다. ({job.name}, ID: {job.id}, 시도: {job.attempts})"
+            )
+
+    def wait(self, timeout: float) -> None:
+        row = self._connection().execute(
+            "SELECT MIN(CASE WHEN status = 'queued' THEN run_at ELSE leased_until END) FROM job_queue "
+            "WHERE status IN ('queued', 'running')"
+        ).fetchone()
+        if row[0] is not None:  # 재시도 예정 작업이나 타임아웃될 작업이 먼저 오면 그 시각까지만 대기
+            timeout = min(timeout, max(row[0] - time.time(), 0))
+        if timeout <= 0:
+            return
+
+        listener = self._get_listener()
+        if listener is None:
+            time.sleep(timeout)
+            return
+        listener.settimeout(timeout)
+        try:
+            listener.recv(1)  # 작업 추가 알림이 오면 바로 깨어남
+        except socket.timeout:
+            pass
+
+    def _notify(self) -> None:
+        """
+        대기 중인 워커에게 작업이 추가되었음을 알립니다. 알림이 실패해도 워커는 POLL_INTERVAL 안에 작업을 가져갑니다.
+        """
+        if not self.notify_port:
+            return
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sender:
+                sender.sendto(b'1', ('127.0.0.1', self.notify_port))
+        except OSError:
+            pass
+
+    def _get_listener(self) -> Optional[socket.socket]:
+        """
+        작업 추가 알림을 받을 UDP 소켓을 반환합니다. 같은 포트를 여러 워커가 함께 사용할 수 있도록 SO_REUSEPORT를 설정합니다.
+        """
+        if not self.notify_port:
+            return None
+        with self._listener_lock:
+            if self._listener is None:
+                listener = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                if hasattr(socket, 'SO_REUSEPORT'):
+                    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+                try:
+                    listener.bind(('127.0.0.1', self.notify_port))
+                except OSError:
+                    logger.warning(f"작업 알림 포트를 사용할 수 없어 주기적으로 확인합니다. (포트: {self.notify_port})")
+                    listener.close()
+                    self.notify_port = None
+                    return None
+                self._listener = listener
+        return self._listener
+
+    def stats(self) -> dict:
+        """
+        상태별 작업 수를 반환합니다.
+
+        Returns
+        -------
+        dict
+            {'queued': 대기 중, 'running': 실행 중, 'failed': 실패} 작업 수입니다.
+        """
+        rows = self._connection().execute('SELECT status, COUNT(*) FROM job_queue GROUP BY status').fetchall()
+        return {'queued': 0, 'running': 0, 'failed': 0, **dict(rows)}
+
+
+JOB_BACKENDS = {
+    'thread': ThreadJobBackend,
+    'sqlite': SqliteJobBackend,
+}
+
+_job_backend = None  # 프로세스 단위 백엔드 (처음 사용할 때 settings로 생성)
+_job_backend_lock = threading.Lock()
+
+
+def create_job_backend(options: dict) -> BaseJobBackend:
+    """
+    AI_JOB_QUEUE 형식의 설정으로 백엔드를 생성합니다.
+
+    Parameters
+    ----------
+    options : dict
+        'BACKEND', 'WORKERS', 'MAX_RETRIES' 등 대문자 키를 가진 설정입니다.
+
+    Returns
+    -------
+    BaseJobBackend
+        생성된 백엔드입니다.
+    """
+    options = {**DEFAULT_OPTIONS, **options}
+    name = options.pop('BACKEND')
+    if name not in JOB_BACKENDS:
+        raise ValueError(f"지원하지 않는 작업 큐 백엔드입니다: {name}")
+    backend_class = JOB_BACKENDS[name]
+    return backend_class(**{key.lower(): value for key, value in options.items()})
+
+
+def get_job_backend() -> BaseJobBackend:
+    """
+    settings.AI_JOB_QUEUE 설정으로 만든 프로세스 단위 작업 큐 백엔드를 반환합니다.
+
+    Returns
+    -------
+    BaseJobBackend
+        프로세스 단위 작업 큐 백엔드입니다.
+    """
+    global _job_backend
+    if _job_backend is None:
+        with _job_backend_lock:
+            if _job_backend is None:
+                from django.conf import settings
+
+                _job_backend = create_job_backend(getattr(settings, 'AI_JOB_QUEUE', {}))
+    return _job_backend
@@ -0,0 +1,66 @@
+from concurrent.futures import ThreadPoolExecutor
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from pybo.inference.backends import AI_BACKENDS, create_ai_backend
+
+
+class Command(BaseCommand):
+    """
+    같은 이미지로 AI 백엔드('remote', 'local', 'pool')별 처리 시간과 처리량을 측정하고 결과를 나란히 출력하는 명령입니다.
+
+    'remote'는 settings.AI_SERVER의 AI 서버로 요청을 보내고(네트워크 왕복 + 서버 처리),
+    'local'은 현재 프로세스에서, 'pool'은 추론 워커 프로세스에서 ai_system 파이프라인을 실행합니다. (로컬 AI 의존성 필요)
+    측정 전에 백엔드를 준비(warm_up)하므로 모델 로드와 워커 시작 시간은 측정에 포함되지 않습니다.
+    --concurrency로 작업 큐의 스레드 수만큼 요청을 동시에 보내 처리량(작업/초)이 코어 수에 따라 늘어나는지 확인할 수 있습니다.
+
+    사용 예:
+        python manage.py benchmark_ai_backend similarity media/a.jpg media/b.jpg --repeat 10
+        python manage.py benchmark_ai_backend detection media/a.jpg --backends local pool --repeat 40 --concurrency 8
+    """
+
+    help = 'AI 백엔드(AI 서버, 로컬 파이프라인)별 처리 시간을 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('board', choices=['similarity', 'detection'], help='측정할 AI 작업의 게시판')
+        parser.add_argument('images', nargs='+', help='이미지 경로 (similarity는 2개, detection은 1개)')
+        parser.add_argument('--backends', nargs='+', choices=list(AI_BACKENDS), default=list(AI_BACKENDS), help='측정할 백엔드 목록')
+        parser.add_argument('--repeat', type=int, default=5, help='백엔드별 반복 횟수')
+        parser.add_argument('--concurrency', type=int, default=1, help='동시에 보낼 요청 수')
+        parser.add_argument('--detectors', nargs='+', default=['yolo'], help="'local', 'pool' 백엔드가 사용할 탐지기 이름 목록")
+
+    def handle(self, *args, **options):
+        expected_images = 2 if options['board'] == 'similarity' else 1
+        if len(options['images']) != expected_images:
+            raise CommandError(f"{options['board']} 게시판은 이미지 {expected_images}개가 필요합니다.")
+
+        for name in options['backends']:
+            backend = create_ai_backend(name, options['detectors'])
+            run = backend.compare_faces if options['board'] == 'similarity' else backend.detect_president
+            try:
+                backend.warm_up()
+
+                def timed(_):
+                    start = time.perf_counter()
+                    result = run(*options['images'])
+                    return (time.perf_counter() - start) * 1000, result
+
+                start = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=options['concurrency']) as executor:
+                    runs = list(executor.map(timed, range(options['repeat'])))
+                elapsed = time.perf_counter() - start
+            except Exception as e:  # 한 백엔드를 쓸 수 없어도 나머지 백엔드는 측정
+                self.stdout.write(self.style.ERROR(f'{name:>6}: 실행 실패 ({type(e).__name__}: {e})'))
+                continue
+            finally:
+                if hasattr(backend, 'close'):
+                    backend.close()  # 'pool' 백엔드의 워커 종료
+
+            timings = sorted(timing for timing, _ in runs)
+            p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+            self.stdout.write(
+                f'{name:>6}: 중앙값 {statistics.median(timings):8.1f} ms, p95 {p95:8.1f} ms, '
+                f'{len(timings) / elapsed:6.2f} 작업/초 ({len(timings)}회, 동시 {options["concurrency"]}) -> {runs[-1][1]}'
+            )
@@ -0,0 +1,98 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+from django.core.management.base import BaseCommand
+
+from pybo.ai_client import PROCESS_IMAGE_PATH, build_client_kwargs, get_client_options
+
+
+class StubAIHandler(BaseHTTPRequestHandler):
+    """
+    AI 서버 대신 요청 본문을 읽고 바로 JSON을 반환하는 로컬 스텁 서버의 핸들러입니다.
+    """
+
+    protocol_version = 'HTTP/1.1'  # keep-alive 지원
+    disable_nagle_algorithm = True  # 헤더와 본문을 나눠 보낼 때 생기는 Nagle/지연 ACK 대기(약 40ms) 제거
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        body = json.dumps({'message': 'ok', 'result': 'ok'}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class Command(BaseCommand):
+    """
+    AI 서버 호출 방식별 요청당 소요 시간을 로컬 스텁 서버로 측정하는 명령입니다.
+
+    1. per-job client : 이전 구현처럼 요청마다 httpx.Client를 새로 만듦 (매번 TCP 연결)
+    2. pooled client  : settings.AI_SERVER 설정의 공유 클라이언트로 연결 재사용
+    3. async pooled   : 공유 AsyncClient로 --concurrency개 요청을 동시에 보냄
+
+    --latency 옵션으로 연결 수립에 드는 네트워크 왕복 지연을 흉내 낼 수 있습니다.
+
+    사용 예:
+        python manage.py benchmark_ai_client --requests 200 --payload-kb 200
+    """
+
+    help = 'AI 서버 HTTP 클라이언트의 연결 재사용 효과를 측정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200, help='방식별 요청 수')
+        parser.add_argument('--payload-kb', type=int, default=100, help='업로드할 가짜 이미지 크기(KB)')
+        parser.add_argument('--concurrency', type=int, default=8, help='비동기 방식의 동시 요청 수')
+        parser.add_argument('--latency', type=float, default=0.0, help='연결 수립 시 추가할 지연(ms)')
+
+    def handle(self, *args, **options):
+        latency = options['latency'] / 1000
+
+        class Handler(StubAIHandler):
+            def setup(self):
+                time.sleep(latency)  # 새 연결마다 네트워크 왕복 지연 흉내
+                super().setup()
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f'http://127.0.0.1:{server.server_address[1]}'
+        kwargs = build_client_kwargs({**get_client_options(), 'BASE_URL': base_url})
+        files = {'file': ('image.jpg', b'\xff' * options['payload_kb'] * 1024, 'image/jpeg')}
+        count = options['requests']
+
+        try:
+            def per_job():
+                for _ in range(count):
+                    with httpx.Client(**kwargs) as client:
+                        client.post(PROCESS_IMAGE_PATH, files=files).raise_for_status()
+
+            def pooled():
+                with httpx.Client(**kwargs) as client:
+                    for _ in range(count):
+                        client.post(PROCESS_IMAGE_PATH, files=files).raise_for_status()
+
+            async def async_pooled():
+                semaphore = asyncio.Semaphore(options['concurrency'])
+                async with httpx.AsyncClient(**kwargs) as client:
+                    async def send():
+                        async with semaphore:
+                            (await client.post(PROCESS_IMAGE_PATH, files=files)).raise_for_status()
+                    await asyncio.gather(*(send() for _ in range(count)))
+
+            for name, run in (('per-job client', per_job), ('pooled client', pooled),
+                              ('async pooled', lambda: asyncio.run(async_pooled()))):
+                start = time.perf_counter()
+                run()
+                elapsed_ms = (time.perf_counter() - start) / count * 1000
+                self.stdout.write(f'{name:>15}: {elapsed_ms:8.3f} ms / 요청 ({count}회, {options["payload_kb"]}KB)')
+        finally:
+            server.shutdown()
+            server.server_close()
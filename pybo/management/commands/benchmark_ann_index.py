@@ -0,0 +1,82 @@
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand
+
+from pybo.inference.ann import AnnIndexFactory, BruteForceIndex, IVFIndex
+from pybo.inference.gallery import l2_normalize
+
+
+def make_clustered_vectors(count: int, dim: int, clusters: int, seed: int = 0) -> np.ndarray:
+    """
+    얼굴 인코딩처럼 사람(군집)별로 모여 있는 정규화된 벡터를 만듭니다.
+    """
+    rng = np.random.default_rng(seed)
+    centers = l2_normalize(rng.standard_normal((clusters, dim)).astype(np.float32))
+    members = rng.integers(0, clusters, count)
+    noise = rng.standard_normal((count, dim)).astype(np.float32) * 0.5 / np.sqrt(dim)  # 같은 사람 사진 간 차이
+    return l2_normalize(centers[members] + noise)
+
+
+class Command(BaseCommand):
+    """
+    근사 최근접 이웃 인덱스의 재현율(recall@k)과 검색 지연 시간을 정확한 전체 탐색과 비교하는 명령입니다.
+
+    군집화된 가상 얼굴 인코딩을 만들어 brute 인덱스의 결과를 정답으로 두고,
+    IVF 인덱스는 nprobe 값별로, HNSW 인덱스는 hnswlib가 설치된 경우 ef 값별로 측정합니다.
+
+    사용 예:
+        python manage.py benchmark_ann_index --vectors 200000 --dim 128 --nlist 1024
+    """
+
+    help = '근사 최근접 이웃 인덱스의 재현율과 지연 시간을 측정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--vectors', type=int, default=100000, help='인덱스에 넣을 벡터 수')
+        parser.add_argument('--dim', type=int, default=128, help='벡터 차원')
+        parser.add_argument('--queries', type=int, default=200, help='질의 수')
+        parser.add_argument('--k', type=int, default=10, help='recall@k의 k')
+        parser.add_argument('--nlist', type=int, default=1024, help='IVF 군집 수')
+        parser.add_argument('--nprobe', type=int, nargs='+', default=[1, 4, 16, 64], help='측정할 IVF nprobe 값 목록')
+        parser.add_argument('--ef', type=int, nargs='+', default=[16, 64, 256], help='측정할 HNSW ef 값 목록')
+
+    def handle(self, *args, **options):
+        k = options['k']
+        vectors = make_clustered_vectors(options['vectors'], options['dim'], clusters=max(options['vectors'] // 20, 1))
+        queries = make_clustered_vectors(options['queries'], options['dim'], clusters=max(options['vectors'] // 20, 1), seed=0)
+        queries = l2_normalize(queries + np.random.default_rng(1).standard_normal(queries.shape).astype(np.float32) * 0.02)
+
+        exact = BruteForceIndex(options['dim'])
+        exact.build(vectors)
+        truth = [set(exact.search(query, k)[0].tolist()) for query in queries]
+        self._report('brute', exact.search, queries, truth, k)
+
+        start = time.perf_counter()
+        ivf = IVFIndex(options['dim'], nlist=options['nlist'])
+        ivf.build(vectors)
+        self.stdout.write(f'IVF 빌드: {time.perf_counter() - start:.2f}s (nlist={ivf.nlist})')
+        for nprobe in options['nprobe']:
+            self._report(f'ivf nprobe={nprobe}', lambda q, k, n=nprobe: ivf.search(q, k, nprobe=n), queries, truth, k)
+
+        hnsw = AnnIndexFactory.create('hnsw', options['dim'], max_elements=options['vectors'])
+        if hnsw.name != 'hnsw':
+            self.stdout.write('hnswlib가 설치되어 있지 않아 HNSW 측정을 건너뜁니다.')
+            return
+        start = time.perf_counter()
+        hnsw.build(vectors)
+        self.stdout.write(f'HNSW 빌드: {time.perf_counter() - start:.2f}s')
+        for ef in options['ef']:
+            hnsw._index.set_ef(max(ef, k))
+            self._report(f'hnsw ef={ef}', hnsw.search, queries, truth, k)
+
+    def _report(self, name, search, queries, truth, k):
+        """
+        질의별 평균 지연 시간과 정확한 결과 대비 recall@k를 출력합니다.
+        """
+        found = 0
+        start = time.perf_counter()
+        for query, expected in zip(queries, truth):
+            ids, _ = search(query, k)
+            found += len(expected.intersection(ids.tolist()))
+        elapsed_ms = (time.perf_counter() - start) / len(queries) * 1000
+        self.stdout.write(f'{name:>16}: {elapsed_ms:8.3f} ms / 질의, recall@{k} = {found / (k * len(queries)):.3f}')
@@ -0,0 +1,56 @@
+from types import SimpleNamespace
+import time
+
+from django.contrib.messages import constants
+from django.contrib.messages.storage.base import Message
+from django.core.management.base import BaseCommand
+
+from pybo.views.base_views import index_comment_messages
+
+
+def substring_match_messages(message_list, comments) -> dict:
+    """
+    이전 구현과 같은 방식(메시지 x 댓글 이중 루프 + 부분 문자열 비교)으로 메시지를 분류합니다.
+
+    비교 기준으로만 사용합니다.
+    """
+    comment_messages = {comment.id: [] for comment in comments}
+    for message in message_list:
+        for comment in comments:
+            if str(comment.id) in message.tags:
+                comment_messages[comment.id].append({'text': message.message, 'tags': message.tags})
+    return comment_messages
+
+
+class Command(BaseCommand):
+    """
+    댓글 메시지 분류(BaseReadView._get_comment_messages)의 성능을 측정하는 명령입니다.
+
+    댓글이 많은 스레드(기본 1,000개)와 플래시 메시지 목록을 만들어,
+    태그 인덱스 방식과 이전의 부분 문자열 이중 루프 방식의 소요 시간을 비교합니다.
+
+    사용 예:
+        python manage.py benchmark_comment_messages --comments 1000 --messages 50
+    """
+
+    help = '댓글 메시지 분류 방식의 성능을 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--comments', type=int, default=1000, help='스레드의 댓글 수')
+        parser.add_argument('--messages', type=int, default=50, help='플래시 메시지 수')
+        parser.add_argument('--repeat', type=int, default=20, help='반복 측정 횟수')
+
+    def handle(self, *args, **options):
+        comments = [SimpleNamespace(id=i) for i in range(1, options['comments'] + 1)]
+        message_list = [
+            Message(constants.SUCCESS, '추천하였습니다.', extra_tags=f'comment {comments[i * 7 % len(comments)].id}')
+            for i in range(options['messages'])
+        ]
+
+        for name, func in (('tag index', index_comment_messages), ('substring loop', substring_match_messages)):
+            start = time.perf_counter()
+            for _ in range(options['repeat']):
+                func(message_list, comments)
+            elapsed_ms = (time.perf_counter() - start) / options['repeat'] * 1000
+            self.stdout.write(f'{name:>15}: {elapsed_ms:8.3f} ms / 요청 '
+                              f'(댓글 {len(comments)}개, 메시지 {len(message_list)}개)')
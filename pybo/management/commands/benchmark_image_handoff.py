@@ -0,0 +1,130 @@
+import hashlib
+import os
+import pickle
+import statistics
+import tempfile
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand
+
+from pybo.inference.pool import InferencePool
+from pybo.inference.shared_image import SharedImage, decode_image, open_image
+
+
+def touch_path(path: str) -> int:
+    """
+    경로 전달: 워커가 파일을 읽어 해시를 계산하고 디코딩합니다.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    hashlib.sha256(data).hexdigest()
+    return _checksum(decode_image(data))
+
+
+def touch_array(image: np.ndarray) -> int:
+    """
+    배열 전달: 작업 스레드가 디코딩한 배열을 pickle로 받습니다.
+    """
+    return _checksum(image)
+
+
+def touch_handle(handle) -> int:
+    """
+    공유 메모리 전달: 핸들로 공유 메모리 블록을 복사 없이 엽니다.
+    """
+    with open_image(handle) as source:
+        return _checksum(source.image_rgb)
+
+
+def _checksum(image: np.ndarray) -> int:
+    return int(image[::97, ::97].sum())  # 추론 대신 이미지 전체에 흩어진 픽셀을 읽음
+
+
+class Command(BaseCommand):
+    """
+    업로드 이미지를 추론 워커 프로세스에 넘기는 방식별 소요 시간과 복사량을 측정하는 명령입니다.
+
+    1. path   : 경로만 넘기고 워커가 파일을 다시 읽어 해시/디코딩 (SHARED_MEMORY=False)
+    2. pickle : 작업 스레드가 디코딩한 배열을 작업 인자로 넘김 (pickle → 파이프 → unpickle)
+    3. shared : 작업 스레드가 디코딩해 공유 메모리에 올리고 핸들만 넘김 (SHARED_MEMORY=True)
+
+    시간은 작업 스레드의 준비(읽기, 디코딩, 공유 메모리 복사)부터 워커의 결과를 받을 때까지이며,
+    워커는 추론 대신 이미지 전체에 흩어진 픽셀을 읽기만 합니다. (모델 실행 시간 제외)
+
+    사용 예:
+        python manage.py benchmark_image_handoff --megapixels 12 --repeat 20
+        python manage.py benchmark_image_handoff --image media/similarity/q_image1/a.jpg
+    """
+
+    help = '추론 워커로 이미지를 넘기는 방식(경로, pickle, 공유 메모리)별 소요 시간과 복사량을 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--image', default=None, help='측정할 이미지 경로 (기본값: --megapixels 크기의 합성 JPEG)')
+        parser.add_argument('--megapixels', type=float, default=12.0, help='합성 이미지의 화소 수(백만)')
+        parser.add_argument('--repeat', type=int, default=10, help='방식별 반복 횟수')
+
+    def handle(self, *args, **options):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = options['image'] or self._synthetic_jpeg(tmp_dir, options['megapixels'])
+            with open(path, 'rb') as f:
+                image = decode_image(f.read())
+            self.stdout.write(
+                f'이미지: {image.shape[1]}x{image.shape[0]} ({image.nbytes / 1024 / 1024:.1f}MB RGB, '
+                f'파일 {os.path.getsize(path) / 1024 / 1024:.1f}MB)'
+            )
+
+            pool = InferencePool(processes=1, max_jobs_per_worker=options['repeat'] * 10).start()
+            try:
+                def by_path():
+                    return pool.run(touch_path, path), pickle.dumps(path)
+
+                def by_pickle():
+                    with open(path, 'rb') as f:
+                        data = f.read()
+                    hashlib.sha256(data).hexdigest()  # 임베딩 캐시 키 (공유 메모리 방식과 같은 작업량)
+                    decoded = decode_image(data)
+                    return pool.run(touch_array, decoded), pickle.dumps(decoded, protocol=pickle.HIGHEST_PROTOCOL)
+
+                def by_shared_memory():
+                    with SharedImage(path) as shared:
+                        return pool.run(touch_handle, shared.handle), pickle.dumps(shared.handle)
+
+                # (이름, 실행 함수, 워커로 넘어가는 이미지 전체 복사 횟수)
+                # pickle: 직렬화 + 파이프 쓰기/읽기(커널) + 역직렬화, shared: 공유 메모리에 한 번 씀
+                methods = [('path', by_path, '0 (워커가 다시 디코딩)'), ('pickle', by_pickle, '4'), ('shared', by_shared_memory, '1')]
+                checksums = set()
+                for name, run, copies in methods:
+                    run()  # 첫 실행(임포트, 페이지 폴트)은 제외
+                    timings = []
+                    for _ in range(options['repeat']):
+                        start = time.perf_counter()
+                        checksum, payload = run()
+                        timings.append((time.perf_counter() - start) * 1000)
+                    checksums.add(checksum)
+                    timings.sort()
+                    self.stdout.write(
+                        f'{name:>7}: 평균 {statistics.mean(timings):8.2f} ms, p95 {timings[min(len(timings) - 1, int(len(timings) * 0.95))]:8.2f} ms, '
+                        f'파이프 전송 {len(payload) / 1024:10.1f}KB, 이미지 복사 {copies}'
+                    )
+                if len(checksums) != 1:
+                    self.stdout.write(self.style.ERROR('방식별로 워커가 읽은 이미지가 다릅니다.'))
+            finally:
+                pool.shutdown()
+
+    @staticmethod
+    def _synthetic_jpeg(directory: str, megapixels: float) -> str:
+        """
+        4:3 비율의 합성 JPEG를 만듭니다. (그라디언트 + 잡음으로 실제 사진과 비슷한 압축률)
+        """
+        from PIL import Image
+
+        height = int((megapixels * 1_000_000 * 3 / 4) ** 0.5)
+        width = int(height * 4 / 3)
+        rng = np.random.default_rng(0)
+        y, x = np.mgrid[0:height, 0:width]
+        image = np.stack([x * 255 // width, y * 255 // height, (x + y) * 255 // (width + height)], axis=-1)
+        image = np.clip(image + rng.integers(-12, 12, image.shape), 0, 255).astype(np.uint8)
+        path = os.path.join(directory, 'synthetic.jpg')
+        Image.fromarray(image).save(path, quality=90)
+        return path
@@ -0,0 +1,100 @@
+import statistics
+import threading
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand
+
+from pybo.inference.batching import MicroBatcher
+
+
+class SyntheticModel:
+    """
+    배치 크기에 따라 비용이 늘어나는 방식이 탐지 모델과 비슷한 합성 모델입니다.
+
+    호출마다 고정 비용(전처리, 커널 실행)과 가중치 전체 읽기가 한 번씩 들고, 이미지 수에 비례하는 연산이 더해집니다.
+    """
+
+    def __init__(self, width: int, overhead_ms: float):
+        rng = np.random.default_rng(0)
+        self.weights = rng.standard_normal((width, width), dtype=np.float32)
+        self.overhead = overhead_ms / 1000
+
+    def __call__(self, images: list) -> list:
+        time.sleep(self.overhead)
+        outputs = np.stack(images) @ self.weights
+        return list(outputs.sum(axis=1))
+
+
+class Command(BaseCommand):
+    """
+    탐지기 마이크로 배치(pybo.inference.batching)의 최대 배치 크기와 대기 시간별 처리량과 p99 지연을 측정하는 명령입니다.
+
+    --clients개의 스레드가 동시에 탐지 요청을 보내고 결과를 받으면 다음 요청을 보냅니다. (작업 큐 스레드와 같은 방식)
+    모델은 합성 모델(SyntheticModel)이며, 배치 크기 1은 배치를 사용하지 않는 경우와 같습니다.
+    실제 탐지기로 측정하려면 AI_DETECTOR_BATCHING을 켜고 benchmark_ai_backend --backends local --concurrency N을 사용합니다.
+
+    사용 예:
+        python manage.py benchmark_micro_batching --batch-sizes 1 4 8 16 --waits 2 5 10 --clients 16
+    """
+
+    help = '탐지기 마이크로 배치의 배치 크기와 대기 시간별 처리량과 p99 지연을 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-sizes', nargs='+', type=int, default=[1, 4, 8, 16], help='측정할 최대 배치 크기 목록')
+        parser.add_argument('--waits', nargs='+', type=float, default=[1.0, 5.0, 10.0], help='측정할 최대 대기 시간(밀리초) 목록')
+        parser.add_argument('--clients', type=int, default=16, help='동시에 요청을 보내는 스레드 수')
+        parser.add_argument('--requests', type=int, default=400, help='설정별 전체 요청 수')
+        parser.add_argument('--width', type=int, default=2048, help='합성 모델의 가중치 크기 (width x width float32)')
+        parser.add_argument('--overhead-ms', type=float, default=2.0, help='합성 모델의 호출당 고정 비용(밀리초)')
+
+    def handle(self, *args, **options):
+        model = SyntheticModel(options['width'], options['overhead_ms'])
+        image = np.ones(options['width'], dtype=np.float32)
+        model([image])  # 첫 실행(메모리 할당)은 제외
+
+        self.stdout.write(f"요청 {options['requests']}개, 동시 {options['clients']}개")
+        for batch_size in options['batch_sizes']:
+            waits = [0.0] if batch_size == 1 else options['waits']  # 배치 크기 1은 대기하지 않음
+            for wait_ms in waits:
+                batcher = MicroBatcher(model, batch_size, wait_ms, name='benchmark')
+                try:
+                    latencies, elapsed = self._run(batcher, image, options['clients'], options['requests'])
+                finally:
+                    batcher.close()
+
+                latencies.sort()
+                p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+                self.stdout.write(
+                    f'배치 {batch_size:>3}, 대기 {wait_ms:5.1f} ms: {len(latencies) / elapsed:8.1f} 요청/초, '
+                    f'p50 {statistics.median(latencies):7.2f} ms, p99 {p99:7.2f} ms, '
+                    f'평균 배치 {batcher.stats["items"] / max(batcher.stats["batches"], 1):5.2f}'
+                )
+
+    @staticmethod
+    def _run(batcher: MicroBatcher, image: np.ndarray, clients: int, requests: int):
+        """
+        clients개의 스레드가 요청 수를 나눠 보내고, 요청별 지연(밀리초)과 전체 소요 시간(초)을 반환합니다.
+        """
+        latencies = []
+        lock = threading.Lock()
+
+        def client(count):
+            timings = []
+            for _ in range(count):
+                start = time.perf_counter()
+                batcher(image)
+                timings.append((time.perf_counter() - start) * 1000)
+            with lock:
+                latencies.extend(timings)
+
+        threads = [
+            threading.Thread(target=client, args=(requests // clients + (i < requests % clients),))
+            for i in range(clients)
+        ]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return latencies, time.perf_counter() - start
@@ -0,0 +1,91 @@
+from datetime import timedelta
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.core.paginator import Paginator
+from django.db import transaction
+from django.test import RequestFactory
+from django.utils import timezone
+
+from pybo.models import SimilarityPostModel
+from pybo.pagination import NEXT, encode_cursor, paginate_by_cursor
+from pybo.views.similarity_post_views import SimilarityPostListView
+
+
+class Rollback(Exception):
+    """
+    측정용 데이터를 되돌리기 위한 예외입니다.
+    """
+
+
+class Command(BaseCommand):
+    """
+    게시판 목록의 페이지 번호(OFFSET) 방식과 커서 방식의 페이지 위치별 조회 시간을 비교하는 명령입니다.
+
+    트랜잭션 안에서 측정용 게시글을 만들고, 측정이 끝나면 롤백하므로 기존 데이터는 바뀌지 않습니다.
+    각 방식으로 1페이지와 --deep-page 페이지를 조회하는 시간을 목록 화면과 같은 QuerySet으로 측정합니다.
+
+    사용 예:
+        python manage.py benchmark_pagination --deep-page 10000
+    """
+
+    help = '페이지 번호 방식과 커서 방식의 페이지 조회 시간을 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--deep-page', type=int, default=10000, help='측정할 뒤쪽 페이지 번호')
+        parser.add_argument('--per-page', type=int, default=10, help='페이지당 게시글 수')
+        parser.add_argument('--repeat', type=int, default=20, help='반복 측정 횟수')
+
+    def handle(self, *args, **options):
+        per_page, deep_page = options['per_page'], options['deep_page']
+        try:
+            with transaction.atomic():
+                self._create_posts(per_page * deep_page)
+                request = RequestFactory().get('/')
+                view = SimilarityPostListView()
+                view.setup(request)
+                queryset = view.get_queryset()  # 목록 화면과 같은 QuerySet
+
+                for page_number in (1, deep_page):
+                    offset = (page_number - 1) * per_page
+                    token = None
+                    if offset:  # 해당 페이지 직전 글을 가리키는 토큰 (측정 시간에 포함하지 않음)
+                        token = encode_cursor(queryset[offset - 1], NEXT, offset - 1)
+
+                    page_ms = self._measure(
+                        lambda: list(Paginator(queryset, per_page).page(page_number).object_list), options['repeat']
+                    )
+                    cursor_ms = self._measure(lambda: paginate_by_cursor(queryset, token, per_page), options['repeat'])
+                    self.stdout.write(f'{page_number:>6} 페이지: 페이지 번호 방식 {page_ms:8.2f} ms, 커서 방식 {cursor_ms:8.2f} ms')
+                raise Rollback
+        except Rollback:
+            pass
+
+    def _create_posts(self, count: int) -> None:
+        """
+        작성 시각이 1분씩 차이 나는 측정용 게시글을 만듭니다.
+        """
+        author = User.objects.create_user(username='benchmark_pagination_user')
+        create_date = SimilarityPostModel._meta.get_field('create_date')
+        start = timezone.now() - timedelta(minutes=count)
+        create_date.auto_now_add = False  # 작성 시각을 직접 지정하기 위해 잠시 해제
+        try:
+            SimilarityPostModel.objects.bulk_create(
+                (SimilarityPostModel(author=author, subject=f'제목 {i}', content='내용', create_date=start + timedelta(minutes=i))
+                 for i in range(count)),
+                batch_size=5000,
+            )
+        finally:
+            create_date.auto_now_add = True
+        self.stdout.write(f'측정용 게시글 {count}개 생성')
+
+    @staticmethod
+    def _measure(func, repeat: int) -> float:
+        """
+        함수 실행 시간의 평균(ms)을 반환합니다.
+        """
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        return (time.perf_counter() - start) / repeat * 1000
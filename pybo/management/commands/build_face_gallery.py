@@ -0,0 +1,49 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """
+    얼굴 유사도 비교 게시판의 모든 이미지로 얼굴 갤러리를 새로 만드는 명령입니다.
+
+    process_image()의 임베딩 캐시를 사용하므로 이미 처리한 이미지는 다시 인코딩하지 않습니다.
+    갤러리 파일이 손상되었거나 모델(MODEL_VERSION)을 바꾼 뒤에 실행합니다.
+    현재 게시글로 새로 만들므로 삭제된 게시글의 행(tombstone)과 중복 행도 정리되며, 다시 실행해도 결과가 같습니다.
+    새 세대 디렉터리에 저장한 뒤 한 번에 전환하므로, 실행 중인 워커는 재시작 없이 다음 refresh()에서 새 갤러리를 불러옵니다.
+
+    --index 옵션을 주면 settings.AI_ANN_INDEX 설정의 근사 최근접 이웃 인덱스도 함께 만들어 저장합니다.
+
+    사용 예:
+        python manage.py build_face_gallery
+        python manage.py build_face_gallery --index
+    """
+
+    help = '얼굴 유사도 비교 게시판의 이미지로 얼굴 갤러리를 새로 만듭니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--index', action='store_true', help='근사 최근접 이웃 인덱스도 함께 만듭니다.')
+
+    def handle(self, *args, **options):
+        import numpy as np
+        from pybo.inference.ann import AnnIndexFactory
+        from pybo.inference.gallery import FaceGallery
+        from pybo.models import SimilarityPostModel
+        from pybo.views.ai import index_similarity_post  # ai_system 등 AI 의존성은 명령 실행 시점에만 임포트
+
+        gallery = FaceGallery()  # 메모리에서 만든 뒤 한 번에 저장
+        posts = SimilarityPostModel.objects.order_by('pk')  # 이미지가 없는 게시글은 index_similarity_post에서 건너뜀
+        for post in posts.iterator():
+            try:
+                index_similarity_post(post, gallery=gallery)
+            except Exception as e:
+                self.stderr.write(f'게시글 {post.pk} 처리 실패: {e}')
+
+        gallery.save(settings.AI_FACE_GALLERY['PATH'])
+        self.stdout.write(f'얼굴 {len(gallery)}개로 갤러리를 만들었습니다.')
+
+        if options['index'] and len(gallery):
+            index_options = settings.AI_ANN_INDEX
+            index = AnnIndexFactory.create(index_options['BACKEND'], gallery.dim, **index_options.get('OPTIONS', {}))
+            index.build(gallery.matrix, np.arange(len(gallery), dtype=np.int64))  # 벡터 ID = 갤러리 행 번호
+            index.save(index_options['PATH'])
+            self.stdout.write(f'{index.name} 인덱스를 저장했습니다. ({index_options["PATH"]})')
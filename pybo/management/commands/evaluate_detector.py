@@ -0,0 +1,168 @@
+import glob
+import os
+import statistics
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand, CommandError
+
+from pybo.inference.onnx_detector import OnnxYoloModel, box_iou
+from pybo.inference.shared_image import decode_image
+
+
+def read_labels(path: str, image_shape: tuple) -> np.ndarray:
+    """
+    YOLO 형식 라벨 파일(줄마다 '클래스 중심x 중심y 너비 높이', 0~1)을 (얼굴 수, 4) 픽셀 좌표 박스로 읽습니다.
+
+    라벨 파일이 없으면 얼굴이 없는 이미지로 봅니다.
+    """
+    if not os.path.exists(path):
+        return np.zeros((0, 4), dtype=np.float32)
+    rows = np.loadtxt(path, dtype=np.float32, ndmin=2)
+    if not rows.size:
+        return np.zeros((0, 4), dtype=np.float32)
+    height, width = image_shape[:2]
+    center, size = rows[:, 1:3] * (width, height), rows[:, 3:5] * (width, height)
+    return np.concatenate([center - size / 2, center + size / 2], axis=1)
+
+
+def match_detections(detections: np.ndarray, truths: np.ndarray, iou_threshold: float = 0.5):
+    """
+    신뢰도가 높은 탐지부터 IoU가 가장 큰 정답 박스에 하나씩 짝짓습니다.
+
+    Parameters
+    ----------
+    detections : np.ndarray
+        (탐지 수, 5) 배열 (x1, y1, x2, y2, 신뢰도)입니다.
+    truths : np.ndarray
+        (정답 수, 4) 정답 박스입니다.
+    iou_threshold : float, optional
+        정답으로 인정할 최소 IoU입니다.
+
+    Returns
+    -------
+    tuple
+        (맞은 탐지 수, 틀린 탐지 수, 놓친 정답 수, 맞은 탐지의 IoU 목록)입니다.
+    """
+    detections = np.asarray(detections, dtype=np.float32).reshape(-1, 5)
+    detections = detections[np.argsort(-detections[:, 4])]
+    ious = box_iou(detections[:, :4], truths)
+    matched, matched_ious = set(), []
+    for row in ious:
+        candidates = [(iou, index) for index, iou in enumerate(row) if index not in matched and iou >= iou_threshold]
+        if candidates:
+            iou, index = max(candidates)
+            matched.add(index)
+            matched_ious.append(float(iou))
+    true_positives = len(matched)
+    return true_positives, len(detections) - true_positives, len(truths) - true_positives, matched_ious
+
+
+def load_model(path: str, options: dict):
+    """
+    모델 파일 확장자에 따라 이미지 한 장을 받아 (탐지 수, 5) 배열을 반환하는 함수를 만듭니다.
+
+    .onnx는 OnnxYoloModel(onnxruntime), .pt는 ultralytics YOLO(PyTorch)로 실행합니다.
+    """
+    if path.endswith('.onnx'):
+        model = OnnxYoloModel(path, options['image_size'], options['conf'], options['nms_iou'], options['threads'])
+        return lambda image: model(image)[0]
+
+    import torch
+    from ultralytics import YOLO  # 선택 의존성
+
+    if options['threads']:
+        torch.set_num_threads(options['threads'])
+    model = YOLO(path)
+
+    def detect(image):
+        boxes = model.predict(
+            image[..., ::-1], imgsz=options['image_size'], conf=options['conf'], iou=options['nms_iou'], verbose=False,
+        )[0].boxes  # ultralytics는 NumPy 입력을 BGR로 봄
+        return np.concatenate([boxes.xyxy.cpu().numpy(), boxes.conf.cpu().numpy()[:, None]], axis=1)
+
+    return detect
+
+
+class Command(BaseCommand):
+    """
+    라벨이 있는 로컬 샘플로 YOLO 탐지기(PyTorch .pt, ONNX, int8 ONNX)의 정확도와 지연 시간을 비교하는 명령입니다.
+
+    샘플은 ultralytics 데이터셋 형식(이미지마다 같은 이름의 .txt 라벨)이며, 라벨 디렉터리를 지정하지 않으면
+    이미지 경로의 'images'를 'labels'로 바꾼 디렉터리, 그것도 없으면 이미지 디렉터리에서 라벨을 찾습니다.
+    정확도는 IoU 기준 이상으로 겹친 탐지를 맞은 것으로 보고 precision, recall, F1, 평균 IoU를 계산하며,
+    지연 시간은 이미지를 디코딩한 뒤 탐지(전처리, 추론, 후처리)에 걸린 시간입니다.
+
+    사용 예:
+        python manage.py evaluate_detector samples/images yolov8_l_trump.pt models/yolov8_l_trump.onnx models/yolov8_l_trump.int8.onnx
+        python manage.py evaluate_detector samples/images models/yolov8_l_trump.int8.onnx --threads 1 --repeat 3
+    """
+
+    help = '라벨이 있는 샘플로 탐지기 모델(.pt, .onnx)별 정확도와 지연 시간을 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('images', help='샘플 이미지 디렉터리')
+        parser.add_argument('models', nargs='+', help='비교할 모델 경로 (.pt 또는 .onnx)')
+        parser.add_argument('--labels', default=None, help='라벨 디렉터리')
+        parser.add_argument('--image-size', type=int, default=640, help='모델 입력 크기')
+        parser.add_argument('--conf', type=float, default=0.25, help='탐지 신뢰도 하한')
+        parser.add_argument('--nms-iou', type=float, default=0.45, help='NMS IoU 기준')
+        parser.add_argument('--match-iou', type=float, default=0.5, help='정답으로 인정할 최소 IoU')
+        parser.add_argument('--threads', type=int, default=None, help='추론 스레드 수 (추론 워커의 THREADS_PER_WORKER와 맞춰 측정)')
+        parser.add_argument('--repeat', type=int, default=1, help='이미지별 지연 시간 측정 반복 횟수')
+
+    def handle(self, *args, **options):
+        image_paths = sorted(
+            path for pattern in ('*.jpg', '*.jpeg', '*.png')
+            for path in glob.glob(os.path.join(options['images'], pattern))
+        )
+        if not image_paths:
+            raise CommandError(f"샘플 이미지가 없습니다: {options['images']}")
+        label_dir = options['labels'] or self._label_dir(options['images'])
+
+        samples = []
+        for path in image_paths:
+            with open(path, 'rb') as f:
+                image = decode_image(f.read())
+            label_path = os.path.join(label_dir, os.path.splitext(os.path.basename(path))[0] + '.txt')
+            samples.append((image, read_labels(label_path, image.shape)))
+        self.stdout.write(f'샘플 {len(samples)}장, 정답 얼굴 {sum(len(truths) for _, truths in samples)}개 (라벨: {label_dir})')
+
+        for path in options['models']:
+            try:
+                detect = load_model(path, options)
+                detect(samples[0][0])  # 첫 실행(메모리 할당, 그래프 준비)은 제외
+            except Exception as e:  # 한 모델을 쓸 수 없어도 나머지 모델은 측정
+                self.stdout.write(self.style.ERROR(f'{path}: 실행 실패 ({type(e).__name__}: {e})'))
+                continue
+
+            timings, totals, ious = [], np.zeros(3, dtype=np.int64), []
+            for image, truths in samples:
+                for _ in range(options['repeat']):
+                    start = time.perf_counter()
+                    detections = detect(image)
+                    timings.append((time.perf_counter() - start) * 1000)
+                *counts, matched_ious = match_detections(detections, truths, options['match_iou'])
+                totals += counts
+                ious.extend(matched_ious)
+
+            true_positives, false_positives, false_negatives = totals
+            precision = true_positives / max(true_positives + false_positives, 1)
+            recall = true_positives / max(true_positives + false_negatives, 1)
+            f1 = 2 * precision * recall / max(precision + recall, 1e-9)
+            timings.sort()
+            self.stdout.write(
+                f'{os.path.basename(path):>28}: precision {precision:.3f}, recall {recall:.3f}, F1 {f1:.3f}, '
+                f'평균 IoU {statistics.mean(ious) if ious else 0:.3f} | '
+                f'중앙값 {statistics.median(timings):7.1f} ms, p95 {timings[min(len(timings) - 1, int(len(timings) * 0.95))]:7.1f} ms '
+                f'({os.path.getsize(path) / 1024 / 1024:.1f}MB)'
+            )
+
+    @staticmethod
+    def _label_dir(image_dir: str) -> str:
+        """
+        ultralytics 데이터셋 형식(.../images, .../labels)이면 labels 디렉터리를, 아니면 이미지 디렉터리를 반환합니다.
+        """
+        head, tail = os.path.split(os.path.normpath(image_dir))
+        labels = os.path.join(head, 'labels') if tail == 'images' else None
+        return labels if labels and os.path.isdir(labels) else image_dir
@@ -0,0 +1,203 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from pybo.counters import get_post_counter
+from pybo.models import DetectionCommentModel, DetectionPostModel, SimilarityCommentModel, SimilarityPostModel
+from pybo.page_cache import get_page_cache
+from pybo.pagination import NEXT, encode_cursor
+from pybo.search import get_search_backend
+from pybo.view_counter import get_view_counter
+
+BOARDS = {
+    'similarity': (SimilarityPostModel, SimilarityCommentModel),
+    'detection': (DetectionPostModel, DetectionCommentModel),
+}
+EXPLAINED_STATEMENTS = ('SELECT', 'UPDATE', 'DELETE')  # 세션 저장 등 INSERT와 SAVEPOINT는 제외
+
+
+class Rollback(Exception):
+    """
+    측정용 데이터를 되돌리기 위한 예외입니다.
+    """
+
+
+class Command(BaseCommand):
+    """
+    게시판 화면(BaseListView, BaseReadView, BaseVoteView)이 실행하는 쿼리의 실행 계획을 확인하는 명령입니다.
+
+    트랜잭션 안에서 게시판마다 측정용 게시글/댓글을 만들고, 목록/검색/상세/추천 요청을 실제로 보내
+    실행된 SELECT/UPDATE/DELETE 문마다 EXPLAIN 결과를 출력합니다. 끝나면 롤백하므로 기존 데이터는 바뀌지 않습니다.
+
+    인덱스를 사용하지 않고 테이블 전체를 읽는 단계(전체 스캔)와 인덱스 순서를 쓰지 못해 따로 정렬하는 단계(임시 정렬)를 표시합니다.
+    - sqlite: 'SCAN 테이블'(USING INDEX 없음), 'USE TEMP B-TREE'
+    - MySQL: type이 ALL인 행, Extra의 'Using filesort'
+
+    사용 예:
+        python manage.py explain_queries --posts 5000 --fail-on-scan
+    """
+
+    help = '게시판 화면이 실행하는 쿼리의 실행 계획에서 전체 스캔과 임시 정렬을 찾습니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--posts', type=int, default=2000, help='게시판마다 만들 측정용 게시글 수')
+        parser.add_argument('--comments', type=int, default=50, help='상세 화면에서 조회할 게시글의 댓글 수')
+        parser.add_argument('--host', default=None, help='요청에 사용할 호스트 이름 (기본값: ALLOWED_HOSTS의 첫 번째 또는 localhost)')
+        parser.add_argument('--fail-on-scan', action='store_true', help='전체 스캔이나 임시 정렬이 있으면 오류로 종료')
+
+    def handle(self, *args, **options):
+        if connection.vendor not in ('sqlite', 'mysql'):
+            raise CommandError(f"지원하지 않는 데이터베이스입니다: {connection.vendor}")
+
+        problems = []
+        try:
+            with transaction.atomic():
+                author = User.objects.create_user(username='explain_queries_author')
+                viewer = User.objects.create_user(username='explain_queries_viewer')
+                client = Client(SERVER_NAME=options['host'] or self._default_host())
+                client.force_login(viewer)
+
+                for board_name, (post_model, comment_model) in BOARDS.items():
+                    post, comment = self._create_posts(post_model, comment_model, author, options['posts'], options['comments'])
+                    for label, run, expected in self._steps(client, board_name, post_model, post, comment):
+                        problems += self._explain(f'[{board_name}] {label}', run, expected)
+                raise Rollback
+        except Rollback:
+            pass
+        finally:
+            get_view_counter().clear()  # 롤백된 게시글의 조회 수가 남지 않도록 버림
+            get_page_cache().invalidate_site()  # 측정용 게시글로 그린 페이지가 캐시에 남지 않도록 무효화
+
+        if problems:
+            self.stdout.write(self.style.WARNING(f'전체 스캔/임시 정렬 {len(problems)}건'))
+            for problem in problems:
+                self.stdout.write(f'  {problem}')
+            if options['fail_on_scan']:
+                raise CommandError(f'전체 스캔/임시 정렬이 {len(problems)}건 있습니다.')
+        else:
+            self.stdout.write(self.style.SUCCESS('전체 스캔/임시 정렬 없음'))
+
+    def _steps(self, client, board_name, post_model, post, comment):
+        """
+        게시판 화면별로 (이름, 요청 함수, 허용하는 문제) 목록을 반환합니다.
+
+        검색 결과는 검색 인덱스에서 찾은 게시글 ID 순서로 나오므로 최신순으로 다시 정렬하는 임시 정렬을 허용합니다.
+        (검색 결과 수만큼만 정렬하며, 검색하지 않는 목록은 (create_date, id) 인덱스 순서로 읽음)
+        """
+        json_header = {'HTTP_ACCEPT': 'application/json'}
+        list_url = reverse(f'pybo:{board_name}_post_list')
+        middle = post_model.objects.order_by('-create_date', '-id')[post_model.objects.count() // 2]
+        return [
+            ('목록 (페이지 번호)', lambda: client.get(list_url, {'mode': 'page', 'page': 2}), ()),
+            ('목록 (커서)', lambda: client.get(list_url, {'cursor': encode_cursor(middle, NEXT)}), ()),
+            ('목록 (검색)', lambda: client.get(list_url, {'mode': 'page', 'kw': '제목'}), ('임시 정렬',)),
+            ('상세', lambda: client.get(reverse(f'pybo:{board_name}_post_read', kwargs={'pk': post.pk})), ()),
+            ('조회 수 반영', lambda: get_view_counter().flush(), ()),
+            ('게시글 추천', lambda: client.get(reverse(f'pybo:{board_name}_post_vote', kwargs={'pk': post.pk}), **json_header), ()),
+            ('댓글 추천', lambda: client.get(reverse(f'pybo:{board_name}_comment_vote', kwargs={'pk': comment.pk}), **json_header), ()),
+        ]
+
+    def _explain(self, label: str, run, expected=()) -> list:
+        """
+        run()이 실행한 쿼리마다 실행 계획을 출력하고, expected에 없는 전체 스캔/임시 정렬 목록을 반환합니다.
+        """
+        with CaptureQueriesContext(connection) as captured:
+            run()
+
+        self.stdout.write(self.style.MIGRATE_HEADING(label))
+        problems, seen = [], set()
+        for query in captured.captured_queries:
+            sql = query['sql']
+            if not sql.lstrip().upper().startswith(EXPLAINED_STATEMENTS) or sql in seen:
+                continue
+            seen.add(sql)
+            self.stdout.write(f'  {sql[:120]}{"..." if len(sql) > 120 else ""}')
+            for line, problem in self._plan(sql):
+                if problem in expected:
+                    self.stdout.write(f'    {line}  <- {problem} (예상됨)')
+                elif problem:
+                    self.stdout.write(f'    {line}' + self.style.ERROR(f'  <- {problem}'))
+                    problems.append(f'{label}: {problem} ({line})')
+                else:
+                    self.stdout.write(f'    {line}')
+        return problems
+
+    def _plan(self, sql: str) -> list:
+        """
+        쿼리의 실행 계획을 (설명, 문제) 목록으로 반환합니다. 문제가 없으면 문제는 None입니다.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(f'{connection.ops.explain_query_prefix()} {sql}')  # 값이 이미 채워진 SQL이므로 파라미터 없음
+            columns = [column[0] for column in cursor.description]
+            rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+        plan = []
+        if connection.vendor == 'sqlite':  # EXPLAIN QUERY PLAN: (id, parent, notused, detail)
+            tables = set(connection.introspection.table_names())
+            for row in rows:
+                detail = row['detail']
+                problem = None
+                words = detail.split()
+                # 'SCAN subquery'처럼 중간 결과를 읽는 단계는 제외하고, 인덱스 없이 실제 테이블을 읽는 단계만 전체 스캔으로 봄
+                if words[0] == 'SCAN' and words[1] in tables and 'USING' not in words and 'VIRTUAL' not in words:
+                    problem = '전체 스캔'
+                elif detail.startswith('USE TEMP B-TREE'):
+                    problem = '임시 정렬'
+                plan.append((detail, problem))
+        else:  # MySQL EXPLAIN: 테이블마다 한 행
+            for row in rows:
+                extra = row.get('Extra') or ''
+                problem = None
+                if row.get('type') == 'ALL':
+                    problem = '전체 스캔'
+                elif 'Using filesort' in extra:
+                    problem = '임시 정렬'
+                plan.append((f"{row.get('table')} type={row.get('type')} key={row.get('key')} {extra}".rstrip(), problem))
+        return plan
+
+    def _create_posts(self, post_model, comment_model, author, count: int, comment_count: int):
+        """
+        작성 시각이 1분씩 차이 나는 측정용 게시글과, 그중 한 게시글의 댓글을 만듭니다.
+
+        Returns
+        -------
+        tuple
+            (댓글이 달린 게시글, 그 댓글 중 하나)입니다.
+        """
+        start = timezone.now() - timedelta(minutes=count)
+        create_date = post_model._meta.get_field('create_date')
+        create_date.auto_now_add = False  # 작성 시각을 직접 지정하기 위해 잠시 해제
+        try:
+            post_model.objects.bulk_create(
+                (post_model(author=author, subject=f'제목 {i}', content='내용', create_date=start + timedelta(minutes=i))
+                 for i in range(count)),
+                batch_size=5000,
+            )
+        finally:
+            create_date.auto_now_add = True
+        get_post_counter().recount(post_model)  # bulk_create는 시그널을 보내지 않으므로 게시글 수와 검색 인덱스를 다시 만듦
+        get_search_backend().rebuild(post_model)
+
+        posts = list(post_model.objects.order_by('id')[:count // 2 + 1])
+        comments = [comment_model(post=p, author=author, content='댓글') for p in posts for _ in range(2)]  # 다른 글의 댓글
+        post = posts[-1]
+        comments += [comment_model(post=post, author=author, content=f'댓글 {i}') for i in range(comment_count)]
+        comment_model.objects.bulk_create(comments, batch_size=5000)
+        return post, comment_model.objects.filter(post=post).order_by('-id').first()
+
+    @staticmethod
+    def _default_host() -> str:
+        """
+        ALLOWED_HOSTS에서 요청에 사용할 호스트 이름을 고릅니다.
+        """
+        for host in settings.ALLOWED_HOSTS:
+            if host != '*':
+                return host.lstrip('.')
+        return 'localhost'  # DEBUG=True이고 ALLOWED_HOSTS가 비어 있으면 localhost 허용
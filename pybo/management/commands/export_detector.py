@@ -0,0 +1,51 @@
+import glob
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from pybo.inference.onnx_detector import export_onnx, quantize_onnx
+
+
+class Command(BaseCommand):
+    """
+    YOLO 얼굴 탐지기 가중치(.pt)를 ONNX로 내보내고, 선택적으로 int8로 양자화하는 명령입니다. (ultralytics, onnxruntime 필요)
+
+    결과 파일을 settings.AI_ONNX_DETECTOR['MODELS']에 등록하고 탐지기 이름 'yolo_onnx'를 선택하면
+    onnxruntime으로 CPU에서 탐지합니다. 바꾸기 전에 evaluate_detector로 정확도와 지연 시간을 비교합니다.
+
+    사용 예:
+        python manage.py export_detector yolov8_l_trump.pt
+        python manage.py export_detector yolov8_l_trump.pt --int8 --calibration media/detection/q_image1
+    """
+
+    help = 'YOLO 탐지기를 ONNX(선택적으로 int8)로 내보냅니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('weights', help='YOLO 가중치(.pt) 경로')
+        parser.add_argument('--output-dir', default='models', help='ONNX 모델을 저장할 디렉터리')
+        parser.add_argument('--image-size', type=int, default=640, help='모델 입력 크기')
+        parser.add_argument('--int8', action='store_true', help='int8 양자화 모델도 만듦')
+        parser.add_argument('--calibration', default=None, help='정적 양자화의 보정 이미지 디렉터리 (없으면 동적 양자화)')
+        parser.add_argument('--calibration-size', type=int, default=100, help='보정에 사용할 최대 이미지 수')
+
+    def handle(self, *args, **options):
+        if not os.path.exists(options['weights']):
+            raise CommandError(f"가중치 파일이 없습니다: {options['weights']}")
+
+        stem = os.path.splitext(os.path.basename(options['weights']))[0]
+        onnx_path = export_onnx(options['weights'], os.path.join(options['output_dir'], f'{stem}.onnx'), options['image_size'])
+        self.stdout.write(f'ONNX: {onnx_path} ({os.path.getsize(onnx_path) / 1024 / 1024:.1f}MB)')
+
+        if options['int8']:
+            calibration_images = None
+            if options['calibration']:
+                calibration_images = sorted(
+                    path for pattern in ('*.jpg', '*.jpeg', '*.png')
+                    for path in glob.glob(os.path.join(options['calibration'], pattern))
+                )[:options['calibration_size']]
+                if not calibration_images:
+                    raise CommandError(f"보정 이미지가 없습니다: {options['calibration']}")
+            int8_path = quantize_onnx(
+                onnx_path, os.path.join(options['output_dir'], f'{stem}.int8.onnx'), calibration_images, options['image_size'],
+            )
+            self.stdout.write(f'int8: {int8_path} ({os.path.getsize(int8_path) / 1024 / 1024:.1f}MB)')
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """
+    게시글 검색 인덱스(pybo.search)를 다시 만드는 명령입니다.
+
+    SEARCH_BACKEND를 바꾸었거나, 시그널을 거치지 않고(예: QuerySet.update(), 직접 SQL) 게시글을 수정한 뒤에 실행합니다.
+
+    사용 예:
+        python manage.py rebuild_search_index
+    """
+
+    help = '게시글 검색 인덱스를 다시 만듭니다.'
+
+    def handle(self, *args, **options):
+        from pybo.models import SimilarityPostModel, DetectionPostModel
+        from pybo.search import get_search_backend
+
+        backend = get_search_backend()
+        for model in (SimilarityPostModel, DetectionPostModel):
+            backend.create_table(model)
+            count = backend.rebuild(model)
+            self.stdout.write(f'{model.__name__}: {count}개 게시글 색인 ({backend.name})')
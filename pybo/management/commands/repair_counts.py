@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """
+    게시글/댓글에 저장된 추천 수(vote_count), 댓글 수(comment_count)와 게시판별 게시글 수를 실제 값으로 고치는 명령입니다.
+
+    시그널을 거치지 않고(예: bulk_create, QuerySet.update(), 직접 SQL) 추천이나 댓글, 게시글을 바꾼 뒤에 실행합니다.
+    실제 값과 다른 행만 찾아 --batch-size개씩 UPDATE 합니다.
+
+    사용 예:
+        python manage.py repair_counts
+        python manage.py repair_counts --dry-run
+    """
+
+    help = '저장된 추천 수, 댓글 수, 게시판별 게시글 수를 실제 값으로 고칩니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='고치지 않고 어긋난 행 수만 출력')
+        parser.add_argument('--batch-size', type=int, default=1000, help='한 번의 UPDATE로 고칠 최대 행 수')
+
+    def handle(self, *args, **options):
+        from pybo.counters import get_post_counter, repair_counts
+        from pybo.models import SimilarityPostModel, SimilarityCommentModel, DetectionPostModel, DetectionCommentModel
+
+        dry_run = options['dry_run']
+        for model in (SimilarityPostModel, SimilarityCommentModel, DetectionPostModel, DetectionCommentModel):
+            drifted = repair_counts(model, dry_run=dry_run, batch_size=options['batch_size'])
+            self.stdout.write(f'{model.__name__}: {drifted}개 행의 개수가 어긋남' + ('' if dry_run else ' (수정함)'))
+
+        if not dry_run:
+            counter = get_post_counter()
+            for model in (SimilarityPostModel, DetectionPostModel):
+                self.stdout.write(f'{model.__name__}: 게시글 수 {counter.recount(model)}')
@@ -0,0 +1,52 @@
+import signal
+import threading
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """
+    AI 작업 큐(pybo.jobs)의 작업을 실행하는 워커 명령입니다. (process_tasks 대체)
+
+    settings.AI_JOB_QUEUE['BACKEND']가 'sqlite'일 때 웹 서버와 별도로 실행합니다.
+    SIGTERM/SIGINT를 받으면 실행 중인 작업을 마친 뒤 종료합니다.
+
+    사용 예:
+        python manage.py run_jobs --workers 2
+        python manage.py run_jobs --burst  # 대기 중인 작업만 처리하고 종료
+    """
+
+    help = 'AI 작업 큐의 작업을 실행합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=2, help='작업을 동시에 실행할 스레드 수')
+        parser.add_argument('--burst', action='store_true', help='대기 중인 작업을 모두 처리한 뒤 종료합니다.')
+        parser.add_argument('--warm-up', action='store_true', help="시작 전에 게시판별 AI 백엔드를 준비합니다. ('local' 모델 로드, 'pool' 워커 시작)")
+
+    def handle(self, *args, **options):
+        from pybo.jobs import get_job_backend
+        from pybo.views import detection_comment_views, similarity_comment_views  # noqa: F401  작업 등록
+
+        if options['warm_up']:
+            from pybo.inference.backends import get_ai_backend
+            from pybo.url_patterns import URLS
+
+            for board_name in URLS['BOARD_NAME'].values():
+                get_ai_backend(board_name).warm_up()  # ai_system 등 AI 의존성은 'local', 'pool' 백엔드만 임포트
+
+        backend = get_job_backend()
+        stop_event = threading.Event()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, lambda *_: stop_event.set())
+
+        self.stdout.write(f'작업 워커 시작 - {type(backend).__name__}, 스레드 {options["workers"]}개')
+        threads = [
+            threading.Thread(target=backend.work, args=(stop_event, options['burst']), name=f'pybo-job-{i}')
+            for i in range(options['workers'])
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            while thread.is_alive():
+                thread.join(timeout=1)  # 메인 스레드가 시그널을 받을 수 있도록 짧게 대기
+        self.stdout.write('작업 워커 종료')
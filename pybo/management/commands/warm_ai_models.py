@@ -0,0 +1,26 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """
+    얼굴 탐지 모델을 미리 로드하고 로드 시간과 메모리 사용량을 출력하는 명령입니다.
+
+    워커를 띄우기 전에 모델 파일과 설정이 올바른지 확인하거나,
+    모델별 로드 시간/메모리 사용량을 확인할 때 사용합니다.
+
+    사용 예:
+        python manage.py warm_ai_models --detectors yolo
+    """
+
+    help = '얼굴 탐지 모델을 미리 로드하고 메모리 사용량을 출력합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--detectors', nargs='+', default=['yolo'], help='로드할 탐지기 이름 목록')
+
+    def handle(self, *args, **options):
+        from pybo.views.ai import warm_up  # ai_system 등 AI 의존성은 명령 실행 시점에만 임포트
+
+        report = warm_up(options['detectors'])
+        self.stdout.write(json.dumps(report, indent=2, ensure_ascii=False))
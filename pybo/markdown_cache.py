@@ -0,0 +1,186 @@
+from collections import OrderedDict
+import hashlib
+import threading
+
+import markdown
+
+from .url_patterns import URLS
+
+import logging
+logger = logging.getLogger(URLS['APP_NAME'])  # 로거 설정
+
+"""
+마크다운을 HTML로 변환한 결과를 보관하는 캐시 모듈입니다.
+
+게시글과 댓글 본문은 페이지를 볼 때마다 markdown.markdown()으로 변환되는데,
+긴 AI 답변이 많은 상세 페이지에서는 이 변환이 가장 큰 CPU 비용입니다.
+변환 결과를 본문 내용의 SHA-1 해시로 찾아 쓰므로 본문이 바뀌면 자연스럽게 새 키를 사용합니다. (별도 무효화 불필요)
+
+1. 프로세스 계층: 최대 MAX_ENTRIES개를 보관하는 LRU
+2. 공유 계층: settings.CACHES의 CACHE_ALIAS 캐시 (여러 워커 프로세스가 함께 사용)
+
+게시글과 댓글을 저장할 때(pybo.signals) 미리 변환해 두므로, 페이지 조회 시에는 대부분 캐시에서 읽습니다.
+"""
+
+MARKDOWN_EXTENSIONS = [
+    "markdown.extensions.extra",
+    "markdown.extensions.nl2br",
+    "markdown.extensions.fenced_code",
+]
+KEY_VERSION = 1  # 확장 기능이나 변환 방식을 바꾸면 값을 올려 이전 결과를 사용하지 않도록 함
+DEFAULT_OPTIONS = {
+    'MAX_ENTRIES': 2048,
+    'CACHE_ALIAS': 'default',
+    'TIMEOUT': 60 * 60 * 24 * 7,
+}
+
+
+class MarkdownCache:
+    """
+    프로세스 LRU와 공유 캐시로 구성된 마크다운 변환 캐시입니다.
+
+    Attributes
+    ----------
+    max_entries : int
+        프로세스 계층에 보관할 최대 항목 수입니다.
+    cache_alias : str or None
+        공유 계층으로 사용할 settings.CACHES의 이름입니다. None이면 공유 계층을 사용하지 않습니다.
+    timeout : int
+        공유 계층의 보관 시간(초)입니다.
+    hits, misses : int
+        캐시 적중/실패(변환) 횟수입니다.
+
+    Methods
+    -------
+    render(text):
+        마크다운을 HTML로 변환한 결과를 반환합니다.
+    clear():
+        프로세스 계층을 비웁니다.
+    """
+
+    def __init__(self, max_entries: int = 2048, cache_alias: str = 'default', timeout: int = 60 * 60 * 24 * 7):
+        self.max_entries = max_entries
+        self.cache_alias = cache_alias
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = OrderedDict()  # 키 -> HTML (앞쪽일수록 오래 사용하지 않은 항목)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(text: str) -> str:
+        """
+        본문 내용의 SHA-1 해시로 캐시 키를 만듭니다.
+        """
+        return f"pybo:md:{KEY_VERSION}:{hashlib.sha1(text.encode('utf-8')).hexdigest()}"
+
+    def render(self, text: str) -> str:
+        """
+        마크다운을 HTML로 변환한 결과를 반환합니다. 프로세스 계층, 공유 계층 순서로 찾고 없으면 변환합니다.
+
+        Parameters
+        ----------
+        text : str
+            변환할 마크다운 문자열입니다.
+
+        Returns
+        -------
+        str
+            변환된 HTML 문자열입니다.
+        """
+        if not text:
+            return ""
+
+        key = self.make_key(text)
+        with self._lock:
+            html = self._entries.get(key)
+            if html is not None:
+                self._entries.move_to_end(key)  # 최근 사용한 항목으로 표시
+                self.hits += 1
+                return html
+
+        shared = self._shared_cache()
+        html = shared.get(key) if shared is not None else None
+        if html is None:
+            html = markdown.markdown(text, extensions=MARKDOWN_EXTENSIONS)  # 캐시에 없을 때만 변환
+            if shared is not None:
+                shared.set(key, html, self.timeout)
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        with self._lock:
+            self._entries[key] = html
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)  # 가장 오래 사용하지 않은 항목 제거
+        return html
+
+    def clear(self) -> None:
+        """
+        프로세스 계층을 비웁니다. 공유 계층은 유지됩니다.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _shared_cache(self):
+        """
+        공유 계층 캐시를 반환합니다. 설정되지 않았으면 None을 반환합니다.
+        """
+        if not self.cache_alias:
+            return None
+        from django.core.cache import caches
+
+        return caches[self.cache_alias]
+
+
+_markdown_cache = None  # 프로세스 단위 캐시 (처음 사용할 때 settings로 생성)
+_markdown_cache_lock = threading.Lock()
+
+
+def get_markdown_cache() -> MarkdownCache:
+    """
+    settings.MARKDOWN_CACHE 설정으로 만든 프로세스 단위 마크다운 캐시를 반환합니다.
+
+    Returns
+    -------
+    MarkdownCache
+        프로세스 단위 마크다운 캐시입니다.
+    """
+    global _markdown_cache
+    if _markdown_cache is None:
+        with _markdown_cache_lock:
+            if _markdown_cache is None:
+                from django.conf import settings
+
+                options = {**DEFAULT_OPTIONS, **getattr(settings, 'MARKDOWN_CACHE', {})}
+                _markdown_cache = MarkdownCache(
+                    max_entries=options['MAX_ENTRIES'],
+                    cache_alias=options['CACHE_ALIAS'],
+                    timeout=options['TIMEOUT'],
+                )
+    return _markdown_cache
+
+
+def render_markdown(text: str) -> str:
+    """
+    마크다운을 HTML로 변환합니다. 같은 내용은 캐시된 결과를 반환합니다.
+
+    Parameters
+    ----------
+    text : str
+        변환할 마크다운 문자열입니다. None이면 빈 문자열로 처리합니다.
+
+    Returns
+    -------
+    str
+        변환된 HTML 문자열입니다.
+    """
+    return get_markdown_cache().render(text or "")
@@ -0,0 +1,39 @@
+from django.conf import settings
+from django.db import migrations
+
+SEARCH_MODELS = ('SimilarityPostModel', 'DetectionPostModel')
+
+
+def create_search_index(apps, schema_editor):
+    """
+    게시글 모델마다 검색 인덱스 테이블을 만들고 기존 게시글을 색인합니다.
+    """
+    from pybo.search import create_search_backend
+
+    backend = create_search_backend(getattr(settings, 'SEARCH_BACKEND', 'auto'), schema_editor.connection)
+    for model_name in SEARCH_MODELS:
+        model = apps.get_model('pybo', model_name)
+        backend.create_table(model, schema_editor.connection)
+        backend.rebuild(model)
+
+
+def drop_search_index(apps, schema_editor):
+    """
+    검색 인덱스 테이블을 삭제합니다.
+    """
+    from pybo.search import create_search_backend
+
+    backend = create_search_backend(getattr(settings, 'SEARCH_BACKEND', 'auto'), schema_editor.connection)
+    for model_name in SEARCH_MODELS:
+        backend.drop_table(apps.get_model('pybo', model_name), schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pybo', '0019_rename_similaritycomment_similaritycommentmodel'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.16 on 2026-10-18 19:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pybo', '0020_post_search_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='detectionpostmodel',
+            index=models.Index(fields=['create_date', 'id'], name='detectionpostmodel_cdate_id'),
+        ),
+        migrations.AddIndex(
+            model_name='similaritypostmodel',
+            index=models.Index(fields=['create_date', 'id'], name='similaritypostmodel_cdate_id'),
+        ),
+    ]
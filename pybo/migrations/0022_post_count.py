@@ -0,0 +1,36 @@
+# Generated by Django 4.2.16 on 2026-10-18 20:03
+
+from django.db import migrations, models
+
+COUNTED_MODELS = ('SimilarityPostModel', 'DetectionPostModel')
+
+
+def backfill_post_counts(apps, schema_editor):
+    """
+    기존 게시글 수로 게시판별 게시글 수를 채웁니다.
+    """
+    PostCountModel = apps.get_model('pybo', 'PostCountModel')
+    for model_name in COUNTED_MODELS:
+        model = apps.get_model('pybo', model_name)
+        PostCountModel.objects.update_or_create(
+            label=model._meta.label_lower, defaults={'count': model.objects.count()}
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pybo', '0021_post_create_date_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostCountModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('label', models.CharField(max_length=100, unique=True)),
+                ('count', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(backfill_post_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 4.2.16 on 2026-10-18 20:04
+
+from django.db import migrations, models
+
+COUNTED_MODELS = ('SimilarityPostModel', 'SimilarityCommentModel', 'DetectionPostModel', 'DetectionCommentModel')
+
+
+def backfill_counts(apps, schema_editor):
+    """
+    기존 게시글/댓글의 추천 수와 댓글 수를 테이블마다 한 번의 UPDATE로 채웁니다.
+    """
+    from pybo.counters import count_expressions
+
+    for model_name in COUNTED_MODELS:
+        model = apps.get_model('pybo', model_name)
+        model.objects.update(**count_expressions(model))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pybo', '0022_post_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='detectioncommentmodel',
+            name='vote_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='detectionpostmodel',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='detectionpostmodel',
+            name='vote_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='similaritycommentmodel',
+            name='vote_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='similaritypostmodel',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='similaritypostmodel',
+            name='vote_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_counts, migrations.RunPython.noop),
+    ]
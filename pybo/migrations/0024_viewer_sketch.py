@@ -0,0 +1,37 @@
+# Generated by Django 4.2.16 on 2026-10-18 20:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pybo', '0023_denormalized_counts'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ViewerSketchModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('label', models.CharField(max_length=100)),
+                ('post_id', models.PositiveIntegerField()),
+                ('sketch', models.BinaryField()),
+                ('update_date', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='detectionpostmodel',
+            name='unique_viewer_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='similaritypostmodel',
+            name='unique_viewer_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddConstraint(
+            model_name='viewersketchmodel',
+            constraint=models.UniqueConstraint(fields=('label', 'post_id'), name='viewer_sketch_post'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.16 on 2026-10-18 20:20
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pybo', '0024_viewer_sketch'),
+    ]
+
+    # MySQL은 외래 키 컬럼에 인덱스가 있어야 하므로 (post, create_date, id) 인덱스를 먼저 만든 뒤 post_id 단독 인덱스를 삭제합니다.
+    operations = [
+        migrations.AddIndex(
+            model_name='detectioncommentmodel',
+            index=models.Index(fields=['post', 'create_date', 'id'], name='detectioncommentmodel_post_cd'),
+        ),
+        migrations.AddIndex(
+            model_name='similaritycommentmodel',
+            index=models.Index(fields=['post', 'create_date', 'id'], name='similaritycommentmodel_post_cd'),
+        ),
+        migrations.AlterField(
+            model_name='detectioncommentmodel',
+            name='post',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='comments', to='pybo.detectionpostmodel'),
+        ),
+        migrations.AlterField(
+            model_name='similaritycommentmodel',
+            name='post',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='comments', to='pybo.similaritypostmodel'),
+        ),
+    ]
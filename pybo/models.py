@@ -25,6 +25,12 @@ class AbstractPost(models.Model):
         게시글 조회수, 기본값은 0입니다.
     voter : ManyToManyField
         게시글을 추천한 사용자들, 다대다 관계.
+    vote_count : PositiveIntegerField
+        추천 수, voter가 바뀔 때마다 함께 갱신됩니다. (pybo.signals)
+    comment_count : PositiveIntegerField
+        댓글 수, 댓글을 작성/삭제할 때마다 함께 갱신됩니다. (pybo.signals)
+    unique_viewer_count : PositiveIntegerField
+        순 방문자 수 추정값, 조회수와 함께 주기적으로 갱신됩니다. (pybo.view_counter, ViewerSketchModel)
     """
     
     author = models.ForeignKey(User, on_delete=models.CASCADE)
@@ -34,9 +40,16 @@ class AbstractPost(models.Model):
     modify_date = models.DateTimeField(null=True, blank=True)
     view_count = models.PositiveIntegerField(default=0)
     voter = models.ManyToManyField(User, related_name='voter_%(class)s')
+    vote_count = models.PositiveIntegerField(default=0)  # 목록/상세 화면에서 voter를 세지 않도록 저장한 추천 수
+    comment_count = models.PositiveIntegerField(default=0)  # 목록 화면에서 댓글을 세지 않도록 저장한 댓글 수
+    unique_viewer_count = models.PositiveIntegerField(default=0)  # HyperLogLog 스케치로 추정한 순 방문자 수
 
     class Meta:
         abstract = True  # 이 모델은 실제 데이터베이스 테이블로 생성되지 않음 (추상 클래스)
+        indexes = [
+            # 목록의 최신순 정렬과 커서 페이지네이션((create_date, id) 범위 검색)에 사용
+            models.Index(fields=['create_date', 'id'], name='%(class)s_cdate_id'),
+        ]
 
     def __str__(self) -> str:
         """
@@ -69,6 +82,8 @@ class AbstractComment(models.Model):
         댓글 수정일시, null 값을 허용하며, 수정 시 변경됩니다.
     voter : ManyToManyField
         댓글을 추천한 사용자들, 다대다 관계.
+    vote_count : PositiveIntegerField
+        추천 수, voter가 바뀔 때마다 함께 갱신됩니다. (pybo.signals)
     """
     
     author = models.ForeignKey(User, on_delete=models.CASCADE)
@@ -76,9 +91,14 @@ class AbstractComment(models.Model):
     create_date = models.DateTimeField(auto_now_add=True)
     modify_date = models.DateTimeField(null=True, blank=True)
     voter = models.ManyToManyField(User, related_name='voter_%(class)s')
+    vote_count = models.PositiveIntegerField(default=0)  # 상세 화면에서 voter를 세지 않도록 저장한 추천 수
 
     class Meta:
         abstract = True  # 이 모델은 실제 데이터베이스 테이블로 생성되지 않음 (추상 클래스)
+        indexes = [
+            # 상세 화면의 댓글 조회(post_id = ? ORDER BY create_date, id)를 정렬 없이 인덱스 순서대로 처리 (post는 하위 모델에서 정의)
+            models.Index(fields=['post', 'create_date', 'id'], name='%(class)s_post_cd'),
+        ]
 
     def __str__(self) -> str:
         """
@@ -137,7 +157,8 @@ class SimilarityCommentModel(AbstractComment):
         댓글에 첨부된 두 번째 이미지.
     """
     
-    post = models.ForeignKey(SimilarityPostModel, on_delete=models.CASCADE, related_name='comments')
+    post = models.ForeignKey(SimilarityPostModel, on_delete=models.CASCADE, related_name='comments',
+                             db_index=False)  # (post, create_date, id) 인덱스가 post_id 검색도 처리
     image1 = models.ImageField(upload_to='similarity/a_image1/', null=True, blank=True, verbose_name='a_image1')
     image2 = models.ImageField(upload_to='similarity/a_image2/', null=True, blank=True, verbose_name='a_image2')
 
@@ -193,7 +214,8 @@ class DetectionCommentModel(AbstractComment):
         댓글에 첨부된 이미지.
     """
     
-    post = models.ForeignKey(DetectionPostModel, on_delete=models.CASCADE, related_name='comments')
+    post = models.ForeignKey(DetectionPostModel, on_delete=models.CASCADE, related_name='comments',
+                             db_index=False)  # (post, create_date, id) 인덱스가 post_id 검색도 처리
     image1 = models.ImageField(upload_to='detection/a_image1/', null=True, blank=True, verbose_name='a_image1')
 
     def __str__(self) -> str:
@@ -206,3 +228,74 @@ class DetectionCommentModel(AbstractComment):
             댓글 내용을 나타내는 문자열입니다.
         """
         return f"댓글: {self.content[:20]}"
+
+
+class PostCountModel(models.Model):
+    """
+    게시판별 전체 게시글 수를 보관하는 모델입니다.
+
+    목록 화면의 페이지 수와 게시글 번호를 계산할 때 매번 COUNT(*)를 실행하지 않도록
+    게시글을 작성/삭제할 때마다 값을 1씩 증감합니다. (pybo.counters, pybo.signals)
+
+    Attributes
+    ----------
+    label : CharField
+        게시글 모델의 이름입니다. (예: 'pybo.similaritypostmodel')
+    count : PositiveIntegerField
+        게시글 수입니다.
+    """
+
+    label = models.CharField(max_length=100, unique=True)
+    count = models.PositiveIntegerField(default=0)
+
+    def __str__(self) -> str:
+        """
+        게시판 이름과 게시글 수를 반환합니다.
+
+        Returns
+        -------
+        str
+            게시판 이름과 게시글 수를 나타내는 문자열입니다.
+        """
+        return f"{self.label}: {self.count}"
+
+
+class ViewerSketchModel(models.Model):
+    """
+    게시글의 순 방문자를 추정하는 HyperLogLog 스케치를 보관하는 모델입니다. (pybo.hyperloglog)
+
+    방문자마다 행을 저장하지 않고 게시글마다 4KB(precision=12)의 스케치 하나만 저장합니다.
+    워커마다 모은 스케치를 조회수와 함께 주기적으로 합쳐 저장합니다. (pybo.view_counter)
+
+    Attributes
+    ----------
+    label : CharField
+        게시글 모델의 이름입니다. (예: 'pybo.similaritypostmodel')
+    post_id : PositiveIntegerField
+        게시글 ID입니다.
+    sketch : BinaryField
+        HyperLogLog 레지스터입니다.
+    update_date : DateTimeField
+        마지막으로 합친 일시입니다.
+    """
+
+    label = models.CharField(max_length=100)
+    post_id = models.PositiveIntegerField()
+    sketch = models.BinaryField()
+    update_date = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['label', 'post_id'], name='viewer_sketch_post'),
+        ]
+
+    def __str__(self) -> str:
+        """
+        게시판 이름과 게시글 ID를 반환합니다.
+
+        Returns
+        -------
+        str
+            게시판 이름과 게시글 ID를 나타내는 문자열입니다.
+        """
+        return f"{self.label} #{self.post_id}"
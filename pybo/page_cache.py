@@ -0,0 +1,243 @@
+import hashlib
+import threading
+import time
+
+from django.contrib import messages
+from django.db import transaction
+
+from .url_patterns import URLS
+
+import logging
+logger = logging.getLogger(URLS['APP_NAME'])  # 로거 설정
+
+"""
+게시판 목록/상세 페이지와 상세 페이지의 댓글 목록 조각(fragment)을 캐시하는 모듈입니다.
+
+캐시 키에 게시판 버전과 게시글 버전을 넣어 두고, 게시글/댓글/추천이 바뀌면 시그널(pybo.signals)에서 버전 값만 1 올립니다.
+이전 버전의 키는 더 이상 조회되지 않으므로 페이지가 몇 개 캐시되어 있든 무효화는 캐시 연산 한 번(incr)입니다.
+(이전 키는 TIMEOUT이 지나면 캐시에서 사라짐)
+
+1. 버전 범위: 'site'(전체), 'board:{모델}'(목록), 'post:{모델}:{ID}'(상세)
+2. 페이지 캐시: 로그인하지 않은 사용자의 목록/상세 응답 HTML (전달할 메시지가 있는 요청은 제외)
+3. 댓글 조각 캐시: 상세 페이지의 댓글 목록 HTML (사용자별로 추천/수정 버튼이 다르므로 사용자마다 따로 보관)
+
+AI 댓글은 처리가 끝나면 댓글을 저장하므로(post_save) 게시글 버전이 올라가 "AI가 처리 중입니다." 화면이 남지 않습니다.
+조회수는 버전을 올리지 않으므로 캐시된 페이지의 조회수는 최대 TIMEOUT초 동안 이전 값일 수 있습니다.
+
+버전 값은 시간(마이크로초)으로 시작하므로 버전 키가 캐시에서 밀려나 다시 만들어져도 이전 버전 값과 겹치지 않습니다.
+여러 워커 프로세스가 같은 버전을 보도록 운영 환경에서는 공유 캐시(파일, Redis, Memcached 등)를 사용해야 합니다.
+"""
+
+DEFAULT_OPTIONS = {
+    'CACHE_ALIAS': 'default',
+    'TIMEOUT': 60,
+}
+SITE_SCOPE = 'site'
+
+
+class PageCache:
+    """
+    버전 키로 무효화하는 페이지/조각 캐시입니다.
+
+    Attributes
+    ----------
+    cache_alias : str or None
+        페이지와 버전을 보관할 settings.CACHES의 이름입니다. None이면 캐시하지 않습니다.
+    timeout : int
+        페이지와 조각의 보관 시간(초)입니다. 버전 키는 만료되지 않습니다.
+
+    Methods
+    -------
+    is_cacheable(request, anonymous_only):
+        요청의 응답을 캐시할 수 있는지 확인합니다.
+    page_key(model, path, pk):
+        목록(pk가 None) 또는 상세 페이지의 캐시 키를 만듭니다.
+    fragment_key(name, model, pk, variant):
+        상세 페이지 조각의 캐시 키를 만듭니다.
+    get(key) / set(key, value):
+        캐시된 HTML을 읽거나 저장합니다.
+    invalidate_board(model) / invalidate_post(model, *pks) / invalidate_site():
+        버전을 올려 해당 범위의 캐시를 무효화합니다.
+    """
+
+    def __init__(self, cache_alias: str = 'default', timeout: int = 60):
+        self.cache_alias = cache_alias
+        self.timeout = timeout
+
+    @staticmethod
+    def board_scope(model) -> str:
+        return f"board:{model._meta.label_lower}"
+
+    @staticmethod
+    def post_scope(model, pk) -> str:
+        return f"post:{model._meta.label_lower}:{pk}"
+
+    def is_cacheable(self, request, anonymous_only: bool = True) -> bool:
+        """
+        요청의 응답을 캐시할 수 있는지 확인합니다.
+
+        GET/HEAD 요청이고, 전달할 메시지(django.contrib.messages)가 없어야 합니다.
+        메시지는 한 번만 표시해야 하므로 메시지가 포함된 화면은 저장하지도, 캐시에서 읽지도 않습니다.
+
+        Parameters
+        ----------
+        request : HttpRequest
+            확인할 요청입니다.
+        anonymous_only : bool
+            True이면 로그인하지 않은 사용자의 요청만 허용합니다. (페이지 캐시)
+
+        Returns
+        -------
+        bool
+            캐시할 수 있으면 True입니다.
+        """
+        if not self.cache_alias or request.method not in ('GET', 'HEAD'):
+            return False
+        if anonymous_only and request.user.is_authenticated:
+            return False
+        return not len(messages.get_messages(request))  # len()은 메시지를 읽음 처리하지 않음
+
+    def page_key(self, model, path: str, pk=None) -> str:
+        """
+        목록(pk가 None) 또는 상세 페이지의 캐시 키를 만듭니다.
+
+        Parameters
+        ----------
+        model : Model class
+            게시글 모델 클래스입니다.
+        path : str
+            쿼리 문자열을 포함한 요청 경로입니다. (페이지 번호, 커서, 검색어 포함)
+        pk : int, optional
+            상세 페이지의 게시글 ID입니다.
+
+        Returns
+        -------
+        str
+            현재 버전이 들어간 캐시 키입니다.
+        """
+        scope = self.board_scope(model) if pk is None else self.post_scope(model, pk)
+        versions = self._versions(SITE_SCOPE, scope)
+        digest = hashlib.sha1(path.encode('utf-8')).hexdigest()
+        return f"pybo:page:{scope}:{'.'.join(map(str, versions))}:{digest}"
+
+    def fragment_key(self, name: str, model, pk, variant: str = 'anon') -> str:
+        """
+        상세 페이지 조각의 캐시 키를 만듭니다.
+
+        Parameters
+        ----------
+        name : str
+            조각 이름입니다. (예: 'comments')
+        model : Model class
+            게시글 모델 클래스입니다.
+        pk : int
+            게시글 ID입니다.
+        variant : str
+            사용자마다 다르게 그려지는 조각을 구분하는 값입니다. (예: 'anon', 'u12:...')
+
+        Returns
+        -------
+        str
+            현재 버전이 들어간 캐시 키입니다.
+        """
+        scope = self.post_scope(model, pk)
+        versions = self._versions(SITE_SCOPE, scope)
+        return f"pybo:fragment:{name}:{scope}:{'.'.join(map(str, versions))}:{variant}"
+
+    def get(self, key: str):
+        """
+        캐시된 HTML을 반환합니다. 없으면 None을 반환합니다.
+        """
+        return self._cache().get(key)
+
+    def set(self, key: str, value) -> None:
+        """
+        HTML을 timeout초 동안 캐시합니다.
+        """
+        self._cache().set(key, value, self.timeout)
+
+    def invalidate_board(self, model) -> None:
+        """
+        게시판 목록 페이지를 무효화합니다. (게시글 작성/수정/삭제, 댓글 수와 추천 수 변경)
+        """
+        self._bump([self.board_scope(model)])
+
+    def invalidate_post(self, model, *pks) -> None:
+        """
+        게시글 상세 페이지와 댓글 조각을 무효화합니다. (게시글/댓글/추천 변경)
+        """
+        self._bump([self.post_scope(model, pk) for pk in pks])
+
+    def invalidate_site(self) -> None:
+        """
+        모든 페이지와 조각을 무효화합니다. (사용자 삭제처럼 여러 게시글에 걸친 변경)
+        """
+        self._bump([SITE_SCOPE])
+
+    def _versions(self, *scopes) -> list:
+        """
+        범위별 현재 버전을 한 번의 캐시 조회로 가져옵니다. 버전이 없으면 현재 시각으로 만듭니다.
+        """
+        cache = self._cache()
+        keys = [f"pybo:version:{scope}" for scope in scopes]
+        found = cache.get_many(keys)
+        for key in keys:
+            if key not in found:
+                cache.add(key, self._initial_version(), None)  # 다른 요청이 먼저 만들었으면 그 값을 사용
+                found[key] = cache.get(key) or self._initial_version()
+        return [found[key] for key in keys]
+
+    def _bump(self, scopes) -> None:
+        """
+        범위별 버전을 지금 올리고, 진행 중인 트랜잭션이 커밋된 뒤 한 번 더 올립니다.
+
+        커밋 전에 다른 요청이 이전 데이터로 그린 페이지를 새 버전으로 저장할 수 있으므로,
+        커밋 뒤에 다시 올려 그 페이지를 사용하지 않도록 합니다. (트랜잭션 밖에서는 두 번 연속 올라감)
+        """
+        if not self.cache_alias:
+            return
+        self._incr(scopes)
+        transaction.on_commit(lambda: self._incr(scopes))
+
+    def _incr(self, scopes) -> None:
+        cache = self._cache()
+        for scope in scopes:
+            key = f"pybo:version:{scope}"
+            try:
+                cache.incr(key)
+            except ValueError:  # 버전이 아직 없거나 캐시에서 밀려남
+                cache.set(key, self._initial_version(), None)
+                logger.info(f"페이지 캐시 버전 새로 생성: {scope}")
+
+    @staticmethod
+    def _initial_version() -> int:
+        return time.time_ns() // 1000
+
+    def _cache(self):
+        from django.core.cache import caches
+
+        return caches[self.cache_alias]
+
+
+_page_cache = None  # 프로세스 단위 캐시 (처음 사용할 때 settings로 생성)
+_page_cache_lock = threading.Lock()
+
+
+def get_page_cache() -> PageCache:
+    """
+    settings.PAGE_CACHE 설정으로 만든 프로세스 단위 페이지 캐시를 반환합니다.
+
+    Returns
+    -------
+    PageCache
+        프로세스 단위 페이지 캐시입니다.
+    """
+    global _page_cache
+    if _page_cache is None:
+        with _page_cache_lock:
+            if _page_cache is None:
+                from django.conf import settings
+
+                options = {**DEFAULT_OPTIONS, **getattr(settings, 'PAGE_CACHE', {})}
+                _page_cache = PageCache(cache_alias=options['CACHE_ALIAS'], timeout=options['TIMEOUT'])
+    return _page_cache
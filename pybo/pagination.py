@@ -0,0 +1,185 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from django.core import signing
+from django.core.paginator import Paginator
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+from .url_patterns import URLS
+
+import logging
+logger = logging.getLogger(URLS['APP_NAME'])  # 로거 설정
+
+"""
+게시판 목록의 커서(keyset) 페이지네이션 모듈입니다.
+
+OFFSET 방식은 n번째 페이지를 보여주기 위해 앞의 모든 행을 건너뛰어야 하고, 페이지 번호 계산을 위해 COUNT(*)도 실행하므로
+게시글이 많아질수록 뒤쪽 페이지가 느려집니다. 커서 방식은 (create_date, id) 순서에서 현재 페이지의
+마지막(또는 첫) 게시글 위치를 토큰으로 넘겨 "그 다음 행부터 n개"만 조회하므로 페이지 위치와 관계없이 속도가 같습니다.
+
+토큰은 django.core.signing으로 서명하여 사용자가 내용을 알거나 조작할 수 없습니다. (잘못된 토큰은 첫 페이지로 처리)
+토큰에는 기준 게시글의 목록 내 위치(앞에 있는 글 수)도 담아, 전체 글 수를 세지 않고도 행 번호(번호 열)를 계산합니다.
+"""
+
+CURSOR_SALT = 'pybo.pagination.cursor'
+NEXT, PREVIOUS = 'n', 'p'  # 토큰의 이동 방향
+
+
+@dataclass
+class CursorPage:
+    """
+    커서 방식으로 조회한 한 페이지입니다.
+
+    Attributes
+    ----------
+    object_list : list
+        현재 페이지의 게시글 목록입니다. (최신순)
+    next_cursor : str or None
+        다음(더 오래된) 페이지 토큰입니다. 다음 페이지가 없으면 None입니다.
+    previous_cursor : str or None
+        이전(더 최근) 페이지 토큰입니다. 이전 페이지가 없으면 None입니다.
+    start_offset : int
+        현재 페이지 첫 게시글 앞에 있는 게시글 수입니다. (첫 페이지는 0, 행 번호 계산에 사용)
+    """
+
+    object_list: list
+    next_cursor: Optional[str] = None
+    previous_cursor: Optional[str] = None
+    start_offset: int = 0
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+
+def encode_cursor(post, direction: str, offset: Optional[int] = None) -> str:
+    """
+    게시글의 (create_date, id) 위치와 이동 방향을 서명된 토큰으로 만듭니다.
+
+    Parameters
+    ----------
+    post : Model
+        기준 게시글입니다.
+    direction : str
+        NEXT(기준보다 오래된 글) 또는 PREVIOUS(기준보다 최근 글)입니다.
+    offset : int, optional
+        기준 게시글 앞에 있는 게시글 수입니다. None이면 토큰을 사용할 때 인덱스 범위 COUNT로 계산합니다.
+
+    Returns
+    -------
+    str
+        URL에 넣을 수 있는 토큰 문자열입니다.
+    """
+    return signing.dumps([post.create_date.isoformat(), post.pk, direction, offset], salt=CURSOR_SALT, compress=True)
+
+
+def decode_cursor(token: str):
+    """
+    토큰을 (create_date, id, 방향)으로 되돌립니다.
+
+    Parameters
+    ----------
+    token : str
+        encode_cursor()로 만든 토큰입니다.
+
+    Returns
+    -------
+    tuple or None
+        (datetime, int, str, int 또는 None) 튜플입니다. 토큰이 없거나 잘못되었으면 None을 반환합니다.
+    """
+    if not token:
+        return None
+    try:
+        create_date, pk, direction, *rest = signing.loads(token, salt=CURSOR_SALT)
+        offset = rest[0] if rest else None  # 위치가 없는 이전 형식의 토큰
+        if direction not in (NEXT, PREVIOUS):
+            raise ValueError(direction)
+        return datetime.fromisoformat(create_date), int(pk), direction, None if offset is None else int(offset)
+    except (signing.BadSignature, ValueError, TypeError):
+        logger.warning(f"잘못된 페이지 토큰: {token[:40]}")
+        return None
+
+
+def paginate_by_cursor(queryset, token: Optional[str], per_page: int) -> CursorPage:
+    """
+    최신순((create_date, id) 내림차순)으로 정렬한 게시글을 커서 방식으로 한 페이지 조회합니다.
+
+    COUNT(*) 없이 per_page + 1개만 조회하여 다음(또는 이전) 페이지가 있는지 판단합니다.
+    (create_date, id) 인덱스가 있으면 페이지 위치와 관계없이 인덱스 범위 검색 한 번으로 처리됩니다.
+    (OR 조건만으로는 인덱스 범위를 정하지 못하는 DB가 있어 create_date 범위 조건을 따로 붙임)
+
+    Parameters
+    ----------
+    queryset : QuerySet
+        조회할 게시글 QuerySet입니다. (검색 조건, annotate 포함 가능, 정렬은 이 함수에서 지정)
+    token : str or None
+        이전 페이지에서 받은 토큰입니다. None이면 첫 페이지를 조회합니다.
+    per_page : int
+        한 페이지의 게시글 수입니다.
+
+    Returns
+    -------
+    CursorPage
+        현재 페이지의 게시글, 이전/다음 페이지 토큰, 첫 게시글 앞의 게시글 수입니다.
+    """
+    cursor = decode_cursor(token)
+
+    if cursor is None:  # 첫 페이지
+        rows = list(queryset.order_by('-create_date', '-id')[:per_page + 1])
+        has_more, has_previous = len(rows) > per_page, False
+        rows = rows[:per_page]
+        start_offset = 0
+    else:
+        create_date, pk, direction, offset = cursor
+        newer = Q(create_date__gte=create_date), Q(create_date__gt=create_date) | Q(id__gt=pk)  # 기준 글보다 최근 글
+        if offset is None:  # 이전 형식의 토큰: 기준 글 앞의 글 수를 인덱스 범위 COUNT로 계산
+            offset = queryset.filter(*newer).count()
+        if direction == NEXT:  # 기준 글보다 오래된 글
+            rows = list(
+                queryset.filter(Q(create_date__lte=create_date), Q(create_date__lt=create_date) | Q(id__lt=pk))
+                .order_by('-create_date', '-id')[:per_page + 1]
+            )
+            has_more, has_previous = len(rows) > per_page, True
+            rows = rows[:per_page]
+            start_offset = offset + 1
+        else:  # 기준 글보다 최근 글 (가까운 글부터 조회한 뒤 최신순으로 뒤집음)
+            rows = list(queryset.filter(*newer).order_by('create_date', 'id')[:per_page + 1])
+            has_previous, has_more = len(rows) > per_page, True
+            rows = rows[:per_page][::-1]
+            start_offset = max(offset - len(rows), 0)  # 그 사이 최근 글이 삭제된 경우 0 미만이 되지 않도록
+
+    if not rows:
+        return CursorPage(object_list=[])
+    return CursorPage(
+        object_list=rows,
+        next_cursor=encode_cursor(rows[-1], NEXT, start_offset + len(rows) - 1) if has_more else None,
+        previous_cursor=encode_cursor(rows[0], PREVIOUS, start_offset) if has_previous else None,
+        start_offset=start_offset,
+    )
+
+
+class CountedPaginator(Paginator):
+    """
+    전체 개수를 COUNT(*) 대신 count_func로 구하는 Paginator입니다. (pybo.counters의 게시글 수 사용)
+
+    Attributes
+    ----------
+    count_func : callable or None
+        전체 개수를 반환하는 함수입니다. None이면 Paginator와 같이 COUNT(*)를 실행합니다.
+    """
+
+    def __init__(self, object_list, per_page, count_func=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_func = count_func
+
+    @cached_property
+    def count(self) -> int:
+        if self.count_func is None:
+            return super().count
+        return self.count_func()
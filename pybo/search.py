@@ -0,0 +1,303 @@
+import re
+import threading
+
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+from .url_patterns import URLS
+
+import logging
+logger = logging.getLogger(URLS['APP_NAME'])  # 로거 설정
+
+"""
+게시글 검색(BaseListView의 'kw' 검색)에 사용하는 전문 검색(full-text search) 모듈입니다.
+
+이전 구현은 검색 필드마다 icontains(LIKE '%검색어%')를 OR로 묶고 author 테이블과 JOIN한 뒤 distinct()를 호출하므로,
+게시글이 늘어날수록 검색 시간이 전체 행 수에 비례해 늘어납니다.
+이 모듈은 게시글 모델마다 별도의 검색 인덱스 테이블(<게시글 테이블>_search)을 두고
+제목(subject), 본문(content), 작성자 이름(username)을 색인합니다.
+
+1. 'fts5'     : sqlite FTS5 가상 테이블 (로컬 개발)
+2. 'fulltext' : MySQL FULLTEXT 인덱스 + ngram 파서 (운영)
+3. 'like'     : 이전과 같은 icontains 검색 (그 외 DB, 또는 인덱스를 사용할 수 없을 때)
+
+한국어는 띄어쓰기 단위가 아닌 부분 문자열로 검색되어야 하므로 2글자 n-gram으로 색인합니다.
+FTS5에서는 ngram_tokens()로 만든 토큰을 저장하고 검색어 토큰을 구(phrase)로 검색하며,
+MySQL에서는 ngram 파서(ngram_token_size=2)가 같은 역할을 합니다.
+검색어에 1글자 단어가 있으면 2글자 n-gram으로 찾을 수 없으므로 'like' 방식으로 검색합니다.
+
+인덱스는 pybo.signals에서 게시글 저장/삭제, 작성자 이름 변경 시 갱신하며,
+`python manage.py rebuild_search_index`로 전체를 다시 만들 수 있습니다.
+"""
+
+NGRAM_SIZE = 2  # n-gram 크기 (MySQL ngram_token_size와 같아야 함)
+WORD_RE = re.compile(r'\w+')  # 문장 부호를 제외한 단어
+
+
+def ngram_tokens(text: str, n: int = NGRAM_SIZE) -> list:
+    """
+    문자열을 소문자 n-gram 토큰 목록으로 변환합니다. n글자 이하의 단어는 그대로 하나의 토큰이 됩니다.
+
+    Parameters
+    ----------
+    text : str
+        변환할 문자열입니다.
+    n : int, optional
+        n-gram 크기입니다. (기본값은 2)
+
+    Returns
+    -------
+    list
+        토큰 목록입니다. 예: '얼굴 유사도' -> ['얼굴', '유사', '사도']
+    """
+    tokens = []
+    for word in WORD_RE.findall((text or '').lower()):
+        if len(word) <= n:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + n] for i in range(len(word) - n + 1))
+    return tokens
+
+
+def search_table_name(model) -> str:
+    """
+    게시글 모델의 검색 인덱스 테이블 이름을 반환합니다.
+    """
+    return f'{model._meta.db_table}_search'
+
+
+def index_values(post) -> tuple:
+    """
+    게시글에서 색인할 (제목, 본문, 작성자 이름)을 반환합니다.
+    """
+    return post.subject or '', post.content or '', post.author.username if post.author_id else ''
+
+
+class LikeSearchBackend:
+    """
+    검색 필드마다 icontains로 검색하는 기본 백엔드입니다. 별도의 인덱스 테이블을 사용하지 않습니다.
+
+    Methods
+    -------
+    filter(queryset, keyword, search_fields):
+        검색어로 게시글 QuerySet을 거릅니다.
+    create_table(model, db_connection) / drop_table(model, db_connection):
+        검색 인덱스 테이블을 만들거나 삭제합니다.
+    index(post) / remove(model, pk):
+        게시글 하나를 색인하거나 인덱스에서 제거합니다.
+    rebuild(model):
+        모델의 모든 게시글을 다시 색인합니다.
+    """
+
+    name = 'like'
+
+    def filter(self, queryset, keyword: str, search_fields) -> 'QuerySet':
+        query = Q()  # 복합 쿼리 생성을 위한 Q 객체 생성
+        for field in search_fields:
+            query |= Q(**{f'{field}__icontains': keyword})  # 검색 필드 내에서 검색어가 포함된 항목을 필터링
+        return queryset.filter(query).distinct()  # 중복된 게시글 제거
+
+    def create_table(self, model, db_connection=connection) -> None:
+        pass
+
+    def drop_table(self, model, db_connection=connection) -> None:
+        pass
+
+    def index(self, post) -> None:
+        pass
+
+    def remove(self, model, pk: int) -> None:
+        pass
+
+    def rebuild(self, model) -> int:
+        """
+        모델의 모든 게시글을 다시 색인합니다.
+
+        Parameters
+        ----------
+        model : Model class
+            게시글 모델입니다. (마이그레이션에서는 과거 버전 모델)
+
+        Returns
+        -------
+        int
+            색인한 게시글 수입니다.
+        """
+        return 0
+
+
+class SqliteFTS5SearchBackend(LikeSearchBackend):
+    """
+    sqlite FTS5 가상 테이블을 사용하는 검색 백엔드입니다.
+
+    각 열에는 ngram_tokens()로 만든 토큰을 공백으로 이어 저장하고(rowid = 게시글 ID),
+    검색어 토큰을 따옴표로 묶은 구(phrase)로 검색하여 icontains와 같은 부분 문자열 검색이 되도록 합니다.
+    """
+
+    name = 'fts5'
+
+    def filter(self, queryset, keyword: str, search_fields) -> 'QuerySet':
+        words = WORD_RE.findall(keyword.lower())
+        if not words or min(len(word) for word in words) < NGRAM_SIZE:
+            return super().filter(queryset, keyword, search_fields)  # 1글자 단어는 n-gram으로 찾을 수 없음
+
+        table = search_table_name(queryset.model)
+        phrase = '"' + ' '.join(ngram_tokens(keyword)) + '"'  # 토큰은 \w 문자로만 구성되어 따옴표 이스케이프가 필요 없음
+        return queryset.filter(pk__in=RawSQL(f'SELECT rowid FROM {table} WHERE {table} MATCH %s', (phrase,)))
+
+    def create_table(self, model, db_connection=connection) -> None:
+        with db_connection.cursor() as cursor:
+            cursor.execute(
+                f'CREATE VIRTUAL TABLE IF NOT EXISTS {search_table_name(model)} '
+                "USING fts5(subject, content, username, tokenize='unicode61 remove_diacritics 0')"
+            )
+
+    def drop_table(self, model, db_connection=connection) -> None:
+        with db_connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS {search_table_name(model)}')
+
+    def index(self, post) -> None:
+        values = [' '.join(ngram_tokens(value)) for value in index_values(post)]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'INSERT OR REPLACE INTO {search_table_name(type(post))} (rowid, subject, content, username) '
+                'VALUES (%s, %s, %s, %s)',
+                [post.pk, *values],
+            )
+
+    def remove(self, model, pk: int) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {search_table_name(model)} WHERE rowid = %s', [pk])
+
+    def rebuild(self, model) -> int:
+        table = search_table_name(model)
+        rows = [
+            (post.pk, *(' '.join(ngram_tokens(value)) for value in index_values(post)))
+            for post in model.objects.select_related('author').iterator()
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {table}')
+            cursor.executemany(f'INSERT INTO {table} (rowid, subject, content, username) VALUES (%s, %s, %s, %s)', rows)
+        return len(rows)
+
+
+class MySQLFulltextSearchBackend(LikeSearchBackend):
+    """
+    MySQL FULLTEXT 인덱스(ngram 파서)를 사용하는 검색 백엔드입니다.
+
+    ngram 파서가 한국어를 2글자 단위(ngram_token_size=2, MySQL 기본값)로 나누어 색인하므로 원문을 그대로 저장하고,
+    BOOLEAN MODE의 구(phrase) 검색으로 부분 문자열 검색이 되도록 합니다.
+    """
+
+    name = 'fulltext'
+
+    def filter(self, queryset, keyword: str, search_fields) -> 'QuerySet':
+        words = WORD_RE.findall(keyword.lower())
+        if not words or min(len(word) for word in words) < NGRAM_SIZE:
+            return super().filter(queryset, keyword, search_fields)
+
+        table = search_table_name(queryset.model)
+        phrase = '"' + ' '.join(words) + '"'  # BOOLEAN MODE 연산자를 제거한 구(phrase) 검색
+        return queryset.filter(pk__in=RawSQL(
+            f'SELECT post_id FROM {table} WHERE MATCH(subject, content, username) AGAINST (%s IN BOOLEAN MODE)',
+            (phrase,),
+        ))
+
+    def create_table(self, model, db_connection=connection) -> None:
+        with db_connection.cursor() as cursor:
+            cursor.execute(
+                f'CREATE TABLE IF NOT EXISTS {search_table_name(model)} ('
+                'post_id BIGINT PRIMARY KEY, subject VARCHAR(200) NOT NULL, content LONGTEXT NOT NULL, '
+                'username VARCHAR(150) NOT NULL, FULLTEXT KEY ft_search (subject, content, username) WITH PARSER ngram'
+                ') ENGINE=InnoDB DEFAULT CHARSET=utf8mb4'
+            )
+
+    def drop_table(self, model, db_connection=connection) -> None:
+        with db_connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS {search_table_name(model)}')
+
+    def index(self, post) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'REPLACE INTO {search_table_name(type(post))} (post_id, subject, content, username) '
+                'VALUES (%s, %s, %s, %s)',
+                [post.pk, *index_values(post)],
+            )
+
+    def remove(self, model, pk: int) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {search_table_name(model)} WHERE post_id = %s', [pk])
+
+    def rebuild(self, model) -> int:
+        table = search_table_name(model)
+        rows = [(post.pk, *index_values(post)) for post in model.objects.select_related('author').iterator()]
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {table}')
+            cursor.executemany(
+                f'INSERT INTO {table} (post_id, subject, content, username) VALUES (%s, %s, %s, %s)', rows
+            )
+        return len(rows)
+
+
+SEARCH_BACKENDS = {
+    'like': LikeSearchBackend,
+    'fts5': SqliteFTS5SearchBackend,
+    'fulltext': MySQLFulltextSearchBackend,
+}
+VENDOR_BACKENDS = {'sqlite': 'fts5', 'mysql': 'fulltext'}  # SEARCH_BACKEND가 'auto'일 때 DB 종류별 백엔드
+
+_search_backend = None  # 프로세스 단위 백엔드 (처음 사용할 때 settings로 생성)
+_search_backend_lock = threading.Lock()
+
+
+def fts5_available(db_connection=connection) -> bool:
+    """
+    sqlite에서 FTS5 확장을 사용할 수 있는지 확인합니다.
+    """
+    with db_connection.cursor() as cursor:
+        cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+        return bool(cursor.fetchone()[0])
+
+
+def create_search_backend(name: str = 'auto', db_connection=connection) -> LikeSearchBackend:
+    """
+    이름으로 검색 백엔드를 생성합니다. 'auto'이면 DB 종류에 맞는 백엔드를 고릅니다.
+
+    Parameters
+    ----------
+    name : str, optional
+        'auto', 'like', 'fts5', 'fulltext' 중 하나입니다.
+    db_connection : DatabaseWrapper, optional
+        DB 종류를 확인할 연결입니다.
+
+    Returns
+    -------
+    LikeSearchBackend
+        검색 백엔드입니다. sqlite에 FTS5가 없으면 'like' 백엔드를 반환합니다.
+    """
+    if name == 'auto':
+        name = VENDOR_BACKENDS.get(db_connection.vendor, 'like')
+    if name == 'fts5' and not fts5_available(db_connection):
+        logger.warning("sqlite FTS5를 사용할 수 없어 LIKE 검색을 사용합니다.")
+        name = 'like'
+    return SEARCH_BACKENDS[name]()
+
+
+def get_search_backend() -> LikeSearchBackend:
+    """
+    settings.SEARCH_BACKEND 설정으로 만든 프로세스 단위 검색 백엔드를 반환합니다.
+
+    Returns
+    -------
+    LikeSearchBackend
+        프로세스 단위 검색 백엔드입니다.
+    """
+    global _search_backend
+    if _search_backend is None:
+        with _search_backend_lock:
+            if _search_backend is None:
+                from django.conf import settings
+
+                _search_backend = create_search_backend(getattr(settings, 'SEARCH_BACKEND', 'auto'))
+    return _search_backend
@@ -0,0 +1,438 @@
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_save, post_delete, pre_delete
+from django.dispatch import receiver
+
+from .ai_user import AI_USERNAME, clear_ai_user_cache, peek_ai_user_id
+from .counters import adjust_count, get_post_counter, recount_votes
+from .inference.gallery import remove_from_face_gallery
+from .markdown_cache import render_markdown
+from .page_cache import get_page_cache
+from .search import get_search_backend
+from .models import SimilarityPostModel, SimilarityCommentModel, DetectionPostModel, DetectionCommentModel
+from .votes import vote_toggled
+
+"""
+pybo 앱에서 사용하는 시그널 수신기 모음입니다.
+
+PyboConfig.ready()에서 이 모듈을 임포트하여 수신기를 등록합니다.
+"""
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_ai_user_cache(sender, instance, **kwargs) -> None:
+    """
+    AI 계정 행이 변경되면 캐시된 AI 계정을 무효화합니다.
+
+    사용자 이름이 'AI'인 행이 저장/삭제되었거나, 캐시된 AI 계정의 행이 변경(예: 이름 변경)된 경우에 해당합니다.
+
+    Parameters
+    ----------
+    sender : Model class
+        시그널을 보낸 모델 클래스(User)입니다.
+    instance : User
+        저장되거나 삭제된 사용자 객체입니다.
+
+    Returns
+    -------
+    None
+    """
+    cached_id = peek_ai_user_id()  # 데이터베이스 조회 없이 캐시된 ID만 확인
+
+    if instance.username == AI_USERNAME or (cached_id is not None and instance.pk == cached_id):
+        clear_ai_user_cache()
+
+
+@receiver(post_save, sender=SimilarityPostModel)
+@receiver(post_save, sender=SimilarityCommentModel)
+@receiver(post_save, sender=DetectionPostModel)
+@receiver(post_save, sender=DetectionCommentModel)
+def prerender_markdown(sender, instance, **kwargs) -> None:
+    """
+    게시글/댓글이 저장되면 본문을 미리 HTML로 변환하여 마크다운 캐시에 넣습니다.
+
+    캐시 키가 본문 내용의 해시이므로 수정 전 본문의 결과는 무효화할 필요 없이 더 이상 사용되지 않습니다.
+
+    Parameters
+    ----------
+    sender : Model class
+        시그널을 보낸 게시글/댓글 모델 클래스입니다.
+    instance : Model
+        저장된 게시글/댓글 객체입니다.
+
+    Returns
+    -------
+    None
+    """
+    render_markdown(instance.content)
+
+
+@receiver(post_save, sender=SimilarityPostModel)
+@receiver(post_save, sender=DetectionPostModel)
+def index_post_for_search(sender, instance, **kwargs) -> None:
+    """
+    게시글이 저장되면 검색 인덱스의 제목, 본문, 작성자 이름을 갱신합니다.
+
+    Parameters
+    ----------
+    sender : Model class
+        시그널을 보낸 게시글 모델 클래스입니다.
+    instance : Model
+        저장된 게시글 객체입니다.
+
+    Returns
+    -------
+    None
+    """
+    get_search_backend().index(instance)
+
+
+@receiver(post_delete, sender=SimilarityPostModel)
+@receiver(post_delete, sender=DetectionPostModel)
+def remove_post_from_search(sender, instance, **kwargs) -> None:
+    """
+    게시글이 삭제되면 검색 인덱스에서 제거합니다.
+
+    Parameters
+    ----------
+    sender : Model class
+        시그널을 보낸 게시글 모델 클래스입니다.
+    instance : Model
+        삭제된 게시글 객체입니다.
+
+    Returns
+    -------
+    None
+    """
+    get_search_backend().remove(sender, instance.pk)
+
+
+@receiver(post_delete, sender=SimilarityPostModel)
+def remove_post_from_face_gallery(sender, instance, **kwargs) -> None:
+    """
+    얼굴 유사도 비교 게시글이 삭제되면 커밋 후 얼굴 갤러리 검색에서 제외합니다.
+
+    Parameters
+    ----------
+    sender : Model class
+        시그널을 보낸 게시글 모델 클래스입니다.
+    instance : SimilarityPostModel
+        삭제된 게시글 객체입니다.
+
+    Returns
+    -------
+    None
+    """
+    post_id = instance.pk
+    transaction.on_commit(lambda: remove_from_face_gallery(post_id))
+
+
+@receiver(post_save, sender=User)
+def reindex_author_posts(sender, instance, created, update_fields=None, **kwargs) -> None:
+    """
+    사용자 이름이 바뀌었을 수 있으면 그 사용자가 작성한 게시글을 다시 색인합니다.
+
+    로그인 시 last_login만 저장하는 경우(update_fields 지정)나 새로 가입한 경우는 건너뜁니다.
+
+    Parameters
+    ----------
+    sender : Model class
+        시그널을 보낸 모델 클래스(User)입니다.
+    instance : User
+        저장된 사용자 객체입니다.
+    created : bool
+        새로 만든 사용자이면 True입니다.
+
+    Returns
+    -------
+    None
+    """
+    if created or (update_fields is not None and 'username' not in update_fields):
+        return
+
+    backend = get_search_backend()
+    for model in (SimilarityPostModel, DetectionPostModel):
+        for post in model.objects.filter(author=instance).select_related('author'):
+            backend.index(post)
+
+
+@receiver(post_save, sender=SimilarityPostModel)
+@receiver(post_save, sender=DetectionPostModel)
+def count_created_post(sender, instance, created, **kwargs) -> None:
+    """
+    게시글이 새로 작성되면 게시판의 게시글 수를 1 늘립니다.
+
+    Parameters
+    ----------
+    sender : Model class
+        시그널을 보낸 게시글 모델 클래스입니다.
+    instance : Model
+        저장된 게시글 객체입니다.
+    created : bool
+        새로 작성한 게시글이면 True입니다.
+
+    Returns
+    -------
+    None
+    """
+    if created:
+        get_post_counter().increment(sender, 1)
+
+
+@receiver(post_delete, sender=SimilarityPostModel)
+@receiver(post_delete, sender=DetectionPostModel)
+def count_deleted_post(sender, instance, **kwargs) -> None:
+    """
+    게시글이 삭제되면 게시판의 게시글 수를 1 줄입니다.
+
+    Parameters
+    ----------
+    sender : Model class
+        시그널을 보낸 게시글 모델 클래스입니다.
+    instance : Model
+        삭제된 게시글 객체입니다.
+
+    Returns
+    -------
+    None
+    """
+    get_post_counter().increment(sender, -1)
+
+
+VOTED_MODELS = (SimilarityPostModel, SimilarityCommentModel, DetectionPostModel, DetectionCommentModel)
+
+
+@receiver(m2m_changed, sender=SimilarityPostModel.voter.through)
+@receiver(m2m_changed, sender=SimilarityCommentModel.voter.through)
+@receiver(m2m_changed, sender=DetectionPostModel.voter.through)
+@receiver(m2m_changed, sender=DetectionCommentModel.voter.through)
+def count_votes(sender, instance, action, reverse, model, pk_set, **kwargs) -> None:
+    """
+    추천(voter)이 추가/삭제되면 바뀐 게시글/댓글의 vote_count를 중간 테이블의 실제 행 수로 다시 계산합니다.
+
+    post_remove의 pk_set에는 실제로 삭제된 행이 아니라 삭제를 요청한 ID가 모두 들어 있고(추천하지 않은 사용자 포함),
+    동시에 실행된 add()는 같은 ID로 post_add를 두 번 보낼 수 있으므로 pk_set 크기만큼 증감하지 않습니다.
+    관리자 화면, 셸, 사용자 쪽(reverse) 변경이 이 경로를 사용합니다. (추천 버튼은 pybo.votes.toggle_vote가 직접 갱신)
+
+    Parameters
+    ----------
+    sender : Model class
+        voter의 중간 테이블 모델입니다.
+    instance : Model
+        voter가 바뀐 게시글/댓글(reverse=True이면 사용자) 객체입니다.
+    action : str
+        'post_add', 'post_remove', 'pre_clear', 'post_clear' 등 변경 종류입니다.
+    reverse : bool
+        사용자 쪽에서 변경했으면(user.voter_xxx.add()) True입니다.
+    model : Model class
+        pk_set의 모델 클래스입니다.
+    pk_set : set or None
+        추가/삭제를 요청한 객체의 ID 집합입니다.
+
+    Returns
+    -------
+    None
+    """
+    voted_model = model if reverse else type(instance)
+    if action in ('post_add', 'post_remove'):
+        recount_votes(voted_model, pk_set if reverse else [instance.pk])
+    elif action == 'pre_clear' and reverse:  # 사용자의 추천을 모두 삭제 (삭제 전에 대상 조회)
+        instance._cleared_vote_pks = list(voted_model.objects.filter(voter=instance).values_list('pk', flat=True))
+    elif action == 'post_clear':
+        recount_votes(voted_model, instance.__dict__.pop('_cleared_vote_pks', []) if reverse else [instance.pk])
+
+
+@receiver(pre_delete, sender=User)
+def discount_deleted_user_votes(sender, instance, **kwargs) -> None:
+    """
+    사용자가 삭제되면 그 사용자가 추천한 게시글/댓글의 vote_count를 1씩 줄입니다.
+
+    사용자 삭제로 함께 삭제되는 중간 테이블 행에는 m2m_changed 시그널이 발생하지 않으므로 여기서 처리합니다.
+
+    Parameters
+    ----------
+    sender : Model class
+        시그널을 보낸 모델 클래스(User)입니다.
+    instance : User
+        삭제될 사용자 객체입니다.
+
+    Returns
+    -------
+    None
+    """
+    for voted_model in VOTED_MODELS:
+        adjust_count(voted_model, voted_model.objects.filter(voter=instance).values_list('pk', flat=True), 'vote_count', -1)
+
+
+@receiver(post_save, sender=SimilarityCommentModel)
+@receiver(post_save, sender=DetectionCommentModel)
+def count_created_comment(sender, instance, created, **kwargs) -> None:
+    """
+    댓글이 새로 작성되면(사용자 댓글, AI 댓글 모두) 게시글의 comment_count를 1 늘립니다.
+
+    Parameters
+    ----------
+    sender : Model class
+        시그널을 보낸 댓글 모델 클래스입니다.
+    instance : Model
+        저장된 댓글 객체입니다.
+    created : bool
+        새로 작성한 댓글이면 True입니다.
+
+    Returns
+    -------
+    None
+    """
+    if created:
+        adjust_count(sender.post.field.related_model, [instance.post_id], 'comment_count', 1)
+
+
+@receiver(post_delete, sender=SimilarityCommentModel)
+@receiver(post_delete, sender=DetectionCommentModel)
+def count_deleted_comment(sender, instance, **kwargs) -> None:
+    """
+    댓글이 삭제되면 게시글의 comment_count를 1 줄입니다.
+
+    게시글 삭제로 함께 삭제되는 댓글은 게시글보다 먼저 삭제되므로 이미 삭제된 게시글을 갱신하지 않습니다.
+
+    Parameters
+    ----------
+    sender : Model class
+        시그널을 보낸 댓글 모델 클래스입니다.
+    instance : Model
+        삭제된 댓글 객체입니다.
+
+    Returns
+    -------
+    None
+    """
+    adjust_count(sender.post.field.related_model, [instance.post_id], 'comment_count', -1)
+
+
+@receiver(post_save, sender=SimilarityPostModel)
+@receiver(post_save, sender=DetectionPostModel)
+@receiver(post_delete, sender=SimilarityPostModel)
+@receiver(post_delete, sender=DetectionPostModel)
+def invalidate_post_pages(sender, instance, **kwargs) -> None:
+    """
+    게시글이 작성/수정/삭제되면 게시판 목록과 게시글 상세 페이지의 캐시 버전을 올립니다.
+
+    Parameters
+    ----------
+    sender : Model class
+        시그널을 보낸 게시글 모델 클래스입니다.
+    instance : Model
+        저장되거나 삭제된 게시글 객체입니다.
+
+    Returns
+    -------
+    None
+    """
+    page_cache = get_page_cache()
+    page_cache.invalidate_board(sender)
+    page_cache.invalidate_post(sender, instance.pk)
+
+
+@receiver(post_save, sender=SimilarityCommentModel)
+@receiver(post_save, sender=DetectionCommentModel)
+@receiver(post_delete, sender=SimilarityCommentModel)
+@receiver(post_delete, sender=DetectionCommentModel)
+def invalidate_comment_pages(sender, instance, created=False, **kwargs) -> None:
+    """
+    댓글이 작성/수정/삭제되면(AI 처리 결과 저장 포함) 게시글 상세 페이지의 캐시 버전을 올립니다.
+
+    작성/삭제는 목록의 댓글 수도 바뀌므로 게시판 목록의 버전도 올립니다.
+
+    Parameters
+    ----------
+    sender : Model class
+        시그널을 보낸 댓글 모델 클래스입니다.
+    instance : Model
+        저장되거나 삭제된 댓글 객체입니다.
+    created : bool
+        새로 작성한 댓글이면 True입니다. (post_delete에서는 전달되지 않음)
+
+    Returns
+    -------
+    None
+    """
+    post_model = sender.post.field.related_model
+    page_cache = get_page_cache()
+    if created or kwargs['signal'] is post_delete:
+        page_cache.invalidate_board(post_model)
+    page_cache.invalidate_post(post_model, instance.post_id)
+
+
+def invalidate_voted_pages(voted_model, pks) -> None:
+    """
+    추천이 바뀐 게시글/댓글이 표시되는 페이지의 캐시 버전을 올립니다.
+
+    게시글 추천은 목록에도 표시되므로 게시판 목록의 버전도 올리고, 댓글 추천은 댓글이 달린 게시글의 버전만 올립니다.
+
+    Parameters
+    ----------
+    voted_model : Model class
+        추천이 바뀐 게시글 또는 댓글 모델 클래스입니다.
+    pks : iterable
+        추천이 바뀐 게시글/댓글의 ID 목록입니다.
+
+    Returns
+    -------
+    None
+    """
+    pks = list(pks)
+    if not pks:
+        return
+    page_cache = get_page_cache()
+    if voted_model in (SimilarityPostModel, DetectionPostModel):
+        page_cache.invalidate_board(voted_model)
+        page_cache.invalidate_post(voted_model, *pks)
+    else:
+        post_ids = voted_model.objects.filter(pk__in=pks).values_list('post_id', flat=True).distinct()
+        page_cache.invalidate_post(voted_model.post.field.related_model, *post_ids)
+
+
+@receiver(m2m_changed, sender=SimilarityPostModel.voter.through)
+@receiver(m2m_changed, sender=SimilarityCommentModel.voter.through)
+@receiver(m2m_changed, sender=DetectionPostModel.voter.through)
+@receiver(m2m_changed, sender=DetectionCommentModel.voter.through)
+def invalidate_m2m_vote_pages(sender, instance, action, reverse, model, pk_set, **kwargs) -> None:
+    """
+    voter.add()/remove()/clear()로 추천이 바뀌면 페이지 캐시 버전을 올립니다. (count_votes와 같은 경우를 처리)
+
+    Returns
+    -------
+    None
+    """
+    if reverse:  # 한 사용자가 여러 게시글/댓글의 추천을 변경
+        if action in ('post_add', 'post_remove'):
+            invalidate_voted_pages(model, pk_set)
+        elif action == 'pre_clear':  # 삭제 전에 대상 조회
+            invalidate_voted_pages(model, model.objects.filter(voter=instance).values_list('pk', flat=True))
+    elif action in ('post_add', 'post_remove', 'post_clear'):
+        invalidate_voted_pages(type(instance), [instance.pk])
+
+
+@receiver(vote_toggled)
+def invalidate_toggled_vote_pages(sender, instance, **kwargs) -> None:
+    """
+    추천 버튼(pybo.votes.toggle_vote)으로 추천이 바뀌면 페이지 캐시 버전을 올립니다.
+
+    Returns
+    -------
+    None
+    """
+    invalidate_voted_pages(sender, [instance.pk])
+
+
+@receiver(pre_delete, sender=User)
+def invalidate_deleted_user_pages(sender, instance, **kwargs) -> None:
+    """
+    사용자가 삭제되면 그 사용자의 게시글, 댓글, 추천이 여러 게시판에 걸쳐 사라지므로 모든 페이지 캐시를 무효화합니다.
+
+    Returns
+    -------
+    None
+    """
+    get_page_cache().invalidate_site()
@@ -1,6 +1,6 @@
 from django import template  # Django 템플릿 라이브러리
 from django.utils.safestring import mark_safe  # 안전한 HTML 문자열로 변환하는 함수
-import markdown  # 마크다운 문자열을 HTML로 변환하기 위한 모듈
+from ..markdown_cache import render_markdown  # 변환 결과를 캐시하는 마크다운 변환 함수
 
 # 템플릿 필터를 등록하기 위한 Library 객체 생성
 register = template.Library()
@@ -35,6 +35,8 @@ def md_to_html(value):
     - 'nl2br': 줄바꿈을 <br> 태그로 변환합니다.
     - 'fenced_code': 코드 블록을 처리합니다.
 
+    변환 결과는 본문 내용의 해시로 캐시되며(pybo.markdown_cache), 캐시에 없을 때만 변환합니다.
+
     사용 예:
     {{ value|render_markdown }} 형태로 템플릿에서 사용하여
     마크다운을 HTML로 변환할 수 있습니다.
@@ -46,18 +48,8 @@ def md_to_html(value):
         str: HTML로 변환된 안전한 문자열
     """
 
-    if value is None:
-        value = ""
-
-    # 마크다운 확장 기능 설정
-    extensions =  [
-        "markdown.extensions.extra", 
-        "markdown.extensions.nl2br", 
-        "markdown.extensions.fenced_code"
-        ]
-
-    # 마크다운을 HTML로 변환하고, 안전한 HTML로 처리하여 반환
-    return mark_safe(markdown.markdown(value, extensions=extensions))
+    # 마크다운을 HTML로 변환하고(같은 내용은 캐시된 결과 사용), 안전한 HTML로 처리하여 반환
+    return mark_safe(render_markdown(value))
 
 @register.filter
 def add_class(field, css_class):
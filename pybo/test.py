@@ -1,5 +1,91 @@
-from django.test import TestCase
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+from types import SimpleNamespace
+from unittest import mock
+
+import base64
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import markdown
+import numpy as np
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import DatabaseError, OperationalError, close_old_connections, connection
+from django.contrib.messages import constants
+from django.contrib.messages.storage.base import Message
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from pybo import jobs
+from pybo.ai_client import PROCESS_IMAGE_PATH, PROCESS_IMAGE_TWO_PATH, close_ai_clients, get_ai_client
+from pybo.inference.onnx_detector import decode_output, letterbox, nms
+from pybo.management.commands.evaluate_detector import match_detections, read_labels
+from pybo.inference.batching import BatchingModel, MicroBatcher, enable_batching
+from pybo.inference.backends import AIBackendError, DetectionResult, SimilarityResult, clear_ai_backends, get_ai_backend
+from pybo.inference.pool import InferencePool, InferencePoolError
+from pybo.inference.shared_image import SharedImage, open_image, share_images
+from pybo.inference import ann
+from pybo.inference.ann import AnnIndexFactory, BruteForceIndex, IVFIndex, get_ann_index, search_gallery
+from pybo.counters import PostCounter, get_post_counter, repair_counts
+from pybo.pagination import NEXT, encode_cursor, paginate_by_cursor
+from pybo.page_cache import get_page_cache
+from pybo.hyperloglog import HyperLogLog, standard_error
+from pybo.view_counter import ViewCounter, get_view_counter
+from pybo.votes import VoteResult, toggle_vote
+from pybo.search import LikeSearchBackend, get_search_backend, ngram_tokens
+from pybo.markdown_cache import MarkdownCache, MARKDOWN_EXTENSIONS, get_markdown_cache
+from pybo.inference.embedding_cache import EmbeddingCache, EmbeddingEntry, hash_image
+from pybo.inference.gallery import FaceGallery
+from pybo import ai_user as ai_user_module
+from pybo.ai_user import get_ai_user, clear_ai_user_cache
+from pybo.models import SimilarityPostModel, SimilarityCommentModel, DetectionPostModel, DetectionCommentModel, PostCountModel, ViewerSketchModel
 from pybo.urls import urlpatterns
+from pybo.views.detection_comment_views import detect_president
+from pybo.views.base_views import index_comment_messages, parse_comment_id
+
+def tearDownModule():
+    """
+    테스트 중 모인 조회수를 버립니다. (테스트 데이터베이스 삭제 후 프로세스 종료 시 기록되지 않도록)
+    """
+    get_view_counter().clear()
+
+
+def pool_task_pid(value=None):
+    """
+    추론 워커 풀 테스트용 작업: 워커 프로세스 ID와 받은 값을 반환합니다.
+    """
+    return os.getpid(), value
+
+
+def pool_task_fail(message):
+    """
+    추론 워커 풀 테스트용 작업: ValueError를 던집니다.
+    """
+    raise ValueError(message)
+
+
+def pool_task_image_sum(image):
+    """
+    추론 워커 풀 테스트용 작업: 공유 메모리 이미지를 열어 픽셀 합계를 반환합니다.
+    """
+    with open_image(image) as source:
+        return int(source.image_rgb.sum()), source.digest
+
+
+def pool_task_crash():
+    """
+    추론 워커 풀 테스트용 작업(또는 initializer): 워커 프로세스를 비정상 종료합니다.
+    """
+    os._exit(3)
+
 
 class URLPatternTest(TestCase):
     """
@@ -40,4 +126,2434 @@ class URLPatternTest(TestCase):
                 print(f'Invalid pattern: {pattern}')
         
         # 테스트 종료를 알리는 출력
-        print('URL Pattern Test Done!')
\ No newline at end of file
+        print('URL Pattern Test Done!')
+
+
+class PostListQueryCountTest(TestCase):
+    """
+    게시글 목록 페이지의 쿼리 수를 검사하는 테스트 클래스입니다.
+
+    게시글 수나 추천/댓글 수와 관계없이 목록 페이지가 일정한 수의 쿼리만 실행하는지 확인합니다.
+    (게시글 수 조회 쿼리 1개 + 현재 페이지 조회 쿼리 1개)
+
+    Methods
+    -------
+    test_similarity_list_query_count():
+        얼굴 유사도 비교 게시판 목록의 쿼리 수를 확인합니다.
+
+    test_detection_list_query_count():
+        대통령을 찾아라 게시판 목록의 쿼리 수를 확인합니다.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        테스트에 사용할 사용자, 게시글, 추천, 댓글을 생성합니다.
+        """
+        cls.author = User.objects.create_user(username='author', password='pw')
+        cls.voters = [User.objects.create_user(username=f'voter{i}', password='pw') for i in range(3)]
+
+        for post_model, comment_model in ((SimilarityPostModel, SimilarityCommentModel),
+                                          (DetectionPostModel, DetectionCommentModel)):
+            for i in range(15):  # 한 페이지(10개)보다 많은 게시글 생성
+                post = post_model.objects.create(author=cls.author, subject=f'제목 {i}', content='내용')
+                post.voter.add(*cls.voters)
+                for _ in range(2):
+                    comment_model.objects.create(author=cls.voters[0], post=post, content='댓글')
+
+    def _assert_list_query_count(self, board_name: str):
+        """
+        주어진 게시판의 목록 페이지가 2개의 쿼리만 실행하고, 추천 수와 댓글 수를 올바르게 표시하는지 확인합니다.
+        """
+        url = reverse(f'pybo:{board_name}_post_list')
+
+        with self.assertNumQueries(2):
+            response = self.client.get(url, {'mode': 'page'})  # 페이지 번호 방식
+
+        self.assertEqual(response.status_code, 200)
+        post_indices = response.context['post_indices']
+        self.assertEqual(len(post_indices), 10)
+        self.assertEqual(post_indices[0][0], 15)  # 최신 글이 가장 큰 번호를 가짐
+        for _, post in post_indices:
+            self.assertEqual(post.vote_count, 3)
+            self.assertEqual(post.comment_count, 2)
+
+        # 검색 시에도 쿼리 수는 동일해야 함 (검색 결과 수는 캐시되지 않은 상태)
+        cache.clear()
+        with self.assertNumQueries(2):
+            self.client.get(url, {'kw': 'author', 'page': 2, 'mode': 'page'})
+
+    def test_similarity_list_query_count(self):
+        """
+        얼굴 유사도 비교 게시판 목록의 쿼리 수를 확인합니다.
+        """
+        self._assert_list_query_count('similarity')
+
+    def test_detection_list_query_count(self):
+        """
+        대통령을 찾아라 게시판 목록의 쿼리 수를 확인합니다.
+        """
+        self._assert_list_query_count('detection')
+
+
+class PostReadQueryCountTest(TestCase):
+    """
+    게시글 상세 페이지의 쿼리 수를 검사하는 테스트 클래스입니다.
+
+    댓글 수나 댓글별 추천 수와 관계없이 상세 페이지가 정해진 쿼리 예산 안에서 렌더링되는지 확인합니다.
+
+    Methods
+    -------
+    test_similarity_read_query_count():
+        얼굴 유사도 비교 게시판 상세 페이지의 쿼리 수를 확인합니다.
+
+    test_detection_read_query_count():
+        대통령을 찾아라 게시판 상세 페이지의 쿼리 수를 확인합니다.
+    """
+
+    query_budget = 2  # 게시글 1 + 댓글 1 (AI 계정은 프로세스 단위로 캐시됨)
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        테스트에 사용할 사용자, 게시글, 댓글, 추천을 생성합니다.
+        """
+        cls.ai_user = User.objects.create_user(username='AI', password='pw')
+        cls.author = User.objects.create_user(username='author', password='pw')
+        cls.voters = [User.objects.create_user(username=f'voter{i}', password='pw') for i in range(3)]
+
+        cls.posts = {}
+        for board_name, post_model, comment_model in (('similarity', SimilarityPostModel, SimilarityCommentModel),
+                                                      ('detection', DetectionPostModel, DetectionCommentModel)):
+            post = post_model.objects.create(author=cls.author, subject='제목', content='내용')
+            post.voter.add(*cls.voters)
+            for i in range(30):  # 긴 댓글 스레드
+                author = cls.ai_user if i % 2 else cls.voters[i % 3]
+                comment = comment_model.objects.create(author=author, post=post, content=f'댓글 {i}')
+                comment.voter.add(*cls.voters[:i % 3])
+            cls.posts[board_name] = post
+
+    def setUp(self):
+        """
+        다른 테스트에서 캐시된 AI 계정을 비우고, 현재 테스트의 AI 계정으로 캐시를 채웁니다.
+        """
+        clear_ai_user_cache()
+        get_ai_user()
+        get_view_counter().clear()  # 다른 테스트의 조회수가 이번 요청에서 기록되지 않도록 비움
+
+    def _assert_read_query_count(self, board_name: str):
+        """
+        주어진 게시판의 상세 페이지가 쿼리 예산 안에서 렌더링되고, 댓글 정보를 올바르게 전달하는지 확인합니다.
+        """
+        post = self.posts[board_name]
+        url = reverse(f'pybo:{board_name}_post_read', kwargs={'pk': post.pk})
+
+        with self.assertNumQueries(self.query_budget):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['post'].vote_count, 3)
+
+        processed_comments = response.context['processed_comments']
+        self.assertEqual(len(processed_comments), 30)
+        for i, comment in enumerate(processed_comments):
+            self.assertEqual(comment['content'], f'댓글 {i}')
+            self.assertEqual(comment['voter_count'], i % 3)
+            self.assertEqual(comment['author_username'], 'AI' if i % 2 else f'voter{i % 3}')
+
+    def test_similarity_read_query_count(self):
+        """
+        얼굴 유사도 비교 게시판 상세 페이지의 쿼리 수를 확인합니다.
+        """
+        self._assert_read_query_count('similarity')
+
+    def test_detection_read_query_count(self):
+        """
+        대통령을 찾아라 게시판 상세 페이지의 쿼리 수를 확인합니다.
+        """
+        self._assert_read_query_count('detection')
+
+
+class AIUserCacheTest(TestCase):
+    """
+    AI 계정 캐시를 테스트하는 클래스입니다.
+
+    Methods
+    -------
+    test_cached_after_first_lookup():
+        첫 조회 이후에는 데이터베이스를 조회하지 않는지 확인합니다.
+
+    test_invalidated_on_user_change():
+        AI 계정이 생성/이름 변경/삭제되면 캐시가 무효화되는지 확인합니다.
+
+    test_invalidated_by_other_process():
+        다른 프로세스가 공유 버전을 올리면 이 프로세스도 다시 조회하는지 확인합니다.
+
+    test_version_checked_after_interval():
+        공유 캐시의 버전은 VERSION_CHECK_INTERVAL초마다 한 번만 확인하는지 확인합니다.
+
+    test_missing_account_retried():
+        계정이 없다는 결과는 MISS_TIMEOUT이 지나면 다시 조회하는지 확인합니다.
+
+    test_read_view_without_ai_user():
+        AI 계정이 없어도 상세 페이지가 정상적으로 렌더링되는지 확인합니다.
+    """
+
+    def setUp(self):
+        """
+        다른 테스트에서 캐시된 AI 계정을 비웁니다.
+        """
+        clear_ai_user_cache()
+
+    def test_cached_after_first_lookup(self):
+        """
+        첫 조회 이후에는 데이터베이스를 조회하지 않는지 확인합니다.
+        """
+        ai_user = User.objects.create_user(username='AI', password='pw')
+
+        with self.assertNumQueries(1):
+            self.assertEqual(get_ai_user(), ai_user)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_ai_user(), ai_user)
+
+    def test_invalidated_on_user_change(self):
+        """
+        AI 계정이 생성/이름 변경/삭제되면 캐시가 무효화되는지 확인합니다.
+        """
+        self.assertIsNone(get_ai_user())  # 계정이 없는 상태도 MISS_TIMEOUT 동안 캐싱됨
+
+        ai_user = User.objects.create_user(username='AI', password='pw')
+        self.assertEqual(get_ai_user(), ai_user)
+
+        ai_user.username = 'former-AI'
+        ai_user.save()
+        self.assertIsNone(get_ai_user())
+
+        ai_user.username = 'AI'
+        ai_user.save()
+        self.assertEqual(get_ai_user(), ai_user)
+
+        ai_user.delete()
+        self.assertIsNone(get_ai_user())
+
+    def test_invalidated_by_other_process(self):
+        """
+        다른 프로세스가 공유 버전을 올리면 이 프로세스도 다시 조회하는지 확인합니다.
+        """
+        ai_user = User.objects.create_user(username='AI', password='pw')
+        self.assertEqual(get_ai_user(), ai_user)
+
+        # 다른 프로세스에서 계정을 다시 만든 상황: 행은 바뀌었지만 이 프로세스의 시그널은 실행되지 않음
+        User.objects.filter(pk=ai_user.pk).update(username='former-AI')
+        recreated = User.objects.bulk_create([User(username='AI')])[0]
+        with self.assertNumQueries(0):
+            self.assertEqual(get_ai_user(), ai_user)  # 아직 이 프로세스의 캐시
+
+        cache.incr(ai_user_module.VERSION_KEY)  # 다른 프로세스의 clear_ai_user_cache()
+        with override_settings(AI_USER={'CACHE_ALIAS': 'default', 'VERSION_CHECK_INTERVAL': 0}):
+            with self.assertNumQueries(1):
+                self.assertEqual(get_ai_user().pk, recreated.pk)
+
+    def test_version_checked_after_interval(self):
+        """
+        공유 캐시의 버전은 VERSION_CHECK_INTERVAL초마다 한 번만 확인하는지 확인합니다.
+        """
+        ai_user = User.objects.create_user(username='AI', password='pw')
+        self.assertEqual(get_ai_user(), ai_user)
+        User.objects.filter(pk=ai_user.pk).update(username='former-AI')  # 다른 프로세스에서 이름 변경
+        cache.incr(ai_user_module.VERSION_KEY)
+
+        now = time.monotonic()
+        with mock.patch.object(cache, 'get', wraps=cache.get) as cache_get, \
+                mock.patch.object(ai_user_module.time, 'monotonic', return_value=now + 4):
+            self.assertEqual(get_ai_user(), ai_user)  # 확인 간격(5초) 안에서는 이전 값을 그대로 사용
+        cache_get.assert_not_called()
+
+        with mock.patch.object(ai_user_module.time, 'monotonic', return_value=now + 6):
+            self.assertIsNone(get_ai_user())  # 간격이 지나면 바뀐 버전을 보고 다시 조회
+
+    def test_missing_account_retried(self):
+        """
+        계정이 없다는 결과는 MISS_TIMEOUT이 지나면 다시 조회하는지 확인합니다.
+        """
+        with override_settings(AI_USER={'CACHE_ALIAS': 'default', 'MISS_TIMEOUT': 0}):
+            self.assertIsNone(get_ai_user())
+            created = User.objects.bulk_create([User(username='AI')])[0]  # 시그널 없이 생성
+            self.assertEqual(get_ai_user().pk, created.pk)
+
+        clear_ai_user_cache()
+        with override_settings(AI_USER={'CACHE_ALIAS': 'default', 'MISS_TIMEOUT': 60}):
+            User.objects.filter(username='AI').update(username='former-AI')
+            self.assertIsNone(get_ai_user())
+            User.objects.filter(username='former-AI').update(username='AI')
+            with self.assertNumQueries(0):
+                self.assertIsNone(get_ai_user())  # 보관 시간 동안은 다시 조회하지 않음
+
+    def test_read_view_without_ai_user(self):
+        """
+        AI 계정이 없어도 상세 페이지가 정상적으로 렌더링되는지 확인합니다.
+        """
+        author = User.objects.create_user(username='author', password='pw')
+        post = SimilarityPostModel.objects.create(author=author, subject='제목', content='내용')
+        SimilarityCommentModel.objects.create(author=author, post=post, content='AI가 처리 중입니다.')
+
+        response = self.client.get(reverse('pybo:similarity_post_read', kwargs={'pk': post.pk}))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.context['is_superuser'])
+        self.assertFalse(response.context['processed_comments'][0]['is_ai_processing'])
+
+
+class CommentMessageIndexTest(TestCase):
+    """
+    댓글 메시지 분류(index_comment_messages)를 테스트하는 클래스입니다.
+
+    Methods
+    -------
+    test_parse_comment_id():
+        메시지 태그에서 댓글 ID를 올바르게 추출하는지 확인합니다.
+
+    test_no_prefix_match():
+        댓글 1이 댓글 12의 메시지와 일치하지 않는지 확인합니다.
+    """
+
+    def test_parse_comment_id(self):
+        """
+        메시지 태그에서 댓글 ID를 올바르게 추출하는지 확인합니다.
+        """
+        self.assertEqual(parse_comment_id('comment 12 success'), 12)
+        self.assertIsNone(parse_comment_id('comment success'))
+        self.assertIsNone(parse_comment_id('post error'))
+
+    def test_no_prefix_match(self):
+        """
+        댓글 1이 댓글 12의 메시지와 일치하지 않는지 확인합니다.
+        """
+        comments = [SimpleNamespace(id=1), SimpleNamespace(id=12)]
+        message_list = [
+            Message(constants.SUCCESS, '추천하였습니다.', extra_tags='comment 12'),
+            Message(constants.SUCCESS, '작성되었습니다.', extra_tags='comment'),
+            Message(constants.SUCCESS, '삭제했습니다.', extra_tags='post'),
+        ]
+
+        comment_messages = index_comment_messages(message_list, comments)
+
+        self.assertEqual(comment_messages[1], [])
+        self.assertEqual([m['text'] for m in comment_messages[12]], ['추천하였습니다.'])
+
+
+class ModelRegistryTest(TestCase):
+    """
+    탐지기와 파이프라인 레지스트리(pybo.inference.registry)를 테스트하는 클래스입니다.
+
+    ai_system은 테스트 환경에 없으므로 sys.modules에 가짜 모듈을 넣고 레지스트리 모듈을 새로 불러옵니다.
+
+    Methods
+    -------
+    test_detector_created_once():
+        같은 (설정 클래스, 탐지기 이름)의 탐지기를 한 번만 생성하는지 확인합니다.
+
+    test_pipeline_built_once():
+        같은 (파이프라인 이름, 설정 클래스, 탐지기 목록)의 파이프라인을 한 번만 생성하는지 확인합니다.
+
+    test_threads_share_serialized_detector():
+        스레드마다 파이프라인을 따로 만들고, 공유하는 탐지기의 모델은 동시에 호출되지 않는지 확인합니다.
+
+    test_clear():
+        clear()가 보관 중인 탐지기와 파이프라인을 비워 다음 요청에서 다시 생성하는지 확인합니다.
+    """
+
+    class BaseConfig:
+        @staticmethod
+        def get_config():
+            return {'yolo': {'path': 'yolo.pt'}, 'dlib': {}}
+
+    class DetectionConfig(BaseConfig):
+        @staticmethod
+        def get_config():
+            return {'yolo': {'path': 'detection.pt'}}
+
+    def setUp(self):
+        self.running, self.overlaps = 0, 0  # 동시에 실행 중인 모델 호출 수, 겹쳐 실행된 횟수
+
+        def model(image):
+            self.running += 1
+            self.overlaps += self.running > 1
+            time.sleep(0.005)
+            self.running -= 1
+            return [image]
+
+        self.create = mock.Mock(side_effect=lambda name, config: SimpleNamespace(name=name, config=config, model=model))
+        ai_system = SimpleNamespace(
+            Pipeline=list,
+            BaseConfig=self.BaseConfig,
+            factories=SimpleNamespace(FaceDetectorFactory=SimpleNamespace(create=self.create)),
+        )
+        modules = mock.patch.dict(sys.modules, {'ai_system': ai_system})
+        modules.start()
+        self.addCleanup(modules.stop)  # 가짜 ai_system으로 불러온 레지스트리 모듈도 함께 제거됨
+        sys.modules.pop('pybo.inference.registry', None)
+
+        from pybo.inference.registry import ModelRegistry
+
+        self.registry = ModelRegistry()
+        self.builder = mock.Mock(side_effect=lambda detectors: ['pipeline', *detectors])
+
+    def test_detector_created_once(self):
+        """
+        같은 (설정 클래스, 탐지기 이름)의 탐지기를 한 번만 생성하는지 확인합니다.
+        """
+        first = self.registry.get_detectors(['yolo', 'mtcnn'])  # 사용하지 않는 탐지기는 제외
+        second = self.registry.get_detectors(['yolo'])
+        self.assertEqual(len(first), 1)
+        self.assertIs(first[0], second[0])
+        self.create.assert_called_once_with('yolo', {'path': 'yolo.pt'})
+
+        detection = self.registry.get_detectors(['yolo'], self.DetectionConfig)  # 설정 클래스가 다르면 따로 생성
+        self.assertIsNot(detection[0], first[0])
+        self.assertEqual(detection[0].config, {'path': 'detection.pt'})
+        self.assertEqual(self.create.call_count, 2)
+        self.assertEqual(set(self.registry.memory_report()['detectors']), {'BaseConfig.yolo', 'DetectionConfig.yolo'})
+
+    def test_pipeline_built_once(self):
+        """
+        같은 (파이프라인 이름, 설정 클래스, 탐지기 목록)의 파이프라인을 한 번만 생성하는지 확인합니다.
+        """
+        pipeline = self.registry.get_pipeline('encode', ['yolo'], self.builder)
+        self.assertIs(self.registry.get_pipeline('encode', ['yolo'], self.builder), pipeline)
+        self.assertEqual(self.builder.call_count, 1)
+
+        self.assertIsNot(self.registry.get_pipeline('detect', ['yolo'], self.builder), pipeline)
+        self.assertIsNot(self.registry.get_pipeline('encode', ['yolo', 'dlib'], self.builder), pipeline)
+        self.assertEqual(self.builder.call_count, 3)
+        self.assertEqual(self.create.call_count, 2)  # 파이프라인끼리 탐지기(yolo)는 공유
+        self.assertEqual(self.registry.memory_report()['pipelines'], 3)
+
+    def test_threads_share_serialized_detector(self):
+        """
+        스레드마다 파이프라인을 따로 만들고, 공유하는 탐지기의 모델은 동시에 호출되지 않는지 확인합니다.
+        """
+        pipelines = []
+
+        def worker():
+            pipeline = self.registry.get_pipeline('encode', ['yolo'], self.builder)
+            pipelines.append(pipeline)
+            for _ in range(5):
+                pipeline[1].model('image')  # 파이프라인의 탐지 단계가 모델을 호출하는 것과 같음
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len({id(pipeline) for pipeline in pipelines}), 4)  # 스레드마다 파이프라인 생성
+        self.assertEqual(len({id(pipeline[1]) for pipeline in pipelines}), 1)  # 탐지기는 공유
+        self.assertEqual(self.create.call_count, 1)
+        self.assertEqual(self.overlaps, 0)
+
+    def test_clear(self):
+        """
+        clear()가 보관 중인 탐지기와 파이프라인을 비워 다음 요청에서 다시 생성하는지 확인합니다.
+        """
+        detector = self.registry.get_detectors(['yolo'])[0]
+        pipeline = self.registry.get_pipeline('encode', ['yolo'], self.builder)
+
+        self.registry.clear()
+        self.assertEqual(self.registry.memory_report()['detectors'], {})
+        self.assertEqual(self.registry.memory_report()['pipelines'], 0)
+
+        self.assertIsNot(self.registry.get_detectors(['yolo'])[0], detector)
+        self.assertIsNot(self.registry.get_pipeline('encode', ['yolo'], self.builder), pipeline)
+        self.assertEqual(self.create.call_count, 2)
+        self.assertEqual(self.builder.call_count, 2)
+
+
+class EmbeddingCacheTest(TestCase):
+    """
+    얼굴 인코딩 캐시(EmbeddingCache)를 테스트하는 클래스입니다.
+
+    Methods
+    -------
+    test_key_depends_on_content_and_detectors():
+        캐시 키가 이미지 내용, 탐지기 목록, 모델 버전에 따라 달라지는지 확인합니다.
+
+    test_lru_eviction():
+        메모리 한도를 넘으면 가장 오래 사용하지 않은 항목부터 제거되는지 확인합니다.
+
+    test_disk_tier():
+        디스크 계층에 저장된 항목을 새 캐시 객체에서 읽을 수 있는지 확인합니다.
+    """
+
+    @staticmethod
+    def _entry(value: float) -> EmbeddingEntry:
+        """
+        테스트용 인코딩 결과(얼굴 1개, 128차원)를 만듭니다.
+        """
+        return EmbeddingEntry(
+            encodings=np.full((1, 128), value, dtype=np.float32),
+            boxes=np.array([[0, 0, 10, 10]], dtype=np.float32),
+        )
+
+    def test_key_depends_on_content_and_detectors(self):
+        """
+        캐시 키가 이미지 내용, 탐지기 목록, 모델 버전에 따라 달라지는지 확인합니다.
+        """
+        cache = EmbeddingCache(model_version='v1')
+
+        self.assertEqual(cache.make_key(b'image', ['yolo']), cache.make_key(b'image', ['yolo']))
+        self.assertNotEqual(cache.make_key(b'image', ['yolo']), cache.make_key(b'other', ['yolo']))
+        self.assertNotEqual(cache.make_key(b'image', ['yolo']), cache.make_key(b'image', ['yolo', 'dlib']))
+        self.assertNotEqual(cache.make_key(b'image', ['yolo']), EmbeddingCache(model_version='v2').make_key(b'image', ['yolo']))
+
+        with tempfile.NamedTemporaryFile(delete=False) as f:  # 파일 경로와 바이트는 같은 키를 만듦
+            f.write(b'image')
+        try:
+            self.assertEqual(cache.make_key(f.name, ['yolo']), cache.make_key(b'image', ['yolo']))
+        finally:
+            os.remove(f.name)
+
+    def test_lru_eviction(self):
+        """
+        메모리 한도를 넘으면 가장 오래 사용하지 않은 항목부터 제거되는지 확인합니다.
+        """
+        entry_size = self._entry(0).nbytes
+        cache = EmbeddingCache(max_bytes=entry_size * 2)
+
+        cache.set('a', self._entry(1))
+        cache.set('b', self._entry(2))
+        cache.get('a')  # 'a'를 최근 사용한 항목으로 만듦
+        cache.set('c', self._entry(3))
+
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a').encodings[0, 0], 1)
+        self.assertEqual(cache.get('c').encodings[0, 0], 3)
+        self.assertEqual(len(cache), 2)
+
+    def test_disk_tier(self):
+        """
+        디스크 계층에 저장된 항목을 새 캐시 객체에서 읽을 수 있는지 확인합니다.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            db_path = os.path.join(directory, 'embeddings.sqlite3')
+            EmbeddingCache(db_path=db_path).set('key', self._entry(5))
+
+            entry = EmbeddingCache(db_path=db_path).get('key')
+
+            self.assertIsNotNone(entry)
+            np.testing.assert_array_equal(entry.encodings, self._entry(5).encodings)
+            np.testing.assert_array_equal(entry.boxes, self._entry(5).boxes)
+            self.assertFalse(hasattr(entry, 'output_image_path'))  # 결과 이미지 경로는 요청마다 만듦
+
+
+class FaceGalleryTest(TestCase):
+    """
+    얼굴 갤러리(FaceGallery)를 테스트하는 클래스입니다.
+
+    Methods
+    -------
+    test_search_matches_brute_force():
+        상위 k개 결과가 코사인 유사도를 하나씩 계산한 결과와 같은지 확인합니다.
+
+    test_incremental_append():
+        여러 번 나누어 추가해도 모든 얼굴이 검색되는지 확인합니다.
+
+    test_persistence_and_refresh():
+        파일로 저장한 갤러리를 불러오고, 다른 인스턴스가 덧붙인 행을 refresh()로 읽는지 확인합니다.
+
+    test_remove_post():
+        삭제된 게시글의 얼굴이 다른 인스턴스와 인덱스 검색에서도 제외되고, 다시 추가되지 않는지 확인합니다.
+
+    test_duplicate_labels_ignored():
+        같은 게시글을 다시 추가해도(작업 재시도) 한 번만 검색되는지 확인합니다.
+
+    test_deleted_post_removed():
+        게시글을 삭제하면 커밋 후 갤러리 파일의 삭제 목록에 기록되는지 확인합니다.
+
+    test_rebuild_switches_generation():
+        갤러리를 다시 저장하면 다른 인스턴스가 refresh()에서 새 세대를 처음부터 다시 불러오는지 확인합니다.
+    """
+
+    def setUp(self):
+        """
+        테스트용 임의 인코딩을 만듭니다.
+        """
+        rng = np.random.default_rng(0)
+        self.encodings = rng.normal(size=(300, 128)).astype(np.float32)
+        self.labels = [(i, 1, 0) for i in range(300)]
+
+    def test_search_matches_brute_force(self):
+        """
+        상위 k개 결과가 코사인 유사도를 하나씩 계산한 결과와 같은지 확인합니다.
+        """
+        gallery = FaceGallery()
+        gallery.add(self.encodings, self.labels)
+        query = self.encodings[42] + 0.1
+
+        results = gallery.search(query, k=5)
+
+        normalized = self.encodings / np.linalg.norm(self.encodings, axis=1, keepdims=True)
+        expected = np.argsort(-(normalized @ (query / np.linalg.norm(query))))[:5]
+        self.assertEqual([post_id for post_id, _, _, _ in results], list(expected))
+        self.assertEqual(results[0][0], 42)
+
+        # 질의 게시글 제외
+        self.assertNotIn(42, [r[0] for r in gallery.search(query, k=5, exclude_post_id=42)])
+
+    def test_incremental_append(self):
+        """
+        여러 번 나누어 추가해도 모든 얼굴이 검색되는지 확인합니다.
+        """
+        gallery = FaceGallery(initial_capacity=4)
+        for start in range(0, 300, 7):
+            gallery.add(self.encodings[start:start + 7], self.labels[start:start + 7])
+
+        self.assertEqual(len(gallery), 300)
+        self.assertTrue(gallery.matrix.flags['C_CONTIGUOUS'])
+        for i in (0, 150, 299):
+            self.assertEqual(gallery.search(self.encodings[i], k=1)[0][0], i)
+
+    def test_persistence_and_refresh(self):
+        """
+        파일로 저장한 갤러리를 불러오고, 다른 인스턴스가 덧붙인 행을 refresh()로 읽는지 확인합니다.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            writer = FaceGallery.load(directory)
+            writer.add(self.encodings[:100], self.labels[:100])
+
+            reader = FaceGallery.load(directory)
+            self.assertEqual(len(reader), 100)
+
+            writer.add(self.encodings[100:], self.labels[100:])
+            self.assertEqual(reader.refresh(), 200)
+            self.assertEqual(len(reader), 300)
+            np.testing.assert_array_equal(reader.labels, writer.labels)
+            np.testing.assert_allclose(reader.matrix, writer.matrix)
+
+    def test_remove_post(self):
+        """
+        삭제된 게시글의 얼굴이 다른 인스턴스와 인덱스 검색에서도 제외되고, 다시 추가되지 않는지 확인합니다.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            writer = FaceGallery.load(directory)
+            writer.add(self.encodings, self.labels)
+            reader = FaceGallery.load(directory)
+
+            writer.remove([42])
+            self.assertFalse(writer.has_post(42))
+            self.assertEqual(len(writer), 300)  # 행 번호(인덱스 벡터 ID)는 그대로
+            self.assertNotIn(42, [r[0] for r in writer.search(self.encodings[42], k=5)])
+
+            reader.refresh()  # 다른 프로세스의 삭제 목록 반영
+            self.assertFalse(reader.has_post(42))
+            self.assertNotIn(42, [r[0] for r in reader.search(self.encodings[42], k=5)])
+
+            index = BruteForceIndex(128)
+            index.build(reader.matrix, np.arange(len(reader), dtype=np.int64))
+            results = search_gallery(index, reader, self.encodings[42], k=5)
+            self.assertEqual(len(results), 5)
+            self.assertNotIn(42, [r[0] for r in results])
+
+            writer.add(self.encodings[42:43], self.labels[42:43])  # 삭제 뒤 늦게 실행된 추가 작업
+            self.assertNotIn(42, [r[0] for r in FaceGallery.load(directory).search(self.encodings[42], k=5)])
+
+    def test_duplicate_labels_ignored(self):
+        """
+        같은 게시글을 다시 추가해도(작업 재시도) 한 번만 검색되는지 확인합니다.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            gallery = FaceGallery.load(directory)
+            gallery.add(self.encodings[:10], self.labels[:10])
+            self.assertTrue(gallery.has_post(3))
+            gallery.add(self.encodings[3:4], self.labels[3:4])
+
+            for reader in (gallery, FaceGallery.load(directory)):
+                self.assertEqual(reader.inactive_count, 1)
+                self.assertEqual([r[0] for r in reader.search(self.encodings[3], k=2)].count(3), 1)
+
+    def test_rebuild_switches_generation(self):
+        """
+        갤러리를 다시 저장하면 다른 인스턴스가 refresh()에서 새 세대를 처음부터 다시 불러오는지 확인합니다.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            writer = FaceGallery.load(directory)  # 이전 형식 (세대 디렉터리 없음)
+            writer.add(self.encodings[:200], self.labels[:200])
+            writer.remove([5])
+            reader = FaceGallery.load(directory)
+            self.assertEqual(len(reader), 200)
+
+            rebuilt = FaceGallery()  # build_face_gallery와 같이 메모리에서 새로 만든 뒤 저장
+            rebuilt.add(self.encodings[100:150], self.labels[100:150])
+            rebuilt.save(directory)
+            self.assertFalse(os.path.exists(os.path.join(directory, 'gallery.bin')))  # 이전 형식 파일 정리
+
+            reader.refresh()
+            self.assertEqual(len(reader), 50)
+            np.testing.assert_array_equal(reader.labels, rebuilt.labels)
+            self.assertTrue(reader.has_post(5) is False and reader.has_post(120))
+
+            writer.add(self.encodings[250:251], self.labels[250:251])  # 이전 세대를 불러온 프로세스의 추가도 새 세대에 기록
+            self.assertEqual(len(writer), 51)
+            reader.refresh()
+            self.assertTrue(reader.has_post(250))
+
+            rebuilt.save(directory)  # 다시 만들면 바로 이전 세대만 남김
+            rebuilt.save(directory)
+            self.assertEqual(len([name for name in os.listdir(directory) if name.startswith('gen-')]), 2)
+
+    def test_deleted_post_removed(self):
+        """
+        게시글을 삭제하면 커밋 후 갤러리 파일의 삭제 목록에 기록되는지 확인합니다.
+        """
+        author = User.objects.create_user(username='gallery', password='password')
+        post = SimilarityPostModel.objects.create(author=author, subject='제목', content='내용')
+        post_id = post.pk
+
+        with tempfile.TemporaryDirectory() as directory, override_settings(AI_FACE_GALLERY={'PATH': directory}):
+            FaceGallery.load(directory).add(self.encodings[:2], [(post_id, 1, 0), (post_id, 2, 0)])
+            with self.captureOnCommitCallbacks(execute=True):
+                post.delete()
+
+            gallery = FaceGallery.load(directory)
+            self.assertFalse(gallery.has_post(post_id))
+            self.assertEqual(gallery.search(self.encodings[0], k=2), [])
+
+
+class AnnIndexTest(TestCase):
+    """
+    근사 최근접 이웃 인덱스(pybo.inference.ann)를 테스트하는 클래스입니다.
+
+    Methods
+    -------
+    test_brute_force_matches_gallery():
+        brute 인덱스와 갤러리 검색 결과가 같은지 확인합니다.
+
+    test_ivf_recall_and_incremental_add():
+        IVF 인덱스가 자기 자신을 찾고, 빌드 이후 추가한 벡터도 검색되는지 확인합니다.
+
+    test_ivf_persistence_with_mmap():
+        저장한 IVF 인덱스를 메모리 맵으로 불러와 같은 결과를 반환하는지 확인합니다.
+
+    test_factory_fallback():
+        알 수 없는 인덱스는 거부하고, hnswlib가 없으면 brute 인덱스로 대체하는지 확인합니다.
+
+    test_exclude_post_with_many_faces():
+        얼굴이 많은 게시글을 제외해도 k개를 채우는지 확인합니다.
+
+    test_rebuild_after_removals():
+        삭제된 얼굴이 기준 비율을 넘으면 활성 얼굴만으로 인덱스를 다시 만드는지 확인합니다.
+
+    test_rebuild_mismatched_saved_index():
+        저장된 인덱스의 벡터 수가 갤러리보다 많으면 갤러리로 다시 만드는지 확인합니다.
+    """
+
+    def setUp(self):
+        """
+        군집화된 테스트용 인코딩을 만듭니다.
+        """
+        rng = np.random.default_rng(0)
+        centers = rng.normal(size=(50, 64)).astype(np.float32)
+        self.encodings = centers[rng.integers(0, 50, 2000)] + rng.normal(scale=0.1, size=(2000, 64)).astype(np.float32)
+
+    def test_brute_force_matches_gallery(self):
+        """
+        brute 인덱스와 갤러리 검색 결과가 같은지 확인합니다.
+        """
+        gallery = FaceGallery()
+        gallery.add(self.encodings, [(i, 1, 0) for i in range(len(self.encodings))])
+        index = BruteForceIndex(64)
+        index.build(gallery.matrix)
+        query = self.encodings[7]
+
+        expected = gallery.search(query, k=5, exclude_post_id=7)
+        results = search_gallery(index, gallery, query, k=5, exclude_post_id=7)
+        self.assertEqual([r[:3] for r in results], [r[:3] for r in expected])
+
+    def test_ivf_recall_and_incremental_add(self):
+        """
+        IVF 인덱스가 자기 자신을 찾고, 빌드 이후 추가한 벡터도 검색되는지 확인합니다.
+        """
+        index = IVFIndex(64, nlist=32, nprobe=4)
+        index.build(self.encodings)
+        hits = sum(int(index.search(self.encodings[i], k=1)[0][0] == i) for i in range(0, 2000, 40))
+        self.assertGreaterEqual(hits, 48)
+
+        new_vector = np.random.default_rng(1).normal(size=64).astype(np.float32)
+        index.add(new_vector[None, :])
+        self.assertEqual(index.ntotal, 2001)
+        self.assertEqual(index.search(new_vector, k=1, nprobe=32)[0][0], 2000)
+
+    def test_ivf_persistence_with_mmap(self):
+        """
+        저장한 IVF 인덱스를 메모리 맵으로 불러와 같은 결과를 반환하는지 확인합니다.
+        """
+        index = IVFIndex(64, nlist=32, nprobe=4)
+        index.build(self.encodings[:1500])
+        index.add(self.encodings[1500:])  # delta 영역도 저장 시 합쳐짐
+
+        with tempfile.TemporaryDirectory() as directory:
+            index.save(directory)
+            loaded = AnnIndexFactory.load(directory)
+
+            self.assertIsInstance(loaded, IVFIndex)
+            self.assertIsInstance(loaded._vectors, np.memmap)
+            self.assertEqual(loaded.ntotal, 2000)
+            query = self.encodings[1700]
+            np.testing.assert_array_equal(loaded.search(query, k=5)[0], index.search(query, k=5)[0])
+            del loaded  # 메모리 맵을 닫은 뒤 임시 디렉터리 삭제
+
+    def test_factory_fallback(self):
+        """
+        알 수 없는 인덱스는 거부하고, hnswlib가 없으면 brute 인덱스로 대체하는지 확인합니다.
+        """
+        with self.assertRaises(ValueError):
+            AnnIndexFactory.create('unknown', 64)
+
+        try:
+            import hnswlib  # noqa: F401
+        except ImportError:
+            with self.assertLogs('pybo', level='WARNING'):
+                self.assertIsInstance(AnnIndexFactory.create('hnsw', 64), BruteForceIndex)
+
+    def _reset_ann_index(self):
+        """
+        프로세스 단위 인덱스를 비우고, 테스트가 끝나면 다시 비웁니다.
+        """
+        ann._ann_index = None
+        self.addCleanup(setattr, ann, '_ann_index', None)
+
+    def test_exclude_post_with_many_faces(self):
+        """
+        얼굴이 많은 게시글을 제외해도 k개를 채우는지 확인합니다.
+        """
+        query = self.encodings[0]
+        crowd = np.repeat(query[None, :], 30, axis=0) + np.random.default_rng(2).normal(scale=0.01, size=(30, 64))
+        gallery = FaceGallery()
+        gallery.add(crowd, [(1, 1, face_no) for face_no in range(30)])  # 질의와 매우 비슷한 얼굴 30개
+        gallery.add(self.encodings, [(i + 2, 1, 0) for i in range(len(self.encodings))])
+        index = BruteForceIndex(64)
+        index.build(gallery.matrix)
+
+        results = search_gallery(index, gallery, query, k=5, exclude_post_id=1)
+        self.assertEqual(len(results), 5)
+        self.assertEqual([r[:3] for r in results], [r[:3] for r in gallery.search(query, k=5, exclude_post_id=1)])
+
+    @override_settings(AI_ANN_INDEX={'BACKEND': 'brute', 'PATH': None, 'REBUILD_INACTIVE_RATIO': 0.1})
+    def test_rebuild_after_removals(self):
+        """
+        삭제된 얼굴이 기준 비율을 넘으면 활성 얼굴만으로 인덱스를 다시 만드는지 확인합니다.
+        """
+        self._reset_ann_index()
+        gallery = FaceGallery()
+        gallery.add(self.encodings[:1000], [(i, 1, 0) for i in range(1000)])
+        index = get_ann_index(gallery)
+        self.assertEqual(index.ntotal, 1000)
+
+        gallery.remove(range(50))  # 기준(10%) 이하: 인덱스 유지, 검색에서만 제외
+        self.assertIs(get_ann_index(gallery), index)
+        results = search_gallery(index, gallery, self.encodings[10], k=5)
+        self.assertEqual(len(results), 5)
+        self.assertNotIn(10, [r[0] for r in results])
+
+        gallery.remove(range(50, 150))  # 기준 초과: 활성 얼굴만으로 다시 만듦
+        rebuilt = get_ann_index(gallery)
+        self.assertIsNot(rebuilt, index)
+        self.assertEqual(rebuilt.ntotal, 850)
+
+        gallery.add(self.encodings[1000:1010], [(i, 1, 0) for i in range(1000, 1010)])  # 새 얼굴은 행 번호 그대로 추가
+        self.assertEqual(get_ann_index(gallery).ntotal, 860)
+        self.assertEqual(search_gallery(rebuilt, gallery, self.encodings[1005], k=1)[0][0], 1005)
+
+    def test_rebuild_mismatched_saved_index(self):
+        """
+        저장된 인덱스의 벡터 수가 갤러리보다 많으면 갤러리로 다시 만드는지 확인합니다.
+        """
+        self._reset_ann_index()
+        gallery = FaceGallery()
+        gallery.add(self.encodings[:100], [(i, 1, 0) for i in range(100)])
+
+        with tempfile.TemporaryDirectory() as directory:
+            saved = BruteForceIndex(64)
+            saved.build(self.encodings)  # 더 큰 (이전) 갤러리로 만든 인덱스
+            saved.save(directory)
+
+            with override_settings(AI_ANN_INDEX={'BACKEND': 'brute', 'PATH': directory}), self.assertLogs('pybo', level='WARNING'):
+                index = get_ann_index(gallery)
+            self.assertEqual(index.ntotal, 100)
+            self.assertEqual(search_gallery(index, gallery, self.encodings[99], k=1)[0][0], 99)
+            del index, saved  # 메모리 맵을 닫은 뒤 임시 디렉터리 삭제
+
+
+job_calls = []  # 테스트 작업의 실행 기록
+
+
+@jobs.job('test.record')
+def record_job(value: int) -> None:
+    job_calls.append(value)
+
+
+@jobs.job('test.flaky', on_failure=lambda value: job_calls.append(('failed', value)))
+def flaky_job(value: int) -> None:
+    job_calls.append(('attempt', value))
+    raise RuntimeError('일시적인 오류')
+
+
+class JobQueueTest(TestCase):
+    """
+    AI 작업 큐(pybo.jobs)를 테스트하는 클래스입니다.
+
+    Methods
+    -------
+    test_priority_order():
+        우선순위 숫자가 작은 작업부터 실행되는지 확인합니다.
+
+    test_retry_then_fail():
+        실패한 작업이 MAX_RETRIES만큼 재시도된 뒤 실패로 기록되고 on_failure가 호출되는지 확인합니다.
+
+    test_visibility_timeout():
+        완료되지 않은 작업이 가시성 타임아웃 뒤 다시 실행되는지 확인합니다.
+
+    test_expired_lease_ignored():
+        임대가 만료된 워커의 ack/retry/bury가 다시 가져간 워커의 작업을 바꾸지 않는지 확인합니다.
+
+    test_crashing_job_buried():
+        매번 완료를 알리지 못하는 작업이 max_retries + 1회 실행된 뒤 실패로 기록되는지 확인합니다.
+
+    test_enqueue_after_commit():
+        enqueue()가 트랜잭션 커밋 후에 작업을 넣는지 확인합니다.
+
+    test_thread_backend_dispatch():
+        'thread' 백엔드가 작업을 바로 실행하는지 확인합니다.
+    """
+
+    def setUp(self):
+        """
+        임시 sqlite 작업 큐를 만듭니다.
+        """
+        job_calls.clear()
+        self.directory = tempfile.TemporaryDirectory()
+        self.backend = jobs.create_job_backend({
+            'BACKEND': 'sqlite', 'DB_PATH': os.path.join(self.directory.name, 'jobs.sqlite3'),
+            'MAX_RETRIES': 2, 'RETRY_BACKOFF': 0, 'POLL_INTERVAL': 0.05,
+        })
+
+    def tearDown(self):
+        jobs._job_backend = None
+        self.directory.cleanup()
+
+    def test_priority_order(self):
+        """
+        우선순위 숫자가 작은 작업부터 실행되는지 확인합니다.
+        """
+        self.backend.enqueue('test.record', {'value': 1}, priority=jobs.PRIORITY_LOW)
+        self.backend.enqueue('test.record', {'value': 2}, priority=jobs.PRIORITY_NORMAL)
+        self.backend.enqueue('test.record', {'value': 3}, priority=jobs.PRIORITY_HIGH)
+
+        self.assertEqual(self.backend.work(burst=True), 3)
+        self.assertEqual(job_calls, [3, 2, 1])
+        self.assertEqual(self.backend.stats(), {'queued': 0, 'running': 0, 'failed': 0})
+
+    def test_retry_then_fail(self):
+        """
+        실패한 작업이 MAX_RETRIES만큼 재시도된 뒤 실패로 기록되고 on_failure가 호출되는지 확인합니다.
+        """
+        self.backend.enqueue('test.flaky', {'value': 7})
+        self.backend.work(burst=True)
+
+        self.assertEqual(job_calls, [('attempt', 7)] * 3 + [('failed', 7)])  # 첫 실행 + 재시도 2회
+        self.assertEqual(self.backend.stats()['failed'], 1)
+        self.assertEqual(self.backend.retry_delay(3), 0)
+
+    def test_visibility_timeout(self):
+        """
+        완료되지 않은 작업이 가시성 타임아웃 뒤 다시 실행되는지 확인합니다.
+        """
+        self.backend.enqueue('test.record', {'value': 5})
+        lost = self.backend.claim()  # 워커가 작업을 가져간 뒤 종료된 상황
+        self.assertIsNone(self.backend.claim())
+
+        self.backend.visibility_timeout = 0
+        self.backend._connection().execute('UPDATE job_queue SET leased_until = 0 WHERE id = ?', (lost.id,))
+        reclaimed = self.backend.claim()
+        self.assertEqual((reclaimed.id, reclaimed.attempts), (lost.id, 2))
+
+    def test_expired_lease_ignored(self):
+        """
+        임대가 만료된 워커의 ack/retry/bury가 다시 가져간 워커의 작업을 바꾸지 않는지 확인합니다.
+        """
+        self.backend.enqueue('test.record', {'value': 6})
+        slow = self.backend.claim()  # 가시성 타임아웃보다 오래 실행되는 워커
+        self.backend._connection().execute('UPDATE job_queue SET leased_until = 0 WHERE id = ?', (slow.id,))
+        current = self.backend.claim()  # 다른 워커가 다시 가져감
+        self.assertEqual((current.id, current.attempts), (slow.id, 2))
+
+        with self.assertLogs('pybo', level='WARNING'):
+            self.backend.ack(slow)
+            self.backend.retry(slow, 0, 'late')
+            self.backend.bury(slow, 'late')
+        self.assertEqual(self.backend.stats(), {'queued': 0, 'running': 1, 'failed': 0})
+        self.assertIsNone(self.backend.claim())  # 다시 대기 상태로 돌아가지 않음
+
+        self.backend.ack(current)
+        self.assertEqual(self.backend.stats(), {'queued': 0, 'running': 0, 'failed': 0})
+
+    def test_crashing_job_buried(self):
+        """
+        매번 완료를 알리지 못하는 작업이 max_retries + 1회 실행된 뒤 실패로 기록되는지 확인합니다.
+        """
+        self.backend.enqueue('test.flaky', {'value': 8})
+        for attempt in range(1, 4):  # 첫 실행 + 재시도 2회, 매번 워커가 작업 도중 종료됨
+            crashed = self.backend.claim()
+            self.assertEqual(crashed.attempts, attempt)
+            self.backend._connection().execute('UPDATE job_queue SET leased_until = 0 WHERE id = ?', (crashed.id,))
+
+        with self.assertLogs('pybo', level='ERROR'):
+            self.assertIsNone(self.backend.claim())
+        self.assertEqual(self.backend.stats(), {'queued': 0, 'running': 0, 'failed': 1})
+        self.assertEqual(job_calls, [('failed', 8)])
+
+    def test_enqueue_after_commit(self):
+        """
+        enqueue()가 트랜잭션 커밋 후에 작업을 넣는지 확인합니다.
+        """
+        jobs._job_backend = self.backend
+        with self.captureOnCommitCallbacks(execute=True):
+            record_job.enqueue(value=9)
+            self.assertEqual(self.backend.stats()['queued'], 0)
+        self.assertEqual(self.backend.stats()['queued'], 1)
+
+        with self.assertRaises(TypeError):
+            record_job.enqueue(value=object())  # JSON으로 변환할 수 없는 인자
+
+    def test_thread_backend_dispatch(self):
+        """
+        'thread' 백엔드가 작업을 바로 실행하는지 확인합니다.
+        """
+        backend = jobs.create_job_backend({'BACKEND': 'thread', 'WORKERS': 1})
+        for value in range(3):
+            backend.enqueue('test.record', {'value': value})
+
+        for _ in range(100):
+            if len(job_calls) == 3:
+                break
+            time.sleep(0.01)
+        self.assertEqual(sorted(job_calls), [0, 1, 2])
+
+
+class AIClientTest(TestCase):
+    """
+    AI 서버용 공유 HTTP 클라이언트(pybo.ai_client)를 테스트하는 클래스입니다.
+
+    Methods
+    -------
+    test_client_is_shared():
+        같은 프로세스에서는 같은 클라이언트(연결 풀)를 재사용하는지 확인합니다.
+
+    test_settings_applied():
+        settings.AI_SERVER의 주소와 타임아웃이 클라이언트에 적용되는지 확인합니다.
+    """
+
+    def tearDown(self):
+        close_ai_clients()
+
+    def test_client_is_shared(self):
+        """
+        같은 프로세스에서는 같은 클라이언트(연결 풀)를 재사용하는지 확인합니다.
+        """
+        client = get_ai_client()
+        self.assertIs(get_ai_client(), client)
+
+        close_ai_clients()
+        self.assertTrue(client.is_closed)
+        self.assertIsNot(get_ai_client(), client)
+
+    @override_settings(AI_SERVER={'BASE_URL': 'http://127.0.0.1:9000', 'TIMEOUT': {'READ': 12.0}})
+    def test_settings_applied(self):
+        """
+        settings.AI_SERVER의 주소와 타임아웃이 클라이언트에 적용되는지 확인합니다.
+        """
+        close_ai_clients()
+        client = get_ai_client()
+        self.assertEqual(str(client.base_url), 'http://127.0.0.1:9000')
+        self.assertEqual(client.timeout.read, 12.0)
+        self.assertEqual(client.timeout.connect, 5.0)  # 지정하지 않은 값은 기본값 사용
+
+
+class MarkdownCacheTest(TestCase):
+    """
+    마크다운 변환 캐시(pybo.markdown_cache)를 테스트하는 클래스입니다.
+
+    Methods
+    -------
+    test_render_matches_markdown():
+        캐시된 결과가 markdown.markdown()의 결과와 같고, 두 번째 호출은 캐시에서 읽는지 확인합니다.
+
+    test_lru_bound_and_shared_tier():
+        프로세스 계층이 MAX_ENTRIES개로 제한되고, 제거된 항목은 공유 계층에서 다시 읽는지 확인합니다.
+
+    test_prerender_on_save():
+        댓글을 저장하거나 수정하면 본문이 미리 변환되는지 확인합니다.
+    """
+
+    text = "# 제목\n\n본문 첫 줄\n둘째 줄\n\n```python\nprint('hi')\n```"
+
+    def test_render_matches_markdown(self):
+        """
+        캐시된 결과가 markdown.markdown()의 결과와 같고, 두 번째 호출은 캐시에서 읽는지 확인합니다.
+        """
+        cache = MarkdownCache(cache_alias=None)
+        expected = markdown.markdown(self.text, extensions=MARKDOWN_EXTENSIONS)
+
+        self.assertEqual(cache.render(self.text), expected)
+        self.assertEqual(cache.render(self.text), expected)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(cache.render(""), "")
+
+    def test_lru_bound_and_shared_tier(self):
+        """
+        프로세스 계층이 MAX_ENTRIES개로 제한되고, 제거된 항목은 공유 계층에서 다시 읽는지 확인합니다.
+        """
+        cache = MarkdownCache(max_entries=2)
+        for i in range(3):
+            cache.render(f"본문 {i} {self.id()}")
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.misses, 3)
+
+        cache.render(f"본문 0 {self.id()}")  # 프로세스 계층에서는 제거되었지만 공유 계층에 있음
+        self.assertEqual(cache.misses, 3)
+
+    def test_prerender_on_save(self):
+        """
+        댓글을 저장하거나 수정하면 본문이 미리 변환되는지 확인합니다.
+        """
+        user = User.objects.create_user(username='writer', password='pw')
+        post = SimilarityPostModel.objects.create(author=user, subject='제목', content='본문')
+        comment = SimilarityCommentModel.objects.create(author=user, post=post, content='**굵게**')
+        cache = get_markdown_cache()
+
+        misses = cache.misses
+        cache.render('**굵게**')
+        comment.content = '*기울임*'
+        comment.save()
+        cache.render('*기울임*')
+        self.assertEqual(cache.misses, misses + 1)  # 수정 후 저장 시 한 번만 변환
+
+
+class PostSearchTest(TestCase):
+    """
+    게시글 전문 검색(pybo.search)을 테스트하는 클래스입니다.
+
+    Methods
+    -------
+    test_ngram_tokens():
+        한국어/영어 문자열이 2글자 n-gram으로 나뉘는지 확인합니다.
+
+    test_matches_icontains():
+        검색 인덱스의 결과가 icontains 검색 결과와 같은지 확인합니다.
+
+    test_index_kept_in_sync():
+        게시글 수정/삭제와 작성자 이름 변경이 검색 인덱스에 반영되는지 확인합니다.
+
+    test_list_view_search():
+        목록 화면의 'kw' 검색이 검색 인덱스를 사용하는지 확인합니다.
+    """
+
+    search_fields = ['subject', 'content', 'author__username']
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(username='searcher', password='pw')
+        cls.other = User.objects.create_user(username='다른사용자', password='pw')
+        cls.posts = [
+            SimilarityPostModel.objects.create(author=cls.author, subject='얼굴 유사도 비교', content='두 사진의 얼굴이 닮았나요?'),
+            SimilarityPostModel.objects.create(author=cls.other, subject='Face similarity', content='Deep learning 모델'),
+            SimilarityPostModel.objects.create(author=cls.author, subject='질문', content='유사도 점수가 너무 낮게 나와요'),
+        ]
+
+    def test_ngram_tokens(self):
+        """
+        한국어/영어 문자열이 2글자 n-gram으로 나뉘는지 확인합니다.
+        """
+        self.assertEqual(ngram_tokens('얼굴 유사도!'), ['얼굴', '유사', '사도'])
+        self.assertEqual(ngram_tokens('Face'), ['fa', 'ac', 'ce'])
+        self.assertEqual(ngram_tokens(''), [])
+
+    def test_matches_icontains(self):
+        """
+        검색 인덱스의 결과가 icontains 검색 결과와 같은지 확인합니다.
+        """
+        backend = get_search_backend()
+        self.assertEqual(backend.name, 'fts5')
+        queryset = SimilarityPostModel.objects.all()
+        for keyword in ['유사도', '얼굴', '사도 점', 'face', 'LEARNING', '다른사용', 'searcher', '닮', '없는검색어']:
+            with self.subTest(keyword=keyword):
+                expected = set(LikeSearchBackend().filter(queryset, keyword, self.search_fields).values_list('pk', flat=True))
+                found = set(backend.filter(queryset, keyword, self.search_fields).values_list('pk', flat=True))
+                self.assertEqual(found, expected)
+
+    def test_index_kept_in_sync(self):
+        """
+        게시글 수정/삭제와 작성자 이름 변경이 검색 인덱스에 반영되는지 확인합니다.
+        """
+        backend = get_search_backend()
+
+        def search(keyword):
+            return set(backend.filter(SimilarityPostModel.objects.all(), keyword, self.search_fields).values_list('pk', flat=True))
+
+        post = self.posts[2]
+        post.content = '대통령 사진'
+        post.save()
+        self.assertEqual(search('대통령'), {post.pk})
+        self.assertEqual(search('점수가'), set())
+
+        self.other.username = 'renamed'
+        self.other.save()
+        self.assertEqual(search('renamed'), {self.posts[1].pk})
+
+        post.delete()
+        self.assertEqual(search('대통령'), set())
+
+    def test_list_view_search(self):
+        """
+        목록 화면의 'kw' 검색이 검색 인덱스를 사용하는지 확인합니다.
+        """
+        url = reverse('pybo:similarity_post_list')
+        response = self.client.get(url, {'kw': '유사도'})
+        self.assertEqual(
+            {post.pk for _, post in response.context['post_indices']}, {self.posts[0].pk, self.posts[2].pk}
+        )
+
+
+class CursorPaginationTest(TestCase):
+    """
+    커서 페이지네이션(pybo.pagination)을 테스트하는 클래스입니다.
+
+    Methods
+    -------
+    test_walk_forward_and_back():
+        다음/이전 토큰으로 모든 페이지를 빠짐없이, 중복 없이 오가는지 확인합니다.
+
+    test_invalid_cursor():
+        조작된 토큰은 첫 페이지로 처리하는지 확인합니다.
+
+    test_list_view_cursor_mode():
+        커서 방식 목록 화면이 COUNT(*) 없이 페이지 번호 방식과 같은 행 번호를 표시하는지 확인합니다.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(username='author', password='pw')
+        for i in range(25):
+            SimilarityPostModel.objects.create(author=cls.author, subject=f'제목 {i}', content='내용')
+        # 작성 시각이 같은 글도 (create_date, id) 순서로 구분되는지 확인하기 위해 일부 글의 시각을 같게 맞춤
+        same_time = SimilarityPostModel.objects.order_by('pk')[5].create_date
+        SimilarityPostModel.objects.filter(pk__in=list(SimilarityPostModel.objects.order_by('pk').values_list('pk', flat=True)[5:15])).update(create_date=same_time)
+        cls.expected = list(SimilarityPostModel.objects.order_by('-create_date', '-id').values_list('pk', flat=True))
+
+    def test_walk_forward_and_back(self):
+        """
+        다음/이전 토큰으로 모든 페이지를 빠짐없이, 중복 없이 오가는지 확인합니다.
+        """
+        queryset = SimilarityPostModel.objects.all()
+        pages, token = [], None
+        while True:
+            page = paginate_by_cursor(queryset, token, 10)
+            pages.append(page)
+            if not page.has_next:
+                break
+            token = page.next_cursor
+
+        self.assertEqual([post.pk for page in pages for post in page.object_list], self.expected)
+        self.assertEqual([len(page.object_list) for page in pages], [10, 10, 5])
+        self.assertEqual([page.start_offset for page in pages], [0, 10, 20])
+        self.assertFalse(pages[0].has_previous)
+
+        back = paginate_by_cursor(queryset, pages[2].previous_cursor, 10)
+        self.assertEqual([post.pk for post in back.object_list], [post.pk for post in pages[1].object_list])
+        self.assertEqual(back.start_offset, 10)
+        first = paginate_by_cursor(queryset, back.previous_cursor, 10)
+        self.assertEqual([post.pk for post in first.object_list], self.expected[:10])
+        self.assertEqual(first.start_offset, 0)
+        self.assertFalse(first.has_previous)
+
+        # 위치가 없는 이전 형식의 토큰은 인덱스 범위 COUNT로 위치를 계산
+        legacy = paginate_by_cursor(queryset, encode_cursor(pages[1].object_list[-1], NEXT), 10)
+        self.assertEqual(legacy.start_offset, 20)
+
+    def test_invalid_cursor(self):
+        """
+        조작된 토큰은 첫 페이지로 처리하는지 확인합니다.
+        """
+        page = paginate_by_cursor(SimilarityPostModel.objects.all(), 'tampered:token', 10)
+        self.assertEqual([post.pk for post in page.object_list], self.expected[:10])
+
+    def test_list_view_cursor_mode(self):
+        """
+        커서 방식 목록 화면이 COUNT(*) 없이 페이지 번호 방식과 같은 행 번호를 표시하는지 확인합니다.
+        """
+        url = reverse('pybo:similarity_post_list')
+        get_post_counter().total(SimilarityPostModel)  # 게시글 수 기록 생성
+        with self.assertNumQueries(2):  # 목록 조회 + 게시판 게시글 수 (COUNT(*) 없음)
+            response = self.client.get(url, {'mode': 'cursor'})
+        cursor_page = response.context['cursor_page']
+        self.assertEqual([obj.pk for _, obj in response.context['post_indices']], self.expected[:10])
+        self.assertEqual([number for number, _ in response.context['post_indices']], list(range(25, 15, -1)))
+
+        with self.assertNumQueries(2):
+            response = self.client.get(url, {'mode': 'cursor', 'cursor': cursor_page.next_cursor})
+        self.assertEqual([obj.pk for _, obj in response.context['post_indices']], self.expected[10:20])
+        self.assertEqual([number for number, _ in response.context['post_indices']], list(range(15, 5, -1)))
+
+        page_mode = self.client.get(url, {'mode': 'page', 'page': 2})
+        self.assertEqual(
+            [number for number, _ in page_mode.context['post_indices']], [number for number, _ in response.context['post_indices']]
+        )
+        self.assertContains(response, 'data-cursor=')
+
+
+class PostCounterTest(TestCase):
+    """
+    게시글 수 카운터(pybo.counters)를 테스트하는 클래스입니다.
+
+    Methods
+    -------
+    test_total_follows_create_and_delete():
+        게시글 작성/삭제 시 게시판별 게시글 수가 증감하는지 확인합니다.
+
+    test_recount():
+        시그널을 거치지 않고 어긋난 게시글 수를 다시 계산하는지 확인합니다.
+
+    test_list_numbering():
+        목록 화면의 게시글 번호가 삭제 후에도 올바른지 확인합니다.
+
+    test_search_count_cached():
+        검색 결과 수를 캐시하여 보관 시간 동안 다시 세지 않는지 확인합니다.
+
+    test_search_count_capped():
+        검색 결과가 최대 개수보다 많으면 최대 개수를 반환하는지 확인합니다.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(username='author', password='pw')
+        cls.posts = [
+            SimilarityPostModel.objects.create(author=cls.author, subject=f'제목 {i}', content='내용') for i in range(12)
+        ]
+
+    def setUp(self):
+        cache.clear()
+
+    def test_total_follows_create_and_delete(self):
+        """
+        게시글 작성/삭제 시 게시판별 게시글 수가 증감하는지 확인합니다.
+        """
+        counter = get_post_counter()
+        self.assertEqual(counter.total(SimilarityPostModel), 12)
+        self.assertEqual(counter.total(DetectionPostModel), 0)
+
+        DetectionPostModel.objects.create(author=self.author, subject='제목', content='내용')
+        self.posts[0].delete()
+        self.assertEqual(counter.total(SimilarityPostModel), 11)
+        self.assertEqual(counter.total(DetectionPostModel), 1)
+
+        self.author.delete()  # 작성자 삭제로 함께 삭제되는 게시글도 반영
+        self.assertEqual(counter.total(SimilarityPostModel), 0)
+        self.assertEqual(counter.total(DetectionPostModel), 0)
+
+    def test_recount(self):
+        """
+        시그널을 거치지 않고 어긋난 게시글 수를 다시 계산하는지 확인합니다.
+        """
+        counter = get_post_counter()
+        SimilarityPostModel.objects.bulk_create(
+            [SimilarityPostModel(author=self.author, subject='제목', content='내용') for _ in range(3)]
+        )
+        self.assertEqual(counter.total(SimilarityPostModel), 12)  # bulk_create는 시그널을 보내지 않음
+        self.assertEqual(counter.recount(SimilarityPostModel), 15)
+        self.assertEqual(counter.total(SimilarityPostModel), 15)
+
+        PostCountModel.objects.all().delete()  # 기록이 없으면 COUNT(*)로 다시 만듦
+        self.assertEqual(counter.total(SimilarityPostModel), 15)
+
+    def test_list_numbering(self):
+        """
+        목록 화면의 게시글 번호가 삭제 후에도 올바른지 확인합니다.
+        """
+        self.posts[-1].delete()
+        response = self.client.get(reverse('pybo:similarity_post_list'), {'mode': 'page', 'page': 2})
+        self.assertEqual(response.context['paginator'].num_pages, 2)
+        self.assertEqual([number for number, _ in response.context['post_indices']], [1])
+
+    def test_search_count_cached(self):
+        """
+        검색 결과 수를 캐시하여 보관 시간 동안 다시 세지 않는지 확인합니다.
+        """
+        url = reverse('pybo:similarity_post_list')
+        params = {'mode': 'page', 'kw': '제목'}
+        with self.assertNumQueries(2):  # 검색 결과 수 + 현재 페이지
+            response = self.client.get(url, params)
+        self.assertEqual(response.context['paginator'].count, 12)
+
+        SimilarityPostModel.objects.create(author=self.author, subject='제목 새 글', content='내용')
+        with self.assertNumQueries(1):  # 캐시된 검색 결과 수 사용
+            response = self.client.get(url, params)
+        self.assertEqual(response.context['paginator'].count, 12)  # 보관 시간 동안은 이전 값
+
+        cache.clear()
+        response = self.client.get(url, params)
+        self.assertEqual(response.context['paginator'].count, 13)
+
+    def test_search_count_capped(self):
+        """
+        검색 결과가 최대 개수보다 많으면 최대 개수를 반환하는지 확인합니다.
+        """
+        counter = PostCounter(cache_alias=None, search_max_count=5)
+        self.assertEqual(counter.filtered(SimilarityPostModel.objects.filter(subject__startswith='제목')), 5)
+        self.assertEqual(counter.filtered(SimilarityPostModel.objects.filter(subject='제목 3')), 1)
+
+
+class DenormalizedCountTest(TestCase):
+    """
+    게시글/댓글에 저장된 추천 수(vote_count)와 댓글 수(comment_count)를 테스트하는 클래스입니다.
+
+    Methods
+    -------
+    test_vote_view_toggles_count():
+        추천/추천 취소 시 vote_count가 증감하는지 확인합니다.
+
+    test_comment_create_and_delete():
+        댓글 작성/삭제 시 comment_count가 증감하는지 확인합니다.
+
+    test_reverse_and_user_delete():
+        사용자 쪽에서 추천을 바꾸거나 사용자를 삭제해도 vote_count가 맞는지 확인합니다.
+
+    test_remove_non_voter_and_repeated_signal():
+        추천하지 않은 사용자를 remove()하거나 같은 추가 시그널이 두 번 와도 vote_count가 실제 추천 수와 같은지 확인합니다.
+
+    test_repair_counts():
+        시그널을 거치지 않고 어긋난 값을 repair_counts 명령이 고치는지 확인합니다.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(username='author', password='pw')
+        cls.voter = User.objects.create_user(username='voter', password='pw')
+        cls.post = SimilarityPostModel.objects.create(author=cls.author, subject='제목', content='내용')
+
+    def _refresh(self):
+        self.post.refresh_from_db()
+        return self.post
+
+    def test_vote_view_toggles_count(self):
+        """
+        추천/추천 취소 시 vote_count가 증감하는지 확인합니다.
+        """
+        url = reverse('pybo:similarity_post_vote', kwargs={'pk': self.post.pk})
+        self.client.force_login(self.voter)
+        self.client.get(url)
+        self.assertEqual(self._refresh().vote_count, 1)
+        self.client.get(url)  # 추천 취소
+        self.assertEqual(self._refresh().vote_count, 0)
+
+        self.client.force_login(self.author)
+        self.client.get(url)  # 본인 글은 추천할 수 없음
+        self.assertEqual(self._refresh().vote_count, 0)
+
+        self.post.voter.add(self.voter)
+        self.post.voter.add(self.voter)  # 이미 추천한 사용자는 다시 세지 않음
+        self.assertEqual(self._refresh().vote_count, 1)
+        self.post.voter.clear()
+        self.assertEqual(self._refresh().vote_count, 0)
+
+    def test_comment_create_and_delete(self):
+        """
+        댓글 작성/삭제 시 comment_count가 증감하는지 확인합니다.
+        """
+        self.client.force_login(self.voter)
+        self.client.post(reverse('pybo:similarity_comment_create', kwargs={'pk': self.post.pk}), {'content': '댓글'})
+        comment = SimilarityCommentModel.objects.create(author=self.author, post=self.post, content='AI가 처리 중입니다.')
+        self.assertEqual(self._refresh().comment_count, 2)
+
+        comment.voter.add(self.voter)
+        comment.refresh_from_db()
+        self.assertEqual(comment.vote_count, 1)
+
+        mine = SimilarityCommentModel.objects.get(author=self.voter)
+        self.client.get(reverse('pybo:similarity_comment_delete', kwargs={'pk': mine.pk}))
+        self.assertEqual(self._refresh().comment_count, 1)
+
+        response = self.client.get(reverse('pybo:similarity_post_read', kwargs={'pk': self.post.pk}))
+        self.assertEqual([c['voter_count'] for c in response.context['processed_comments']], [1])
+
+    def test_reverse_and_user_delete(self):
+        """
+        사용자 쪽에서 추천을 바꾸거나 사용자를 삭제해도 vote_count가 맞는지 확인합니다.
+        """
+        other = SimilarityPostModel.objects.create(author=self.author, subject='제목2', content='내용')
+        self.voter.voter_similaritypostmodel.add(self.post, other)
+        self.assertEqual(self._refresh().vote_count, 1)
+        self.voter.voter_similaritypostmodel.remove(other)
+        other.refresh_from_db()
+        self.assertEqual(other.vote_count, 0)
+
+        self.voter.voter_similaritypostmodel.add(other)
+        self.voter.voter_similaritypostmodel.clear()
+        other.refresh_from_db()
+        self.assertEqual((self._refresh().vote_count, other.vote_count), (0, 0))
+
+        self.post.voter.add(self.voter)
+        self.voter.delete()
+        self.assertEqual(self._refresh().vote_count, 0)
+
+    def test_remove_non_voter_and_repeated_signal(self):
+        """
+        추천하지 않은 사용자를 remove()하거나 같은 추가 시그널이 두 번 와도 vote_count가 실제 추천 수와 같은지 확인합니다.
+        """
+        from django.db.models.signals import m2m_changed
+
+        self.post.voter.remove(self.voter)  # 추천하지 않은 사용자 (pk_set에는 포함됨)
+        self.assertEqual(self._refresh().vote_count, 0)
+
+        self.post.voter.add(self.voter)
+        self.post.voter.remove(self.voter)
+        self.post.voter.remove(self.voter)  # 두 번 클릭
+        self.assertEqual(self._refresh().vote_count, 0)
+
+        # 동시에 실행된 add()가 둘 다 같은 ID로 post_add를 보내는 경우
+        self.post.voter.add(self.voter)
+        through = SimilarityPostModel.voter.through
+        m2m_changed.send(
+            sender=through, instance=self.post, action='post_add', reverse=False, model=User, pk_set={self.voter.pk}, using='default',
+        )
+        self.assertEqual(self._refresh().vote_count, 1)
+
+    def test_repair_counts(self):
+        """
+        시그널을 거치지 않고 어긋난 값을 repair_counts 명령이 고치는지 확인합니다.
+        """
+        SimilarityCommentModel.objects.bulk_create(
+            [SimilarityCommentModel(author=self.voter, post=self.post, content='댓글') for _ in range(3)]
+        )
+        self.post.voter.add(self.voter)
+        SimilarityPostModel.objects.filter(pk=self.post.pk).update(vote_count=5)
+
+        self.assertEqual(repair_counts(SimilarityPostModel, dry_run=True), 1)
+        self.assertEqual((self._refresh().vote_count, self.post.comment_count), (5, 0))
+
+        call_command('repair_counts', stdout=StringIO())
+        self.assertEqual((self._refresh().vote_count, self.post.comment_count), (1, 3))
+        self.assertEqual(repair_counts(SimilarityPostModel), 0)
+
+
+class ViewCounterTest(TestCase):
+    """
+    게시글 조회수 카운터(pybo.view_counter)를 테스트하는 클래스입니다.
+
+    Methods
+    -------
+    test_flush_batches_increments():
+        조회수를 모았다가 한 번에 기록하고, 같은 증가분을 두 번 기록하지 않는지 확인합니다.
+
+    test_threshold_flush():
+        모인 조회수가 기준 이상이면 바로 기록하는지 확인합니다.
+
+    test_failed_flush_keeps_increments():
+        기록에 실패하면 증가분을 되돌려 놓고 다음에 기록하는지 확인합니다.
+
+    test_discard_after_fork():
+        fork로 만든 프로세스는 부모의 증가분을 기록하지 않는지 확인합니다.
+
+    test_read_view_shows_pending_views():
+        상세 페이지가 아직 기록하지 않은 조회수까지 표시하는지 확인합니다.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(username='author', password='pw')
+        cls.post = SimilarityPostModel.objects.create(author=cls.author, subject='제목', content='내용')
+        cls.other = DetectionPostModel.objects.create(author=cls.author, subject='제목', content='내용')
+
+    def _view_counts(self):
+        self.post.refresh_from_db()
+        self.other.refresh_from_db()
+        return self.post.view_count, self.other.view_count
+
+    def test_flush_batches_increments(self):
+        """
+        조회수를 모았다가 한 번에 기록하고, 같은 증가분을 두 번 기록하지 않는지 확인합니다.
+        """
+        counter = ViewCounter(flush_threshold=100, flush_interval=3600)
+        for _ in range(3):
+            counter.record(SimilarityPostModel, self.post.pk)
+        self.assertEqual(counter.record(DetectionPostModel, self.other.pk), 1)
+        self.assertEqual(self._view_counts(), (0, 0))
+        self.assertEqual(counter.pending(SimilarityPostModel, self.post.pk), 3)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(counter.flush(), 4)
+        self.assertEqual(sum(query['sql'].startswith('UPDATE') for query in queries), 2)  # 게시판마다 UPDATE 1개
+        self.assertEqual(self._view_counts(), (3, 1))
+        self.assertEqual(counter.flush(), 0)
+        self.assertEqual(self._view_counts(), (3, 1))
+
+    def test_threshold_flush(self):
+        """
+        모인 조회수가 기준 이상이면 바로 기록하는지 확인합니다.
+        """
+        counter = ViewCounter(flush_threshold=5, flush_interval=3600)
+        for _ in range(4):
+            counter.record(SimilarityPostModel, self.post.pk)
+        self.assertEqual(self._view_counts(), (0, 0))
+        self.assertEqual(counter.record(SimilarityPostModel, self.post.pk), 5)
+        self.assertEqual(self._view_counts(), (5, 0))
+        self.assertEqual(counter.pending(SimilarityPostModel, self.post.pk), 0)
+
+    def test_failed_flush_keeps_increments(self):
+        """
+        기록에 실패하면 증가분을 되돌려 놓고 다음에 기록하는지 확인합니다.
+        """
+        counter = ViewCounter(flush_threshold=100, flush_interval=3600)
+        counter.record(SimilarityPostModel, self.post.pk)
+        with mock.patch.object(SimilarityPostModel.objects, 'filter', side_effect=DatabaseError):
+            self.assertEqual(counter.flush(), 0)
+        self.assertEqual(counter.pending(SimilarityPostModel, self.post.pk), 1)
+        self.assertEqual(counter.flush(), 1)
+        self.assertEqual(self._view_counts(), (1, 0))
+
+    def test_discard_after_fork(self):
+        """
+        fork로 만든 프로세스는 부모의 증가분을 기록하지 않는지 확인합니다.
+        """
+        counter = ViewCounter(flush_threshold=100, flush_interval=3600)
+        counter.record(SimilarityPostModel, self.post.pk)
+        counter._pid = -1  # 다른 프로세스에서 모은 증가분으로 만듦
+        self.assertEqual(counter.flush(), 0)
+        self.assertEqual(self._view_counts(), (0, 0))
+
+    def test_read_view_shows_pending_views(self):
+        """
+        상세 페이지가 아직 기록하지 않은 조회수까지 표시하는지 확인합니다.
+        """
+        counter = get_view_counter()
+        counter.clear()  # 다른 테스트에서 모인 조회수 (ID가 같은 게시글에 기록되지 않도록)
+        self.client.force_login(self.author)  # 로그인하지 않은 사용자의 페이지는 캐시되어 조회수가 늦게 반영됨
+        url = reverse('pybo:similarity_post_read', kwargs={'pk': self.post.pk})
+        self.client.get(url)
+        response = self.client.get(url)
+        self.assertEqual(response.context['post'].view_count, 2)
+        self.assertContains(response, '조회 2')
+
+        counter.flush()
+        self.assertEqual(self._view_counts(), (2, 0))
+        response = self.client.get(reverse('pybo:similarity_post_list'), {'mode': 'page'})
+        self.assertEqual(response.context['post_indices'][0][1].view_count, 2)
+
+
+class UniqueViewerTest(TestCase):
+    """
+    HyperLogLog 스케치(pybo.hyperloglog)와 게시글 순 방문자 수를 테스트하는 클래스입니다.
+
+    Methods
+    -------
+    test_estimate_within_error_bound():
+        추정값이 표준 오차의 3배 안에 있는지 확인합니다.
+
+    test_merge_and_serialize():
+        스케치를 합친 결과가 합집합의 추정값과 같고, 바이트로 저장/복원되는지 확인합니다.
+
+    test_merge_across_workers():
+        워커마다 모은 스케치가 저장 시 합쳐지고, 같은 방문자는 한 번만 세는지 확인합니다.
+
+    test_read_view_and_admin_report():
+        상세 페이지 조회가 순 방문자 수에 반영되고 관리자 보고서가 표시되는지 확인합니다.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(username='author', password='pw')
+        cls.post = SimilarityPostModel.objects.create(author=cls.author, subject='제목', content='내용')
+
+    def test_estimate_within_error_bound(self):
+        """
+        추정값이 표준 오차의 3배 안에 있는지 확인합니다.
+        """
+        for n in (0, 1, 100, 20000):
+            with self.subTest(n=n):
+                sketch = HyperLogLog()
+                for i in range(n):
+                    sketch.add(f'u:{i}')
+                    sketch.add(f'u:{i}')  # 같은 방문자는 한 번만 셈
+                self.assertLessEqual(abs(sketch.count() - n), max(1, 3 * standard_error() * n))
+        self.assertEqual(len(HyperLogLog().to_bytes()), 4096)
+
+    def test_merge_and_serialize(self):
+        """
+        스케치를 합친 결과가 합집합의 추정값과 같고, 바이트로 저장/복원되는지 확인합니다.
+        """
+        left, right, union = HyperLogLog(), HyperLogLog(), HyperLogLog()
+        for i in range(3000):
+            left.add(f'u:{i}')
+            union.add(f'u:{i}')
+        for i in range(2000, 5000):
+            right.add(f'u:{i}')
+            union.add(f'u:{i}')
+
+        merged = HyperLogLog.from_bytes(left.to_bytes()).merge(right)
+        self.assertEqual(merged.count(), union.count())
+        self.assertEqual(merged.merge(right).count(), union.count())  # 같은 스케치를 다시 합쳐도 같음
+        with self.assertRaises(ValueError):
+            merged.merge(HyperLogLog(10))
+
+    def test_merge_across_workers(self):
+        """
+        워커마다 모은 스케치가 저장 시 합쳐지고, 같은 방문자는 한 번만 세는지 확인합니다.
+        """
+        first, second = ViewCounter(flush_interval=3600), ViewCounter(flush_interval=3600)
+        for viewer in ('u:1', 'u:2', 'u:1'):
+            first.record(SimilarityPostModel, self.post.pk, viewer=viewer)
+        for viewer in ('u:2', 's:abc'):
+            second.record(SimilarityPostModel, self.post.pk, viewer=viewer)
+        self.assertEqual(second.unique_viewers(SimilarityPostModel, self.post.pk), 2)
+
+        first.flush()
+        self.assertEqual(second.unique_viewers(SimilarityPostModel, self.post.pk), 3)  # 저장된 스케치 + 모인 스케치
+        second.flush()
+
+        self.post.refresh_from_db()
+        self.assertEqual((self.post.view_count, self.post.unique_viewer_count), (5, 3))
+        self.assertEqual(ViewerSketchModel.objects.count(), 1)
+
+    def test_read_view_and_admin_report(self):
+        """
+        상세 페이지 조회가 순 방문자 수에 반영되고 관리자 보고서가 표시되는지 확인합니다.
+        """
+        counter = get_view_counter()
+        counter.clear()
+        url = reverse('pybo:similarity_post_read', kwargs={'pk': self.post.pk})
+        self.client.get(url)  # 익명 방문자
+        admin_user = User.objects.create_superuser(username='admin', password='pw')
+        self.client.force_login(admin_user)
+        self.client.get(url)
+        self.client.get(url)
+        counter.flush()
+
+        self.post.refresh_from_db()
+        self.assertEqual((self.post.view_count, self.post.unique_viewer_count), (3, 2))
+
+        response = self.client.get(reverse('admin:pybo_viewersketchmodel_changelist'))
+        self.assertContains(response, '±3.2%')
+
+
+class VoteToggleTest(TestCase):
+    """
+    추천 토글(pybo.votes)과 추천 뷰를 테스트하는 클래스입니다.
+
+    Methods
+    -------
+    test_query_count_independent_of_voters():
+        추천한 사용자 수와 관계없이 토글의 쿼리 수가 같은지 확인합니다.
+
+    test_json_vote():
+        AJAX(JSON) 요청이 리다이렉트 없이 추천 결과를 반환하는지 확인합니다.
+
+    test_redirect_vote():
+        일반 요청은 메시지와 함께 리다이렉트하는지 확인합니다.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(username='author', password='pw')
+        cls.voter = User.objects.create_user(username='voter', password='pw')
+        cls.post = SimilarityPostModel.objects.create(author=cls.author, subject='제목', content='내용')
+        cls.popular = SimilarityPostModel.objects.create(author=cls.author, subject='인기 글', content='내용')
+        cls.popular.voter.add(*[User.objects.create_user(username=f'fan{i}') for i in range(50)])
+
+    def test_query_count_independent_of_voters(self):
+        """
+        추천한 사용자 수와 관계없이 토글의 쿼리 수가 같은지 확인합니다.
+        """
+        with CaptureQueriesContext(connection) as few:
+            self.assertEqual(toggle_vote(self.post, self.voter), VoteResult(voted=True, vote_count=1))
+        with CaptureQueriesContext(connection) as many:
+            self.assertEqual(toggle_vote(self.popular, self.voter), VoteResult(voted=True, vote_count=51))
+        self.assertEqual(len(few), len(many))
+
+        self.assertEqual(toggle_vote(self.popular, self.voter), VoteResult(voted=False, vote_count=50))
+        self.assertEqual(self.popular.voter.count(), 50)
+
+    def test_json_vote(self):
+        """
+        AJAX(JSON) 요청이 리다이렉트 없이 추천 결과를 반환하는지 확인합니다.
+        """
+        url = reverse('pybo:similarity_post_vote', kwargs={'pk': self.post.pk})
+        self.client.force_login(self.voter)
+        response = self.client.get(url, HTTP_ACCEPT='application/json')
+        self.assertEqual(response.json(), {'voted': True, 'vote_count': 1, 'message': '추천하였습니다.'})
+        response = self.client.get(url, HTTP_ACCEPT='application/json')
+        self.assertEqual(response.json()['vote_count'], 0)
+
+        self.client.force_login(self.author)
+        response = self.client.get(url, HTTP_ACCEPT='application/json')
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.json()['vote_count'], 0)
+
+    def test_redirect_vote(self):
+        """
+        일반 요청은 메시지와 함께 리다이렉트하는지 확인합니다.
+        """
+        self.client.force_login(self.voter)
+        response = self.client.get(reverse('pybo:similarity_post_vote', kwargs={'pk': self.post.pk}), follow=True)
+        self.assertContains(response, '추천하였습니다.')
+        self.assertEqual(response.context['post'].vote_count, 1)
+
+
+class VoteConcurrencyTest(TransactionTestCase):
+    """
+    여러 스레드가 동시에 한 게시글을 추천/취소해도 추천 수가 어긋나지 않는지 확인하는 테스트 클래스입니다.
+
+    스레드마다 별도의 데이터베이스 연결을 사용하므로 TransactionTestCase로 실행합니다.
+    sqlite는 쓰기 트랜잭션을 하나씩 처리하므로 잠금 오류가 나면 클라이언트처럼 다시 시도합니다.
+
+    Methods
+    -------
+    test_hammer_one_post():
+        여러 사용자가 여러 번 토글한 뒤 추천 수가 중간 테이블의 행 수, 토글 횟수와 일치하는지 확인합니다.
+    """
+
+    threads = 8
+    toggles_per_user = 5  # 홀수이면 최종 상태는 추천함
+
+    def _hammer(self, post, users, errors):
+        """
+        각 사용자로 toggles_per_user번 추천을 토글합니다.
+        """
+        try:
+            for _ in range(self.toggles_per_user):
+                for user in users:
+                    while True:
+                        try:
+                            toggle_vote(post, user)
+                            break
+                        except OperationalError:  # sqlite 잠금 (database table is locked)
+                            time.sleep(0.001)
+        except Exception as e:  # 스레드 안의 예외를 테스트 스레드로 전달
+            errors.append(e)
+        finally:
+            close_old_connections()
+            connection.close()
+
+    def test_hammer_one_post(self):
+        """
+        여러 사용자가 여러 번 토글한 뒤 추천 수가 중간 테이블의 행 수, 토글 횟수와 일치하는지 확인합니다.
+        """
+        author = User.objects.create_user(username='author')
+        post = SimilarityPostModel.objects.create(author=author, subject='제목', content='내용')
+        users = [User.objects.create_user(username=f'user{i}') for i in range(self.threads * 2)]
+        shared = users[0]  # 모든 스레드가 함께 토글하는 사용자
+
+        errors = []
+        workers = [
+            threading.Thread(target=self._hammer, args=(post, [users[i * 2 + 1], shared], errors))
+            for i in range(self.threads)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        self.assertEqual(errors, [])
+        post.refresh_from_db()
+        voters = set(post.voter.values_list('pk', flat=True))
+        self.assertEqual(post.vote_count, len(voters))
+        self.assertTrue({users[i * 2 + 1].pk for i in range(self.threads)} <= voters)  # 스레드별 사용자는 홀수 번 토글
+        self.assertEqual(repair_counts(SimilarityPostModel, dry_run=True), 0)
+
+
+class PageCacheTest(TestCase):
+    """
+    게시판 페이지/댓글 조각 캐시(pybo.page_cache)와 시그널의 버전 무효화를 테스트하는 클래스입니다.
+
+    Methods
+    -------
+    test_anonymous_list_cached():
+        로그인하지 않은 사용자의 목록 페이지를 캐시에서 쿼리 없이 반환하고, 새 글이 작성되면 다시 그리는지 확인합니다.
+
+    test_ai_result_invalidates_detail():
+        AI 처리 결과가 저장되면 캐시된 상세 페이지 대신 결과가 표시되는지 확인합니다.
+
+    test_vote_invalidates_detail():
+        추천 버튼으로 추천하면 캐시된 상세 페이지의 추천 수가 바뀌는지 확인합니다.
+
+    test_comment_fragment_cached_per_user():
+        로그인한 사용자의 댓글 목록 조각을 캐시하고, 댓글이 바뀌면 다시 그리는지 확인합니다.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(username='author', password='pw')
+        cls.voter = User.objects.create_user(username='voter', password='pw')
+        cls.post = SimilarityPostModel.objects.create(author=cls.author, subject='첫 글', content='내용')
+
+    def setUp(self):
+        cache.clear()  # 다른 테스트에서 캐시된 페이지 (롤백된 데이터의 페이지가 남지 않도록)
+        get_view_counter().clear()
+
+    def test_anonymous_list_cached(self):
+        """
+        로그인하지 않은 사용자의 목록 페이지를 캐시에서 쿼리 없이 반환하고, 새 글이 작성되면 다시 그리는지 확인합니다.
+        """
+        url = reverse('pybo:similarity_post_list')
+        self.assertContains(self.client.get(url), '첫 글')
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+        self.assertContains(response, '첫 글')
+
+        SimilarityPostModel.objects.create(author=self.author, subject='새 글', content='내용')  # 게시판 버전이 올라감
+        self.assertContains(self.client.get(url), '새 글')
+
+        self.client.force_login(self.author)  # 로그인한 사용자는 캐시하지 않음
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(url)
+        self.assertTrue(any('pybo_similaritypostmodel' in query['sql'] for query in queries))
+
+    def test_ai_result_invalidates_detail(self):
+        """
+        AI 처리 결과가 저장되면 캐시된 상세 페이지 대신 결과가 표시되는지 확인합니다.
+        """
+        comment = SimilarityCommentModel.objects.create(author=self.author, post=self.post, content='AI가 처리 중입니다.')
+        url = reverse('pybo:similarity_post_read', kwargs={'pk': self.post.pk})
+        self.assertContains(self.client.get(url), 'AI가 처리 중입니다.')
+        self.assertContains(self.client.get(url), 'AI가 처리 중입니다.')  # 캐시된 페이지
+
+        comment.content = '두 얼굴의 유사도는 87%입니다.'
+        comment.save()
+        response = self.client.get(url)
+        self.assertContains(response, '두 얼굴의 유사도는 87%입니다.')
+        self.assertNotContains(response, 'AI가 처리 중입니다.')
+
+    def test_vote_invalidates_detail(self):
+        """
+        추천 버튼으로 추천하면 캐시된 상세 페이지의 추천 수가 바뀌는지 확인합니다.
+        """
+        url = reverse('pybo:similarity_post_read', kwargs={'pk': self.post.pk})
+        self.assertContains(self.client.get(url), 'text-success">0</span>')
+
+        toggle_vote(self.post, self.voter)
+        self.assertContains(self.client.get(url), 'text-success">1</span>')
+
+    def test_comment_fragment_cached_per_user(self):
+        """
+        로그인한 사용자의 댓글 목록 조각을 캐시하고, 댓글이 바뀌면 다시 그리는지 확인합니다.
+        """
+        SimilarityCommentModel.objects.create(author=self.voter, post=self.post, content='첫 댓글')
+        url = reverse('pybo:similarity_post_read', kwargs={'pk': self.post.pk})
+        self.client.force_login(self.voter)
+        self.assertContains(self.client.get(url), '첫 댓글')
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertContains(response, '첫 댓글')
+        self.assertContains(response, 'me-2 comment-update')  # 작성자 본인의 수정 버튼이 포함된 조각
+        self.assertFalse(any('pybo_similaritycommentmodel' in query['sql'] for query in queries))  # 댓글을 조회하지 않음
+
+        self.client.force_login(self.author)  # 다른 사용자는 따로 그린 조각을 받음
+        self.assertNotContains(self.client.get(url), 'me-2 comment-update')
+
+        SimilarityCommentModel.objects.create(author=self.author, post=self.post, content='두 번째 댓글')
+        self.assertContains(self.client.get(url), '두 번째 댓글')
+
+
+class QueryPlanTest(TestCase):
+    """
+    게시판 화면 쿼리의 실행 계획(explain_queries 명령)을 테스트하는 클래스입니다.
+
+    Methods
+    -------
+    test_no_full_scans():
+        목록/상세/추천 쿼리에 전체 스캔이나 임시 정렬이 없는지 확인합니다.
+    """
+
+    def test_no_full_scans(self):
+        """
+        --fail-on-scan으로 실행해도 오류가 없고, 상세 화면의 댓글 조회가 (post, create_date, id) 인덱스를 사용하는지 확인합니다.
+        """
+        out = StringIO()
+        call_command('explain_queries', posts=200, comments=10, fail_on_scan=True, stdout=out)
+
+        output = out.getvalue()
+        self.assertIn('전체 스캔/임시 정렬 없음', output)
+        if connection.vendor == 'sqlite':
+            self.assertIn('USING INDEX similaritycommentmodel_post_cd', output)
+            self.assertIn('USING INDEX similaritypostmodel_cdate_id', output)
+        self.assertFalse(SimilarityPostModel.objects.exists())  # 측정용 데이터는 롤백됨
+
+
+class AIBackendTest(TestCase):
+    """
+    게시판별 AI 백엔드(pybo.inference.backends)를 로컬 스텁 AI 서버로 테스트하는 클래스입니다.
+
+    Methods
+    -------
+    test_backend_per_board():
+        settings.AI_BACKEND의 게시판별 설정대로 백엔드를 고르는지 확인합니다.
+
+    test_remote_compare_faces():
+        'remote' 백엔드가 AI 서버 응답을 SimilarityResult로 바꾸고, 오류 응답은 AIBackendError로 알리는지 확인합니다.
+
+    test_detection_job_saves_result():
+        인물 탐지 작업이 백엔드 결과 메시지와 결과 이미지를 답변에 저장하는지 확인합니다.
+
+    test_remote_and_local_results_equal():
+        같은 파이프라인 출력이면 'remote'와 'local' 백엔드가 같은 결과를 반환하는지 확인합니다.
+
+    test_detection_job_skips_deleted_post():
+        작업이 실행되기 전에 게시글이 삭제되면 예외 없이(재시도 없이) 끝나는지 확인합니다.
+    """
+
+    def setUp(self):
+        responses = self.responses = {}
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                status, data = responses[self.path]
+                body = json.dumps(data).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.media_root = tempfile.TemporaryDirectory()
+
+        settings_override = override_settings(
+            AI_SERVER={'BASE_URL': f'http://127.0.0.1:{self.server.server_address[1]}'},
+            AI_BACKEND={'DEFAULT': 'remote', 'BOARDS': {}},
+            MEDIA_ROOT=self.media_root.name,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        close_ai_clients()
+        clear_ai_backends()
+
+    def tearDown(self):
+        close_ai_clients()
+        clear_ai_backends()
+        self.server.shutdown()
+        self.server.server_close()
+        self.media_root.cleanup()
+
+    def _write_image(self, name: str) -> str:
+        path = os.path.join(self.media_root.name, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(b'\xff' * 16)
+        return path
+
+    def test_backend_per_board(self):
+        """
+        settings.AI_BACKEND의 게시판별 설정대로 백엔드를 고르는지 확인합니다.
+        """
+        with override_settings(AI_BACKEND={'DEFAULT': 'remote', 'BOARDS': {'detection': 'local', 'gallery': 'pool'}}):
+            clear_ai_backends()
+            self.assertEqual(get_ai_backend('similarity').name, 'remote')
+            self.assertEqual(get_ai_backend('detection').name, 'local')  # 로컬 AI 의존성은 사용할 때 임포트
+            self.assertEqual(get_ai_backend('gallery').name, 'pool')  # 워커 풀은 처음 작업할 때 시작
+            self.assertIs(get_ai_backend('similarity'), get_ai_backend('unknown_board'))  # 같은 백엔드는 공유
+
+        with override_settings(AI_BACKEND={'DEFAULT': 'gpu'}):
+            clear_ai_backends()
+            with self.assertRaises(ValueError):
+                get_ai_backend('similarity')
+
+    def test_remote_compare_faces(self):
+        """
+        'remote' 백엔드가 AI 서버 응답을 SimilarityResult로 바꾸고, 오류 응답은 AIBackendError로 알리는지 확인합니다.
+        """
+        image1, image2 = self._write_image('a.jpg'), self._write_image('b.jpg')
+        backend = get_ai_backend('similarity')
+
+        self.responses[PROCESS_IMAGE_TWO_PATH] = (200, {'result': '두 얼굴의 유사도는 87.50%입니다.', 'similarity': 87.5})
+        self.assertEqual(backend.compare_faces(image1, image2), SimilarityResult('두 얼굴의 유사도는 87.50%입니다.', 87.5))
+
+        self.responses[PROCESS_IMAGE_TWO_PATH] = (500, {})
+        with self.assertRaises(AIBackendError):
+            backend.compare_faces(image1, image2)
+
+    def test_detection_job_saves_result(self):
+        """
+        인물 탐지 작업이 백엔드 결과 메시지와 결과 이미지를 답변에 저장하는지 확인합니다.
+        """
+        self._write_image('detection/q_image1/in.jpg')
+        author = User.objects.create_user(username='writer')
+        post = DetectionPostModel.objects.create(author=author, subject='제목', content='내용', image1='detection/q_image1/in.jpg')
+        comment = DetectionCommentModel.objects.create(author=author, post=post, content='AI가 처리 중입니다.')
+
+        self.responses[PROCESS_IMAGE_PATH] = (200, {
+            'message': '인물 탐지 결과입니다.',
+            'image_path': 'C:\\ai_server\\media\\detection\\a_image1\\in_result.jpg',  # 윈도우 AI 서버의 경로
+            'base64_image': base64.b64encode(b'result').decode(),
+        })
+        detect_president(comment_id=comment.pk, post_id=post.pk)
+
+        comment.refresh_from_db()
+        self.assertEqual(comment.content, '인물 탐지 결과입니다.')
+        self.assertEqual(comment.image1.name, 'detection/a_image1/in_result.jpg')
+        with open(comment.image1.path, 'rb') as f:
+            self.assertEqual(f.read(), b'result')
+        self.assertIsInstance(get_ai_backend('detection').detect_president(post.image1.path), DetectionResult)
+
+    def test_detection_job_skips_deleted_post(self):
+        """
+        작업이 실행되기 전에 게시글이 삭제되면 예외 없이(재시도 없이) 끝나는지 확인합니다.
+        """
+        author = User.objects.create_user(username='writer')
+        post = DetectionPostModel.objects.create(author=author, subject='제목', content='내용', image1='detection/q_image1/in.jpg')
+        comment = DetectionCommentModel.objects.create(author=author, post=post, content='AI가 처리 중입니다.')
+        post_id = post.pk
+        post.delete()  # 댓글도 함께 삭제됨
+
+        detect_president(comment_id=comment.pk, post_id=post_id)  # Http404 등을 던지지 않고 바로 끝남
+        self.assertFalse(DetectionCommentModel.objects.filter(pk=comment.pk).exists())
+
+    def test_remote_and_local_results_equal(self):
+        """
+        같은 파이프라인 출력이면 'remote'와 'local' 백엔드가 같은 결과를 반환하는지 확인합니다.
+
+        로컬 파이프라인(pybo.views.ai)은 ai_system이 필요하므로 같은 출력을 반환하는 가짜 모듈로 바꿉니다.
+        AI 서버는 유사도 없이 결과 메시지만 보냅니다.
+        """
+        image1, image2 = self._write_image('a.jpg'), self._write_image('b.jpg')
+        similarity = 87.5
+        output_path = os.path.join(self.media_root.name, 'detection', 'a_image1', 'in_result.jpg')
+
+        self.responses[PROCESS_IMAGE_TWO_PATH] = (200, {'result': f'두 얼굴의 유사도는 {similarity:.2f}%입니다.'})
+        self.responses[PROCESS_IMAGE_PATH] = (200, {
+            'message': '인물 탐지 결과입니다.',
+            'image_path': 'C:\\ai_server\\media\\detection\\a_image1\\in_result.jpg',
+            'base64_image': base64.b64encode(b'result').decode(),
+        })
+        ai = SimpleNamespace(
+            compare_faces=lambda path1, path2, detectors: similarity,
+            detect_president=lambda path, detectors: output_path,
+        )
+
+        with override_settings(AI_BACKEND={'DEFAULT': 'remote', 'BOARDS': {'detection': 'local'}}), \
+                mock.patch.dict(sys.modules, {'pybo.views.ai': ai}):
+            clear_ai_backends()
+            remote, local = get_ai_backend('similarity'), get_ai_backend('detection')
+            self.assertEqual(local.name, 'local')
+
+            self.assertEqual(remote.compare_faces(image1, image2), local.compare_faces(image1, image2))
+            self.assertEqual(local.compare_faces(image1, image2).similarity, similarity)  # 서버 메시지에서도 유사도를 읽음
+            self.assertEqual(remote.detect_president(image1), local.detect_president(image1))
+
+
+class InferencePoolTest(TestCase):
+    """
+    추론 워커 프로세스 풀(pybo.inference.pool)을 테스트하는 클래스입니다.
+
+    Methods
+    -------
+    test_runs_jobs_and_recycles_workers():
+        작업 결과와 예외를 돌려주고, MAX_JOBS_PER_WORKER개를 처리한 워커를 새 워커로 바꾸는지 확인합니다.
+
+    test_recycles_worker_over_rss_limit():
+        작업을 마친 워커의 RSS가 한도 이상이면 새 워커로 바꾸는지 확인합니다.
+
+    test_restarts_crashed_worker():
+        작업 도중 죽은 워커를 새 워커로 바꾸고, 다시 실행해도 죽는 작업은 실패시키는지 확인합니다.
+
+    test_broken_initializer():
+        워커가 모델 로드(initializer) 중에 계속 죽으면 풀이 오류를 알리는지 확인합니다.
+    """
+
+    def _pool(self, **kwargs) -> InferencePool:
+        pool = InferencePool(**kwargs)
+        self.addCleanup(pool.shutdown)
+        return pool
+
+    def test_runs_jobs_and_recycles_workers(self):
+        """
+        작업 결과와 예외를 돌려주고, MAX_JOBS_PER_WORKER개를 처리한 워커를 새 워커로 바꾸는지 확인합니다.
+        """
+        pool = self._pool(processes=2, max_jobs_per_worker=2).start()
+        first_pids = set(pool.worker_pids())
+        self.assertEqual(len(first_pids), 2)
+        self.assertNotIn(os.getpid(), first_pids)  # 작업은 별도 프로세스에서 실행
+
+        futures = [pool.submit(pool_task_pid, i) for i in range(4)]
+        results = [future.result(timeout=60) for future in futures]
+        self.assertEqual([value for _, value in results], list(range(4)))
+        self.assertEqual({pid for pid, _ in results}, first_pids)
+
+        with self.assertRaisesMessage(ValueError, '얼굴이 없습니다.'):
+            pool.run(pool_task_fail, '얼굴이 없습니다.')
+        pid, _ = pool.run(pool_task_pid)
+        self.assertNotIn(pid, first_pids)  # 2개씩 처리한 워커는 새 워커로 교체됨
+        self.assertEqual(pool.stats['recycled'], 2)
+        self.assertEqual(pool.stats['crashed'], 0)
+
+    def test_recycles_worker_over_rss_limit(self):
+        """
+        작업을 마친 워커의 RSS가 한도 이상이면 새 워커로 바꾸는지 확인합니다.
+        """
+        pool = self._pool(processes=1, max_rss_bytes=1).start()
+        first_pid, _ = pool.run(pool_task_pid)
+        second_pid, _ = pool.run(pool_task_pid)
+        self.assertNotEqual(first_pid, second_pid)
+        self.assertGreaterEqual(pool.stats['recycled'], 1)
+
+    def test_restarts_crashed_worker(self):
+        """
+        작업 도중 죽은 워커를 새 워커로 바꾸고, 다시 실행해도 죽는 작업은 실패시키는지 확인합니다.
+        """
+        pool = self._pool(processes=1, max_crash_retries=1).start()
+        with self.assertRaises(InferencePoolError):
+            pool.run(pool_task_crash)
+        self.assertEqual(pool.stats['crashed'], 2)  # 처음 실행 + 재시도 1번
+
+        pid, value = pool.run(pool_task_pid, 'ok')  # 새 워커가 다음 작업을 처리
+        self.assertEqual(value, 'ok')
+        self.assertIn(pid, pool.worker_pids())
+
+    def test_broken_initializer(self):
+        """
+        워커가 모델 로드(initializer) 중에 계속 죽으면 풀이 오류를 알리는지 확인합니다.
+        """
+        pool = self._pool(processes=1, initializer=pool_task_crash)
+        with self.assertRaises(InferencePoolError):
+            pool.start(timeout=60)
+        with self.assertRaises(InferencePoolError):
+            pool.submit(pool_task_pid)
+
+
+class SharedImageTest(TestCase):
+    """
+    공유 메모리 이미지 전달(pybo.inference.shared_image)을 테스트하는 클래스입니다.
+
+    Methods
+    -------
+    test_worker_reads_shared_image():
+        추론 워커가 핸들만 받아 작업 스레드가 디코딩한 이미지를 그대로 읽는지 확인합니다.
+
+    test_blocks_released():
+        with 문을 빠져나오면 공유 메모리 블록이 해제되는지 확인합니다.
+
+    test_shared_view_read_only():
+        워커가 연 공유 메모리 이미지가 읽기 전용이라 원본 블록을 바꾸지 못하는지 확인합니다.
+    """
+
+    def setUp(self):
+        from PIL import Image
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.image = np.arange(40 * 30 * 3, dtype=np.uint8).reshape(40, 30, 3)
+        self.path = os.path.join(self.tmp_dir.name, 'face.png')  # 무손실 형식이라 디코딩 결과가 원본과 같음
+        Image.fromarray(self.image).save(self.path)
+
+    def test_worker_reads_shared_image(self):
+        """
+        추론 워커가 핸들만 받아 작업 스레드가 디코딩한 이미지를 그대로 읽는지 확인합니다.
+        """
+        pool = InferencePool(processes=1).start()
+        self.addCleanup(pool.shutdown)
+
+        with SharedImage(self.path) as shared:
+            self.assertEqual(shared.handle.digest, hash_image(self.path))  # 임베딩 캐시 키에 같은 해시 사용
+            total, digest = pool.run(pool_task_image_sum, shared.handle)
+        self.assertEqual(total, int(self.image.sum()))
+        self.assertEqual(digest, hash_image(self.path))
+
+        with open_image(self.path) as source:  # 경로는 그대로 전달 (파이프라인이 파일에서 디코딩)
+            self.assertEqual(source.path, self.path)
+            self.assertIsNone(source.image_rgb)
+
+    def test_blocks_released(self):
+        """
+        with 문을 빠져나오면 공유 메모리 블록이 해제되는지 확인합니다.
+        """
+        from multiprocessing import shared_memory
+
+        with share_images(self.path, self.path) as handles:
+            self.assertNotEqual(handles[0].name, handles[1].name)  # 작업마다 별도 블록
+            with open_image(handles[0]) as source:
+                np.testing.assert_array_equal(source.image_rgb, self.image)
+
+        for handle in handles:
+            with self.assertRaises(FileNotFoundError):
+                shared_memory.SharedMemory(name=handle.name)
+
+    def test_shared_view_read_only(self):
+        """
+        워커가 연 공유 메모리 이미지가 읽기 전용이라 원본 블록을 바꾸지 못하는지 확인합니다.
+        """
+        with SharedImage(self.path) as shared:
+            with open_image(shared.handle) as source:
+                with self.assertRaises(ValueError):
+                    source.image_rgb[0, 0] = 255  # 탐지 정보 그리기와 같은 제자리 수정
+                drawn = source.image_rgb.copy()  # 그리는 파이프라인은 복사본 사용
+                drawn[0, 0] = 255
+            with open_image(shared.handle) as source:  # 재시도 시 다시 열어도 원본 그대로
+                np.testing.assert_array_equal(source.image_rgb, self.image)
+
+
+class MicroBatcherTest(TestCase):
+    """
+    탐지기 마이크로 배치(pybo.inference.batching)를 테스트하는 클래스입니다.
+
+    Methods
+    -------
+    test_concurrent_calls_batched():
+        동시에 들어온 한 장짜리 호출이 한 번의 모델 호출로 모이고 결과가 요청마다 돌아가는지 확인합니다.
+
+    test_batch_failure_propagates():
+        배치 실행이 실패하면 배치의 모든 요청에 예외가 전달되고, 이후 요청은 계속 처리되는지 확인합니다.
+
+    test_enable_batching():
+        설정에서 켠 탐지기의 모델만 BatchingModel로 바뀌는지 확인합니다.
+    """
+
+    def test_concurrent_calls_batched(self):
+        """
+        동시에 들어온 한 장짜리 호출이 한 번의 모델 호출로 모이고 결과가 요청마다 돌아가는지 확인합니다.
+        """
+        calls = []
+
+        def model(images, scale=1):
+            calls.append((len(images), scale))
+            return [image * scale for image in images]
+
+        batching = BatchingModel(model, max_batch_size=4, max_wait_ms=2000)  # 배치가 가득 차면 대기 시간 전에 실행
+        self.addCleanup(batching.close)
+
+        results = {}
+        def call(value):
+            results[value] = batching(value, scale=10)
+
+        threads = [threading.Thread(target=call, args=(value,)) for value in range(8)]
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual(results, {value: [value * 10] for value in range(8)})  # 원래 모델처럼 결과 하나가 든 목록
+        self.assertEqual(calls, [(4, 10), (4, 10)])
+        self.assertEqual(batching.batch_stats, {'batches': 2, 'items': 8})
+        self.assertEqual(batching([1, 2]), [1, 2])  # 여러 장은 배치 없이 바로 실행
+
+    def test_batch_failure_propagates(self):
+        """
+        배치 실행이 실패하면 배치의 모든 요청에 예외가 전달되고, 이후 요청은 계속 처리되는지 확인합니다.
+        """
+        def batch_fn(items):
+            if 'bad' in items:
+                raise ValueError('잘못된 이미지')
+            return [item.upper() for item in items]
+
+        batcher = MicroBatcher(batch_fn, max_batch_size=2, max_wait_ms=2000)
+        self.addCleanup(batcher.close)
+
+        futures = [batcher.submit('ok'), batcher.submit('bad')]
+        for future in futures:
+            with self.assertRaisesMessage(ValueError, '잘못된 이미지'):
+                future.result(timeout=5)
+
+        future = batcher.submit('next')
+        batcher.close()  # 남은 요청은 대기 시간을 기다리지 않고 실행한 뒤 종료
+        self.assertEqual(future.result(timeout=5), 'NEXT')
+        with self.assertRaises(RuntimeError):
+            batcher.submit('closed')
+
+    def test_enable_batching(self):
+        """
+        설정에서 켠 탐지기의 모델만 BatchingModel로 바뀌는지 확인합니다.
+        """
+        options = {'ENABLED': True, 'DETECTORS': ['yolo'], 'MAX_BATCH_SIZE': 4, 'MAX_WAIT_MS': 1.0, 'MODEL_ATTRIBUTE': 'model'}
+        model = lambda images: images
+        detector = SimpleNamespace(model=model)
+
+        self.assertIs(enable_batching(detector, 'yolo', {**options, 'ENABLED': False}).model, model)
+        self.assertIs(enable_batching(detector, 'retinaface', options).model, model)
+
+        enable_batching(detector, 'yolo', options)
+        self.addCleanup(detector.model.close)
+        self.assertIsInstance(detector.model, BatchingModel)
+        self.assertEqual(detector.model('image'), ['image'])
+
+        wrapped = detector.model
+        enable_batching(detector, 'yolo', options)  # 다시 감싸지 않음
+        self.assertIs(detector.model, wrapped)
+
+        no_model = SimpleNamespace()
+        self.assertIs(enable_batching(no_model, 'yolo', options), no_model)
+
+
+class OnnxDetectorTest(TestCase):
+    """
+    ONNX 탐지기의 전처리/후처리(pybo.inference.onnx_detector)와 정확도 비교(evaluate_detector)를 테스트하는 클래스입니다.
+
+    Methods
+    -------
+    test_letterbox_and_decode():
+        레터박스한 입력 좌표의 YOLOv8 출력이 원본 이미지 좌표로 돌아오고, 신뢰도 필터와 NMS가 적용되는지 확인합니다.
+
+    test_match_detections():
+        탐지 결과를 정답 박스와 짝지어 맞은 탐지, 틀린 탐지, 놓친 정답 수를 세는지 확인합니다.
+    """
+
+    def test_letterbox_and_decode(self):
+        """
+        레터박스한 입력 좌표의 YOLOv8 출력이 원본 이미지 좌표로 돌아오고, 신뢰도 필터와 NMS가 적용되는지 확인합니다.
+        """
+        image = np.zeros((100, 200, 3), dtype=np.uint8)  # 높이 100, 너비 200
+        tensor, scale, pad = letterbox(image, 64)
+        self.assertEqual(tensor.shape, (3, 64, 64))
+        self.assertAlmostEqual(scale, 0.32)
+        self.assertEqual(pad, (0, 16))  # 위아래 여백
+        self.assertAlmostEqual(float(tensor[0, 0, 0]), 114 / 255, places=5)
+        self.assertEqual(float(tensor[0, 32, 32]), 0.0)
+
+        # 원본 (20, 10, 60, 50) 박스 -> 입력 좌표 중심 (12.8, 25.6), 크기 12.8
+        output = np.array([
+            [12.8, 13.0, 40.0],  # 중심 x
+            [25.6, 25.8, 30.0],  # 중심 y
+            [12.8, 12.8, 5.0],  # 너비
+            [12.8, 12.8, 5.0],  # 높이
+            [0.9, 0.8, 0.1],  # 클래스 신뢰도
+        ], dtype=np.float32)
+        detections = decode_output(output, scale, pad, image.shape, conf_threshold=0.25, iou_threshold=0.45)
+
+        self.assertEqual(detections.shape, (1, 5))  # 겹친 두 번째 후보는 NMS, 세 번째는 신뢰도 필터로 제거
+        np.testing.assert_allclose(detections[0], [20, 10, 60, 50, 0.9], atol=1e-3)
+        self.assertEqual(decode_output(output, scale, pad, image.shape, conf_threshold=0.95).shape, (0, 5))
+        np.testing.assert_array_equal(nms(np.array([[0, 0, 10, 10], [20, 20, 30, 30]], dtype=np.float32), np.array([0.5, 0.9]), 0.5), [1, 0])
+
+    def test_match_detections(self):
+        """
+        탐지 결과를 정답 박스와 짝지어 맞은 탐지, 틀린 탐지, 놓친 정답 수를 세는지 확인합니다.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            label_path = os.path.join(tmp_dir, 'face.txt')
+            with open(label_path, 'w') as f:
+                f.write('0 0.25 0.25 0.2 0.2\n0 0.75 0.75 0.2 0.2\n')
+            truths = read_labels(label_path, (100, 200))
+            self.assertEqual(read_labels(os.path.join(tmp_dir, 'none.txt'), (100, 200)).shape, (0, 4))
+        np.testing.assert_allclose(truths, [[30, 15, 70, 35], [130, 65, 170, 85]], atol=1e-4)
+
+        detections = np.array([
+            [31, 15, 71, 35, 0.9],  # 첫 번째 얼굴
+            [30, 15, 70, 35, 0.5],  # 같은 얼굴 중복 탐지 (틀린 탐지)
+            [0, 60, 20, 80, 0.7],  # 얼굴이 아닌 곳 (틀린 탐지)
+        ], dtype=np.float32)
+        true_positives, false_positives, false_negatives, ious = match_detections(detections, truths, 0.5)
+        self.assertEqual((true_positives, false_positives, false_negatives), (1, 2, 1))
+        self.assertGreater(ious[0], 0.9)
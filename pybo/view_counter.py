@@ -0,0 +1,347 @@
+import atexit
+from collections import defaultdict
+import os
+import threading
+import time
+
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, Value, When
+from django.utils import timezone
+
+from .hyperloglog import DEFAULT_PRECISION, HyperLogLog
+from .url_patterns import URLS
+
+import logging
+logger = logging.getLogger(URLS['APP_NAME'])  # 로거 설정
+
+"""
+게시글 조회수(view_count)를 모아서 기록하는 모듈입니다.
+
+상세 페이지를 볼 때마다 UPDATE를 실행하면 가장 많이 호출되는 읽기 요청이 쓰기 요청이 되므로,
+조회수 증가분을 프로세스 메모리에 모아 두었다가 다음 조건 중 하나를 만족하면 한 번에 기록합니다.
+
+1. 모인 조회수가 FLUSH_THRESHOLD 이상일 때
+2. 마지막 기록 후 FLUSH_INTERVAL초가 지났을 때 (다음 조회 시 확인)
+3. 프로세스가 정상 종료될 때 (atexit)
+
+기록할 때는 모인 증가분을 먼저 비우고 게시판마다 UPDATE ... SET view_count = view_count + CASE ... 한 번으로 처리하며,
+UPDATE가 실패하면 증가분을 다시 되돌려 놓습니다. 따라서 같은 증가분이 두 번 기록되지 않습니다.
+fork로 만든 워커 프로세스는 부모가 모아 둔 증가분을 물려받지만, 부모가 직접 기록하므로 자식은 이를 버립니다.
+비정상 종료 시에는 아직 기록하지 않은 증가분(최대 FLUSH_THRESHOLD 또는 FLUSH_INTERVAL초 분량)만 유실됩니다.
+
+순 방문자 수는 게시글마다 HyperLogLog 스케치(pybo.hyperloglog)에 방문자 키를 넣어 모으고,
+조회수를 기록할 때 저장된 스케치(ViewerSketchModel)와 합쳐 저장한 뒤 추정값을 게시글의 unique_viewer_count에 기록합니다.
+스케치 합치기는 같은 내용을 여러 번 합쳐도 결과가 같으므로 워커 간 순서나 재시도와 관계없이 정확합니다.
+"""
+
+DEFAULT_OPTIONS = {
+    'FLUSH_THRESHOLD': 100,
+    'FLUSH_INTERVAL': 10.0,
+    'HLL_PRECISION': DEFAULT_PRECISION,
+}
+
+
+def get_viewer_key(request) -> str:
+    """
+    순 방문자 수를 셀 때 사용할 방문자 키를 반환합니다.
+
+    로그인한 사용자는 사용자 ID, 세션이 있는 방문자는 세션 키, 그 외에는 IP 주소와 User-Agent를 사용합니다.
+
+    Parameters
+    ----------
+    request : HttpRequest
+        현재 요청 객체입니다.
+
+    Returns
+    -------
+    str
+        방문자 키입니다. (예: 'u:12')
+    """
+    if request.user.is_authenticated:
+        return f"u:{request.user.pk}"
+    session_key = getattr(getattr(request, 'session', None), 'session_key', None)
+    if session_key:
+        return f"s:{session_key}"
+    return f"a:{request.META.get('REMOTE_ADDR', '')}|{request.META.get('HTTP_USER_AGENT', '')}"
+
+
+class ViewCounter:
+    """
+    게시글 조회수 증가분을 모아서 한 번에 기록하는 카운터입니다.
+
+    Attributes
+    ----------
+    flush_threshold : int
+        모인 조회수가 이 값 이상이면 기록합니다.
+    flush_interval : float
+        마지막 기록 후 이 시간(초)이 지나면 다음 조회 시 기록합니다.
+    hll_precision : int
+        순 방문자 스케치의 precision입니다. 저장된 스케치와 같아야 합치므로 운영 중에는 바꾸지 않습니다.
+
+    Methods
+    -------
+    record(model, pk, viewer=None):
+        게시글의 조회수를 1 늘리고 방문자를 스케치에 추가합니다. (기록 조건을 만족하면 바로 기록)
+    pending(model, pk):
+        아직 기록하지 않은 게시글의 조회수 증가분을 반환합니다.
+    unique_viewers(model, pk):
+        저장된 스케치와 아직 기록하지 않은 스케치를 합쳐 순 방문자 수 추정값을 반환합니다.
+    flush():
+        모인 증가분을 데이터베이스에 기록합니다.
+    clear():
+        모인 증가분을 기록하지 않고 버립니다.
+    """
+
+    def __init__(self, flush_threshold: int = 100, flush_interval: float = 10.0, hll_precision: int = DEFAULT_PRECISION):
+        self.flush_threshold = flush_threshold
+        self.flush_interval = flush_interval
+        self.hll_precision = hll_precision
+
+        self._reset()
+        self._last_flush = time.monotonic()
+        self._pid = os.getpid()  # 증가분을 모은 프로세스 ID
+        self._lock = threading.Lock()
+
+    def record(self, model, pk: int, viewer: str = None) -> int:
+        """
+        게시글의 조회수를 1 늘리고 방문자를 스케치에 추가합니다. 기록 조건을 만족하면 모인 증가분을 바로 기록합니다.
+
+        Parameters
+        ----------
+        model : Model class
+            게시글 모델 클래스입니다.
+        pk : int
+            게시글 ID입니다.
+        viewer : str, optional
+            get_viewer_key()로 만든 방문자 키입니다. None이면 순 방문자 수에 반영하지 않습니다.
+
+        Returns
+        -------
+        int
+            이번 조회를 포함하여 아직 기록하지 않았던 이 게시글의 조회수 증가분입니다.
+            데이터베이스에서 읽은 view_count에 더하면 현재 조회수가 됩니다.
+        """
+        with self._lock:
+            self._discard_inherited()
+            self._pending[model][pk] += 1
+            self._pending_total += 1
+            count = self._pending[model][pk]
+            if viewer is not None:
+                sketch = self._sketches[model].get(pk)
+                if sketch is None:
+                    sketch = self._sketches[model][pk] = HyperLogLog(self.hll_precision)
+                sketch.add(viewer)
+            should_flush = (self._pending_total >= self.flush_threshold
+                            or time.monotonic() - self._last_flush >= self.flush_interval)
+
+        if should_flush:
+            self.flush()
+        return count
+
+    def pending(self, model, pk: int) -> int:
+        """
+        아직 기록하지 않은 게시글의 조회수 증가분을 반환합니다.
+
+        Parameters
+        ----------
+        model : Model class
+            게시글 모델 클래스입니다.
+        pk : int
+            게시글 ID입니다.
+
+        Returns
+        -------
+        int
+            이 프로세스에 모여 있는 증가분입니다.
+        """
+        with self._lock:
+            self._discard_inherited()
+            return self._pending[model].get(pk, 0) if model in self._pending else 0
+
+    def unique_viewers(self, model, pk: int) -> int:
+        """
+        저장된 스케치와 이 프로세스에 모인 스케치를 합쳐 게시글의 순 방문자 수 추정값을 반환합니다.
+
+        추정값의 상대 표준 오차는 pybo.hyperloglog.standard_error(hll_precision)입니다.
+
+        Parameters
+        ----------
+        model : Model class
+            게시글 모델 클래스입니다.
+        pk : int
+            게시글 ID입니다.
+
+        Returns
+        -------
+        int
+            순 방문자 수 추정값입니다.
+        """
+        from .models import ViewerSketchModel
+
+        sketch = HyperLogLog(self.hll_precision)
+        stored = ViewerSketchModel.objects.filter(label=model._meta.label_lower, post_id=pk).values_list('sketch', flat=True).first()
+        if stored is not None:
+            self._merge_stored(sketch, stored)
+        with self._lock:
+            self._discard_inherited()
+            pending = self._sketches[model].get(pk) if model in self._sketches else None
+            if pending is not None:
+                sketch.merge(pending)
+        return sketch.count()
+
+    def flush(self) -> int:
+        """
+        모인 증가분을 게시판마다 한 번의 UPDATE로 기록하고, 순 방문자 스케치를 저장된 스케치와 합쳐 저장합니다.
+
+        증가분을 먼저 비운 뒤 기록하고, 기록에 실패하면 다시 되돌려 놓습니다.
+
+        Returns
+        -------
+        int
+            기록한 조회수 증가분의 합입니다. 실패하면 0입니다.
+        """
+        with self._lock:
+            self._discard_inherited()
+            snapshot, total, sketches = self._pending, self._pending_total, self._sketches
+            self._reset()
+            self._last_flush = time.monotonic()
+
+        if not total and not sketches:
+            return 0
+
+        try:
+            with transaction.atomic():
+                for model, counts in snapshot.items():
+                    model.objects.filter(pk__in=list(counts)).update(view_count=F('view_count') + Case(
+                        *(When(pk=pk, then=Value(count)) for pk, count in counts.items()),
+                        default=Value(0),
+                        output_field=IntegerField(),
+                    ))
+                for model, posts in sketches.items():
+                    self._save_sketches(model, posts)
+        except Exception:
+            logger.exception("조회수 기록 실패, 다음 기록 때 다시 시도합니다.")
+            with self._lock:  # 기록하지 못한 증가분과 스케치를 되돌려 놓음
+                for model, counts in snapshot.items():
+                    for pk, count in counts.items():
+                        self._pending[model][pk] += count
+                self._pending_total += total
+                for model, posts in sketches.items():
+                    for pk, sketch in posts.items():
+                        if pk in self._sketches[model]:
+                            self._sketches[model][pk].merge(sketch)
+                        else:
+                            self._sketches[model][pk] = sketch
+            return 0
+
+        logger.debug(f"조회수 기록: {total}회")
+        return total
+
+    def clear(self) -> None:
+        """
+        모인 증가분을 기록하지 않고 버립니다. (테스트 데이터베이스를 삭제하기 전 등)
+
+        버릴 증가분이 없으므로 FLUSH_INTERVAL 기록 주기도 지금부터 다시 셉니다.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            self._reset()
+            self._last_flush = time.monotonic()
+
+    def _save_sketches(self, model, posts: dict) -> None:
+        """
+        게시글별 스케치를 저장된 스케치와 합쳐 저장하고, 추정값을 게시글의 unique_viewer_count에 기록합니다.
+
+        다른 워커가 같은 행을 동시에 합치지 않도록 저장된 스케치를 select_for_update로 읽습니다.
+        flush()의 트랜잭션 안에서 호출합니다.
+        """
+        from .models import ViewerSketchModel
+
+        label = model._meta.label_lower
+        stored = {
+            row.post_id: row
+            for row in ViewerSketchModel.objects.select_for_update().filter(label=label, post_id__in=list(posts))
+        }
+        now = timezone.now()
+        new_rows, updated_rows, estimates = [], [], {}
+        for pk, sketch in posts.items():
+            row = stored.get(pk)
+            merged = HyperLogLog(self.hll_precision).merge(sketch)  # 되돌려 놓을 때를 위해 모은 스케치는 바꾸지 않음
+            if row is None:
+                new_rows.append(ViewerSketchModel(label=label, post_id=pk, sketch=merged.to_bytes(), update_date=now))
+            else:
+                self._merge_stored(merged, row.sketch)
+                row.sketch, row.update_date = merged.to_bytes(), now
+                updated_rows.append(row)
+            estimates[pk] = merged.count()
+
+        ViewerSketchModel.objects.bulk_create(new_rows)
+        ViewerSketchModel.objects.bulk_update(updated_rows, ['sketch', 'update_date'])
+        model.objects.filter(pk__in=list(estimates)).update(unique_viewer_count=Case(
+            *(When(pk=pk, then=Value(estimate)) for pk, estimate in estimates.items()),
+            default=F('unique_viewer_count'),
+            output_field=IntegerField(),
+        ))
+
+    def _merge_stored(self, sketch: HyperLogLog, stored: bytes) -> None:
+        """
+        저장된 스케치 바이트를 sketch에 합칩니다. precision이 다르면(설정 변경) 저장된 스케치를 버립니다.
+        """
+        stored = HyperLogLog.from_bytes(stored)
+        if stored.precision != sketch.precision:
+            logger.warning(f"순 방문자 스케치의 precision이 달라 저장된 스케치를 버립니다: {stored.precision} -> {sketch.precision}")
+            return
+        sketch.merge(stored)
+
+    def _reset(self) -> None:
+        """
+        모인 증가분과 스케치를 비웁니다. (__init__ 외에는 _lock을 잡은 상태에서 호출)
+        """
+        self._pending = defaultdict(lambda: defaultdict(int))  # 모델 클래스 -> {게시글 ID: 증가분}
+        self._pending_total = 0
+        self._sketches = defaultdict(dict)  # 모델 클래스 -> {게시글 ID: HyperLogLog}
+
+    def _discard_inherited(self) -> None:
+        """
+        fork 이후 부모 프로세스에서 물려받은 증가분을 버립니다. (부모가 기록하므로 중복 기록 방지)
+        _lock을 잡은 상태에서 호출합니다.
+        """
+        pid = os.getpid()
+        if self._pid != pid:
+            self._reset()
+            self._last_flush = time.monotonic()
+            self._pid = pid
+
+
+_view_counter = None  # 프로세스 단위 카운터 (처음 사용할 때 settings로 생성)
+_view_counter_lock = threading.Lock()
+
+
+def get_view_counter() -> ViewCounter:
+    """
+    settings.VIEW_COUNTER 설정으로 만든 프로세스 단위 조회수 카운터를 반환합니다.
+
+    처음 만들 때 프로세스 종료 시 남은 증가분을 기록하도록 atexit에 등록합니다.
+
+    Returns
+    -------
+    ViewCounter
+        프로세스 단위 조회수 카운터입니다.
+    """
+    global _view_counter
+    if _view_counter is None:
+        with _view_counter_lock:
+            if _view_counter is None:
+                from django.conf import settings
+
+                options = {**DEFAULT_OPTIONS, **getattr(settings, 'VIEW_COUNTER', {})}
+                _view_counter = ViewCounter(
+                    flush_threshold=options['FLUSH_THRESHOLD'],
+                    flush_interval=options['FLUSH_INTERVAL'],
+                    hll_precision=options['HLL_PRECISION'],
+                )
+                atexit.register(_view_counter.flush)
+    return _view_counter
@@ -7,12 +7,110 @@ import os
 from sklearn.metrics.pairwise import cosine_similarity
 import logging  # 로그 출력을 위한 모듈
 from pathlib import Path
+from django.conf import settings
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
 logger = logging.getLogger('pybo')  # 'pybo'라는 로거 생성
 
 # 각 단계별 클래스를 개별적으로 임포트합니다.
-from ai_system import Pipeline, Data, BaseConfig, steps, factories
+from ai_system import Pipeline, Data, BaseConfig, steps
+from ..inference.registry import registry  # 탐지기와 파이프라인을 프로세스 단위로 재사용
+from ..inference.embedding_cache import EmbeddingEntry, as_encoding_matrix, get_embedding_cache  # 이미지 내용 기반 인코딩 캐시
+from ..inference.gallery import get_face_gallery  # 저장된 모든 얼굴 인코딩을 담은 갤러리
+from ..inference.ann import get_ann_index, search_gallery  # 대규모 갤러리용 근사 최근접 이웃 인덱스
+from ..inference.shared_image import open_image  # 추론 워커 풀이 공유 메모리로 넘긴 이미지 사용
+
+def build_encode_pipeline(detectors: list) -> Pipeline:
+    """
+    얼굴 탐지와 인코딩을 수행하는 파이프라인을 생성합니다.
+
+    Parameters
+    ----------
+    detectors : list
+        사용할 얼굴 탐지기 객체 목록입니다.
+
+    Returns
+    -------
+    Pipeline
+        얼굴 탐지 → 인코딩 단계로 구성된 파이프라인입니다.
+    """
+    pipeline = Pipeline()
+    pipeline.add(steps.FaceDetector(detectors))  # 얼굴 탐지 단계 추가
+    pipeline.add(steps.FaceEncoder())  # 얼굴 인코딩 단계 추가
+    return pipeline
+
+def build_detect_pipeline(detectors: list) -> Pipeline:
+    """
+    얼굴 탐지 결과를 이미지에 그려 저장하는 파이프라인을 생성합니다.
+
+    Parameters
+    ----------
+    detectors : list
+        사용할 얼굴 탐지기 객체 목록입니다.
+
+    Returns
+    -------
+    Pipeline
+        얼굴 탐지 → 정보 그리기 → 저장 단계로 구성된 파이프라인입니다.
+    """
+    pipeline = Pipeline()
+    pipeline.add(steps.FaceDetector(detectors))  # 얼굴 탐지 단계 추가
+    pipeline.add(steps.InfoDrawer(thickness=5))  # 탐지 정보 그리기 단계 추가
+    pipeline.add(steps.Saver())  # 이미지 저장 단계 추가
+    return pipeline
+
+def _extract_boxes(data) -> np.ndarray:
+    """
+    파이프라인 실행 결과에서 얼굴 바운딩 박스를 (얼굴 수, 4) 배열로 꺼냅니다.
+
+    Parameters
+    ----------
+    data : Data
+        파이프라인 실행이 끝난 데이터 객체입니다.
+
+    Returns
+    -------
+    np.ndarray
+        바운딩 박스 배열입니다. 탐지 결과를 해석할 수 없으면 (0, 4) 배열을 반환합니다.
+    """
+    predictions = getattr(data, 'predictions', None)
+    if isinstance(predictions, dict):  # 탐지기별 결과인 경우 모두 합침
+        predictions = [box for boxes in predictions.values() for box in boxes]
+    try:
+        return np.asarray([list(box)[:4] for box in predictions or []], dtype=np.float32).reshape(-1, 4)
+    except (TypeError, ValueError):
+        return np.zeros((0, 4), dtype=np.float32)
+
+def _create_data(config, source, writable: bool = False) -> Data:
+    """
+    파이프라인에 넣을 데이터 객체를 만들고 이미지의 RGB 값을 설정합니다.
+
+    source에 디코딩된 이미지(공유 메모리)가 있으면 그대로 사용하고, 없으면 파일에서 디코딩합니다.
+    공유 메모리 이미지는 읽기 전용이므로, 이미지에 그리는 파이프라인은 writable=True로 복사본을 받습니다.
+
+    Parameters
+    ----------
+    config : dict
+        설정 정보입니다.
+    source : ImageSource
+        open_image()로 연 이미지입니다.
+    writable : bool, optional
+        파이프라인이 이미지를 바꾸는지 여부입니다. (기본값은 False)
+
+    Returns
+    -------
+    Data
+        이미지의 RGB 값이 설정된 데이터 객체입니다.
+    """
+    data = Data(config, source.path)
+    if source.image_rgb is not None:
+        image_rgb = source.image_rgb  # 파일을 다시 읽거나 디코딩하지 않음
+        if writable and not image_rgb.flags.writeable:
+            image_rgb = image_rgb.copy()  # 공유 블록(원본) 대신 복사본에 그림
+        data.image_rgb = image_rgb
+    else:
+        data.image_rgb  # 이미지의 RGB 값 설정 (파일에서 디코딩)
+    return data
 
 def process_image(image_path, selected_detectors):
     """
@@ -20,8 +118,8 @@ def process_image(image_path, selected_detectors):
 
     Parameters
     ----------
-    image_path : str
-        처리할 이미지의 경로입니다.
+    image_path : str or SharedImageHandle
+        처리할 이미지의 경로입니다. 추론 워커 풀에서는 공유 메모리에 디코딩된 이미지의 핸들입니다.
     selected_detectors : list
         사용할 얼굴 탐지기(detectors)의 목록입니다.
 
@@ -32,37 +130,41 @@ def process_image(image_path, selected_detectors):
     encodings : list
         얼굴의 인코딩(숫자로 변환된 얼굴 특징 값)을 반환합니다.
     """
-    # 설정 정보를 가져옵니다.
-    config = BaseConfig.get_config()
+    with open_image(image_path) as source:
+        # 설정 정보를 가져옵니다. (프로세스 단위로 캐시됨)
+        config = registry.get_config(BaseConfig)
 
-    # 탐지기를 선택된 종류에 맞게 생성합니다.
-    detectors = []
-    for detector in selected_detectors:
-        if detector == 'mtcnn':  # 'mtcnn' 탐지기는 사용하지 않음
-            continue
-        # 탐지기 생성하여 리스트에 추가
-        detectors.append(factories.FaceDetectorFactory.create(detector, config[f'{detector}']))
+        # 같은 이미지(내용 기준)를 같은 탐지기로 처리한 적이 있으면 저장된 인코딩을 반환합니다.
+        # 결과 이미지 경로는 이번 요청의 파일 경로로 만듭니다. (같은 내용의 다른 파일이면 경로가 다름)
+        cache = get_embedding_cache()
+        cache_key = cache.make_key(source.path, selected_detectors, digest=source.digest)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"임베딩 캐시 적중: {source.path}")
+            return Data(config, source.path).output_image_path, list(cached.encodings)
 
-    # 파이프라인 설정: 얼굴 탐지와 인코딩을 수행하는 단계 추가
-    pipeline = Pipeline()
-    pipeline.add(steps.FaceDetector(detectors))  # 얼굴 탐지 단계 추가
-    pipeline.add(steps.FaceEncoder())  # 얼굴 인코딩 단계 추가
+        # 파이프라인 설정: 얼굴 탐지와 인코딩을 수행하는 단계 추가
+        # 탐지기(모델 가중치)와 파이프라인은 워커마다 한 번만 생성되어 재사용됩니다.
+        pipeline = registry.get_pipeline('encode', selected_detectors, build_encode_pipeline, BaseConfig)
+
+        logging.info(f"이미지 처리 시작: {source.path}")
 
-    logging.info(f"이미지 처리 시작: {image_path}")
+        # 데이터 객체를 생성하고 이미지의 RGB 값을 설정합니다.
+        data = _create_data(config, source)
 
-    # 데이터 객체를 생성하고 이미지 경로를 설정합니다.
-    data = Data(config, image_path)
-    data.image_rgb  # 이미지의 RGB 값 설정
+        # 파이프라인 실행: 설정된 단계를 순차적으로 수행
+        pipeline.run(data)
 
-    # 파이프라인 실행: 설정된 단계를 순차적으로 수행
-    pipeline.run(data)
+        logging.info(f"이미지 처리 완료: {source.path}")
 
-    logging.info(f"이미지 처리 완료: {image_path}")
+        # 처리된 이미지의 경로와 얼굴 인코딩 반환
+        output_image_path = data.output_image_path
+        encodings = data.encodings
 
-    # 처리된 이미지의 경로와 얼굴 인코딩 반환
-    output_image_path = data.output_image_path
-    encodings = data.encodings
-    return output_image_path, encodings
+        # 다음 요청에서 재사용할 수 있도록 인코딩과 바운딩 박스를 캐시에 저장 (결과 이미지 경로는 저장하지 않음)
+        cache.set(cache_key, EmbeddingEntry(encodings=as_encoding_matrix(encodings), boxes=_extract_boxes(data)))
+        del data  # 공유 메모리 이미지를 닫기 전에 참조를 놓음
+        return output_image_path, encodings
 
 def compare_faces(image1_path: str, image2_path: str, selected_detectors: list = ['yolo']) -> float:
     """
@@ -114,6 +216,82 @@ def compare_faces(image1_path: str, image2_path: str, selected_detectors: list =
 
     return similarity_percentage
 
+def index_similarity_post(post, selected_detectors: list = ['yolo'], gallery=None) -> int:
+    """
+    얼굴 유사도 비교 게시글의 두 이미지에서 얼굴 인코딩을 구해 갤러리에 추가합니다.
+
+    process_image()의 임베딩 캐시를 사용하므로 이미 처리한 이미지는 다시 인코딩하지 않습니다.
+    이미 갤러리에 있는 게시글(작업 재시도, 중복 등록)은 건너뜁니다.
+
+    Parameters
+    ----------
+    post : SimilarityPostModel
+        인코딩을 추가할 게시글입니다.
+    selected_detectors : list, optional
+        사용할 얼굴 탐지기의 목록 (기본값은 ['yolo']).
+    gallery : FaceGallery, optional
+        인코딩을 추가할 갤러리입니다. (기본값은 프로세스 단위 갤러리)
+
+    Returns
+    -------
+    int
+        갤러리에 추가된 얼굴 수입니다.
+    """
+    gallery = gallery if gallery is not None else get_face_gallery()
+    gallery.refresh()  # 다른 워커가 추가한 얼굴 반영
+    if gallery.has_post(post.pk):
+        logger.info(f"얼굴 갤러리에 이미 있는 게시글 - 게시글 ID: {post.pk}")
+        return 0
+
+    added = 0
+    for image_no, image in enumerate((post.image1, post.image2), start=1):
+        if not image:
+            continue
+        _, encodings = process_image(image.path, selected_detectors)
+        if len(encodings) == 0:
+            continue
+        gallery.add(as_encoding_matrix(encodings), [(post.pk, image_no, face_no) for face_no in range(len(encodings))])
+        added += len(encodings)
+
+    logger.info(f"얼굴 갤러리 추가 - 게시글 ID: {post.pk}, 얼굴 수: {added}")
+    return added
+
+def find_similar_faces(image_path: str, k: int = 5, selected_detectors: list = ['yolo'], exclude_post_id: int = None) -> list:
+    """
+    이미지의 얼굴과 가장 비슷한 얼굴을 갤러리 전체에서 찾습니다.
+
+    Parameters
+    ----------
+    image_path : str
+        질의 이미지의 경로입니다. 얼굴이 정확히 1개 있어야 합니다.
+    k : int, optional
+        반환할 결과 수입니다. (기본값은 5)
+    selected_detectors : list, optional
+        사용할 얼굴 탐지기의 목록 (기본값은 ['yolo']).
+    exclude_post_id : int, optional
+        결과에서 제외할 게시글 ID입니다.
+
+    Returns
+    -------
+    list
+        (게시글 ID, 이미지 번호, 얼굴 번호, 코사인 유사도) 튜플 목록입니다. 유사도가 높은 순서입니다.
+    """
+    _, encodings = process_image(image_path, selected_detectors)
+    if len(encodings) != 1:
+        raise ValueError("사진에 얼굴이 1개가 아닙니다.")
+
+    query = as_encoding_matrix(encodings)[0]
+    gallery = get_face_gallery()
+    gallery.refresh()  # 다른 워커가 추가한 얼굴 반영
+
+    if getattr(settings, 'AI_ANN_INDEX', {}).get('BACKEND', 'brute') == 'brute':
+        return gallery.search(query, k=k, exclude_post_id=exclude_post_id)  # 정확한 전체 탐색
+
+    index = get_ann_index(gallery)  # 갤러리에 새로 추가된 얼굴도 인덱스에 반영됨
+    if index is None:
+        return []
+    return search_gallery(index, gallery, query, k=k, exclude_post_id=exclude_post_id)
+
 class DetectionConfig(BaseConfig):
     # 별도로 추가할 커스터마이징이 없으면 그대로 사용
     yolo_path = 'yolov8_l_trump.pt'
@@ -126,8 +304,8 @@ def detect_president(image_path: str, selected_detectors: list = ['yolo']) -> st
 
     Parameters
     ----------
-    image_path : str
-        처리할 이미지의 경로입니다.
+    image_path : str or SharedImageHandle
+        처리할 이미지의 경로입니다. 추론 워커 풀에서는 공유 메모리에 디코딩된 이미지의 핸들입니다.
     selected_detectors : list, optional
         사용할 얼굴 탐지기의 목록 (기본값은 ['yolo']).
 
@@ -136,36 +314,47 @@ def detect_president(image_path: str, selected_detectors: list = ['yolo']) -> st
     output_image_path : str
         처리된 이미지가 저장된 경로입니다.
     """
-    # 설정 정보를 가져옵니다.
-    config = DetectionConfig.get_config()
-
-    # 탐지기를 선택된 종류에 맞게 생성합니다.
-    detectors = []
-    for detector in selected_detectors:
-        if detector == 'mtcnn':  # 'mtcnn' 탐지기는 사용하지 않음
-            continue
-        detectors.append(factories.FaceDetectorFactory.create(detector, config[f'{detector}']))
+    # 설정 정보를 가져옵니다. (프로세스 단위로 캐시됨)
+    config = registry.get_config(DetectionConfig)
 
     # 파이프라인 설정: 얼굴 탐지, 정보 그리기, 저장하는 단계 추가
-    pipeline = Pipeline()
-    pipeline.add(steps.FaceDetector(detectors))  # 얼굴 탐지 단계 추가
-    pipeline.add(steps.InfoDrawer(thickness=5))  # 탐지 정보 그리기 단계 추가
-    pipeline.add(steps.Saver())  # 이미지 저장 단계 추가
+    # 탐지기(모델 가중치)와 파이프라인은 워커마다 한 번만 생성되어 재사용됩니다.
+    pipeline = registry.get_pipeline('detect', selected_detectors, build_detect_pipeline, DetectionConfig)
 
-    logging.info(f"이미지 처리 시작: {image_path}")
+    with open_image(image_path) as source:
+        logging.info(f"이미지 처리 시작: {source.path}")
 
-    # 데이터 객체를 생성하고 이미지 경로를 설정합니다.
-    data = Data(config, image_path)
-    data.image_rgb  # 이미지의 RGB 값 설정
+        # 데이터 객체를 생성하고 이미지의 RGB 값을 설정합니다. (탐지 정보를 그리므로 복사본 사용)
+        data = _create_data(config, source, writable=True)
 
-    # 파이프라인 실행: 설정된 단계를 순차적으로 수행
-    pipeline.run(data)
+        # 파이프라인 실행: 설정된 단계를 순차적으로 수행
+        pipeline.run(data)
 
-    logging.info(f"이미지 처리 완료: {image_path}")
+        logging.info(f"이미지 처리 완료: {source.path}")
 
-    # 처리된 이미지의 경로 반환
-    output_image_path = data.output_image_path
+        # 처리된 이미지의 경로 반환
+        output_image_path = data.output_image_path
+        del data  # 공유 메모리 이미지를 닫기 전에 참조를 놓음
 
     # 서버에서 템플릿 렌더링시 사용할 상대 경로 반환
     delete_path = os.path.join(BASE_DIR, 'media')
-    return output_image_path
\ No newline at end of file
+    return output_image_path
+
+def warm_up(selected_detectors: list = ['yolo']) -> dict:
+    """
+    유사도 비교와 대통령 찾기에 사용하는 탐지기를 미리 로드합니다.
+
+    워커 시작 시점(예: gunicorn의 post_fork 훅, process_tasks 실행 전)에 호출하면
+    첫 작업에서 모델을 로드하느라 지연되는 것을 막을 수 있습니다.
+
+    Parameters
+    ----------
+    selected_detectors : list, optional
+        미리 로드할 얼굴 탐지기의 목록 (기본값은 ['yolo']).
+
+    Returns
+    -------
+    dict
+        로드된 모델과 메모리 사용량 보고서입니다.
+    """
+    return registry.warm_up(selected_detectors, (BaseConfig, DetectionConfig))
@@ -1,12 +1,26 @@
+from functools import partial
+import hashlib
+
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import HttpResponse, JsonResponse
+from django.middleware.csrf import get_token
 from django.shortcuts import get_object_or_404, redirect
+from django.template.loader import render_to_string
 from django.utils import timezone
+from django.utils.safestring import mark_safe
 from django.urls import reverse
 from django.views.generic import ListView, DetailView, CreateView, UpdateView, DeleteView, RedirectView, TemplateView
-from django.db.models import Q
 
 from ..url_patterns import URLS
+from ..ai_user import get_ai_user_id, is_ai_user
+from ..search import get_search_backend
+from ..pagination import CountedPaginator, paginate_by_cursor
+from ..counters import get_post_counter
+from ..page_cache import get_page_cache
+from ..view_counter import get_view_counter, get_viewer_key
+from ..votes import toggle_vote
 
 import logging
 logger = logging.getLogger(URLS['APP_NAME'])  # 로거 설정
@@ -94,7 +108,47 @@ class IndexView(BaseExtraContextMixin, TemplateView):
     template_name = 'pybo/index.html'  # 사용할 템플릿 파일 지정
 
 
-class BaseListView(ListView):
+class PageCacheMixin:
+    """
+    PageCacheMixin 클래스는 로그인하지 않은 사용자의 응답 HTML을 페이지 캐시(pybo.page_cache)에 보관하는 믹스인입니다.
+
+    캐시 키에는 게시판(목록) 또는 게시글(상세)의 버전이 들어가므로, 게시글/댓글/추천이 바뀌면 시그널에서 버전을 올려 무효화합니다.
+
+    Methods
+    -------
+    get(request, *args, **kwargs):
+        캐시된 페이지가 있으면 바로 반환하고, 없으면 페이지를 그린 뒤 캐시에 저장합니다.
+
+    get_page_cache_pk():
+        상세 페이지의 게시글 ID를 반환합니다. 목록 페이지는 None입니다.
+
+    page_cache_hit():
+        캐시된 페이지를 반환하기 전에 호출됩니다. (상세 페이지의 조회수 기록 등)
+    """
+
+    def get(self, request, *args, **kwargs):
+        page_cache = get_page_cache()
+        key = None
+        if page_cache.is_cacheable(request):
+            key = page_cache.page_key(self.model, request.get_full_path(), self.get_page_cache_pk())
+            html = page_cache.get(key)
+            if html is not None:
+                self.page_cache_hit()
+                return HttpResponse(html)
+
+        response = super().get(request, *args, **kwargs)
+        if key is not None and response.status_code == 200:
+            response.add_post_render_callback(lambda rendered: page_cache.set(key, rendered.content))  # 렌더링된 HTML 저장
+        return response
+
+    def get_page_cache_pk(self):
+        return None
+
+    def page_cache_hit(self) -> None:
+        pass
+
+
+class BaseListView(PageCacheMixin, ListView):
     """
     BaseListView는 게시글 목록을 표시하는 공통 뷰입니다.
 
@@ -111,17 +165,49 @@ class BaseListView(ListView):
     search_fields : list
         검색할 필드를 지정합니다. 하위 클래스에서 설정이 필요합니다.
 
+    페이지네이션은 settings.BOARD_PAGINATION_MODE(또는 'mode' 쿼리 파라미터)로 고릅니다.
+    - 'cursor' : (create_date, id) 기준 커서 방식. 'cursor' 토큰으로 이전/다음 페이지로 이동하며 COUNT(*)를 실행하지 않습니다.
+    - 'page'   : 페이지 번호(OFFSET) 방식. 전체 글 수와 페이지 번호를 표시합니다.
+
     Methods
     -------
+    get_pagination_mode():
+        현재 요청의 페이지네이션 방식('cursor' 또는 'page')을 반환합니다.
+
     get_queryset():
         게시글 목록을 검색어에 따라 필터링하고 최신순으로 정렬합니다.
+        작성자를 함께 조회합니다. (추천 수, 댓글 수는 게시글에 저장된 vote_count, comment_count 컬럼)
+
+    get_paginator(queryset, per_page, ...):
+        전체 글 수를 COUNT(*) 대신 게시글 수 카운터(pybo.counters)로 구하는 Paginator를 반환합니다.
     
     get_context_data(**kwargs):
         템플릿에 추가적인 데이터를 전달합니다. 예를 들어, 페이지 번호와 검색어를 설정합니다.
+
+    로그인하지 않은 사용자의 목록 페이지는 게시판 버전별로 캐시됩니다. (PageCacheMixin)
     """
     paginate_by = 10  # 한 페이지에 보여줄 게시글 수
     template_name = ''  # 사용할 템플릿 (하위 클래스에서 설정 필요)
     search_fields = []  # 검색 필드 (하위 클래스에서 설정 필요)
+    pagination_modes = ('cursor', 'page')  # 지원하는 페이지네이션 방식
+
+    def get_pagination_mode(self) -> str:
+        """
+        현재 요청의 페이지네이션 방식을 반환합니다. 'mode' 쿼리 파라미터가 설정값보다 우선합니다.
+
+        Returns
+        -------
+        str
+            'cursor' 또는 'page'입니다.
+        """
+        mode = self.request.GET.get('mode') or getattr(settings, 'BOARD_PAGINATION_MODE', 'page')
+        return mode if mode in self.pagination_modes else 'page'
+
+    def get_paginate_by(self, queryset):
+        """
+        커서 방식에서는 ListView의 OFFSET 페이지네이션을 사용하지 않도록 None을 반환합니다.
+        """
+        return None if self.get_pagination_mode() == 'cursor' else self.paginate_by
 
     def get_queryset(self):
         """
@@ -137,21 +223,55 @@ class BaseListView(ListView):
         -------
         QuerySet
             필터링되고 정렬된 게시글 QuerySet입니다.
+            추천 수와 댓글 수는 게시글에 저장된 vote_count, comment_count 컬럼을 읽으므로 GROUP BY가 없습니다.
         """
         # 검색어 가져오기 ('kw'라는 GET 파라미터로 전달받음)
         search_keyword = self.request.GET.get('kw', '')  # 'kw' 파라미터에서 검색어 가져오기
         logger.info(f"검색어: {search_keyword}")  # 검색어 로깅
-        post_list = self.model.objects.order_by('-create_date')  # 게시글을 생성일 기준으로 최신순 정렬
+        # 템플릿에서 행마다 작성자를 조회하지 않도록 한 번의 쿼리로 함께 가져옵니다.
+        post_list = (
+            self.model.objects
+            .select_related('author')  # 작성자 정보를 JOIN으로 함께 조회
+            .order_by('-create_date', '-id')  # 게시글을 생성일 기준으로 최신순 정렬 (같은 시각이면 ID 역순)
+        )
 
-        # 검색어가 존재하고 검색 필드가 설정된 경우, 해당 검색어로 필터링합니다.
+        # 검색어가 존재하고 검색 필드가 설정된 경우, 검색 인덱스(sqlite FTS5 / MySQL FULLTEXT)로 필터링합니다.
+        # 인덱스를 사용할 수 없는 경우에는 search_fields의 icontains 검색을 사용합니다.
         if search_keyword and self.search_fields:
-            query = Q()  # 복합 쿼리 생성을 위한 Q 객체 생성
-            for field in self.search_fields:
-                query |= Q(**{f'{field}__icontains': search_keyword})  # 검색 필드 내에서 검색어가 포함된 항목을 필터링
-            post_list = post_list.filter(query).distinct()  # 중복된 게시글 제거
+            post_list = get_search_backend().filter(post_list, search_keyword, self.search_fields)
         
         return post_list  # 필터링된 게시글 QuerySet 반환
 
+    def get_count_func(self, queryset):
+        """
+        전체 글 수를 게시글 수 카운터로 구하는 함수를 반환합니다. (페이지 링크와 번호 열 계산에 사용)
+
+        검색어가 없으면 게시판별 게시글 수(항상 정확)를, 검색어가 있으면 캐시된 검색 결과 수(추정값일 수 있음)를 사용합니다.
+
+        Returns
+        -------
+        callable
+            COUNT(*)를 실행하지 않고 전체 글 수를 반환하는 함수입니다.
+        """
+        counter = get_post_counter()
+        if self.request.GET.get('kw', '') and self.search_fields:
+            return partial(counter.filtered, queryset)  # 검색 결과 수 (캐시 또는 추정값)
+        return partial(counter.total, self.model)  # 게시판 전체 글 수
+
+    def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        """
+        전체 글 수를 게시글 수 카운터로 구하는 Paginator를 반환합니다. (get_count_func)
+
+        Returns
+        -------
+        CountedPaginator
+            COUNT(*)를 실행하지 않는 Paginator입니다.
+        """
+        return CountedPaginator(
+            queryset, per_page, count_func=self.get_count_func(queryset),
+            orphans=orphans, allow_empty_first_page=allow_empty_first_page, **kwargs
+        )
+
     def get_context_data(self, **kwargs) -> dict:
         """
         get_context_data 메서드는 템플릿에 전달할 추가 데이터를 설정합니다.
@@ -173,16 +293,27 @@ class BaseListView(ListView):
         # 현재 페이지 번호와 검색어를 컨텍스트에 추가
         context['page'] = self.request.GET.get('page', '1')  # 현재 페이지 번호 설정
         context['kw'] = self.request.GET.get('kw', '')  # 검색어 설정
+        context['pagination_mode'] = self.get_pagination_mode()  # 페이지네이션 방식 설정
+
+        if context['pagination_mode'] == 'cursor':
+            # 커서 방식: 페이지 번호 방식과 같은 행 번호를 표시 (전체 글 수 - 앞에 있는 글 수, 앞에 있는 글 수는 토큰에 담겨 옴)
+            cursor_page = paginate_by_cursor(self.object_list, self.request.GET.get('cursor'), self.paginate_by)
+            context['cursor_page'] = cursor_page
+            total_post_count = self.get_count_func(self.object_list)() if cursor_page.object_list else 0
+            context['post_indices'] = [
+                (total_post_count - cursor_page.start_offset - i, obj) for i, obj in enumerate(cursor_page.object_list)
+            ]
+            return context
 
         # 페이지 인덱스 계산
-        page_obj = context['paginator'].get_page(context['page'])  # 페이지네이션 객체에서 현재 페이지 가져오기
+        page_obj = context['page_obj']  # ListView가 이미 계산한 현재 페이지 (get_page를 다시 호출하면 쿼리가 중복 실행됨)
         """
         현재 페이지에서 몇 번째 글부터 시작하는지를 결정하는 값이 start_index입니다. 
         예를 들어, 페이지 1에서 게시글의 start_index()는 1번부터 시작하고, 
         페이지 2에서는 21번부터 시작하는 식입니다.
         """
         start_index = page_obj.start_index()  # 현재 페이지의 시작 인덱스 계산
-        total_post_count = context['paginator'].count  # 전체 글 개수 가져오기
+        total_post_count = context['paginator'].count  # 전체 글 개수 가져오기 (게시글 수 카운터, COUNT(*) 없음)
         post_indices = [(total_post_count - (start_index - 1) - i, obj) for i, obj in enumerate(page_obj.object_list)]  # 게시글 인덱스와 객체를 리스트로 만듦
         context['post_indices'] = post_indices  # 게시글 인덱스를 역순으로 설정
         
@@ -354,7 +485,61 @@ class BaseCreateView(BaseFormMixin, CreateView):
         return redirect(success_url)
 
 
-class BaseReadView(DetailView):
+def parse_comment_id(tags: str):
+    """
+    메시지 태그 문자열에서 댓글 ID를 추출합니다.
+
+    댓글 관련 메시지는 각 뷰에서 extra_tags='comment {id}' 형식으로 설정되므로,
+    'comment' 토큰 바로 뒤의 숫자 토큰을 댓글 ID로 사용합니다.
+    부분 문자열로 비교하지 않으므로 댓글 1이 댓글 12의 태그와 일치하지 않습니다.
+
+    Parameters
+    ----------
+    tags : str
+        메시지의 태그 문자열입니다. (예: 'comment 12 success')
+
+    Returns
+    -------
+    int or None
+        댓글 ID입니다. 댓글 ID가 없는 태그이면 None을 반환합니다.
+    """
+    tokens = tags.split()
+    for token, next_token in zip(tokens, tokens[1:]):
+        if token == 'comment' and next_token.isdigit():
+            return int(next_token)
+    return None
+
+
+def index_comment_messages(message_list, comments) -> dict:
+    """
+    메시지를 댓글 ID별로 분류한 딕셔너리를 만듭니다.
+
+    메시지를 한 번, 댓글을 한 번 순회하므로 O(메시지 수 + 댓글 수)로 동작합니다.
+
+    Parameters
+    ----------
+    message_list : iterable
+        django.contrib.messages의 Message 객체들입니다.
+    comments : iterable
+        메시지를 연결할 댓글들입니다.
+
+    Returns
+    -------
+    dict
+        댓글 ID(int)를 키로 하여 메시지 리스트를 저장한 딕셔너리입니다.
+    """
+    messages_by_id = {}  # 태그에서 파싱한 댓글 ID별 메시지
+    for message in message_list:
+        comment_id = parse_comment_id(message.tags)
+        if comment_id is not None:
+            messages_by_id.setdefault(comment_id, []).append({
+                'text': message.message,
+                'tags': message.tags,
+            })
+    return {comment.id: messages_by_id.get(comment.id, []) for comment in comments}
+
+
+class BaseReadView(PageCacheMixin, DetailView):
     """
     BaseReadView는 게시글의 상세 내용을 보여주는 공통 뷰입니다.
 
@@ -373,18 +558,100 @@ class BaseReadView(DetailView):
 
     Methods
     -------
+    get_queryset():
+        게시글을 작성자와 함께 조회하는 QuerySet을 반환합니다.
+
+    get_object(queryset=None):
+        게시글을 조회하고 조회수를 1 늘립니다. (pybo.view_counter에 모았다가 한 번에 기록)
+
     get_context_data(**kwargs):
         게시글의 댓글 및 작성자 여부 등의 추가 데이터를 템플릿에 전달합니다.
     
+    get_comments(post):
+        게시글의 댓글을 작성자와 함께 한 번의 쿼리로 조회합니다.
+
+    render_to_response(context, **response_kwargs):
+        댓글 목록 조각을 그리거나 캐시에서 읽어 템플릿에 전달합니다.
+
     _process_comments(comments):
         각 댓글에 대해 작성자 여부 및 AI 처리 여부를 추가합니다.
     
     _get_comment_messages(comments):
         각 댓글에 연결된 메시지를 가져옵니다.
+
+    로그인하지 않은 사용자의 상세 페이지는 게시글 버전별로 캐시되고(PageCacheMixin),
+    댓글 목록 조각(pybo/answer_list.html)은 게시글 버전과 사용자별로 캐시됩니다.
     """
     model = NotImplemented  # 사용할 모델 지정 (하위 클래스에서 설정 필요)
     template_name = NotImplemented  # 사용할 템플릿 지정 (하위 클래스에서 설정 필요)
     context_object_name = 'post'  # 템플릿에서 사용할 객체 이름
+    comments_template_name = 'pybo/answer_list.html'  # 댓글 목록 조각 템플릿
+    comments_cache_key = None  # 댓글 목록 조각의 캐시 키 (캐시할 수 없는 요청이면 None)
+
+    def get_page_cache_pk(self):
+        return self.kwargs['pk']
+
+    def page_cache_hit(self) -> None:
+        """
+        캐시된 상세 페이지를 반환할 때도 조회수와 순 방문자를 기록합니다. (화면의 조회수는 캐시된 값)
+        """
+        get_view_counter().record(self.model, self.kwargs['pk'], viewer=get_viewer_key(self.request))
+
+    def get_queryset(self):
+        """
+        get_queryset 메서드는 게시글을 작성자 정보와 함께 조회하는 QuerySet을 반환합니다.
+
+        Returns
+        -------
+        QuerySet
+            작성자를 select_related 한 게시글 QuerySet입니다. (추천 수는 저장된 vote_count 컬럼)
+        """
+        return super().get_queryset().select_related('author')  # 작성자 정보를 JOIN으로 함께 조회
+
+    def get_object(self, queryset=None):
+        """
+        게시글을 조회하고 조회수를 1 늘립니다. 순 방문자 스케치에도 방문자를 추가합니다.
+
+        조회수는 바로 UPDATE 하지 않고 조회수 카운터에 모았다가 한 번에 기록하므로,
+        화면에는 데이터베이스의 view_count에 아직 기록하지 않은 증가분(이번 조회 포함)을 더해 표시합니다.
+
+        Parameters
+        ----------
+        queryset : QuerySet, optional
+            게시글을 조회할 QuerySet입니다.
+
+        Returns
+        -------
+        Model instance
+            view_count에 이번 조회까지 반영된 게시글입니다.
+        """
+        post = super().get_object(queryset)
+        post.view_count += get_view_counter().record(type(post), post.pk, viewer=get_viewer_key(self.request))
+        return post
+
+    def get_comments(self, post):
+        """
+        get_comments 메서드는 게시글에 달린 댓글을 작성 순서대로 조회합니다.
+
+        댓글마다 작성자를 따로 조회하지 않도록 select_related 하여 한 번의 쿼리로 가져옵니다.
+        추천 수는 댓글에 저장된 vote_count 컬럼을 사용합니다.
+
+        Parameters
+        ----------
+        post : Model instance
+            댓글을 조회할 게시글입니다.
+
+        Returns
+        -------
+        list
+            작성자가 포함된 댓글 리스트입니다.
+        """
+        comments = (
+            post.comments
+            .select_related('author')  # 작성자 정보를 JOIN으로 함께 조회
+            .order_by('create_date', 'id')  # 작성 순서대로 정렬
+        )
+        return list(comments)  # 메시지 매칭과 댓글 처리에서 재사용할 수 있도록 한 번만 평가
 
     def get_context_data(self, **kwargs) -> dict:
         """
@@ -402,22 +669,66 @@ class BaseReadView(DetailView):
         dict
             템플릿에 전달할 추가적인 데이터를 포함한 컨텍스트 딕셔너리입니다.
         """
-        from pybo.models import User  # User 모델 가져오기
-        
         context = super().get_context_data(**kwargs)  # 부모 클래스의 get_context_data 호출
-        post = self.get_object()  # 현재 게시글 가져오기
-        comments = post.comments.all()  # 게시글에 달린 모든 댓글 가져오기
+        post = self.object  # DetailView.get()에서 이미 조회한 게시글 재사용
 
         # 작성자가 현재 사용자인지 여부와 댓글 정보 추가
         context['is_author'] = self.request.user == post.author
-        context['is_superuser'] = self.request.user == User.objects.get(username='AI')
-        
+        ai_user_id = get_ai_user_id()  # 프로세스 단위로 캐시된 AI 계정 ID (계정이 없으면 None)
+        context['is_superuser'] = is_ai_user(self.request.user)  # 현재 사용자가 AI 계정인지 ID로 비교
+
+        # 캐시된 댓글 목록 조각이 있으면 댓글을 조회하지 않음
+        page_cache = get_page_cache()
+        if page_cache.is_cacheable(self.request, anonymous_only=False):
+            self.comments_cache_key = page_cache.fragment_key('comments', type(post), post.pk, self._comments_variant())
+            html = page_cache.get(self.comments_cache_key)
+            if html is not None:
+                context['comments_html'] = mark_safe(html)
+                return context
+
         # 댓글 및 메시지 처리
-        context['processed_comments'] = self._process_comments(comments)
+        comments = self.get_comments(post)  # 게시글에 달린 모든 댓글 가져오기
+        context['processed_comments'] = self._process_comments(comments, ai_user_id)
         
         return context  # 추가 데이터를 포함한 컨텍스트 반환
 
-    def _process_comments(self, comments) -> list:
+    def render_to_response(self, context, **response_kwargs):
+        """
+        댓글 목록 조각을 그려 context['comments_html']로 전달하고, 캐시할 수 있는 요청이면 캐시에 저장합니다.
+
+        하위 클래스가 추가한 댓글 폼(comment_form)까지 포함된 최종 컨텍스트로 그리기 위해 이 단계에서 처리합니다.
+
+        Parameters
+        ----------
+        context : dict
+            템플릿 컨텍스트입니다.
+
+        Returns
+        -------
+        TemplateResponse
+            상세 페이지 응답입니다.
+        """
+        if 'comments_html' not in context:
+            html = render_to_string(self.comments_template_name, context, self.request)
+            if self.comments_cache_key is not None:
+                get_page_cache().set(self.comments_cache_key, html)
+            context['comments_html'] = html
+        return super().render_to_response(context, **response_kwargs)
+
+    def _comments_variant(self) -> str:
+        """
+        댓글 목록 조각을 사용자별로 구분하는 값을 반환합니다.
+
+        로그인한 사용자는 추천/수정 버튼과 수정 폼의 CSRF 토큰이 다르므로 사용자 ID와 CSRF 쿠키 해시로 구분합니다.
+        """
+        user = self.request.user
+        if not user.is_authenticated:
+            return 'anon'
+        get_token(self.request)  # 첫 요청이면 여기서 만든 CSRF 값으로 조각을 그리고 쿠키로 보냄
+        csrf_secret = self.request.META.get('CSRF_COOKIE', '')
+        return f"u{user.pk}:{hashlib.sha1(csrf_secret.encode('utf-8')).hexdigest()[:12]}"
+
+    def _process_comments(self, comments, ai_user_id=None) -> list:
         """
         _process_comments 메서드는 각 댓글에 대해 작성자 여부 및 AI 처리 여부를 추가하고, 
         
@@ -425,8 +736,10 @@ class BaseReadView(DetailView):
 
         Parameters
         ----------
-        comments : QuerySet
-            처리할 댓글들의 QuerySet입니다.
+        comments : list
+            get_comments()로 조회한 댓글 리스트입니다.
+        ai_user_id : int, optional
+            AI 계정의 ID입니다. 작성자 ID와 비교하여 AI 댓글 여부를 판단합니다.
 
         Returns
         -------
@@ -439,7 +752,8 @@ class BaseReadView(DetailView):
         # 각 댓글을 처리하여 필요한 정보를 추가
         for comment in comments:
             is_author = self.request.user == comment.author  # 현재 사용자가 댓글 작성자인지 여부
-            is_ai_processing = (comment.content == "AI가 처리 중입니다." and comment.author.username == "AI")  # AI 처리 여부 확인
+            is_ai = ai_user_id is not None and comment.author_id == ai_user_id  # AI 계정이 작성한 댓글인지 ID로 확인
+            is_ai_processing = (is_ai and comment.content == "AI가 처리 중입니다.")  # AI 처리 여부 확인
             
             # comment에 image1과 image2 필드가 있는지 확인
             image1_url = comment.image1.url if hasattr(comment, 'image1') and comment.image1 else None
@@ -449,14 +763,15 @@ class BaseReadView(DetailView):
                 'id': comment.id,
                 'content': comment.content,
                 'is_author': is_author,
+                'is_ai': is_ai,
                 'is_ai_processing': is_ai_processing,
                 'image1': image1_url,
                 'image2': image2_url,
                 'modify_date': comment.modify_date,
                 'author_username': comment.author.username,
                 'create_date': comment.create_date,
-                'voter_count': comment.voter.count(),
-                'messages': comment_messages.get(str(comment.id), [])  # 해당 댓글의 메시지 추가
+                'voter_count': comment.vote_count,  # 댓글에 저장된 추천 수
+                'messages': comment_messages.get(comment.id, [])  # 해당 댓글의 메시지 추가
             })
         return processed_comments  # 처리된 댓글 리스트 반환
 
@@ -466,25 +781,16 @@ class BaseReadView(DetailView):
 
         Parameters
         ----------
-        comments : QuerySet
-            메시지를 연결할 댓글들의 QuerySet입니다.
+        comments : list
+            메시지를 연결할 댓글 리스트입니다.
 
         Returns
         -------
         dict
-            댓글 ID를 키로 하여 메시지를 리스트로 저장한 딕셔너리입니다.
+            댓글 ID(int)를 키로 하여 메시지를 리스트로 저장한 딕셔너리입니다.
         """
-        comment_messages = {str(comment.id): [] for comment in comments}  # 댓글 ID로 초기화된 딕셔너리
-        for message in messages.get_messages(self.request):
-            for comment in comments:
-                # message.tags에 comment.id가 있는지 확인 
-                # massage.tags 설정은 각 해위하는 뷰(예 : voteview) 에서 extra_tags 로 설정
-                if str(comment.id) in message.tags:  
-                    comment_messages[str(comment.id)].append({
-                        'text': message.message,
-                        'tags': message.tags,
-                    })
-        return comment_messages  # 댓글 메시지 딕셔너리 반환
+        # massage.tags 설정은 각 해위하는 뷰(예 : voteview) 에서 extra_tags 로 설정
+        return index_comment_messages(messages.get_messages(self.request), comments)  # 댓글 메시지 딕셔너리 반환
 
 
 class BaseUpdateView(BaseFormMixin, UpdateView):
@@ -619,9 +925,18 @@ class BaseVoteView(LoginRequiredMixin, RedirectView):
     BaseVoteView 클래스는 게시글 또는 댓글에 대해 추천하는 기능을 담당하는 뷰입니다.
 
     사용자는 자신이 작성한 글이나 댓글은 추천할 수 없으며, 추천 상태에 따라 추천을 추가하거나 취소합니다.
+    추천 토글은 pybo.votes.toggle_vote()로 처리합니다. (유일 인덱스를 사용한 한 번의 DELETE 또는 INSERT)
+
+    Accept 헤더에 application/json이 있으면(AJAX 요청) 리다이렉트 없이 추천 결과를 JSON으로 반환합니다.
 
     Methods
     -------
+    get(request, *args, **kwargs):
+        AJAX 요청이면 추천 결과를 JSON으로 반환하고, 아니면 리다이렉트합니다.
+
+    vote(obj):
+        추천을 토글하고 (성공 여부, 메시지, 추천 결과)를 반환합니다.
+
     get_redirect_url(*args, **kwargs):
         추천 로직을 처리한 후, 추천이 완료된 후 리다이렉트할 URL을 반환합니다.
     """
@@ -629,6 +944,49 @@ class BaseVoteView(LoginRequiredMixin, RedirectView):
     model = NotImplemented  # 사용할 모델 지정 (하위 클래스에서 설정 필요)
     success_url = NotImplemented  # 리다이렉트할 URL 지정 (하위 클래스에서 설정 필요)
 
+    def get(self, request, *args, **kwargs):
+        """
+        AJAX 요청이면 추천을 토글하고 결과를 JSON으로 반환합니다. 그 외에는 추천 후 리다이렉트합니다.
+
+        Parameters
+        ----------
+        request : HttpRequest
+            현재 요청 객체입니다.
+
+        Returns
+        -------
+        HttpResponse
+            JSON 응답({'voted', 'vote_count', 'message'}) 또는 리다이렉트 응답입니다.
+        """
+        if 'application/json' not in request.headers.get('Accept', ''):
+            return super().get(request, *args, **kwargs)
+
+        obj = get_object_or_404(self.model, pk=kwargs['pk'])  # 추천할 객체 가져오기
+        ok, message, result = self.vote(obj)
+        if not ok:
+            return JsonResponse({'message': message, 'vote_count': obj.vote_count}, status=403)
+        return JsonResponse({'voted': result.voted, 'vote_count': result.vote_count, 'message': message})
+
+    def vote(self, obj):
+        """
+        현재 사용자의 추천을 토글합니다.
+
+        Parameters
+        ----------
+        obj : Model instance
+            추천할 게시글 또는 댓글입니다.
+
+        Returns
+        -------
+        tuple
+            (성공 여부, 사용자에게 보여줄 메시지, VoteResult 또는 None)입니다.
+        """
+        if self.request.user == obj.author:
+            return False, '본인이 작성한 항목은 추천할 수 없습니다.', None
+
+        result = toggle_vote(obj, self.request.user)
+        return True, '추천하였습니다.' if result.voted else '추천을 취소했습니다.', result
+
     def get_redirect_url(self, *args, **kwargs) -> str:
         """
         추천 로직을 처리한 후 리다이렉트할 URL을 반환하는 메서드입니다.
@@ -655,15 +1013,12 @@ class BaseVoteView(LoginRequiredMixin, RedirectView):
         else:
             extra_tags = f'post'
 
-        # 추천 로직 처리
-        if self.request.user == obj.author:
-            messages.error(self.request, '본인이 작성한 항목은 추천할 수 없습니다.', extra_tags=extra_tags)
-        elif self.request.user in obj.voter.all():
-            obj.voter.remove(self.request.user)  # 이미 추천한 경우 추천 취소
-            messages.success(self.request, '추천을 취소했습니다.', extra_tags=extra_tags)
+        # 추천 로직 처리 (추천한 사용자 전체를 읽지 않고 유일 인덱스로 토글)
+        ok, message, _ = self.vote(obj)
+        if ok:
+            messages.success(self.request, message, extra_tags=extra_tags)
         else:
-            obj.voter.add(self.request.user)  # 추천하지 않은 경우 추천 추가
-            messages.success(self.request, '추천하였습니다.', extra_tags=extra_tags)
+            messages.error(self.request, message, extra_tags=extra_tags)
 
         # 댓글이면 해당 댓글 위치로 이동할 수 있도록 앵커 추가
         if hasattr(obj, 'post'):
@@ -8,6 +8,9 @@ from django.utils import timezone
 import logging
 
 from ..url_patterns import URLS
+from ..ai_user import get_ai_user
+from ..jobs import job
+from ..inference.backends import get_ai_backend
 
 logger = logging.getLogger(URLS['APP_NAME'])
 
@@ -183,17 +186,14 @@ def create_initial_ai_comment2(post_id: int) -> None:
     None
     """
     
-    from django.contrib.auth.models import User
     from ..models import DetectionPostModel, DetectionCommentModel
 
     logger.info(f"초기 AI 답변 생성 - Board:{board_name} ID: {post_id}")
 
     post = get_object_or_404(DetectionPostModel, pk=post_id)  # 게시글 조회
 
-    try:
-        ai_user = User.objects.get(username='AI')  # AI 사용자 계정 조회
-    except User.DoesNotExist:
-        logger.error("슈퍼유저 'AI'가 존재하지 않습니다.")
+    ai_user = get_ai_user()  # AI 사용자 계정 조회 (프로세스 단위 캐시 사용)
+    if ai_user is None:
         return
 
     # AI가 작성한 초기 답변 생성
@@ -205,84 +205,83 @@ def create_initial_ai_comment2(post_id: int) -> None:
     )
     comment.save()
 
-    # AI 백그라운드 작업 예약
-    detect_president(
-        comment_id=comment.id,
-        post_id=post_id,
-        schedule=1  # 1초 후 실행 예약
-    )
+    # AI 작업을 큐에 넣음 (작업 큐가 즉시 워커를 깨움)
+    detect_president.enqueue(comment_id=comment.id, post_id=post_id)
+
+
+def mark_ai_comment_failed(comment_id: int, post_id: int) -> None:
+    """
+    AI 작업이 재시도를 모두 실패했을 때 답변에 오류 메시지를 기록하는 함수입니다.
 
-from background_task import background
+    Parameters
+    ----------
+    comment_id : int
+        오류 메시지를 기록할 답변의 ID입니다.
 
-@background(schedule=1)
+    post_id : int
+        답변이 달린 게시글의 ID입니다.
+
+    Returns
+    -------
+    None
+    """
+    comment = DetectionCommentModel.objects.filter(pk=comment_id).first()
+    if comment is None:  # 작업이 끝나기 전에 댓글이 삭제됨
+        return
+    comment.content = "AI 처리 중 오류가 발생했습니다. 다시 시도해 주세요."
+    comment.modify_date = timezone.now()
+    comment.save(update_fields=['content', 'modify_date'])  # post_save 시그널로 페이지 캐시도 무효화
+
+
+@job('detection.ai_comment', on_failure=mark_ai_comment_failed)
 def detect_president(comment_id: int, post_id: int) -> None:
+    """
+    게시판에 설정된 AI 백엔드(settings.AI_BACKEND)로 인물 탐지를 실행하고, 결과 이미지와 메시지를 답변으로 업데이트하는 작업입니다.
+
+    'remote' 백엔드의 AI 서버 연결 실패나 시간 초과(httpx.TransportError)는 다시 던져 작업 큐가 재시도하도록 합니다.
+
+    Parameters
+    ----------
+    comment_id : int
+        처리 결과를 업데이트할 답변의 ID입니다.
+
+    post_id : int
+        답변이 달린 게시글의 ID입니다.
+
+    Returns
+    -------
+    None
+    """
     
-    from ..models import DetectionPostModel, DetectionCommentModel
     import httpx
-    from django.shortcuts import get_object_or_404
-    from django.utils import timezone
-    import os
-    from django.conf import settings
-    import base64
-    import platform
-    
 
     logger.info(f"AI 처리 중 - Board:{board_name} ID: {post_id}")
 
-    comment = get_object_or_404(DetectionCommentModel, pk=comment_id)  # 댓글 조회
-    post = get_object_or_404(DetectionPostModel, pk=post_id)  # 게시글 조회
-
-    image_path = post.image1.path  # 게시글에 첨부된 이미지 경로 조회
+    comment = DetectionCommentModel.objects.filter(pk=comment_id).first()  # 댓글 조회
+    post = DetectionPostModel.objects.filter(pk=post_id).first()  # 게시글 조회
+    if comment is None or post is None:  # 작업이 실행되기 전에 삭제됨 (다시 실행해도 찾을 수 없으므로 재시도하지 않음)
+        logger.info(f"AI 처리 건너뜀 (삭제된 댓글 또는 게시글) - Board:{board_name} ID: {post_id}")
+        return
 
     try:
-        with httpx.Client(timeout=httpx.Timeout(30.0)) as client:
-            with open(image_path, 'rb') as f:
-                files = {'file': f}
-                response = client.post("http://52.78.102.210:8007/process_ai_image/", files=files)
-
-        django_dir = settings.BASE_DIR
-
-        if response.status_code == 200:  # OK
-            data = response.json()
-
-            # 서버에서 받은 경로 처리
-            str_path = data['image_path']
-
-            # 윈도우와 우분투를 모두 고려한 경로 처리
-            if platform.system() == "Windows":
-                # 윈도우일 경우
-                result_image_path = os.path.join('media', str_path.split('media\\', 1)[-1])
-                db_path = str_path.split('media\\', 1)[-1]
-            else:
-                # 우분투일 경우
-                result_image_path = os.path.join('media', str_path.split('media/', 1)[-1])
-                db_path = str_path.split('media/', 1)[-1]
-
-            # 받은 이미지를 디코딩 후 저장
-            result_image = data['base64_image']
-            result_text = data['message']
-
-            decode_image = base64.b64decode(result_image)
-            results_folder = os.path.join(django_dir, result_image_path)
-
-            with open(results_folder, 'wb') as out_file:
-                out_file.write(decode_image)
-
-            # AI로 이미지 처리 후 결과 이미지 경로 저장
-            comment.content = result_text
-            comment.image1 = db_path  # 처리된 이미지 경로 저장
-            comment.save()
-
-            logger.info(f"AI 처리 완료 - Board:{board_name} ID: {post_id}")
-            
-        else:
-            comment.content = "AI 처리 중 오류가 발생했습니다. 다시 시도해 주세요."
-            
+        # 게시판에 설정된 AI 백엔드(AI 서버 또는 로컬 파이프라인)로 인물 탐지 (결과 이미지는 MEDIA_ROOT에 저장됨)
+        result = get_ai_backend(board_name).detect_president(post.image1.path)
+
+        # AI로 이미지 처리 후 결과 메시지와 결과 이미지 경로 저장
+        comment.content = result.message
+        comment.image1 = result.image_name
         comment.modify_date = timezone.now()  # 댓글 수정 날짜 갱신
         comment.save()
-        
+
+        logger.info(f"AI 처리 완료 - Board:{board_name} ID: {post_id}")
+
+    except httpx.TransportError:
+        # 연결 실패, 시간 초과 등 일시적인 오류는 작업 큐가 다시 실행 (재시도를 모두 실패하면 mark_ai_comment_failed 호출)
+        logger.warning(f"AI 서버 연결 실패 - Board:{board_name} ID: {post_id}")
+        raise
+
     except Exception as e:
-        # AI 처리 실패 시 예외 처리
+        # AI 처리 실패(AI 서버 오류 응답 포함) 시 예외 처리
         logger.exception(f"AI 처리 실패 - Board:{board_name} ID: {post_id}")
         comment.content = "AI 처리 중 오류가 발생했습니다. 다시 시도해 주세요."
         comment.modify_date = timezone.now()  # 댓글 수정 날짜 갱신
@@ -9,6 +9,9 @@ from django.utils import timezone
 import logging
 
 from ..url_patterns import URLS
+from ..ai_user import get_ai_user
+from ..jobs import job, PRIORITY_LOW
+from ..inference.backends import get_ai_backend
 
 logger = logging.getLogger(URLS['APP_NAME'])
 
@@ -171,8 +174,6 @@ class SimilarityCommentVoteView(BaseVoteView):
     success_url = read_url  # 추천 후 이동할 URL 설정
 
 
-from background_task import background
-
 def create_initial_ai_comment(post_id: int) -> None:
     """
     AI 처리 중임을 알리는 초기 댓글을 생성하는 함수입니다.
@@ -189,18 +190,15 @@ def create_initial_ai_comment(post_id: int) -> None:
     None
     """
     
-    from django.contrib.auth.models import User
     from ..models import SimilarityPostModel, SimilarityCommentModel
 
     logger.info(f"초기 AI 댓글 생성 - Board:{board_name} ID: {post_id}")
 
     post = get_object_or_404(SimilarityPostModel, pk=post_id)  # 게시글 조회
 
-    try:
-        # AI 계정 슈퍼유저 조회
-        ai_user = User.objects.get(username='AI')
-    except User.DoesNotExist:
-        logger.error("슈퍼유저 'AI'가 존재하지 않습니다.")
+    # AI 계정 슈퍼유저 조회 (프로세스 단위 캐시 사용)
+    ai_user = get_ai_user()
+    if ai_user is None:
         return
 
     # AI가 작성한 초기 댓글 생성
@@ -212,18 +210,41 @@ def create_initial_ai_comment(post_id: int) -> None:
     )
     comment.save()
 
-    # AI 백그라운드 작업 예약
-    schedule_ai_comment_update(
-        comment_id=comment.id,
-        post_id=post_id,
-        schedule=1  # 1초 후 실행 예약
-    )
+    # AI 작업을 큐에 넣음 (작업 큐가 즉시 워커를 깨움)
+    schedule_ai_comment_update.enqueue(comment_id=comment.id, post_id=post_id)
+
+
+def mark_ai_comment_failed(comment_id: int, post_id: int) -> None:
+    """
+    AI 작업이 재시도를 모두 실패했을 때 댓글에 오류 메시지를 기록하는 함수입니다.
+
+    Parameters
+    ----------
+    comment_id : int
+        오류 메시지를 기록할 댓글의 ID입니다.
+
+    post_id : int
+        댓글이 달린 게시글의 ID입니다.
 
-@background(schedule=1)
+    Returns
+    -------
+    None
+    """
+    comment = SimilarityCommentModel.objects.filter(pk=comment_id).first()
+    if comment is None:  # 작업이 끝나기 전에 댓글이 삭제됨
+        return
+    comment.content = "AI 처리 중 오류가 발생했습니다. 다시 시도해 주세요."
+    comment.modify_date = timezone.now()
+    comment.save(update_fields=['content', 'modify_date'])  # post_save 시그널로 페이지 캐시도 무효화
+
+
+@job('similarity.ai_comment', on_failure=mark_ai_comment_failed)
 def schedule_ai_comment_update(comment_id: int, post_id: int) -> None:
     """
     백그라운드에서 AI 처리를 실행하고, 처리 결과를 댓글로 업데이트하는 함수입니다.
 
+    AI 처리는 게시판에 설정된 AI 백엔드(settings.AI_BACKEND의 'remote' 또는 'local')가 실행합니다.
+
     Parameters
     ----------
     comment_id : int
@@ -235,70 +256,81 @@ def schedule_ai_comment_update(comment_id: int, post_id: int) -> None:
     Returns
     -------
     None
+
+    Raises
+    ------
+    httpx.TransportError
+        'remote' 백엔드에서 AI 서버 연결 실패나 시간 초과 시 발생하며, 작업 큐가 잠시 뒤 다시 실행합니다.
     """
     
-    from ..models import SimilarityPostModel, SimilarityCommentModel
-    from django.shortcuts import get_object_or_404
-    from django.utils import timezone
     import httpx
-    import mimetypes
-    import os
-    import platform
-    
+    from django.conf import settings
+
     logger.info(f"AI 처리 중 - Board:{board_name} ID: {post_id}")
 
     # 댓글 및 게시글 조회
-    comment = get_object_or_404(SimilarityCommentModel, pk=comment_id)  # 댓글 조회
-    post = get_object_or_404(SimilarityPostModel, pk=post_id)  # 게시글 조회
-
-    # 이미지 경로 조회
-    image1_path = post.image1.path  # 첫 번째 이미지 경로
-    image2_path = post.image2.path  # 두 번째 이미지 경로
-
-    # 이미지 타입 추정
-    img1_type = mimetypes.guess_type(image1_path)
-    img2_type = mimetypes.guess_type(image2_path)
+    comment = SimilarityCommentModel.objects.filter(pk=comment_id).first()  # 댓글 조회
+    post = SimilarityPostModel.objects.filter(pk=post_id).first()  # 게시글 조회
+    if comment is None or post is None:  # 작업이 실행되기 전에 삭제됨 (다시 실행해도 찾을 수 없으므로 재시도하지 않음)
+        logger.info(f"AI 처리 건너뜀 (삭제된 댓글 또는 게시글) - Board:{board_name} ID: {post_id}")
+        return
 
     try:
-        # 운영체제에 맞는 경로 처리 (특히 윈도우와 리눅스)
-        if platform.system() == "Windows":
-            image1_path = image1_path.replace("/", "\\")
-            image2_path = image2_path.replace("/", "\\")
-        else:
-            image1_path = image1_path.replace("\\", "/")
-            image2_path = image2_path.replace("\\", "/")
-
-        # AI 서버로 이미지 전송 및 처리 결과 받기
-        with httpx.Client(timeout=httpx.Timeout(30.0)) as client:
-            with open(image1_path, 'rb') as f1, open(image2_path, 'rb') as f2:
-                response = client.post(
-                    "http://52.78.102.210:8007/process_ai_image_two/",
-                    files={
-                        'file1': (os.path.basename(image1_path), f1, img1_type[0]),
-                        'file2': (os.path.basename(image2_path), f2, img2_type[0])
-                    }
-                )
-        
-        # 응답 처리
-        if response.status_code == 200:
-            result = response.json()
+        # 게시판에 설정된 AI 백엔드(AI 서버 또는 로컬 파이프라인)로 두 이미지의 얼굴 유사도 비교
+        result = get_ai_backend(board_name).compare_faces(post.image1.path, post.image2.path)
 
-            # AI 처리 결과를 댓글에 저장
-            comment.content = result.get('result', 'AI 처리 결과가 없습니다.')
-            comment.save()
+        # AI 처리 결과를 댓글에 저장
+        comment.content = result.message
+        comment.save()
+
+        logger.info(f"AI 처리 완료 - Board:{board_name} ID: {post_id}")
 
-            logger.info(f"AI 처리 완료 - Board:{board_name} ID: {post_id}")
+        # 닮은 얼굴 찾기를 위해 업로드된 얼굴 인코딩을 갤러리에 추가 (낮은 우선순위 작업)
+        if getattr(settings, 'AI_FACE_GALLERY', {}).get('ENABLED'):
+            add_post_to_face_gallery.enqueue(post_id=post_id)
 
     except ValueError as e:
-        # 얼굴 유사도 계산 중 문제가 발생했을 경우 예외 처리
+        # 얼굴 유사도 계산 중 문제가 발생했을 경우 예외 처리 (사진에 얼굴이 1개가 아닌 경우 등)
         logger.exception(f"AI 처리 실패 - Board:{board_name} ID: {post_id}")
         comment.content = str(e)  # 예외 메시지를 댓글 내용으로 저장
         comment.modify_date = timezone.now()  # 수정 날짜 업데이트
         comment.save()
-        
+
+    except httpx.TransportError:
+        # 연결 실패, 시간 초과 등 일시적인 오류는 작업 큐가 다시 실행 (재시도를 모두 실패하면 mark_ai_comment_failed 호출)
+        logger.warning(f"AI 서버 연결 실패 - Board:{board_name} ID: {post_id}")
+        raise
+
     except Exception as e:
-        # 기타 AI 처리 실패 시 예외 처리
+        # 기타 AI 처리 실패(AI 서버 오류 응답 포함) 시 예외 처리
         logger.exception(f"AI 처리 실패 - Board:{board_name} ID: {post_id}")
         comment.content = "AI 처리 중 오류가 발생했습니다. 다시 시도해 주세요."  # 오류 메시지 저장
         comment.modify_date = timezone.now()  # 수정 날짜 업데이트
         comment.save()
+
+
+@job('similarity.face_gallery', priority=PRIORITY_LOW, max_retries=0)
+def add_post_to_face_gallery(post_id: int) -> None:
+    """
+    게시글의 얼굴 인코딩을 얼굴 갤러리에 추가하는 작업입니다. (settings.AI_FACE_GALLERY['ENABLED']가 True일 때 등록)
+
+    AI 댓글 작업보다 낮은 우선순위로 실행되며, 갤러리 추가에 실패해도 AI 댓글 처리에는 영향을 주지 않습니다.
+
+    Parameters
+    ----------
+    post_id : int
+        얼굴 인코딩을 추가할 게시글의 ID입니다.
+
+    Returns
+    -------
+    None
+    """
+    post = SimilarityPostModel.objects.filter(pk=post_id).first()
+    if post is None:
+        return
+
+    try:
+        from .ai import index_similarity_post  # 로컬 AI 의존성은 기능을 사용할 때만 임포트
+        index_similarity_post(post)
+    except Exception:
+        logger.exception(f"얼굴 갤러리 추가 실패 - Board:{board_name} ID: {post_id}")
@@ -0,0 +1,86 @@
+from dataclasses import dataclass
+
+from django.db import IntegrityError, transaction
+from django.dispatch import Signal
+
+from .counters import adjust_count
+from .url_patterns import URLS
+
+import logging
+logger = logging.getLogger(URLS['APP_NAME'])  # 로거 설정
+
+"""
+게시글/댓글 추천을 토글하는 모듈입니다.
+
+user in obj.voter.all()로 확인하면 인기 게시글의 추천한 사용자 전체를 읽어 오고,
+확인과 추가/삭제 사이에 다른 요청이 끼어들면 추천이 중복되거나 추천 수가 어긋날 수 있습니다.
+
+toggle_vote()는 중간 테이블의 (게시글, 사용자) 유일 인덱스를 사용하여
+1. DELETE로 기존 추천을 삭제하고 (삭제된 행이 있으면 추천 취소)
+2. 삭제된 행이 없으면 INSERT로 추천을 추가합니다. (동시에 같은 추천이 먼저 저장되면 유일 제약 위반으로 무시)
+추천 수(vote_count)도 같은 트랜잭션에서 F() 식으로 증감하므로 중간 테이블의 행 수와 항상 일치합니다.
+
+중간 테이블을 직접 수정하므로 m2m_changed 대신 vote_toggled 시그널(sender=모델, instance, user, voted)을 보냅니다.
+"""
+
+vote_toggled = Signal()  # 추천이 추가/취소된 뒤 발생 (pybo.signals에서 페이지 캐시 무효화)
+
+
+@dataclass
+class VoteResult:
+    """
+    추천 토글 결과입니다.
+
+    Attributes
+    ----------
+    voted : bool
+        토글 후 추천한 상태이면 True입니다.
+    vote_count : int
+        토글 후 추천 수입니다.
+    """
+
+    voted: bool
+    vote_count: int
+
+
+def toggle_vote(obj, user) -> VoteResult:
+    """
+    사용자의 추천을 토글합니다. 추천한 상태이면 취소하고, 아니면 추가합니다.
+
+    중간 테이블을 직접 수정하므로 m2m_changed 시그널이 발생하지 않고, 추천 수는 이 함수에서 갱신합니다. (vote_toggled 시그널 발생)
+
+    Parameters
+    ----------
+    obj : Model instance
+        추천할 게시글 또는 댓글입니다.
+    user : User
+        추천하는 사용자입니다.
+
+    Returns
+    -------
+    VoteResult
+        토글 후 추천 여부와 추천 수입니다.
+    """
+    model = type(obj)
+    voter = model._meta.get_field('voter')
+    through = voter.remote_field.through
+    link = {voter.m2m_column_name(): obj.pk, voter.m2m_reverse_name(): user.pk}  # 예: similaritypostmodel_id, user_id
+
+    with transaction.atomic():
+        deleted, _ = through.objects.filter(**link).delete()  # 유일 인덱스로 찾아 한 번의 DELETE
+        if deleted:
+            voted = False
+            adjust_count(model, [obj.pk], 'vote_count', -1)
+        else:
+            voted = True
+            try:
+                with transaction.atomic():  # 유일 제약 위반 시 이 INSERT만 되돌리기 위한 savepoint
+                    through.objects.create(**link)
+            except IntegrityError:  # 다른 요청이 같은 추천을 먼저 저장함 (이미 추천한 상태)
+                logger.info(f"동시 추천 무시 - {model._meta.label_lower} ID: {obj.pk}, 사용자 ID: {user.pk}")
+            else:
+                adjust_count(model, [obj.pk], 'vote_count', 1)
+        vote_count = model.objects.filter(pk=obj.pk).values_list('vote_count', flat=True).get()
+
+    vote_toggled.send(sender=model, instance=obj, user=user, voted=voted)
+    return VoteResult(voted=voted, vote_count=vote_count)